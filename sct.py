@@ -31,22 +31,12 @@ from functools import partial
 from typing import Optional
 from uuid import UUID
 
-import pytest
 import click
 import click_completion
 from prettytable import PrettyTable
 
-from sdcm.localhost import LocalHost
-from sdcm.remote import LOCALRUNNER
-from sdcm.results_analyze import PerformanceResultsAnalyzer, BaseResultsAnalyzer
 from sdcm.sct_config import SCTConfiguration
-from sdcm.sct_provision.common.layout import SCTProvisionLayout, create_sct_configuration
-from sdcm.sct_provision.instances_provider import provision_sct_resources
 from sdcm.sct_runner import AwsSctRunner, GceSctRunner, AzureSctRunner, get_sct_runner, clean_sct_runners
-from sdcm.utils.azure_utils import AzureService
-from sdcm.utils.azure_region import AzureRegion, region_name_to_location
-from sdcm.utils.cloud_monitor import cloud_report, cloud_qa_report
-from sdcm.utils.cloud_monitor.cloud_monitor import cloud_non_qa_report
 from sdcm.utils.common import (
     all_aws_regions,
     aws_tags_to_dict,
@@ -73,20 +63,8 @@ from sdcm.utils.common import (
     list_parallel_timelines_report_urls
 )
 from sdcm.utils.net import get_sct_runner_ip
-from sdcm.utils.jepsen import JepsenResults
-from sdcm.utils.docker_utils import docker_hub_login
-from sdcm.monitorstack import (restore_monitoring_stack, get_monitoring_stack_services,
-                               kill_running_monitoring_stack_services)
 from sdcm.utils.log import setup_stdout_logger
-from sdcm.utils.aws_region import AwsRegion
-from sdcm.utils.get_username import get_username
-from sdcm.send_email import get_running_instances_for_email_report, read_email_data_from_file, build_reporter, \
-    send_perf_email
-from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
 from sdcm.utils.aws_utils import AwsArchType
-from utils.build_system.create_test_release_jobs import JenkinsPipelines  # pylint: disable=no-name-in-module,import-error
-from utils.get_supported_scylla_base_versions import UpgradeBaseVersion  # pylint: disable=no-name-in-module,import-error
-from utils.mocks.aws_mock import AwsMock  # pylint: disable=no-name-in-module
 
 
 SUPPORTED_CLOUDS = ("aws", "gce", "azure",)
@@ -154,6 +132,8 @@ class CloudRegion(click.ParamType):
         self.cloud_provider = cloud_provider
 
     def convert(self, value, param, ctx):
+        from sdcm.utils.azure_utils import AzureService  # pylint: disable=import-outside-toplevel
+        from sdcm.utils.azure_region import region_name_to_location  # pylint: disable=import-outside-toplevel
         cloud_provider = self.cloud_provider or ctx.params["cloud_provider"]
         if cloud_provider == "aws":
             regions = all_aws_regions()
@@ -192,6 +172,8 @@ class SctLoader(unittest.TestLoader):
               expose_value=False,
               help="Install paths for extra python packages to install, scylla-cluster-plugins for example")
 def cli():
+    from sdcm.remote import LOCALRUNNER  # pylint: disable=import-outside-toplevel
+    from sdcm.utils.docker_utils import docker_hub_login  # pylint: disable=import-outside-toplevel
     LOGGER.info("install-bash-completion current path: %s", os.getcwd())
     docker_hub_login(remoter=LOCALRUNNER)
 
@@ -201,6 +183,10 @@ def cli():
 @click.option('-t', '--test-name', type=str, help="Test name")
 @click.option('-c', '--config', multiple=True, type=click.Path(exists=True), help="Test config .yaml to use, can have multiple of those")
 def provision_resources(backend, test_name: str, config: str):
+    # pylint: disable=import-outside-toplevel
+    from sdcm.localhost import LocalHost
+    from sdcm.sct_provision.common.layout import SCTProvisionLayout, create_sct_configuration
+    from sdcm.sct_provision.instances_provider import provision_sct_resources
     if config:
         os.environ['SCT_CONFIG_FILES'] = str(list(config))
     if backend:
@@ -606,6 +592,8 @@ def get_scylla_base_versions(scylla_version, scylla_repo, linux_distro, only_pri
     get the base versions according to the scylla repo and distro type, then we don't need to hardcode
     the base version for each branch.
     """
+    # pylint: disable=import-outside-toplevel,no-name-in-module,import-error
+    from utils.get_supported_scylla_base_versions import UpgradeBaseVersion
     add_file_logger()
 
     version_detector = UpgradeBaseVersion(scylla_repo, linux_distro, scylla_version)
@@ -764,6 +752,8 @@ def conf_docs(output_format):
 @click.option("-e", "--emails", required=True, type=str, help="Comma separated list of emails. Example a@b.com,c@d.com")
 @click.option("-l", "--logdir", required=True, type=str, help="Dir configured to store SCT logs")
 def perf_regression_report(es_id, emails, logdir):
+    from sdcm.results_analyze import PerformanceResultsAnalyzer  # pylint: disable=import-outside-toplevel
+    from sdcm.send_email import read_email_data_from_file, send_perf_email  # pylint: disable=import-outside-toplevel
     add_file_logger()
     emails = emails.split(',')
     if not emails:
@@ -813,6 +803,9 @@ def show_log(test_id, output_format):
 @click.option("--date-time", type=str, required=False, help='Datetime of monitor-set archive is collected')
 @click.option("--kill", type=bool, required=False, help='Kill and remove containers')
 def show_monitor(test_id, date_time, kill):
+    # pylint: disable=import-outside-toplevel
+    from sdcm.monitorstack import restore_monitoring_stack, get_monitoring_stack_services, \
+        kill_running_monitoring_stack_services
     add_file_logger()
 
     click.echo('Search monitoring stack archive files for test id {} and restoring...'.format(test_id))
@@ -840,6 +833,7 @@ def show_monitor(test_id, date_time, kill):
 @investigate.command('show-jepsen-results', help="Run a server with Jepsen results")
 @click.argument('test_id')
 def show_jepsen_results(test_id):
+    from sdcm.utils.jepsen import JepsenResults  # pylint: disable=import-outside-toplevel
     add_file_logger()
 
     click.secho(message=f"\nSearch Jepsen results archive files for test id {test_id} and restoring...\n", fg="green")
@@ -911,6 +905,7 @@ cli.add_command(investigate)
 @click.option("-t", "--test", required=False, default="",
               help="Run specific test file from unit-tests directory")
 def unit_tests(test):
+    import pytest  # pylint: disable=import-outside-toplevel
     sys.exit(pytest.main(['-v', '-p', 'no:warnings', 'unit_tests/{}'.format(test)]))
 
 
@@ -973,6 +968,7 @@ def run_test(argv, backend, config, logdir):
 @click.option('-c', '--config', multiple=True, type=click.Path(exists=True), help="Test config .yaml to use, can have multiple of those")
 @click.option('-l', '--logdir', help="Directory to use for logs")
 def run_pytest(target, backend, config, logdir):
+    import pytest  # pylint: disable=import-outside-toplevel
     if config:
         os.environ['SCT_CONFIG_FILES'] = str(list(config))
     if backend:
@@ -998,6 +994,8 @@ def run_pytest(target, backend, config, logdir):
 @click.option("-u", "--user", required=False, type=str, default="",
               help="User or instance owner. Applicable for last-7-days-* reports")
 def cloud_usage_report(emails, report_type, user):
+    from sdcm.utils.cloud_monitor import cloud_report, cloud_qa_report  # pylint: disable=import-outside-toplevel
+    from sdcm.utils.cloud_monitor.cloud_monitor import cloud_non_qa_report  # pylint: disable=import-outside-toplevel
     add_file_logger()
 
     email_list = emails.split(",")
@@ -1094,6 +1092,11 @@ def get_test_results_for_failed_test(test_status, start_time):
 @click.option('--logdir', help='Directory where to find testrun folder')
 def send_email(test_id=None, test_status=None, start_time=None, started_by=None, runner_ip=None,
                email_recipients=None, logdir=None):
+    # pylint: disable=import-outside-toplevel
+    from sdcm.results_analyze import BaseResultsAnalyzer
+    from sdcm.send_email import get_running_instances_for_email_report, read_email_data_from_file, \
+        build_reporter, send_perf_email
+    from sdcm.utils.get_username import get_username
     if started_by is None:
         started_by = get_username()
     add_file_logger()
@@ -1188,6 +1191,8 @@ def send_email(test_id=None, test_status=None, start_time=None, started_by=None,
 @click.option('--sct_branch', default='master', type=str)
 @click.option('--sct_repo', default='git@github.com:scylladb/scylla-cluster-tests.git', type=str)
 def create_operator_test_release_jobs(branch, username, password, sct_branch, sct_repo):
+    # pylint: disable=import-outside-toplevel,no-name-in-module,import-error
+    from utils.build_system.create_test_release_jobs import JenkinsPipelines
     add_file_logger()
 
     base_job_dir = "scylla-operator"
@@ -1221,6 +1226,8 @@ def create_operator_test_release_jobs(branch, username, password, sct_branch, sc
 @click.option('--sct_branch', default='master', type=str)
 @click.option('--sct_repo', default='git@github.com:scylladb/scylla-cluster-tests.git', type=str)
 def create_test_release_jobs(branch, username, password, sct_branch, sct_repo):
+    # pylint: disable=import-outside-toplevel,no-name-in-module,import-error
+    from utils.build_system.create_test_release_jobs import JenkinsPipelines
     add_file_logger()
 
     base_job_dir = f'{branch}'
@@ -1276,6 +1283,8 @@ def create_test_release_jobs(branch, username, password, sct_branch, sct_repo):
 @click.option('--sct_branch', default='master', type=str)
 @click.option('--sct_repo', default='git@github.com:scylladb/scylla-cluster-tests.git', type=str)
 def create_test_release_jobs_enterprise(branch, username, password, sct_branch, sct_repo):
+    # pylint: disable=import-outside-toplevel,no-name-in-module,import-error
+    from utils.build_system.create_test_release_jobs import JenkinsPipelines
     add_file_logger()
 
     base_job_dir = f'{branch}'
@@ -1302,6 +1311,8 @@ def create_test_release_jobs_enterprise(branch, username, password, sct_branch,
 @cloud_provider_option
 @click.option("-r", "--region", required=True, type=CloudRegion(), help="Cloud region")
 def prepare_region(cloud_provider, region):
+    from sdcm.utils.aws_region import AwsRegion  # pylint: disable=import-outside-toplevel
+    from sdcm.utils.azure_region import AzureRegion  # pylint: disable=import-outside-toplevel
     add_file_logger()
     if cloud_provider == "aws":
         region = AwsRegion(region_name=region)
@@ -1392,6 +1403,7 @@ def clean_runner_instances(test_status, runner_ip, dry_run):
 @click.option("-f", "--force", is_flag=True, default=False, help="don't check aws_mock_ip")
 @click.option("-t", "--test-id", required=False, help="SCT Test ID")
 def run_aws_mock(mock_region: list[str], force: bool = False, test_id: str | None = None) -> None:
+    from utils.mocks.aws_mock import AwsMock  # pylint: disable=no-name-in-module,import-outside-toplevel
     add_file_logger()
     if test_id is None:
         test_id = str(uuid.uuid4())
@@ -1411,6 +1423,7 @@ def run_aws_mock(mock_region: list[str], force: bool = False, test_id: str | Non
 @click.option('--verbose', is_flag=True, default=False, help="if enable, will log progress")
 @click.option("--dry-run", is_flag=True, default=False, help="dry run")
 def clean_aws_mocks(test_id: str | None, all_mocks: bool, verbose: bool, dry_run: bool) -> None:
+    from utils.mocks.aws_mock import AwsMock  # pylint: disable=no-name-in-module,import-outside-toplevel
     add_file_logger()
     AwsMock.clean(test_id=test_id, all_mocks=all_mocks, verbose=verbose, dry_run=dry_run)
 
@@ -1420,6 +1433,8 @@ def clean_aws_mocks(test_id: str | None, all_mocks: bool, verbose: bool, dry_run
 @click.option("-d", "--logdir", envvar='HOME', type=click.Path(exists=True),
               help="Directory with sct-results folder")
 def generate_parallel_timelines_report(logdir: str | None, test_id: str | None) -> None:
+    # pylint: disable=import-outside-toplevel
+    from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
     add_file_logger()
 
     event_log_file = "raw_events.log"
@@ -19,7 +19,7 @@ import concurrent.futures
 
 from sdcm.loader import CassandraHarryStressExporter
 from sdcm.prometheus import nemesis_metrics_obj
-from sdcm.sct_events.loaders import CassandraHarryEvent, CASSANDRA_HARRY_ERROR_EVENTS_PATTERNS
+from sdcm.sct_events.loaders import CassandraHarryEvent, CASSANDRA_HARRY_LOG_CLASSIFIER
 from sdcm.utils.common import FileFollowerThread, generate_random_string
 from sdcm.stress_thread import format_stress_cmd_error
 
@@ -40,13 +40,15 @@ class CassandraHarryStressEventsPublisher(FileFollowerThread):
                 time.sleep(0.5)
                 continue
 
-            for line_number, line in enumerate(self.follow_file(self.harry_log_filename)):
+            line_number = 0
+            for lines in self.follow_file(self.harry_log_filename).batches():
                 if self.stopped():
                     break
 
-                for pattern, event in CASSANDRA_HARRY_ERROR_EVENTS_PATTERNS:
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+                for event in CASSANDRA_HARRY_LOG_CLASSIFIER.events(lines, node=self.node,
+                                                                   start_line_number=line_number):
+                    event.publish()
+                line_number += len(lines)
 
 
 #  pylint: disable=too-many-instance-attributes
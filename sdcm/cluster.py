@@ -66,12 +66,15 @@ from sdcm.provision.scylla_yaml.certificate_builder import ScyllaYamlCertificate
 from sdcm.provision.scylla_yaml.cluster_builder import ScyllaYamlClusterAttrBuilder
 from sdcm.provision.scylla_yaml.scylla_yaml import ScyllaYaml
 from sdcm.provision.helpers.certificate import install_client_certificate, install_encryption_at_rest_files
-from sdcm.remote import RemoteCmdRunnerBase, LOCALRUNNER, NETWORK_EXCEPTIONS, shell_script_cmd
+from sdcm.remote import RemoteCmdRunnerBase, LOCALRUNNER, NETWORK_EXCEPTIONS, shell_script_cmd, run_on_nodes, \
+    raise_for_failures, OutputSink, OutputRetention
 from sdcm.remote.remote_file import remote_file, yaml_file_to_dict, dict_to_yaml_file
 from sdcm import wait, mgmt
 from sdcm.sct_config import SCTConfiguration
 from sdcm.sct_events.continuous_event import ContinuousEventsRegistry
 from sdcm.utils import properties
+from sdcm.utils.backtrace_decoder import BacktraceDecoder, debuginfo_file_name, \
+    prune_debuginfo_cache, BACKTRACES_DECODING_BATCH_SIZE, DEBUGINFO_CACHE_DIR
 from sdcm.utils.benchmarks import ScyllaClusterBenchmarkManager
 from sdcm.utils.common import (
     S3Storage,
@@ -87,13 +90,14 @@ from sdcm.utils.common import (
     prepare_and_start_saslauthd_service,
 )
 from sdcm.utils.ci_tools import get_test_name
+from sdcm.utils.nodes_ip_index import NodesIpIndex
+from sdcm.utils.cs_results import CassandraStressResults, parse_cs_summary
 from sdcm.utils.distro import Distro
 from sdcm.utils.git import clone_repo
 from sdcm.utils.install import InstallMode
 from sdcm.utils.docker_utils import ContainerManager, NotFound, docker_hub_login
-from sdcm.utils.health_checker import check_nodes_status, check_node_status_in_gossip_and_nodetool_status, \
-    check_schema_version, check_nulls_in_peers, check_schema_agreement_in_gossip_and_peers, \
-    CHECK_NODE_HEALTH_RETRIES, CHECK_NODE_HEALTH_RETRY_DELAY
+from sdcm.utils.health_checker import check_nodes_status, check_nodes_health, \
+    check_schema_agreement_in_gossip_and_peers, ClusterHealthSnapshot, CHECK_NODE_HEALTH_RETRIES
 from sdcm.utils.decorators import NoValue, retrying, log_run_info, optional_cached_property
 from sdcm.utils.remotewebbrowser import WebDriverContainerMixin
 from sdcm.test_config import TestConfig
@@ -421,6 +425,7 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         # Invalidate ip address cache
         self._private_ip_address_cached = self._public_ip_address_cached = self._ipv6_ip_address_cached = None
         self.__dict__.pop('cql_ip_address', None)
+        self.invalidate_ip_index()
 
         if self.ssh_login_info["hostname"] == self.external_address:
             return
@@ -861,6 +866,10 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
     def _get_ipv6_ip_address(self) -> Optional[str]:
         raise NotImplementedError()
 
+    def invalidate_ip_index(self):
+        if index := getattr(self.parent_cluster, "nodes_ip_index", None):
+            index.invalidate(self)
+
     def get_all_ip_addresses(self):
         public_ipv4_addresses, private_ipv4_addresses = self._refresh_instance_state()
         return list(set(public_ipv4_addresses + private_ipv4_addresses + [self._get_ipv6_ip_address()]))
@@ -1245,9 +1254,11 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         return self.file_exists(cassandra_stress_bin)
 
     @staticmethod
-    def _parse_cfstats(cfstats_output):
+    def _parse_cfstats(cfstats_output: str | Iterable[str]):
         stat_dict = {}
-        for line in cfstats_output.splitlines()[1:]:
+        if isinstance(cfstats_output, str):
+            cfstats_output = cfstats_output.splitlines()
+        for line in itertools.islice(cfstats_output, 1, None):
             # Example of line of cfstats output:
             #       Space used (total): 123456
             stat_line = [element for element in line.strip().split(':') if
@@ -1289,7 +1300,8 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
     def get_cfstats(self, keyspace, tcpdump=False):
         def keyspace_available():
             self.run_nodetool("flush", ignore_status=True, timeout=60)
-            res = self.run_nodetool(sub_cmd='cfstats', args=keyspace, ignore_status=True, timeout=60)
+            res = self.run_nodetool(sub_cmd='cfstats', args=keyspace, ignore_status=True, timeout=60,
+                                    retention=OutputRetention())
             return res.exit_status == 0
         tcpdump_id = uuid.uuid4()
         if tcpdump:
@@ -1299,19 +1311,24 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
             tcpdump_thread.start()
         wait.wait_for(keyspace_available, timeout=120, step=60,
                       text='Waiting until keyspace {} is available'.format(keyspace), throw_exc=False)
-        try:
-            # Don't need NodetoolEvent when waiting for space_node_threshold before start the nemesis, not publish it
-            result = self.run_nodetool(sub_cmd='cfstats', args=keyspace, timeout=60,
-                                       warning_event_on_exception=(Failure, UnexpectedExit), publish_event=False)
-        except (Failure, UnexpectedExit):
-            self.log.error('nodetool error - see tcpdump thread uuid %s for '
-                           'debugging info', tcpdump_id)
-            raise
-        finally:
-            if tcpdump:
-                self.remoter.run('sudo killall tcpdump', ignore_status=True)
-                self.log.info('END tcpdump thread uuid: %s', tcpdump_id)
-        return self._parse_cfstats(result.stdout)
+        # cfstats output is huge if there are many tables, so parse it from a file instead of keeping it in memory.
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as cfstats_output:
+            try:
+                # Don't need NodetoolEvent when waiting for space_node_threshold before start the nemesis,
+                # not publish it
+                self.run_nodetool(sub_cmd='cfstats', args=keyspace, timeout=60,
+                                  warning_event_on_exception=(Failure, UnexpectedExit), publish_event=False,
+                                  stdout_sink=cfstats_output, retention=OutputRetention())
+            except (Failure, UnexpectedExit):
+                self.log.error('nodetool error - see tcpdump thread uuid %s for '
+                               'debugging info', tcpdump_id)
+                raise
+            finally:
+                if tcpdump:
+                    self.remoter.run('sudo killall tcpdump', ignore_status=True)
+                    self.log.info('END tcpdump thread uuid: %s', tcpdump_id)
+            cfstats_output.seek(0)
+            return self._parse_cfstats(cfstats_output)
 
     def wait_jmx_up(self, verbose=True, timeout=None):
         text = None
@@ -1480,35 +1497,72 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         self._decoding_backtraces_thread.start()
 
     def decode_backtrace(self):
-        scylla_debug_file = None
+        """Decode backtraces from the decoding queue in batches, till the test is terminated.
+
+        All queued backtraces (up to `BACKTRACES_DECODING_BATCH_SIZE') are decoded together: a decoder per debug info
+        file runs one addr2line command for all addresses which weren't decoded yet.
+        """
+        decoders: Dict[tuple, BacktraceDecoder] = {}
         while True:
-            event = None
-            obj = None
+            batch, stop = [], False
             try:
                 obj = self.test_config.DECODING_QUEUE.get(timeout=5)
-                if obj is None:
-                    break
-                event = obj["event"]
-                if not scylla_debug_file:
-                    scylla_debug_file = self.copy_scylla_debug_info(obj["node"], obj["debug_file"])
-                output = self.decode_raw_backtrace(scylla_debug_file, " ".join(event.raw_backtrace.split('\n')))
-                event.backtrace = output.stdout
+                while obj is not None:
+                    batch.append(obj)
+                    if len(batch) >= BACKTRACES_DECODING_BATCH_SIZE:
+                        break
+                    obj = self.test_config.DECODING_QUEUE.get_nowait()
+                stop = obj is None
             except queue.Empty:
                 pass
+            self.decode_backtraces_batch(batch, decoders)
+            if stop or (self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty()):
+                break
+
+    def decode_backtraces_batch(self, batch: List[dict], decoders: Dict[tuple, BacktraceDecoder]) -> None:
+        groups = defaultdict(list)
+        for obj in batch:
+            groups[(obj["node"], obj["debug_file"])].append(obj["event"])
+        for (node_name, debug_file), events in groups.items():
+            try:
+                decoder = self.get_backtrace_decoder(node_name, debug_file, decoders)
+                for event, backtrace in zip(events, decoder.decode_many([event.raw_backtrace for event in events])):
+                    event.backtrace = backtrace
+                self.log.debug("Backtraces decoding stats for %s: %s", decoder.debug_file, decoder.stats)
             except Exception as details:  # pylint: disable=broad-except
                 self.log.error("failed to decode backtrace %s", details)
             finally:
-                if event:
+                for event in events:
                     event.ready_to_publish()
                     event.publish()
 
-            if self.termination_event.is_set() and self.test_config.DECODING_QUEUE.empty():
-                break
+    def get_backtrace_decoder(self, node_name: str, debug_file: str,
+                              decoders: Dict[tuple, BacktraceDecoder]) -> BacktraceDecoder:
+        """Return a decoder for `debug_file' of the db node, memoized in `decoders'.
+
+        Decoders are keyed by the db node, the file and ScyllaDB version of the node, so the file is looked up and
+        copied to this node once and not for every batch, but again after the node is upgraded.  Nodes with the same
+        Scylla build share one decoder.
+        """
+        db_node = self._get_db_node(node_name)
+        key = (node_name, debug_file, db_node.scylla_version_detailed)
+        if (decoder := decoders.get(key)) is None:
+            scylla_debug_file = self.copy_scylla_debug_info(node_name, debug_file)
+            decoder = next((known for known in decoders.values() if known.debug_file == scylla_debug_file), None)
+            decoder = decoders[key] = decoder or BacktraceDecoder(self.remoter, scylla_debug_file)
+        return decoder
+
+    def _get_db_node(self, node_name: str):
+        db_nodes = self.parent_cluster.targets['db_cluster'].nodes
+        db_node = next(iter([n for n in db_nodes if n.name == node_name]), None)
+        assert db_node, f"Node named: {node_name} wasn't found"
+        return db_node
 
     def copy_scylla_debug_info(self, node_name: str, debug_file: str):
         """Copy scylla debug file from db-node to monitor-node
 
-        Copy via builder
+        Copy via builder.  The file is cached by build-id of Scylla on the db-node both on the builder
+        (in `DEBUGINFO_CACHE_DIR') and on the monitor node, so it's copied only once per Scylla build.
         :param node_name: db node name
         :type node_name: str
         :param scylla_debug_file: path to scylla_debug_file on db-node
@@ -1517,40 +1571,28 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         :rtype: {str}
         """
 
-        db_nodes = self.parent_cluster.targets['db_cluster'].nodes
-        db_node = next(iter([n for n in db_nodes if n.name == node_name]), None)
-        assert db_node, f"Node named: {node_name} wasn't found"
-
-        base_scylla_debug_file = os.path.basename(debug_file)
-        transit_scylla_debug_file = os.path.join(db_node.parent_cluster.logdir,
-                                                 base_scylla_debug_file)
+        db_node = self._get_db_node(node_name)
+        base_scylla_debug_file = debuginfo_file_name(debug_file, build_id=db_node.get_scylla_build_id())
         final_scylla_debug_file = os.path.join("/tmp", base_scylla_debug_file)
-
-        if not os.path.exists(transit_scylla_debug_file):
-            db_node.remoter.receive_files(debug_file, transit_scylla_debug_file)
         res = self.remoter.run(
             "test -f {}".format(final_scylla_debug_file), ignore_status=True, verbose=False)
-        if res.exited != 0:
-            self.remoter.send_files(transit_scylla_debug_file,  # pylint: disable=not-callable
-                                    final_scylla_debug_file)
+        if res.exited == 0:
+            return final_scylla_debug_file
+
+        cached_scylla_debug_file = os.path.join(DEBUGINFO_CACHE_DIR, base_scylla_debug_file)
+        if os.path.exists(cached_scylla_debug_file):
+            os.utime(cached_scylla_debug_file)  # mark as recently used for `prune_debuginfo_cache()'
+        else:
+            os.makedirs(DEBUGINFO_CACHE_DIR, exist_ok=True)
+            transit_scylla_debug_file = f"{cached_scylla_debug_file}.{uuid.uuid4().hex}"
+            db_node.remoter.receive_files(debug_file, transit_scylla_debug_file)
+            os.replace(transit_scylla_debug_file, cached_scylla_debug_file)
+            prune_debuginfo_cache(keep=cached_scylla_debug_file)
+        self.remoter.send_files(cached_scylla_debug_file,  # pylint: disable=not-callable
+                                final_scylla_debug_file)
         self.log.info("File on monitor node %s: %s", self, final_scylla_debug_file)
-        self.log.info("Remove transit file: %s", transit_scylla_debug_file)
-        os.remove(transit_scylla_debug_file)
         return final_scylla_debug_file
 
-    def decode_raw_backtrace(self, scylla_debug_file, raw_backtrace):
-        """run decode backtrace on monitor node
-
-        Decode backtrace on monitor node
-        :param scylla_debug_file: file path on db-node
-        :type scylla_debug_file: str
-        :param raw_backtrace: string with backtrace data
-        :type raw_backtrace: str
-        :returns: result of bactrace
-        :rtype: {str}
-        """
-        return self.remoter.run('addr2line -Cpife {0} {1}'.format(scylla_debug_file, raw_backtrace), verbose=True)
-
     def get_scylla_build_id(self) -> Optional[str]:
         for scylla_executable in ("/usr/bin/scylla", "/opt/scylladb/libexec/scylla", ):
             build_id_result = self.remoter.run(f"{scylla_executable} --build-id", ignore_status=True)
@@ -2591,7 +2633,8 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
     # pylint: disable=inconsistent-return-statements
     def run_nodetool(self, sub_cmd, args="", options="", timeout=None,
                      ignore_status=False, verbose=True, coredump_on_timeout=False,
-                     warning_event_on_exception=None, error_message="", publish_event=True, retry=1):
+                     warning_event_on_exception=None, error_message="", publish_event=True, retry=1,
+                     stdout_sink: Optional[OutputSink] = None, retention: Optional[OutputRetention] = None):
         """
             Wrapper for nodetool command.
             Command format: nodetool [options] command [args]
@@ -2611,6 +2654,8 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
                                            in the list
         :param error_message: additional error message to exception message
         :param publish_event: publish event or not
+        :param stdout_sink: object to stream output of the command to as it arrives
+        :param retention: how much of the output to keep in the result
         :return: Remoter result object
         """
         cmd = self._gen_nodetool_cmd(sub_cmd, args, options)
@@ -2621,7 +2666,8 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
                            publish_event=publish_event) as nodetool_event:
             try:
                 result = \
-                    self.remoter.run(cmd, timeout=timeout, ignore_status=ignore_status, verbose=verbose, retry=retry)
+                    self.remoter.run(cmd, timeout=timeout, ignore_status=ignore_status, verbose=verbose, retry=retry,
+                                     stdout_sink=stdout_sink, retention=retention)
                 self.log.debug("Command '%s' duration -> %s s" % (result.command, result.duration))
 
                 nodetool_event.duration = result.duration
@@ -2639,29 +2685,7 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
                     raise
 
     def node_health_events(self) -> Iterator[ClusterHealthValidatorEvent]:
-        nodes_status = self.get_nodes_status()
-        peers_details = self.get_peers_info() or {}
-        gossip_info = self.get_gossip_info() or {}
-
-        return itertools.chain(
-            check_nodes_status(
-                nodes_status=nodes_status,
-                current_node=self,
-                removed_nodes_list=self.parent_cluster.dead_nodes_ip_address_list),
-            check_node_status_in_gossip_and_nodetool_status(
-                gossip_info=gossip_info,
-                nodes_status=nodes_status,
-                current_node=self),
-            check_schema_version(
-                gossip_info=gossip_info,
-                peers_details=peers_details,
-                nodes_status=nodes_status,
-                current_node=self),
-            check_nulls_in_peers(
-                gossip_info=gossip_info,
-                peers_details=peers_details,
-                current_node=self),
-        )
+        return ClusterHealthSnapshot(nodes=[self]).collect().node_health_events(self)
 
     def check_node_health(self, retries: int = CHECK_NODE_HEALTH_RETRIES) -> None:
         # Task 1443: ClusterHealthCheck is bottle neck in scale test and create a lot of noise in 5000 tables test.
@@ -2669,25 +2693,7 @@ class BaseNode(AutoSshContainerMixin, WebDriverContainerMixin):  # pylint: disab
         if not self.parent_cluster.params.get('cluster_health_check'):
             return
 
-        for retry_n in range(1, retries+1):
-            LOGGER.debug("Check the health of the node `%s' [attempt #%d]", self.name, retry_n)
-            events = self.node_health_events()
-            event = next(events, None)
-            if event is None:
-                LOGGER.debug("Node `%s' is healthy", self.name)
-                break
-            if retry_n == retries:  # publish health validation events on the last retry.
-                LOGGER.debug("One or more node `%s' health validation has failed", self.name)
-                event.publish()
-                for event in events:
-                    event.publish()
-                break
-
-            event.dont_publish()
-
-            LOGGER.debug("Wait for %d secs before next try to validate the health of the node `%s'",
-                         CHECK_NODE_HEALTH_RETRY_DELAY, self.name)
-            time.sleep(CHECK_NODE_HEALTH_RETRY_DELAY)
+        check_nodes_health(nodes=[self], retries=retries)
 
     def get_nodes_status(self):
         nodes_status = {}
@@ -3051,6 +3057,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         self.log = SDCMAdapter(LOGGER, extra={'prefix': str(self)})
         self.log.info('Init nodes')
         self.nodes = []
+        self.nodes_ip_index = NodesIpIndex()
         self.instance_provision = params.get('instance_provision')
         self.params = params
         self.datacenter = region_names or []
@@ -3104,11 +3111,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
         return [node.ip_address for node in self.dead_nodes_list]
 
     def find_node_by_ip(self, node_ip):
-        for node in self.nodes:
-            if node_ip in node.get_all_ip_addresses():
-                return node
-
-        return None
+        return self.nodes_ip_index.lookup(self.nodes, node_ip)
 
     def init_log_directory(self):
         assert '_SCT_TEST_LOGDIR' in os.environ
@@ -3128,8 +3131,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
             loader.remoter.send_files(src=src, dst=dst, verbose=verbose)
 
     def run(self, cmd, verbose=False):
-        for loader in self.nodes:
-            loader.remoter.run(cmd=cmd, verbose=verbose)
+        raise_for_failures(run_on_nodes(self.nodes, cmd, verbose=verbose))
 
     def run_func_parallel(self, func, node_list=None):
         if node_list is None:
@@ -3211,6 +3213,7 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
 
         if node in self.nodes:
             self.nodes.remove(node)
+        self.nodes_ip_index.remove(node)
         node.destroy()
 
     def get_db_auth(self):
@@ -3243,10 +3246,9 @@ class BaseCluster:  # pylint: disable=too-many-instance-attributes,too-many-publ
                 node.set_keep_alive()
 
     def get_node_by_ip(self, node_ip, datacenter=None):
-        full_node_ip = f"{datacenter}.{node_ip}" if datacenter else node_ip
-        for node in self.nodes:
-            region_ip = f"{node.datacenter}.{node.ip_address}" if datacenter else node.ip_address
-            if region_ip == full_node_ip:
+        # fallback to all nodes only if there is no indexed node with this IP
+        for node in self.nodes_ip_index.lookup_all(self.nodes, node_ip) or self.nodes:
+            if node.ip_address == node_ip and (not datacenter or node.datacenter == datacenter):
                 return node
         return None
 
@@ -3909,10 +3911,8 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
                 node_ip = node_info.pop("ip")
                 # NOTE: following replacement is needed for the K8S case where
                 #       registered IP is different than the one used for network connections
-                if verification_node.is_kubernetes():
-                    for node in self.nodes:
-                        if node_ip in node.get_all_ip_addresses() and node_ip != node.ip_address:
-                            node_ip = node.ip_address
+                if verification_node.is_kubernetes() and (node := self.find_node_by_ip(node_ip)):
+                    node_ip = node.ip_address
                 node_info["load"] = node_info["load"].replace(" ", "")
                 status[dc_name][node_ip] = node_info
         return status
@@ -3943,8 +3943,7 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
             # Don't run health check in case parallel nemesis.
             # TODO: find how to recognize, that nemesis on the node is running
             if self.nemesis_count == 1:
-                for node in self.nodes:
-                    node.check_node_health()
+                check_nodes_health(nodes=self.nodes)
             else:
                 chc_event.message = "Test runs with parallel nemesis. Nodes health checks are disabled."
                 return
@@ -4364,8 +4363,8 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         for node in self.nodes:
             node.stop_scylla_server()
 
-        for node in self.nodes:
-            node.remoter.sudo(f'cp -r "/var/lib/scylla/data/{ks}" "/var/lib/scylla/data/{backup_name}"')
+        raise_for_failures(run_on_nodes(
+            self.nodes, f'cp -r "/var/lib/scylla/data/{ks}" "/var/lib/scylla/data/{backup_name}"', sudo=True))
 
         for node in self.nodes:
             node.start_scylla_server()
@@ -4377,11 +4376,10 @@ class BaseScyllaCluster:  # pylint: disable=too-many-public-methods, too-many-in
         for node in self.nodes:
             node.stop_scylla_server()
 
-        for node in self.nodes:
-            node.remoter.sudo(shell_script_cmd(f"""\
-                rm -rf '/var/lib/scylla/data/{ks}'
-                cp -r '/var/lib/scylla/data/{backup_name}' '/var/lib/scylla/data/{ks}'
-            """))
+        raise_for_failures(run_on_nodes(self.nodes, shell_script_cmd(f"""\
+            rm -rf '/var/lib/scylla/data/{ks}'
+            cp -r '/var/lib/scylla/data/{backup_name}' '/var/lib/scylla/data/{ks}'
+        """), sudo=True))
 
         for node in self.nodes:
             node.start_scylla_server()
@@ -4692,13 +4690,12 @@ class BaseLoaderSet():
                                  str(loader), str(ex))
 
     def kill_docker_loaders(self):
-        for loader in self.nodes:
-            try:
-                loader.remoter.run(cmd='docker ps -a -q | docker rm -f', verbose=False, ignore_status=True)
-                self.log.info("Killed docker loader on node: %s", loader.name)
-            except Exception as ex:  # pylint: disable=broad-except
+        for res in run_on_nodes(self.nodes, 'docker ps -a -q | docker rm -f', ignore_status=True):
+            if res.ok:
+                self.log.info("Killed docker loader on node: %s", res.node.name)
+            else:
                 self.log.warning("failed to kill docker stress command on [%s]: [%s]",
-                                 str(loader), str(ex))
+                                 str(res.node), str(res.exc))
 
     @staticmethod
     def _parse_cs_summary(lines):
@@ -4707,117 +4704,26 @@ class BaseLoaderSet():
         Collect results of all nodes and return a dictionaries' list,
         the new structure data will be easy to parse, compare, display or save.
         """
-        results = {}
-        enable_parse = False
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            # Parse loader & cpu info
-            if line.startswith('TAG:'):
-                # TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
-                ret = re.findall(r"TAG: loader_idx:(\d+)-cpu_idx:(\d+)-keyspace_idx:(\d+)", line)
-                results['loader_idx'] = ret[0][0]
-                results['cpu_idx'] = ret[0][1]
-                results['keyspace_idx'] = ret[0][2]
-                continue
-            if line.startswith('Username:'):
-                # Mode:
-                # ...
-                #   Username: null
-                #   Password: null
-                results['username'] = line.split('Username:')[1].strip()
-            if line.startswith('Results:'):
-                # Results:
-                # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
-                # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
-                # Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
-                # ....
-                enable_parse = True
-                continue
-            if line == '':
-                continue
-            if line == 'END':
-                break
-            if not enable_parse:
-                continue
-            split_idx = line.find(':')
-            if split_idx < 0:
-                continue
-            # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
-            # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
-            # Row rate                  :    9,999 row/s [WRITE: 9,999 row/s]
-            # Latency mean              :    1.1 ms [WRITE: 1.1 ms]
-            # Latency median            :    0.6 ms [WRITE: 0.6 ms]
-            # Latency 95th percentile   :    2.3 ms [WRITE: 2.3 ms]
-            # Latency 99th percentile   :    5.4 ms [WRITE: 5.4 ms]
-            # Latency 99.9th percentile :   23.7 ms [WRITE: 23.7 ms]
-            # Latency max               : 15787.4 ms [WRITE: 15,787.4 ms]
-            # Total partitions          : 108,000,096 [WRITE: 108,000,096]
-            # Total errors              :          0 [WRITE: 0]
-            # Total GC count            : 0
-            # Total GC memory           : 0.000 KiB
-            # Total GC time             :    0.0 seconds
-            key = line[:split_idx].strip().lower()
-            value = line[split_idx + 1:].split()[0].replace(",", "")
-            results[key] = value
-            match = re.findall(r'.*READ:(\d+), WRITE:(\d+)]', line)
-            if match:  # parse results for mixed workload
-                results['%s read' % key] = match[0][0]
-                results['%s write' % key] = match[0][1]
-
-        if not enable_parse:
-            LOGGER.warning('Cannot find summary in c-stress results: %s', lines[-10:])
-            return {}
-        return results
+        return parse_cs_summary(lines)
 
     @staticmethod
     def _parse_cs_results(lines):
-        results = {}
-        results['time'] = []
-        results['ops'] = []
-        results['totalops'] = []
-        results['latmax'] = []
-        results['lat999'] = []
-        results['lat99'] = []
-        results['lat95'] = []
-        for line in lines:
-            line.strip()
-            if line.startswith('total,'):
-                items = line.split(',')
-                totalops = items[1]
-                ops = items[2]
-                lat95 = items[7]
-                lat99 = items[8]
-                lat999 = items[9]
-                latmax = items[10]
-                time_point = items[11]
-                results['time'].append(time_point)
-                results['totalops'].append(totalops)
-                results['ops'].append(ops)
-                results['lat95'].append(lat95)
-                results['lat99'].append(lat99)
-                results['lat999'].append(lat999)
-                results['latmax'].append(latmax)
-        return results
+        """Return columns of c-s intervals (time, ops, totalops, lat95, lat99, lat999, latmax) as float arrays."""
+        return CassandraStressResults.from_lines(lines).intervals
+
+    def _interrupt_processes(self, name: str) -> None:
+        active = raise_for_failures(run_on_nodes(self.nodes, f'pgrep -f {name}', ignore_status=True))
+        active_loaders = [res.node for res in active if res.result.exit_status == 0]
+        for res in raise_for_failures(run_on_nodes(
+                active_loaders, f'pkill -f -SIGINT {name}', ignore_status=True, verbose=True)):
+            if res.result.exit_status != 0:
+                self.log.warning('Terminate %s on node %s:\n%s', name, res.node, res.result)
 
     def kill_stress_thread_bench(self):
-        for loader in self.nodes:
-            sb_active = loader.remoter.run(cmd='pgrep -f scylla-bench', verbose=False, ignore_status=True)
-            if sb_active.exit_status == 0:
-                kill_result = loader.remoter.run('pkill -f -SIGINT scylla-bench', ignore_status=True)
-                if kill_result.exit_status != 0:
-                    self.log.warning('Terminate scylla-bench on node %s:\n%s',
-                                     loader, kill_result)
+        self._interrupt_processes('scylla-bench')
 
     def kill_gemini_thread(self):
-        for loader in self.nodes:
-            sb_active = loader.remoter.run(cmd='pgrep -f gemini', verbose=False, ignore_status=True)
-            if sb_active.exit_status == 0:
-                kill_result = loader.remoter.run('pkill -f -SIGINT gemini', ignore_status=True)
-                if kill_result.exit_status != 0:
-                    self.log.warning('Terminate gemini on node %s:\n%s', loader, kill_result)
+        self._interrupt_processes('gemini')
 
 
 class BaseMonitorSet:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
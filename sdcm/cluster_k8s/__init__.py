@@ -1952,6 +1952,7 @@ class BaseScyllaPodContainer(BasePodContainer):  # pylint: disable=abstract-meth
         # Invalidate ip address cache
         old_ip_info = (self.public_ip_address, self.private_ip_address)
         self._private_ip_address_cached = self._public_ip_address_cached = self._ipv6_ip_address_cached = None
+        self.invalidate_ip_index()
 
         if old_ip_info == (self.public_ip_address, self.private_ip_address):
             return
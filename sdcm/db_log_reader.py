@@ -15,7 +15,6 @@
 
 import json
 import logging
-import os
 import re
 from functools import cached_property
 from multiprocessing import Process, Event, Queue
@@ -26,9 +25,13 @@ from sdcm.sct_events.base import LogEvent
 from sdcm.sct_events.database import get_pattern_to_event_to_func_mapping, BACKTRACE_RE
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.common import make_threads_be_daemonic_by_default
+from sdcm.utils.file_tail import FileTailReader
+from sdcm.utils.multi_pattern import MultiPatternMatcher
 
 LOGGER = logging.getLogger(__name__)
 
+ONE_LINE_BACKTRACE_RE = re.compile("backtrace:", re.IGNORECASE)
+
 
 class DbLogReader(Process):
     # pylint: disable=too-many-instance-attributes
@@ -47,6 +50,7 @@ class DbLogReader(Process):
         'repair id [id=',
         '] stream_session - [Stream ',
     ]
+    READ_INTERVAL_MAX = 0.5  # seconds
     # pylint: disable=too-many-arguments
 
     def __init__(self,
@@ -66,14 +70,31 @@ class DbLogReader(Process):
         self._terminate_event = Event()
         self._last_error: LogEvent | None = None
         self._last_line_no = -1
-        self._last_log_position = 0
         self._remoter = remoter
-        self._skipped_end_line = 0
         super().__init__(name=self.__class__.__name__, daemon=True)
 
     @cached_property
-    def _continuous_event_patterns(self):
-        return get_pattern_to_event_to_func_mapping(node=self._node_name)
+    def _log_tail(self) -> FileTailReader:
+        return FileTailReader(self._system_log)
+
+    @cached_property
+    def _continuous_event_patterns(self) -> MultiPatternMatcher:
+        return MultiPatternMatcher((item.pattern, item) for item in get_pattern_to_event_to_func_mapping(
+            node=self._node_name))
+
+    @cached_property
+    def _system_event_matcher(self) -> MultiPatternMatcher:
+        return MultiPatternMatcher(self._system_event_patterns)
+
+    @cached_property
+    def _candidate_line_matcher(self) -> MultiPatternMatcher:
+        """A line which isn't a candidate for this matcher can't produce any event or be a part of a backtrace."""
+        return MultiPatternMatcher([
+            (BACKTRACE_RE, None),
+            (ONE_LINE_BACKTRACE_RE, None),
+            *self._continuous_event_patterns.patterns,
+            *self._system_event_matcher.patterns,
+        ])
 
     def _read_and_publish_events(self) -> None:
         """Search for all known patterns listed in `sdcm.sct_events.database.SYSTEM_ERROR_EVENTS'."""
@@ -81,83 +102,73 @@ class DbLogReader(Process):
         # pylint: disable=too-many-branches,too-many-locals,too-many-statements
 
         backtraces = []
-        index = 0
-
-        if not os.path.exists(self._system_log):
-            return
-
-        with open(self._system_log, encoding="utf-8") as db_file:
-            if self._last_log_position:
-                db_file.seek(self._last_log_position)
-            for index, line in enumerate(db_file, start=self._last_line_no + 1):
-                # Postpone processing line with no ending in case if half of line is written to the disc
-                if line[-1] == '\n' or self._skipped_end_line > 20:
-                    self._skipped_end_line = 0
-                else:
-                    self._skipped_end_line += 1
-                    continue
-                try:
-                    json_log = None
-                    if line[0] == '{':
-                        try:
-                            json_log = json.loads(line)
-                        except Exception:  # pylint: disable=broad-except
-                            pass
-
-                    if self._log_lines:
-                        line = line.strip()
-                        for pattern in self.EXCLUDE_FROM_LOGGING:
-                            if pattern in line:
-                                break
-                        else:
-                            LOGGER.debug(line)
-
-                    if json_log:
-                        continue
-
-                    match = BACKTRACE_RE.search(line)
-                    one_line_backtrace = []
-                    if match and backtraces:
-                        data = match.groupdict()
-                        if data['other_bt']:
-                            backtraces[-1]['backtrace'] += [data['other_bt'].strip()]
-                        if data['scylla_bt']:
-                            backtraces[-1]['backtrace'] += [data['scylla_bt'].strip()]
-                    elif "backtrace:" in line.lower() and "0x" in line:
-                        # This part handles the backtrases are printed in one line.
-                        # Example:
-                        # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
-                        # (Operation timed out for system.paxos - received only 0 responses from 1 CL=ONE.),
-                        # backtrace:   0x3316f4d#012  0x2e2d177#012  0x189d397#012  0x2e76ea0#012  0x2e770af#012
-                        # 0x2eaf065#012  0x2ebd68c#012  0x2e48d5d#012  /opt/scylladb/libreloc/libpthread.so.0+0x94e1#012
-                        splitted_line = re.split("backtrace:", line, flags=re.IGNORECASE)
-                        for trace_line in splitted_line[1].split():
-                            if trace_line.startswith('0x') or 'scylladb/lib' in trace_line:
-                                one_line_backtrace.append(trace_line)
-
-                    # for each line, if it matches a continuous event pattern,
-                    # call the appropriate function with the class tied to that pattern
-                    for item in self._continuous_event_patterns:
-                        if event_match := item.pattern.search(line):
-                            item.period_func(match=event_match)
+        index = self._last_line_no
+        candidate_line_matcher = self._candidate_line_matcher
+
+        for index, line in enumerate(self._log_tail.iter_lines(), start=self._last_line_no + 1):
+            try:
+                json_log = None
+                if line[0] == '{':
+                    try:
+                        json_log = json.loads(line)
+                    except Exception:  # pylint: disable=broad-except
+                        pass
+
+                if self._log_lines:
+                    line = line.strip()
+                    for pattern in self.EXCLUDE_FROM_LOGGING:
+                        if pattern in line:
                             break
+                    else:
+                        LOGGER.debug(line)
 
-                    # for each line use all regexes to match, and if found send an event
-                    for pattern, event in self._system_event_patterns:
-                        if pattern.search(line):
-                            cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
-                            backtraces.append(dict(event=cloned_event, backtrace=[]))
-                            break  # Stop iterating patterns to avoid creating two events for one line of the log
+                if json_log:
+                    continue
 
-                    if one_line_backtrace and backtraces:
-                        backtraces[-1]['backtrace'] = one_line_backtrace
-                except Exception:  # pylint: disable=broad-except
-                    LOGGER.exception('Processing of %s line of %s failed, line content:\n%s',
-                                     index, self._system_log, line)
+                folded_line = line.casefold()
+                if not candidate_line_matcher.is_candidate(line, folded_line):
+                    continue
 
-            if index:
-                self._last_line_no = index
-                self._last_log_position = db_file.tell() + 1
+                match = BACKTRACE_RE.search(line) if "0x" in folded_line else None
+                one_line_backtrace = []
+                if match and backtraces:
+                    data = match.groupdict()
+                    if data['other_bt']:
+                        backtraces[-1]['backtrace'] += [data['other_bt'].strip()]
+                    if data['scylla_bt']:
+                        backtraces[-1]['backtrace'] += [data['scylla_bt'].strip()]
+                elif "backtrace:" in folded_line and "0x" in line:
+                    # This part handles the backtrases are printed in one line.
+                    # Example:
+                    # [shard 2] seastar - Exceptional future ignored: exceptions::mutation_write_timeout_exception
+                    # (Operation timed out for system.paxos - received only 0 responses from 1 CL=ONE.),
+                    # backtrace:   0x3316f4d#012  0x2e2d177#012  0x189d397#012  0x2e76ea0#012  0x2e770af#012
+                    # 0x2eaf065#012  0x2ebd68c#012  0x2e48d5d#012  /opt/scylladb/libreloc/libpthread.so.0+0x94e1#012
+                    splitted_line = re.split("backtrace:", line, flags=re.IGNORECASE)
+                    for trace_line in splitted_line[1].split():
+                        if trace_line.startswith('0x') or 'scylladb/lib' in trace_line:
+                            one_line_backtrace.append(trace_line)
+
+                # for each line, if it matches a continuous event pattern,
+                # call the appropriate function with the class tied to that pattern
+                if continuous_match := self._continuous_event_patterns.first_match(line, folded_line):
+                    event_match, item = continuous_match
+                    item.period_func(match=event_match)
+
+                # for each line use all regexes to match, and if found send an event (only the first matched
+                # pattern is used to avoid creating two events for one line of the log)
+                if system_match := self._system_event_matcher.first_match(line, folded_line):
+                    _, event = system_match
+                    cloned_event = event.clone().add_info(node=self._node_name, line_number=index, line=line)
+                    backtraces.append(dict(event=cloned_event, backtrace=[]))
+
+                if one_line_backtrace and backtraces:
+                    backtraces[-1]['backtrace'] = one_line_backtrace
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception('Processing of %s line of %s failed, line content:\n%s',
+                                 index, self._system_log, line)
+
+        self._last_line_no = index
 
         traces_count = 0
         for backtrace in backtraces:
@@ -170,10 +181,12 @@ class DbLogReader(Process):
             self._last_error = None
             backtraces = list(filter(self.filter_backtraces, backtraces))
 
+        scylla_debug_info = None
         for backtrace in backtraces:
             if self._decoding_queue and backtrace["event"].raw_backtrace:
-                scylla_debug_info = self.get_scylla_debuginfo_file()
-                LOGGER.debug("Debug info file %s", scylla_debug_info)
+                if scylla_debug_info is None:  # lookup once for all backtraces read
+                    scylla_debug_info = self.get_scylla_debuginfo_file()
+                    LOGGER.debug("Debug info file %s", scylla_debug_info)
                 self._decoding_queue.put({
                     "node": self._node_name,
                     "debug_file": scylla_debug_info,
@@ -185,19 +198,23 @@ class DbLogReader(Process):
     @raise_event_on_failure
     def run(self):
         """
-        Keep reporting new events from db log, every 30 seconds.
+        Keep reporting new events from db log, every time the log is changed or every `READ_INTERVAL_MAX' seconds.
         """
         LOGGER.debug('Logging for node %s is started with following configuration:\nsystem_log=%s'
                      '\nlog_lines=%s\ndecoding_queue=%s',
                      self._node_name, self._system_log, self._log_lines, self._decoding_queue is not None)
         make_threads_be_daemonic_by_default()
-        while not self._terminate_event.wait(0.1):
-            try:
-                self._read_and_publish_events()
-            except (SystemExit, KeyboardInterrupt) as ex:
-                LOGGER.debug("db_log_reader_thread() stopped by %s", ex.__class__.__name__)
-            except Exception:  # pylint: disable=broad-except
-                LOGGER.exception("failed to read db log")
+        try:
+            while not self._terminate_event.is_set():
+                try:
+                    self._read_and_publish_events()
+                except (SystemExit, KeyboardInterrupt) as ex:
+                    LOGGER.debug("db_log_reader_thread() stopped by %s", ex.__class__.__name__)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception("failed to read db log")
+                self._log_tail.wait(timeout=self.READ_INTERVAL_MAX)
+        finally:
+            self._log_tail.close()
 
     def filter_backtraces(self, backtrace):
         # A filter function to attach the backtrace to the correct error and not to the backtraces.
@@ -18,13 +18,15 @@ import os
 import platform
 import logging
 import json
+import threading
 import urllib.parse
 
 from textwrap import dedent
-from math import sqrt
-from typing import Optional
+from math import ceil, floor
+from typing import Any, Dict, List, Optional
 from functools import cached_property
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 import requests
@@ -34,9 +36,15 @@ from sdcm.test_config import TestConfig
 from sdcm.utils.common import normalize_ipv6_url
 from sdcm.utils.git import get_git_commit_id
 from sdcm.utils.decorators import retrying
+from sdcm.utils.time_series import TimeSeries
 from sdcm.sct_events.system import ElasticsearchEvent
 from sdcm.utils.ci_tools import get_job_name, get_job_url
 
+PROMETHEUS_QUERY_CONCURRENCY: int = 8
+PROMETHEUS_QUERY_CHUNK_POINTS: int = 120  # long range queries are split to chunks of this number of steps
+PROMETHEUS_QUERY_CACHE_SIZE: int = 1024  # chunks
+PROMETHEUS_QUERY_CACHE_DELAY: int = 120  # seconds; recent chunks can get more samples, so they are not cached
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -55,11 +63,6 @@ class CassandraStressCmdParseError(Exception):
         return self.__str__()
 
 
-def stddev(lst):
-    mean = float(sum(lst)) / len(lst)
-    return sqrt(sum((x - mean)**2 for x in lst) / len(lst))
-
-
 def get_stress_cmd_params(cmd):
     """
     Parsing cassandra stress command
@@ -191,7 +194,52 @@ def get_cdcreader_cmd_params(cmd):
     return get_raw_cmd_params(cmd)
 
 
+_PROMETHEUS_LOCK = threading.Lock()
+_PROMETHEUS_CONFIGS = {}
+_PROMETHEUS_QUERY_CACHE = OrderedDict()
+_PROMETHEUS_HTTP_SESSION = None
+_PROMETHEUS_EXECUTOR = None
+
+
+def get_prometheus_http_session() -> requests.Session:
+    global _PROMETHEUS_HTTP_SESSION  # pylint: disable=global-statement
+    with _PROMETHEUS_LOCK:
+        if _PROMETHEUS_HTTP_SESSION is None:
+            _PROMETHEUS_HTTP_SESSION = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=PROMETHEUS_QUERY_CONCURRENCY)
+            _PROMETHEUS_HTTP_SESSION.mount("http://", adapter)
+        return _PROMETHEUS_HTTP_SESSION
+
+
+def get_prometheus_executor() -> ThreadPoolExecutor:
+    global _PROMETHEUS_EXECUTOR  # pylint: disable=global-statement
+    with _PROMETHEUS_LOCK:
+        if _PROMETHEUS_EXECUTOR is None:
+            _PROMETHEUS_EXECUTOR = ThreadPoolExecutor(max_workers=PROMETHEUS_QUERY_CONCURRENCY,
+                                                      thread_name_prefix="PrometheusQuery")
+        return _PROMETHEUS_EXECUTOR
+
+
+def _reset_prometheus_clients_after_fork() -> None:
+    # Threads of the executor and connections of the session belong to the parent process, create new ones on demand.
+    global _PROMETHEUS_LOCK, _PROMETHEUS_HTTP_SESSION, _PROMETHEUS_EXECUTOR  # pylint: disable=global-statement
+    _PROMETHEUS_LOCK = threading.Lock()
+    _PROMETHEUS_HTTP_SESSION = None
+    _PROMETHEUS_EXECUTOR = None
+
+
+os.register_at_fork(after_in_child=_reset_prometheus_clients_after_fork)
+
+
 class PrometheusDBStats():
+    """Client for Prometheus HTTP API.
+
+    All instances share one HTTP session, so connections are reused.  Configuration of a Prometheus server is
+    fetched once per process.  Range queries are split to step-aligned chunks of `PROMETHEUS_QUERY_CHUNK_POINTS'
+    steps which are fetched concurrently; chunks which are old enough to be complete are cached, so repeated
+    and overlapping queries don't hit the server again.
+    """
+
     def __init__(self, host, port=9090, alternator=None):
         self.host = host
         self.port = port
@@ -206,10 +254,11 @@ class PrometheusDBStats():
     @staticmethod
     @retrying(n=5, sleep_time=7, allowed_exceptions=(requests.ConnectionError, requests.HTTPError))
     def request(url, post=False):
+        session = get_prometheus_http_session()
         if post:
-            response = requests.post(url)
+            response = session.post(url)
         else:
-            response = requests.get(url)
+            response = session.get(url)
         response.raise_for_status()
 
         result = json.loads(response.content)
@@ -221,6 +270,9 @@ class PrometheusDBStats():
         return None
 
     def get_configuration(self):
+        with _PROMETHEUS_LOCK:
+            if configs := _PROMETHEUS_CONFIGS.get((self.host, self.port)):
+                return configs
         result = self.request(url="http://{}:{}/api/v1/status/config".format(normalize_ipv6_url(self.host), self.port))
         configs = yaml.safe_load(result["data"]["yaml"])
         LOGGER.debug("Parsed Prometheus configs: %s", configs)
@@ -228,6 +280,8 @@ class PrometheusDBStats():
         for conf in configs["scrape_configs"]:
             new_scrape_configs[conf["job_name"]] = conf
         configs["scrape_configs"] = new_scrape_configs
+        with _PROMETHEUS_LOCK:
+            _PROMETHEUS_CONFIGS[(self.host, self.port)] = configs
         return configs
 
     def query(self, query, start, end, scrap_metrics_step=None):
@@ -240,19 +294,94 @@ class PrometheusDBStats():
                   metric: { },
                   values: [[linux_timestamp1, value1], [linux_timestamp2, value2]...[linux_timestampN, valueN]]
                  }
+
+        If `start', `end' and `scrap_metrics_step' are numbers, values are evaluated at timestamps which are
+        multiples of the step, so results of overlapping queries can be reused.
         """
-        url = "http://{}:{}/api/v1/query_range?query=".format(normalize_ipv6_url(self.host), self.port)
         if not scrap_metrics_step:
             scrap_metrics_step = self.scylla_scrape_interval
-        _query = "{url}{query}&start={start}&end={end}&step={scrap_metrics_step}".format(
-            url=url, query=query, start=start, end=end, scrap_metrics_step=scrap_metrics_step)
-        LOGGER.debug("Query to PrometheusDB: %s", _query)
-        result = self.request(url=_query)
-        if result:
-            return result["data"]["result"]
+        try:
+            start, end, step = float(start), float(end), int(scrap_metrics_step)
+        except (TypeError, ValueError):  # e.g., RFC 3339 timestamps or a step with units
+            results = [self._query_range(query, start, end, scrap_metrics_step)]
         else:
+            results = self._query_chunks(query, start, end, step)
+        if any(result is None for result in results):
             LOGGER.error("Prometheus query unsuccessful!")
             return []
+        if len(results) == 1:
+            return results[0]
+
+        series = {}
+        for result in results:
+            for item in result:
+                key = tuple(sorted(item["metric"].items()))
+                if key not in series:
+                    series[key] = {"metric": item["metric"], "values": []}
+                series[key]["values"].extend(item["values"])
+        return list(series.values())
+
+    def _query_chunks(self, query, start: float, end: float, step: int) -> List[Optional[List[dict]]]:
+        first, last = ceil(start / step) * step, floor(end / step) * step
+        if last < first:
+            return [[]]
+
+        span = step * PROMETHEUS_QUERY_CHUNK_POINTS
+        cacheable_until = time.time() - PROMETHEUS_QUERY_CACHE_DELAY
+        chunks = [(chunk_start, chunk_start + span - step)
+                  for chunk_start in range(first - first % span, last + 1, span)]
+
+        def query_chunk(chunk):
+            chunk_start, chunk_end = chunk
+            if chunk_end > cacheable_until:
+                return self._query_range(query, max(chunk_start, first), min(chunk_end, last), step)
+            if (result := self._query_cached_chunk(query, chunk_start, chunk_end, step)) is None:
+                return None
+            if first <= chunk_start and chunk_end <= last:
+                return result
+            return [{"metric": item["metric"], "values": values} for item in result
+                    if (values := [value for value in item["values"] if first <= value[0] <= last])]
+
+        if len(chunks) == 1:
+            return [query_chunk(chunks[0])]
+        return list(get_prometheus_executor().map(query_chunk, chunks))
+
+    def query_many(self, queries: Dict[Any, str], start, end, scrap_metrics_step=None) -> Dict[Any, List[dict]]:
+        """Run independent range queries concurrently and return results by the same keys as in `queries'."""
+        if not queries:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(queries), PROMETHEUS_QUERY_CONCURRENCY)) as executor:
+            futures = {name: executor.submit(self.query, query, start, end, scrap_metrics_step)
+                       for name, query in queries.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _query_range(self, query, start, end, step) -> Optional[List[dict]]:
+        _query = "{url}{query}&start={start}&end={end}&step={step}".format(
+            url=self.range_query_url, query=query, start=start, end=end, step=step)
+        LOGGER.debug("Query to PrometheusDB: %s", _query)
+        result = self.request(url=_query)
+        return result["data"]["result"] if result else None
+
+    def _query_cached_chunk(self, query, start, end, step) -> Optional[List[dict]]:
+        key = (self.host, self.port, query, step, start)
+        with _PROMETHEUS_LOCK:
+            if (result := _PROMETHEUS_QUERY_CACHE.get(key)) is not None:
+                _PROMETHEUS_QUERY_CACHE.move_to_end(key)
+                return self._copy_result(result)
+        result = self._query_range(query, start, end, step)
+        if result is None:
+            return None
+        with _PROMETHEUS_LOCK:
+            _PROMETHEUS_QUERY_CACHE[key] = result
+            while len(_PROMETHEUS_QUERY_CACHE) > PROMETHEUS_QUERY_CACHE_SIZE:
+                _PROMETHEUS_QUERY_CACHE.popitem(last=False)
+        return self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result: List[dict]) -> List[dict]:
+        """Callers get their own copy of a cached result, so they can't change it for others."""
+        return [{"metric": dict(item["metric"]), "values": [list(value) for value in item["values"]]}
+                for item in result]
 
     @staticmethod
     def _check_start_end_time(start_time, end_time):
@@ -294,9 +423,8 @@ class PrometheusDBStats():
             return []
         query = "avg(scylla_reactor_utilization{})"
         res = self._get_query_values(query, start_time, end_time, scrap_metrics_step=scrap_metrics_step)
-        if res:
-            res = [float(value[1]) for value in res]
-            return sum(res) / len(res)
+        if res and (utilization := TimeSeries.from_values(res)):
+            return utilization.mean()
         else:
             return res
 
@@ -338,11 +466,7 @@ class PrometheusDBStats():
         query = """sum(irate(scylla_storage_proxy_replica_cross_shard_ops{instance=~".+[0-9]{1,3}.[0-9]{1,3}.[0-9]{1,3}.[0-9]{1,3}.+",shard=~"[0-9]+"}[1m])) by (dc)"""  # pylint: disable=line-too-long
         query = urllib.parse.quote(query)
         results = self.query(query, start_time, end_time)
-        cross_shards_ops_per_node_shard_by_dc = []
-        for res in results:
-            cross_shards_ops_per_node_shard_by_dc.extend([float(v) for _, v in res["values"]])
-
-        return cross_shards_ops_per_node_shard_by_dc
+        return list(TimeSeries.from_prometheus(results).values)
 
     def get_latency(self, start_time, end_time, latency_type, scrap_metrics_step=None):
         """latency values are returned in microseconds"""
@@ -618,13 +742,13 @@ class TestStatsMixin(Stats):
                 self.log.error("Not enough data from Prometheus: %s" % ps_results)
                 return {}
             stat = {}
-            ops_per_sec = [float(val) for _, val in ps_results if val.lower() != "nan"]  # float("nan") is not a number
-            stat["max"] = max(ops_per_sec)
+            ops_per_sec = TimeSeries.from_values(ps_results)  # NaN values are dropped
+            stat["max"] = ops_per_sec.max()
             # filter all values that are less than 1% of max
-            ops_filtered = [x for x in ops_per_sec if x >= stat["max"] * 0.01]
-            stat["min"] = min(ops_filtered)
-            stat["avg"] = float(sum(ops_filtered)) / len(ops_filtered)
-            stat["stdev"] = stddev(ops_filtered)
+            ops_filtered = ops_per_sec.filtered(min_value=stat["max"] * 0.01)
+            stat["min"] = ops_filtered.min()
+            stat["avg"] = ops_filtered.mean()
+            stat["stdev"] = ops_filtered.stdev()
             self.log.debug("Stats: %s", stat)
             return stat
         except Exception as ex:  # pylint: disable=broad-except
@@ -639,11 +763,11 @@ class TestStatsMixin(Stats):
         offset = 120  # 2 minutes offset
         start = int(self._stats["test_details"]["start_time"] + offset)
         end = int(time.time() - offset)
-        prometheus_stats = {}
-        for stat in self.PROMETHEUS_STATS:
-            stat_calc_func = getattr(prometheus_db_stats, "get_" + stat)
-            prometheus_stats[stat] = self._calc_stats(ps_results=stat_calc_func(start_time=start, end_time=end,
-                                                                                scrap_metrics_step=scrap_metrics_step))
+        with ThreadPoolExecutor(max_workers=len(self.PROMETHEUS_STATS)) as executor:
+            futures = {stat: executor.submit(getattr(prometheus_db_stats, "get_" + stat),
+                                             start_time=start, end_time=end, scrap_metrics_step=scrap_metrics_step)
+                       for stat in self.PROMETHEUS_STATS}
+        prometheus_stats = {stat: self._calc_stats(ps_results=future.result()) for stat, future in futures.items()}
         self._stats['results'].update(prometheus_stats)
         return prometheus_stats
 
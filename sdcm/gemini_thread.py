@@ -21,7 +21,7 @@ import time
 
 from sdcm.sct_events import Severity
 from sdcm.utils.common import FileFollowerThread
-from sdcm.sct_events.loaders import GeminiStressEvent, GeminiStressLogEvent
+from sdcm.sct_events.loaders import GeminiStressEvent, get_gemini_log_classifier
 
 
 LOGGER = logging.getLogger(__name__)
@@ -41,17 +41,19 @@ class GeminiEventsPublisher(FileFollowerThread):
         self.node = str(node)
         self.verbose = verbose
         self.event_id = event_id
+        self.log_classifier = get_gemini_log_classifier(verbose=verbose)
 
     def run(self):
         while not self.stopped():
             if not os.path.isfile(self.gemini_log_filename):
                 time.sleep(0.5)
                 continue
-            for line_number, line in enumerate(self.follow_file(self.gemini_log_filename), start=1):
-                gemini_event = GeminiStressLogEvent.GeminiEvent(verbose=self.verbose)
-                gemini_event.add_info(node=self.node, line=line, line_number=line_number)
-                gemini_event.event_id = self.event_id
-                gemini_event.publish(warn_not_ready=False)
+            line_number = 1
+            for lines in self.follow_file(self.gemini_log_filename).batches():
+                for gemini_event in self.log_classifier.events(lines, node=self.node, start_line_number=line_number):
+                    gemini_event.event_id = self.event_id
+                    gemini_event.publish(warn_not_ready=False)
+                line_number += len(lines)
 
                 if self.stopped():
                     break
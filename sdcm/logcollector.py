@@ -22,6 +22,7 @@ import datetime
 import tarfile
 import tempfile
 import traceback
+import subprocess
 from collections import OrderedDict
 from typing import Optional
 from pathlib import Path
@@ -33,7 +34,7 @@ import sdcm.monitorstack.ui as monitoring_ui
 from sdcm.paths import SCYLLA_YAML_PATH, SCYLLA_PROPERTIES_PATH
 from sdcm.provision import provisioner_factory
 from sdcm.provision.provisioner import ProvisionerError
-from sdcm.remote import RemoteCmdRunnerBase, LocalCmdRunner
+from sdcm.remote import RemoteCmdRunnerBase, LocalCmdRunner, OutputRetention
 from sdcm.db_stats import PrometheusDBStats
 from sdcm.utils.common import (
     S3Storage,
@@ -55,6 +56,22 @@ from sdcm.utils.docker_utils import get_docker_bridge_gateway
 from sdcm.utils.get_username import get_username
 from sdcm.utils.remotewebbrowser import RemoteBrowser, WebDriverContainerMixin
 
+# Max number of nodes to collect logs from at the same time.
+LOG_COLLECTION_CONCURRENCY: int = 32
+LOG_COLLECTION_CONCURRENCY_PER_BACKEND: dict[str, int] = {
+    "docker": 4,  # all nodes share the host with the runner
+    "k8s-local-kind": 4,
+    "k8s-local-kind-aws": 4,
+    "k8s-local-kind-gce": 4,
+}
+
+# Compressors to archive logs on nodes, in order of preference: (command, archive extension).
+NODE_LOG_COMPRESSORS: tuple[tuple[str, str], ...] = (
+    ("zstd -q -T0", "tar.zst"),
+    ("pigz", "tar.gz"),
+    ("gzip", "tar.gz"),
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -106,6 +123,14 @@ class BaseLogEntity:  # pylint: disable=too-few-public-methods
     def collect(self, node, local_dst, remote_dst=None, local_search_path=None):  # pylint: disable=unused-argument,no-self-use
         raise Exception('Should be implemented in child class')
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        """Collect the log, but leave files created in `remote_dst' on the node and return their paths.
+
+        Used to receive all files from the node at once.  By default, it's the same as `collect()'.
+        """
+        self.collect(node, local_dst, remote_dst, local_search_path=local_search_path)
+        return []
+
 
 class BaseMonitoringEntity(BaseLogEntity):
     def get_monitoring_base_dir(self, node):
@@ -164,18 +189,26 @@ class CommandLog(BaseLogEntity):  # pylint: disable=too-few-public-methods
         BaseLogEntity
     """
 
-    def collect(self, node, local_dst, remote_dst=None, local_search_path=None) -> Optional[str]:
+    def _collect_remotely(self, node, remote_dst) -> Optional[str]:
         if not node or not node.remoter or remote_dst is None:
             return None
-        remote_logfile = LogCollector.collect_log_remotely(node=node,
-                                                           cmd=self.cmd,
-                                                           log_filename=os.path.join(remote_dst, self.name))
+        return LogCollector.collect_log_remotely(node=node,
+                                                 cmd=self.cmd,
+                                                 log_filename=os.path.join(remote_dst, self.name))
+
+    def collect(self, node, local_dst, remote_dst=None, local_search_path=None) -> Optional[str]:
+        if not (remote_logfile := self._collect_remotely(node, remote_dst)):
+            return None
         LogCollector.receive_log(node=node,
                                  remote_log_path=remote_logfile,
                                  local_dir=local_dst,
                                  timeout=self.collect_timeout)
         return os.path.join(local_dst, os.path.basename(remote_logfile))
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        remote_logfile = self._collect_remotely(node, remote_dst)
+        return [remote_logfile] if remote_logfile else []
+
 
 class FileLog(CommandLog):
     """Log File Entinty
@@ -218,7 +251,7 @@ class FileLog(CommandLog):
                 return True
         return False
 
-    def collect(self, node, local_dst, remote_dst=None, local_search_path=None):
+    def _collect_locally(self, node, local_dst, local_search_path):
         os.makedirs(local_dst, exist_ok=True)
         if self.search_locally and local_search_path:
             search_pattern = self.name if not node else "/".join([node.name, self.name])
@@ -226,11 +259,19 @@ class FileLog(CommandLog):
             for logfile in local_logfiles:
                 shutil.copy(src=logfile, dst=local_dst)
 
+    def collect(self, node, local_dst, remote_dst=None, local_search_path=None):
+        self._collect_locally(node, local_dst, local_search_path)
         if self.cmd and not self._is_file_collected(local_dst):
             super().collect(node, local_dst, remote_dst)
 
         return local_dst
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        self._collect_locally(node, local_dst, local_search_path)
+        if self.cmd and not self._is_file_collected(local_dst):
+            return super().collect_on_node(node, local_dst, remote_dst)
+        return []
+
     def collect_from_builder(self, builder, local_dst, search_in_dir) -> None:
         if file_path := self.find_on_builder(builder, self.name, search_in_dir):
             builder.remoter.receive_files(file_path, local_dst, timeout=self.collect_timeout)
@@ -261,6 +302,10 @@ class DirLog(FileLog):
                 dst_logfiles.append(str(current_dst))
         return dst_logfiles
 
+    def collect_on_node(self, node, local_dst, remote_dst=None, local_search_path=None) -> list[str]:
+        self.collect(node, local_dst, remote_dst, local_search_path=local_search_path)
+        return []
+
     def collect_from_builder(self, builder, local_dst, search_in_dir) -> None:
         # TODO: implement it to be able to gather whole dirs on remote nodes
         LOGGER.warning(
@@ -680,6 +725,43 @@ class LogCollector:
             return None
         return archive_name
 
+    @staticmethod
+    def archive_dir_remotely(node, remote_dir: str, remote_logfiles: list[str]) -> Optional[str]:
+        """Compress `remote_logfiles' from `remote_dir' on the node using the fastest available compressor.
+
+        Paths in the archive are relative to `remote_dir'.  Return the archive path.
+        """
+        if not node.remoter:
+            return None
+        remote_dir = remote_dir.rstrip("/")
+        file_names = " ".join(f"'{os.path.relpath(path, remote_dir)}'" for path in remote_logfiles)
+        for command, extension in NODE_LOG_COMPRESSORS:
+            # The archive is extracted on the runner, so it should be able to decompress it too.
+            if extension == "tar.zst" and not shutil.which("zstd"):
+                continue
+            if not node.remoter.run(f"command -v {command.split()[0]}", ignore_status=True).ok:
+                continue
+            archive_name = f"{remote_dir}.{extension}"
+            node.remoter.run(f"tar -cf - -C '{remote_dir}' {file_names} | {command} > '{archive_name}'",
+                             ignore_status=True, timeout=600)
+            if check_archive(node.remoter, archive_name):
+                return archive_name
+            break
+        LOGGER.error("Unable to archive `%s' on %s", remote_dir, node.name)
+        return None
+
+    @staticmethod
+    def receive_archive(node, remote_archive: str, local_dir: str, timeout: int = 300) -> None:
+        """Receive an archive created by `archive_dir_remotely()', remove it from the node and extract to `local_dir'.
+
+        If the archive can't be extracted, it's left in `local_dir' as is.
+        """
+        LogCollector.receive_log(node, remote_archive, local_dir, timeout=timeout)
+        node.remoter.run(f"rm -f '{remote_archive}'", ignore_status=True)
+        local_archive = os.path.join(local_dir, os.path.basename(remote_archive))
+        if extract_archive(local_archive, local_dir):
+            os.remove(local_archive)
+
     @staticmethod
     def receive_log(node, remote_log_path, local_dir, timeout=300):
         os.makedirs(local_dir, exist_ok=True)
@@ -689,16 +771,41 @@ class LogCollector:
                                        timeout=timeout)
         return local_dir
 
+    @property
+    def collection_concurrency(self) -> int:
+        backend = self.params.get("cluster_backend") if self.params else None
+        return LOG_COLLECTION_CONCURRENCY_PER_BACKEND.get(backend, LOG_COLLECTION_CONCURRENCY)
+
     def collect_logs(self, local_search_path: Optional[str] = None) -> list[str]:
         def collect_logs_per_node(node):
             LOGGER.info('Collecting logs on host: %s', node.name)
             remote_node_dir = self.create_remote_storage_dir(node)
             local_node_dir = os.path.join(self.local_dir, node.name)
+            remote_logfiles = []
             for log_entity in self.log_entities:
                 try:
-                    log_entity.collect(node, local_node_dir, remote_node_dir, local_search_path=local_search_path)
+                    remote_logfiles.extend(log_entity.collect_on_node(
+                        node, local_node_dir, remote_node_dir, local_search_path=local_search_path))
                 except Exception as details:  # pylint: disable=unused-variable, broad-except
                     LOGGER.error("Error occured during collecting on host: %s\n%s", node.name, details)
+            if not remote_logfiles:
+                return
+
+            # Logs compress well, so compress them on the node (all nodes do it in parallel) and receive one file.
+            if remote_node_dir != self.node_remote_dir and \
+                    (archive := self.archive_dir_remotely(node, remote_node_dir, remote_logfiles)):
+                try:
+                    self.receive_archive(node, archive, local_node_dir, timeout=self.collect_timeout)
+                    return
+                except Exception as details:  # pylint: disable=broad-except
+                    LOGGER.error("Error occured during receiving %s from host: %s\n%s",
+                                 archive, node.name, details)
+            for remote_logfile in remote_logfiles:
+                try:
+                    self.receive_log(node, remote_logfile, local_node_dir, timeout=self.collect_timeout)
+                except Exception as details:  # pylint: disable=broad-except
+                    LOGGER.error("Error occured during receiving %s from host: %s\n%s",
+                                 remote_logfile, node.name, details)
 
         LOGGER.debug("Nodes list %s", [node.name for node in self.nodes])
 
@@ -707,8 +814,7 @@ class LogCollector:
             return []
         if self.nodes:
             try:
-                workers_number = int(len(self.nodes) / 2)
-                workers_number = len(self.nodes) if workers_number < 2 else workers_number
+                workers_number = min(len(self.nodes), self.collection_concurrency)
                 ParallelObject(self.nodes, num_workers=workers_number, timeout=self.collect_timeout).run(
                     collect_logs_per_node, ignore_exceptions=True)
             except Exception as details:  # pylint: disable=broad-except
@@ -718,12 +824,9 @@ class LogCollector:
             LOGGER.warning('Directory %s is empty', self.local_dir)
             return []
 
-        final_archive = self.archive_to_tarfile(self.local_dir)
-        if not final_archive:
+        if not (s3_link := stream_archive_to_s3(self.local_dir, f"{self.test_id}/{self.current_run}")):
             return []
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
         remove_files(self.local_dir)
-        remove_files(final_archive)
         return [s3_link]
 
     def collect_logs_for_inactive_nodes(self, local_search_path=None):
@@ -984,11 +1087,9 @@ class SCTLogCollector(LogCollector):
         return self.get_files_size() < 3*1024*1024*1024
 
     def create_single_archive_and_upload(self) -> list[str]:
-        final_archive = self.archive_to_tarfile(self.local_dir)
-
-        s3_link = upload_archive_to_s3(final_archive, f"{self.test_id}/{self.current_run}")
+        if not (s3_link := stream_archive_to_s3(self.local_dir, f"{self.test_id}/{self.current_run}")):
+            return []
         remove_files(self.local_dir)
-        remove_files(final_archive)
         return [s3_link]
 
     def create_archive_per_file_and_upload(self) -> list[str]:
@@ -1427,11 +1528,14 @@ def check_archive(remoter, path: str) -> bool:
 
     if path.endswith(".tar.gz"):
         cmd = f"tar tzf '{path}'"
+    elif path.endswith(".tar.zst"):
+        cmd = f"zstd -dcq '{path}' | tar tf -"
     elif path.endswith(".zip"):
         cmd = f"unzip -qql '{path}'"
     else:
         raise ValueError(f"Unsupported archive type: {path}")
-    result = remoter.run(cmd, ignore_status=True)
+    # Listing of a big archive is long and only a non-empty output is needed.
+    result = remoter.run(cmd, ignore_status=True, retention=OutputRetention())
     archive_is_ok = result.ok and bool(result.stdout.strip())
     if not archive_is_ok:
         LOGGER.error("Archive `%s' is corrupted: `%s' returns %d\n-- STDOUT: --\n%s\n\n-- STDERR: --\n%s",
@@ -1445,3 +1549,49 @@ def upload_archive_to_s3(archive_path: str, storing_path: str) -> Optional[str]:
         LOGGER.error("File `%s' will not be uploaded", archive_path)
         return None
     return S3Storage().upload_file(file_path=archive_path, dest_dir=storing_path)
+
+
+def extract_archive(path: str, dst_dir: str) -> bool:
+    """Extract .tar.gz or .tar.zst archive to `dst_dir'."""
+    try:
+        if path.endswith(".tar.zst"):
+            with subprocess.Popen(["zstd", "-dcq", path], stdout=subprocess.PIPE) as zstd, \
+                    tarfile.open(fileobj=zstd.stdout, mode="r|") as tar:
+                tar.extractall(dst_dir)
+            if zstd.returncode:
+                raise OSError(f"zstd returned {zstd.returncode}")
+        else:
+            with tarfile.open(path, mode="r:gz") as tar:
+                tar.extractall(dst_dir)
+    except (OSError, tarfile.TarError) as exc:
+        LOGGER.error("Unable to extract `%s': %s", path, exc)
+        return False
+    return True
+
+
+def stream_archive_to_s3(src_path: str, storing_path: str) -> Optional[str]:
+    """Archive `src_path' to .tar.gz and upload it to S3 on the fly, without writing the archive to the disk.
+
+    `pigz' is used to compress the archive if available.  The upload runs while the archive is being created, so
+    if tar or the compressor failed, the uploaded (truncated) archive is deleted.
+    """
+    src_dir, src_name = os.path.split(os.path.normpath(src_path))
+    file_name = f"{src_name}.tar.gz"
+    s3_storage = S3Storage()
+    compressor = "pigz" if shutil.which("pigz") else "gzip"
+    with subprocess.Popen(["tar", "-cf", "-", "-C", src_dir, src_name], stdout=subprocess.PIPE) as tar, \
+            subprocess.Popen([compressor, "-c"], stdin=tar.stdout, stdout=subprocess.PIPE) as gzip:
+        tar.stdout.close()  # the compressor owns the pipe now
+        try:
+            s3_link = s3_storage.upload_fileobj(fileobj=gzip.stdout, file_name=file_name, dest_dir=storing_path)
+        finally:
+            gzip.stdout.close()  # stop the pipeline if the upload failed in the middle
+    if not s3_link:
+        return None
+    # tar exits with 1 if some files were changed while being archived, it's fine for logs.
+    if tar.returncode not in (0, 1) or gzip.returncode:
+        LOGGER.error("Unable to archive `%s': tar returned %s, %s returned %s",
+                     src_path, tar.returncode, compressor, gzip.returncode)
+        s3_storage.delete_file(file_name=file_name, dest_dir=storing_path)
+        return None
+    return s3_link
@@ -19,7 +19,7 @@ import uuid
 from typing import Any
 
 from sdcm.prometheus import nemesis_metrics_obj
-from sdcm.sct_events.loaders import NdBenchStressEvent, NDBENCH_ERROR_EVENTS_PATTERNS
+from sdcm.sct_events.loaders import NdBenchStressEvent, NDBENCH_LOG_CLASSIFIER
 from sdcm.utils.common import FileFollowerThread
 from sdcm.utils.docker_remote import RemoteDocker
 from sdcm.stress_thread import format_stress_cmd_error, DockerBasedStressThread
@@ -42,18 +42,15 @@ class NdBenchStressEventsPublisher(FileFollowerThread):
                 time.sleep(0.5)
                 continue
 
-            for line_number, line in enumerate(self.follow_file(self.ndbench_log_filename)):
+            line_number = 0
+            for lines in self.follow_file(self.ndbench_log_filename).batches():
                 if self.stopped():
                     break
 
-                for pattern, event in NDBENCH_ERROR_EVENTS_PATTERNS:
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
-                        break  # Stop iterating patterns to avoid creating two events for one line of the log
+                for event in NDBENCH_LOG_CLASSIFIER.events(lines, node=self.node, event_id=self.event_id,
+                                                           start_line_number=line_number):
+                    event.publish()
+                line_number += len(lines)
 
 
 class NdBenchStatsPublisher(FileFollowerThread):
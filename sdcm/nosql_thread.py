@@ -20,7 +20,7 @@ import threading
 from sdcm.cluster import BaseNode
 from sdcm.sct_events import Severity
 from sdcm.stress_thread import format_stress_cmd_error, DockerBasedStressThread
-from sdcm.sct_events.loaders import NoSQLBenchStressEvent, NOSQLBENCH_EVENT_PATTERNS
+from sdcm.sct_events.loaders import NoSQLBenchStressEvent, NOSQLBENCH_LOG_CLASSIFIER
 from sdcm.utils.common import FileFollowerThread
 
 LOGGER = logging.getLogger(__name__)
@@ -38,13 +38,14 @@ class NoSQLBenchEventsPublisher(FileFollowerThread):
                 time.sleep(0.5)
                 continue
 
-            for line_number, line in enumerate(self.follow_file(self.nb_log_filename)):
+            line_number = 0
+            for lines in self.follow_file(self.nb_log_filename).batches():
                 if self.stopped():
                     break
 
-                for pattern, event in NOSQLBENCH_EVENT_PATTERNS:
-                    if pattern.search(line):
-                        event.clone().add_info(node=self.node, line=line, line_number=line_number).publish()
+                for event in NOSQLBENCH_LOG_CLASSIFIER.events(lines, node=self.node, start_line_number=line_number):
+                    event.publish()
+                line_number += len(lines)
 
 
 class NoSQLBenchStressThread(DockerBasedStressThread):  # pylint: disable=too-many-instance-attributes
@@ -19,8 +19,9 @@ import sys
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from jinja2 import Environment, FileSystemLoader
 
 
@@ -94,6 +95,7 @@ class Event:
         return timestamp * 1000 if timestamp else timestamp
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _parse_node_name(name_to_parse: str | None) -> tuple[str, str] | tuple[None, None]:
         """
         The node names may look like this
@@ -149,18 +151,248 @@ class Event:
         return label_string
 
 
+# Events of one chart label which have the same value and are closer than the merge gap are merged into one segment
+# while the file is read.  When a label has too many segments, the merge gap grows until the segments fit, and if
+# there are still too many of them (e.g., all values are different), segments are merged into equal time buckets.
+SEGMENTS_MERGE_GAP_MS: int = 1000
+MAX_SEGMENTS_PER_LABEL: int = 1000
+MIN_SEGMENTS_PER_LABEL: int = 50
+MAX_CHART_SEGMENTS: int = 100_000
+MAX_TRACKED_VALUES: int = 64
+
+# Continuous events without `end' record last till the end of the test.
+ENDLESS_EVENTS_TILL_TEST_END = ("ScyllaServerStatusEvent", "JMXServiceEvent", )
+
+EVENT_GROUP_BY_BASE: dict[str, EventGroup] = {base: group for group in EventGroup for base in group.value}
+
+
+def merge_segments(segments: list[list], gap: float) -> list[list]:
+    """Merge segments [begin, end, val, merged] sorted by begin which have the same value and are closer than `gap'."""
+    merged = []
+    last = {}
+    for segment in segments:
+        if (prev := last.get(segment[2])) is not None and segment[0] <= prev[1] + gap:
+            prev[1] = max(prev[1], segment[1])
+            prev[3] += segment[3]
+        else:
+            last[segment[2]] = segment = list(segment)
+            merged.append(segment)
+    return merged
+
+
+def merge_segments_into_buckets(segments: list[list], width: float) -> list[list]:
+    """Merge segments sorted by begin into time buckets of `width' regardless of their values.
+
+    A merged segment keeps the value of the first one and `merged' counts segments with other values.
+    """
+    merged = []
+    start = segments[0][0] if segments else 0
+    bucket = None
+    for segment in segments:
+        if merged and (segment[0] - start) // width == bucket:
+            prev = merged[-1]
+            prev[1] = max(prev[1], segment[1])
+            prev[3] += segment[3] + (prev[2] != segment[2])
+        else:
+            bucket = (segment[0] - start) // width
+            merged.append(list(segment))
+    return merged
+
+
+class TimelineLabel:
+    """Segments of one chart label (one line of the chart.)"""
+
+    __slots__ = ("label", "sort_key", "segments", "merge_gap", "max_segments", "_last", )
+
+    def __init__(self, label: str, sort_key: tuple, merge_gap: float, max_segments: int):
+        self.label = label
+        self.sort_key = sort_key
+        self.segments = []
+        self.merge_gap = merge_gap
+        self.max_segments = max_segments
+        self._last = {}  # the last segment for every value
+
+    def add(self, begin: float, end: float, val: str) -> None:
+        if (last := self._last.get(val)) is not None \
+                and begin <= last[1] + self.merge_gap and end >= last[0] - self.merge_gap:
+            last[0], last[1] = min(last[0], begin), max(last[1], end)
+            return
+        if len(self._last) >= MAX_TRACKED_VALUES:
+            self._last.clear()
+        self._last[val] = segment = [begin, end, val, 0]
+        self.segments.append(segment)
+        if len(self.segments) > 2 * self.max_segments:
+            self.compact(max_segments=self.max_segments)
+
+    def compact(self, max_segments: int) -> None:
+        """Merge segments with increasing merge gap until there are not more than `max_segments'."""
+        self._last.clear()
+        if len(self.segments) <= max_segments:
+            return
+        self.segments.sort(key=itemgetter(0))
+        span = max(segment[1] for segment in self.segments) - self.segments[0][0]
+        self.merge_gap = max(self.merge_gap, span / max_segments)
+        while True:
+            self.segments = merge_segments(self.segments, gap=self.merge_gap)
+            if len(self.segments) <= max_segments or self.merge_gap >= span:
+                break
+            self.merge_gap *= 2
+        if len(self.segments) > max_segments:
+            self.segments = merge_segments_into_buckets(self.segments, width=span / max_segments or float("inf"))
+
+    def chart_data(self) -> dict:
+        return {"label": self.label,
+                "data": [{"timeRange": [begin, end], "val": f"{val} and {merged} more" if merged else val}
+                         for begin, end, val, merged in self.segments]}
+
+
+class TimelineGroup:
+    """Chart labels of one group indexed by the label name."""
+
+    __slots__ = ("name", "sort_key", "labels", "stats", )
+
+    def __init__(self, name: str, sort_key: tuple):
+        self.name = name
+        self.sort_key = sort_key
+        self.labels: dict[str, TimelineLabel] = {}
+        self.stats: dict[str, int] = {}
+
+    def add(self, event: Event, sort_key: tuple, merge_gap: float, max_segments: int) -> None:
+        if (label := self.labels.get(event.chart_label)) is None:
+            label = self.labels[event.chart_label] = TimelineLabel(
+                label=event.chart_label, sort_key=sort_key, merge_gap=merge_gap, max_segments=max_segments)
+        elif sort_key < label.sort_key:
+            label.sort_key = sort_key
+        label.add(begin=event.begin_timestamp, end=event.end_timestamp, val=event.chart_value)
+        self.stats[event.base] = self.stats.get(event.base, 0) + 1
+
+    def chart_data(self, max_segments: int) -> dict:
+        labels = sorted(self.labels.values(), key=attrgetter("sort_key"))
+        for label in labels:
+            label.compact(max_segments=max_segments)
+        return {"group": self.name, "data": [label.chart_data() for label in labels]}
+
+
+class TimelineChartBuilder:
+    """Build chart data from a stream of events in one pass.
+
+    Continuous events are paired by `event_id': `begin' record waits for the `end' one and only the latter is added
+    to the chart.  Events with `begin' record only are added by finish() with the evaluated `end_timestamp'.
+    Events are expected in the file order, i.e., `begin' record goes before `end' one.
+    """
+
+    def __init__(self, merge_gap: float = SEGMENTS_MERGE_GAP_MS, max_segments: int = MAX_SEGMENTS_PER_LABEL,
+                 max_chart_segments: int = MAX_CHART_SEGMENTS):
+        self.merge_gap = merge_gap
+        self.max_segments = max_segments
+        self.max_chart_segments = max_chart_segments
+        self.groups: dict[str, TimelineGroup] = {}
+        self.begin_events: dict[str, Event] = {}
+        self.max_end_timestamp = 0
+        self.events_count = 0
+
+    def add(self, event: Event) -> None:
+        self.events_count += 1
+        if event.end_timestamp and event.end_timestamp > self.max_end_timestamp:
+            self.max_end_timestamp = event.end_timestamp
+        if event.base not in EVENT_GROUP_BY_BASE:
+            return
+        # Exclude DisruptionEvents with nemesis=RunUniqueSequence from processing
+        if event.base == "DisruptionEvent" and event.nemesis_name == "RunUniqueSequence":
+            return
+        if not event.begin_timestamp:
+            LOGGER.warning("Empty begin_timestamp for event name=%s, id=%s", event.base, event.event_id)
+        elif not event.end_timestamp and event.period_type == "end":
+            LOGGER.warning("Empty end_timestamp when period_type=end for event name=%s, id=%s", event.base,
+                           event.event_id)
+        elif event.period_type == "begin":
+            self.begin_events[event.event_id] = event
+        else:
+            if event.period_type == "end":
+                self.begin_events.pop(event.event_id, None)
+            self._add_to_group(event)
+
+    def _add_to_group(self, event: Event) -> None:
+        event_group = EVENT_GROUP_BY_BASE[event.base]
+        order = self.events_count
+        if event_group is EventGroup.NODES_RELATED_EVENTS:
+            group_name, group_key = event.node_name, (0, self._node_index(event.node_name))
+            sort_key = (event.base, order)
+        elif event_group is EventGroup.PROMETHEUS_EVENTS:
+            group_name, group_key = "Prometheus events", (1, )
+            sort_key = (event.original_node_name or "", event.alert_name or "", order)
+        elif event_group is EventGroup.SCT_EVENTS:
+            group_name, group_key = "SCT events", (2, )
+            sort_key = (event.base, event.original_node_name or "", event.nemesis_name or "", order)
+        else:
+            group_name, group_key = "Stress events", (3, )
+            sort_key = (event.base, event.original_node_name or "", event.stress_cmd or "", order)
+        if (group := self.groups.get(group_name)) is None:
+            group = self.groups[group_name] = TimelineGroup(name=group_name, sort_key=group_key)
+        group.add(event=event, sort_key=sort_key, merge_gap=self.merge_gap, max_segments=self.max_segments)
+
+    @staticmethod
+    def _node_index(node_name: str | None) -> tuple:
+        # Node names are like `node-3' and are sorted by the number.
+        try:
+            return 0, int(node_name.split("-")[1]), ""
+        except (AttributeError, IndexError, ValueError):
+            return 1, 0, node_name or ""
+
+    def finish(self) -> list[dict]:
+        """Add continuous events which have no `end' record and return the chart data.
+
+        The chart data looks like this:
+        [
+            {group: "group1name",
+             data: [
+                     {label: "label1name",
+                      data: [
+                                {timeRange: [<date>, <date>],
+                                 val: <val: number (continuous dataScale) or string (ordinal dataScale)>},
+                                (...)
+                            ]},
+                     (...)
+                   ]},
+             (...)
+        ]
+        """
+        for event in self.begin_events.values():
+            if event.base in ENDLESS_EVENTS_TILL_TEST_END:
+                event.end_timestamp = self.max_end_timestamp
+            else:
+                event.end_timestamp = event.begin_timestamp
+            self._add_to_group(event)
+        self.begin_events.clear()
+
+        # Share the total segments budget between all labels to keep the HTML report loadable.
+        labels_count = sum(len(group.labels) for group in self.groups.values())
+        max_segments = min(self.max_segments,
+                           max(MIN_SEGMENTS_PER_LABEL, self.max_chart_segments // (labels_count or 1)))
+        chart_data = []
+        for group in sorted(self.groups.values(), key=attrgetter("sort_key")):
+            chart_data.append(group.chart_data(max_segments=max_segments))
+            LOGGER.info("%s data have been prepared. Number of events processed: %s", group.name,
+                        ", ".join(f"{key}={value}" for key, value in group.stats.items()))
+        return chart_data
+
+
 # pylint: disable=too-many-instance-attributes
 class ParallelTimelinesReportGenerator:
-    def __init__(self, events_file):
+    def __init__(self, events_file, merge_gap: float = SEGMENTS_MERGE_GAP_MS,
+                 max_segments: int = MAX_SEGMENTS_PER_LABEL):
         self.events_file = Path(events_file)
         self.test_id = ""
         self.cluster_name = ""
-        self.max_end_timestamp = 0
-        self.events = []
+        self.chart_builder = TimelineChartBuilder(merge_gap=merge_gap, max_segments=max_segments)
         self.chart_data = []
         self.template = "pt_report_template.html"
         self.default_report_file_name = "parallel-timelines-report.html"
 
+    @property
+    def max_end_timestamp(self) -> float:
+        return self.chart_builder.max_end_timestamp
+
     def read_events_file(self) -> None:
         if not self.events_file.exists():
             LOGGER.critical("File \"%s\" not found!", self.events_file)
@@ -169,154 +401,24 @@ class ParallelTimelinesReportGenerator:
         with self.events_file.open(encoding="utf-8") as file:
             for line in file:
                 event = Event(event_dict=json.loads(line))
-                if event.end_timestamp and event.end_timestamp > self.max_end_timestamp:
-                    self.max_end_timestamp = event.end_timestamp
                 if not self.cluster_name and event.cluster_name:
                     self.cluster_name = event.cluster_name
                 # Getting test_id from the line like this "test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"
-                if not self.test_id and event.base == "InfoEvent" and "TEST_START" in event.message:
+                if not self.test_id and event.base == "InfoEvent" and "TEST_START" in (event.message or ""):
                     self.test_id = event.message.split("=")[-1]
-                self.events.append(event)
+                self.chart_builder.add(event)
             LOGGER.info("File \"%s\" has been read successfully. %d rows have been processed.",
-                        self.events_file, len(self.events))
-
-    def prepare_scylla_nodes_event_data(self) -> None:
-        scylla_nodes_events = self._process_raw_data(events_to_process=EventGroup.NODES_RELATED_EVENTS.value)
-        if scylla_nodes_events:
-            LOGGER.info("Preparing Scylla node-related event data...")
-            scylla_nodes_events_sorted = sorted(scylla_nodes_events,
-                                                key=lambda x: (int(x.node_name.split("-")[1]), x.base))
-
-            group_dict = {}
-            stat_dict = {}
-            for event in scylla_nodes_events_sorted:
-                group_dict.setdefault(event.node_name, []).append(event)
-                stat_dict[event.base] = stat_dict.setdefault(event.base, 0) + 1
-
-            for key, value in group_dict.items():
-                self._process_chart_data(event_list=value, group_name=key)
-            stat_string = ', '.join([f"{key}={value}" for key, value in stat_dict.items()])
-            LOGGER.info("All Scylla node-related event data have been successfully prepared")
-            LOGGER.info("Total number of node-related events processed: %s", stat_string)
-
-    def prepare_prometheus_event_data(self) -> None:
-        prometheus_events_data = self._process_raw_data(events_to_process=EventGroup.PROMETHEUS_EVENTS.value)
-        if prometheus_events_data:
-            prometheus_events_data_sorted = sorted(prometheus_events_data, key=lambda x: (x.original_node_name,
-                                                                                          x.alert_name))
-            self._process_chart_data(event_list=prometheus_events_data_sorted, group_name="Prometheus events")
-
-    def prepare_sct_event_data(self) -> None:
-        sct_events_data = self._process_raw_data(events_to_process=EventGroup.SCT_EVENTS.value)
-        if sct_events_data:
-            sct_events_data_sorted = sorted(sct_events_data,
-                                            key=lambda x: (x.base, x.original_node_name, x.nemesis_name))
-            self._process_chart_data(event_list=sct_events_data_sorted, group_name="SCT events")
-
-    def prepare_stress_event_data(self) -> None:
-        stress_events_data = self._process_raw_data(events_to_process=EventGroup.STRESS_EVENTS.value)
-        if stress_events_data:
-            stress_events_data_sorted = sorted(stress_events_data, key=lambda x: (x.base, x.original_node_name,
-                                                                                  x.stress_cmd))
-            self._process_chart_data(event_list=stress_events_data_sorted, group_name="Stress events")
-
-    def _process_chart_data(self, event_list: List[Event], group_name: str) -> None:
-        """
-        The structure of self.chart_data should look like this:
-        [
-            {group: "group1name",
-             data: [
-                     {label: "label1name",
-                      data: [
-                                {timeRange: [<date>, <date>],
-                                 val: <val: number (continuous dataScale) or string (ordinal dataScale)>},
-                                {timeRange: [<date>, <date>],
-                                 val: <val>},
-                                (...)
-                            ]},
-                     {label: "label2name",
-                      data: [...]},
-                     (...)
-                   ]},
-            {group: "group2name",
-             data: [...]},
-             (...)
-        ]
-        Firstly, we create here an appropriate structure of self.chart_data for the given group of events.
-        Then we populate created group structure with events' data by calling append_group_data().
-        """
-        LOGGER.info("Preparing %s data...", group_name)
-        stat_dict = {}
-
-        # Prepare self.chart_data structure. Add new group dictionary.
-        self.chart_data.append({"group": group_name,
-                                "data": []})
-        current_chart_group = self.chart_data[-1]["data"]
-
-        # Fill self.chart_data with data
-        for event in event_list:
-            if event.chart_label not in [item["label"] for item in current_chart_group]:
-                current_chart_group.append({"label": event.chart_label,
-                                            "data": []})
-            self._append_group_data(group_name=group_name,
-                                    event_data=event)
-            stat_dict[event.base] = stat_dict.setdefault(event.base, 0) + 1
-        stat_string = ', '.join([f"{key}={value}" for key, value in stat_dict.items()])
-        LOGGER.info("All %s data have been successfully prepared.", group_name)
-        LOGGER.info("Number of events processed: %s", stat_string)
-
-    def _append_group_data(self, group_name: str, event_data: Event) -> None:
-        group_by_name_list = list(filter(lambda x: x['group'] == group_name, self.chart_data))
-        for data in group_by_name_list[0]["data"]:
-            if event_data.chart_label == data["label"]:
-                data["data"].append({"timeRange": [event_data.begin_timestamp,
-                                                   event_data.end_timestamp],
-                                     "val": event_data.chart_value})
-
-    def _process_raw_data(self, events_to_process: list) -> List[Event]:
-        """
-        Finds continuous events with 'begin' records only and evaluates 'end_timestamp' for them.
-        If continuous event has both 'begin' and 'end' records, then only 'end' record will be processed.
-        """
-        processed_events = []
-        end_event_id_set = set()
-        begin_event_id_set = set()
-        begin_events = []
-        events_string = ', '.join(events_to_process)
-        LOGGER.info("Processing raw data for events: %s.", events_string)
-        selected_events = list(filter(lambda x: x.base in events_to_process, self.events))
-        for event in selected_events:
-            # Exclude DisruptionEvents with nemesis=RunUniqueSequence from processing
-            if event.base == "DisruptionEvent" and event.nemesis_name == "RunUniqueSequence":
-                continue
-            if not event.begin_timestamp:
-                LOGGER.warning("Empty begin_timestamp for event name=%s, id=%s", event.base, event.event_id)
-            elif not event.end_timestamp and event.period_type == 'end':
-                LOGGER.warning("Empty end_timestamp when period_type=end for event name=%s, id=%s", event.base,
-                               event.event_id)
-            # Processing of event records with period_type = None or period_type in ["end", "one-time"]
-            elif event.period_type != "begin":
-                if event.period_type == "end":
-                    end_event_id_set.add(event.event_id)
-                processed_events.append(event)
-            # Save the continuous events with period_type = "begin" and their IDs
-            else:
-                begin_event_id_set.add(event.event_id)
-                begin_events.append(event)
-        # Check if there are event IDs with period_type = "begin" and without period_type = "end"
-        endless_event_id_set = begin_event_id_set.difference(end_event_id_set)
-        if endless_event_id_set:
-            # If endless events exist, evaluate end_timestamp for them
-            endless_events = list(filter(lambda x: x.event_id in endless_event_id_set, begin_events))
-            for event in endless_events:
-                if event.base in ["ScyllaServerStatusEvent", "JMXServiceEvent"]:
-                    event.end_timestamp = self.max_end_timestamp
-                else:
-                    event.end_timestamp = event.begin_timestamp
-                processed_events.append(event)
-        return processed_events
-
-    def create_report_file(self) -> None:
+                        self.events_file, self.chart_builder.events_count)
+
+    def prepare_chart_data(self) -> None:
+        LOGGER.info("Preparing chart data...")
+        self.chart_data = self.chart_builder.finish()
+        LOGGER.info("Chart data have been prepared: %d groups, %d labels, %d segments",
+                    len(self.chart_data),
+                    sum(len(group["data"]) for group in self.chart_data),
+                    sum(len(label["data"]) for group in self.chart_data for label in group["data"]))
+
+    def create_report_file(self) -> Path:
         if self.cluster_name:
             report_file_name = self.cluster_name.replace("-db-cluster", "") + "-" + self.default_report_file_name
         else:
@@ -329,20 +431,16 @@ class ParallelTimelinesReportGenerator:
             label_count += len(group["data"])
         max_height = max_line_height * label_count + 200
         template = env.get_template(self.template)
-        rendered_template = template.render(chart_data=self.chart_data, max_height=max_height,
-                                            max_line_height=max_line_height, test_id=self.test_id,
-                                            cluster_name=self.cluster_name)
         with report_file.open("w", encoding="utf-8") as file:
-            file.write(rendered_template)
+            template.stream(chart_data=self.chart_data, max_height=max_height, max_line_height=max_line_height,
+                            test_id=self.test_id, cluster_name=self.cluster_name).dump(file)
         LOGGER.info("Report file has been successfully created")
+        return report_file
 
-    def generate_full_report(self):
+    def generate_full_report(self) -> Path:
         self.read_events_file()
-        self.prepare_scylla_nodes_event_data()
-        self.prepare_prometheus_event_data()
-        self.prepare_sct_event_data()
-        self.prepare_stress_event_data()
-        self.create_report_file()
+        self.prepare_chart_data()
+        return self.create_report_file()
 
 
 def setup_logging():
@@ -16,12 +16,15 @@ from .remote_cmd_runner import RemoteCmdRunner
 from .remote_libssh_cmd_runner import RemoteLibSSH2CmdRunner
 from .remote_base import RemoteCmdRunnerBase
 from .base import FailuresWatcher, RetryableNetworkException, SSHConnectTimeoutError, shell_script_cmd
+from .fan_out import run_on_nodes, raise_for_failures, NodeCommandResult, RunOnNodesError
+from .libssh2_client.output import OutputSink, OutputRetention
 
 
 __all__ = (
     'LocalCmdRunner', 'RemoteLibSSH2CmdRunner', 'RemoteCmdRunner', 'NETWORK_EXCEPTIONS', 'LOCALRUNNER',
     'RemoteCmdRunnerBase', 'FailuresWatcher', 'RetryableNetworkException', 'SSHConnectTimeoutError',
-    'shell_script_cmd',
+    'shell_script_cmd', 'run_on_nodes', 'raise_for_failures', 'NodeCommandResult', 'RunOnNodesError',
+    'OutputSink', 'OutputRetention',
 )
 
 
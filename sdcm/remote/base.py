@@ -24,6 +24,8 @@ from invoke.watchers import StreamWatcher, Responder
 from invoke.runners import Result
 from fabric import Connection
 
+from .libssh2_client.output import OutputSink, OutputRetention
+
 
 class OutputCheckError(Exception):
     """
@@ -100,7 +102,10 @@ class CommandRunner(metaclass=ABCMeta):
             log_file: Optional[str] = None,
             retry: int = 1,
             watchers: Optional[List[StreamWatcher]] = None,
-            change_context: bool = False
+            change_context: bool = False,
+            stdout_sink: Optional[OutputSink] = None,
+            stderr_sink: Optional[OutputSink] = None,
+            retention: Optional[OutputRetention] = None,
             ) -> Result:
         pass
 
@@ -114,7 +119,10 @@ class CommandRunner(metaclass=ABCMeta):
              log_file: Optional[str] = None,
              retry: int = 1,
              watchers: Optional[List[StreamWatcher]] = None,
-             user: Optional[str] = 'root') -> Result:
+             user: Optional[str] = 'root',
+             stdout_sink: Optional[OutputSink] = None,
+             stderr_sink: Optional[OutputSink] = None,
+             retention: Optional[OutputRetention] = None) -> Result:
         if user != self.user:
             if user == 'root':
                 cmd = f"sudo {cmd}"
@@ -127,12 +135,45 @@ class CommandRunner(metaclass=ABCMeta):
                         new_session=new_session,
                         log_file=log_file,
                         retry=retry,
-                        watchers=watchers)
+                        watchers=watchers,
+                        stdout_sink=stdout_sink,
+                        stderr_sink=stderr_sink,
+                        retention=retention)
 
     @abstractmethod
     def _create_connection(self):
         pass
 
+    @staticmethod
+    def _output_kwargs(stdout_sink: Optional[OutputSink], stderr_sink: Optional[OutputSink],
+                       retention: Optional[OutputRetention]) -> dict:  # pylint: disable=unused-argument
+        """Translate output streaming options to arguments of invoke's `run()'.
+
+        invoke doesn't hide a stream which has `out_stream' / `err_stream' set, but always keeps the whole output
+        in `Result', so `retention' is ignored.
+        """
+        kwargs = {}
+        if stdout_sink is not None:
+            kwargs["out_stream"] = stdout_sink
+        if stderr_sink is not None:
+            kwargs["err_stream"] = stderr_sink
+        return kwargs
+
+    @staticmethod
+    def _sinks_rewinder(*sinks: Optional[OutputSink]) -> Callable[[], None]:
+        """Return a function which drops everything written to seekable `sinks' after this call.
+
+        Called before every run attempt, so sinks get output of the last attempt only if a command is retried.
+        """
+        positions = [(sink, sink.tell()) for sink in set(sinks)
+                     if sink is not None and getattr(sink, "seekable", lambda: False)()]
+
+        def rewind():
+            for sink, position in positions:
+                sink.seek(position)
+                sink.truncate()
+        return rewind
+
     def _print_command_results(self, result: Result, verbose: bool, ignore_status: bool):
         """When verbose=True and ignore_status=True that means nothing will be printed in any case"""
         if verbose and not result.failed:
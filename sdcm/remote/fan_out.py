@@ -0,0 +1,111 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import logging
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from invoke.runners import Result
+
+
+RUN_ON_NODES_CONCURRENCY: int = 16  # commands in flight for one `run_on_nodes()' call
+RUN_ON_NODES_MAX_CONCURRENCY: int = 64  # commands in flight for all `run_on_nodes()' calls in the process
+
+LOGGER = logging.getLogger(__name__)
+
+_GLOBAL_SLOTS = threading.BoundedSemaphore(RUN_ON_NODES_MAX_CONCURRENCY)
+
+
+class NodeCommandResult(NamedTuple):
+    node: Any
+    result: Optional[Result]
+    exc: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        return self.exc is None
+
+
+class RunOnNodesError(Exception):
+    def __init__(self, failed: List[NodeCommandResult], results: List[NodeCommandResult]):
+        super().__init__()
+        self.failed = failed
+        self.results = results
+
+    def __str__(self):
+        errors = "\n".join(f"  {res.node}: ({type(res.exc).__name__}) {res.exc}" for res in self.failed)
+        return f"Command failed on {len(self.failed)} of {len(self.results)} node(s):\n{errors}"
+
+
+def run_on_nodes(nodes: Iterable[Any],  # pylint: disable=too-many-arguments
+                 cmd: Union[str, Callable[[Any], str]],
+                 concurrency: int = RUN_ON_NODES_CONCURRENCY,
+                 timeout: Optional[float] = None,
+                 ignore_status: bool = False,
+                 verbose: bool = False,
+                 sudo: bool = False,
+                 retry: int = 1) -> Iterator[NodeCommandResult]:
+    """Run a command on many nodes in parallel and yield results as soon as they are ready.
+
+    `cmd' can be a command line or a function which returns a command line for a node.  `timeout' is a timeout of
+    the command on every node.  Errors are not raised, but returned as a part of the result; use
+    `raise_for_failures()' to get all results and raise if the command failed on some nodes.
+
+    Not more than `concurrency' commands of this call and `RUN_ON_NODES_MAX_CONCURRENCY' commands of all calls
+    in the process run at the same time.
+
+        >>> for res in run_on_nodes(db_cluster.nodes, "nodetool status", timeout=60):
+        ...     print(res.node.name, res.result.stdout if res.ok else res.exc)
+    """
+    nodes = list(nodes)
+    if not nodes:
+        return
+
+    def run_on_node(node) -> Result:
+        with _GLOBAL_SLOTS:
+            run = node.remoter.sudo if sudo else node.remoter.run
+            return run(cmd(node) if callable(cmd) else cmd,
+                       timeout=timeout, ignore_status=ignore_status, verbose=verbose, retry=retry)
+
+    executor = ThreadPoolExecutor(max_workers=min(concurrency, len(nodes)), thread_name_prefix="RunOnNodes")
+    try:
+        futures = {executor.submit(run_on_node, node): node for node in nodes}
+        for future in as_completed(futures):
+            try:
+                yield NodeCommandResult(node=futures[future], result=future.result(), exc=None)
+            except Exception as exc:  # pylint: disable=broad-except
+                yield NodeCommandResult(node=futures[future], result=None, exc=exc)
+    finally:
+        # Don't start commands on the rest of nodes if a consumer stopped the iteration.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def raise_for_failures(results: Iterable[NodeCommandResult]) -> List[NodeCommandResult]:
+    """Consume all results and raise if the command failed on some nodes.
+
+    If the command failed on one node only, its exception is re-raised as is (e.g., UnexpectedExit), the same way as
+    if the command was run on nodes one by one.  Failures on few nodes are raised as RunOnNodesError chained to the
+    exception of the first failed node.
+    """
+    results = list(results)
+    failed = [res for res in results if not res.ok]
+    if len(failed) == 1:
+        raise failed[0].exc
+    if failed:
+        raise RunOnNodesError(failed=failed, results=results) from failed[0].exc
+    return results
+
+
+__all__ = ("run_on_nodes", "raise_for_failures", "NodeCommandResult", "RunOnNodesError",
+           "RUN_ON_NODES_CONCURRENCY", "RUN_ON_NODES_MAX_CONCURRENCY", )
@@ -138,7 +138,8 @@ class KubernetesCmdRunner(RemoteCmdRunnerBase):
     # pylint: disable=too-many-arguments
     def _run_execute(self, cmd: str, timeout: Optional[float] = None,  # pylint: disable=too-many-arguments
                      ignore_status: bool = False, verbose: bool = True, new_session: bool = False,
-                     watchers: Optional[List[StreamWatcher]] = None):
+                     watchers: Optional[List[StreamWatcher]] = None, stdout_sink=None, stderr_sink=None,
+                     retention=None):
         # TODO: This should be removed than sudo calls will be done in more organized way.
         tmp = cmd.split(maxsplit=3)
         if tmp[0] == 'sudo':
@@ -152,7 +153,8 @@ class KubernetesCmdRunner(RemoteCmdRunnerBase):
                 cmd = cmd[cmd.find('sudo') + 5:]
         # Session should be created for each run
         return super()._run_execute(cmd, timeout=timeout, ignore_status=ignore_status, verbose=verbose,
-                                    new_session=True, watchers=watchers)
+                                    new_session=True, watchers=watchers, stdout_sink=stdout_sink,
+                                    stderr_sink=stderr_sink, retention=retention)
 
     # pylint: disable=too-many-arguments,unused-argument
     @retrying(n=3, sleep_time=5, allowed_exceptions=(RetryableNetworkException, ))
@@ -15,7 +15,6 @@ from typing import List, Optional, Dict
 from time import perf_counter, sleep
 from os.path import normpath, expanduser, exists
 from sys import float_info
-from io import StringIO
 from warnings import warn
 from socket import socket, AF_INET, AF_INET6, SOCK_STREAM, gaierror, gethostbyname, error as sock_error
 from threading import Thread, Lock, Event, BoundedSemaphore
@@ -32,9 +31,12 @@ from .exceptions import AuthenticationException, UnknownHostException, ConnectEr
 from .result import Result
 from .session import Session
 from .timings import Timings, NullableTiming
+from .pool import ConnectionPool, ConnectionPoolStats, DEFAULT_CONNECTION_POOL
+from .output import OutputBuffer, OutputRetention, OutputSink
 
 
-__all__ = ['Session', 'Timings', 'Client', 'Channel', 'FailedToRunCommand']
+__all__ = ['Session', 'Timings', 'Client', 'Channel', 'FailedToRunCommand', 'ConnectionPool', 'ConnectionPoolStats',
+           'DEFAULT_CONNECTION_POOL', 'OutputRetention', 'OutputSink']
 
 
 LINESEP = b'\n'
@@ -50,13 +52,22 @@ class StreamWatcher(ABC):  # pylint: disable=too-few-public-methods
         pass
 
 
+def submit_lines(watchers: List[StreamWatcher], data: str):
+    """Submit a chunk of complete lines to the watchers line by line."""
+    for line in data[:-1].split('\n'):
+        line += '\n'
+        for watcher in watchers:
+            watcher.submit_line(line)
+
+
 class SSHReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
     """
     Thread that reads data from ssh session socket and forwards it to Queue.
     It is needed because socket buffer gets overflowed if data is sent faster than watchers can process it, so
       we have to have Queue as a buffer with 'endless' memory, and fast reader that reads data from the socket
       and forward it to the Queue.
-      As part of this process it splits data into lines, because watchers expect it is organized in this way.
+      As part of this process it cuts data on line boundaries, because watchers expect it is organized in lines:
+      every item put to the Queue is a chunk of one or more complete lines (ends with LINESEP.)
     """
 
     def __init__(self, session: Session, channel: Channel, timeout: NullableTiming, timeout_read_data: NullableTiming):
@@ -82,7 +93,7 @@ class SSHReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
     def _read_output(  # pylint: disable=too-many-arguments,too-many-branches
             self, session: Session, channel: Channel, timeout: NullableTiming, timeout_read_data: NullableTiming,
             stdout_stream: Queue, stderr_stream: Queue):
-        """Reads data from ssh session, split it into lines and forward lines into stderr ad stdout pipes
+        """Reads data from ssh session, cut it on line boundaries and forward chunks into stderr ad stdout pipes
         It is required for it to be fast, that is why there is code duplications and non-pythonic code
         """
         # pylint: disable=too-many-locals
@@ -99,38 +110,34 @@ class SSHReaderThread(Thread):  # pylint: disable=too-many-instance-attributes
             if perf_counter() > end_time:
                 self.timeout_reached = True
                 break
+            if stdout_size == LIBSSH2_ERROR_EAGAIN and stderr_size == LIBSSH2_ERROR_EAGAIN:  # pylint: disable=consider-using-in
+                session.wait_for_data(timeout=timeout_read_data)
             with session.lock:
-                if stdout_size == LIBSSH2_ERROR_EAGAIN and stderr_size == LIBSSH2_ERROR_EAGAIN:  # pylint: disable=consider-using-in
-                    session.simple_select(timeout=timeout_read_data)
                 stdout_size, stdout_chunk = channel.read()
                 stderr_size, stderr_chunk = channel.read_stderr()
                 eof_result = channel.eof()
+            if stdout_size > 0 or stderr_size > 0:
+                session.notify_data()
 
             if stdout_chunk and stdout_stream is not None:
-                data_splitted = stdout_chunk.split(LINESEP)
-                if len(data_splitted) == 1:
-                    stdout_remainder = stdout_remainder + data_splitted.pop()
+                end_of_lines = stdout_chunk.rfind(LINESEP) + 1
+                if end_of_lines:
+                    stdout_stream.put(stdout_remainder + stdout_chunk[:end_of_lines])
+                    stdout_remainder = stdout_chunk[end_of_lines:]
                 else:
-                    if stdout_remainder:
-                        stdout_stream.put(stdout_remainder + data_splitted.pop(0))
-                    stdout_remainder = data_splitted.pop()
-                for chunk in data_splitted:
-                    stdout_stream.put(chunk)
+                    stdout_remainder += stdout_chunk
 
             if stderr_chunk and stderr_stream is not None:
-                data_splitted = stderr_chunk.split(LINESEP)
-                if len(data_splitted) == 1:
-                    stderr_remainder = stderr_remainder + data_splitted.pop()
+                end_of_lines = stderr_chunk.rfind(LINESEP) + 1
+                if end_of_lines:
+                    stderr_stream.put(stderr_remainder + stderr_chunk[:end_of_lines])
+                    stderr_remainder = stderr_chunk[end_of_lines:]
                 else:
-                    if stderr_remainder:
-                        stderr_stream.put(stderr_remainder + data_splitted.pop(0))
-                    stderr_remainder = data_splitted.pop()
-                for chunk in data_splitted:
-                    stderr_stream.put(chunk)
+                    stderr_remainder += stderr_chunk
         if stdout_remainder:
-            stdout_stream.put(stdout_remainder)
+            stdout_stream.put(stdout_remainder + LINESEP)
         if stderr_remainder:
-            stderr_stream.put(stderr_remainder)
+            stderr_stream.put(stderr_remainder + LINESEP)
 
     def stop(self, timeout: float = None):
         self._can_run.clear()
@@ -283,11 +290,13 @@ class Client:  # pylint: disable=too-many-instance-attributes
     keepalive_seconds: int = 60
     timings: Timings = Timings()
     flood_preventing: FloodPreventingFacility = DEFAULT_FLOOD_PREVENTING
+    # If set, commands are run on sessions shared with other clients to the same endpoint
+    pool: Optional[ConnectionPool] = None
 
     def __init__(self, host: str, user: str, password: str = None,  # pylint: disable=too-many-arguments
                  port: int = None, pkey: str = None, allow_agent: bool = None, forward_ssh_agent: bool = None,
                  proxy_host: str = None, keepalive_seconds: int = None, timings: Timings = None,
-                 flood_preventing: FloodPreventingFacility = None):
+                 flood_preventing: FloodPreventingFacility = None, pool: ConnectionPool = None):
         self.host = host
         self.user = user
         if password is not None:
@@ -308,12 +317,22 @@ class Client:  # pylint: disable=too-many-instance-attributes
             self.timings = timings
         if flood_preventing is not None:
             self.flood_preventing = flood_preventing
+        if pool is not None:
+            self.pool = pool
         self.channel_lock = Lock()
         self.session: Optional[Session] = None
         self.sock: Optional[socket] = None
+        self._pool_reconnect_requested = False
+        self._pooled_session = None
 
     def __reduce__(self):
         return self.__class__, (
+            self.host, self.user, self.password, self.port, self.pkey, self.allow_agent, self.forward_ssh_agent,
+            self.proxy_host, self.keepalive_seconds, self.timings, self.flood_preventing, self.pool)
+
+    def unpooled_copy(self) -> 'Client':
+        """Return a client to the same endpoint which owns its own session."""
+        return self.__class__(
             self.host, self.user, self.password, self.port, self.pkey, self.allow_agent, self.forward_ssh_agent,
             self.proxy_host, self.keepalive_seconds, self.timings, self.flood_preventing)
 
@@ -423,13 +442,15 @@ class Client:  # pylint: disable=too-many-instance-attributes
 
     @staticmethod
     def _process_output(  # pylint: disable=too-many-arguments, too-many-branches
-            watchers: List[StreamWatcher], encoding: str, stdout_stream: StringIO, stderr_stream: StringIO,
-            reader: SSHReaderThread, timeout: NullableTiming, timeout_read_data_chunk: NullableTiming):
+            watchers: List[StreamWatcher], encoding: str, stdout_stream: OutputBuffer,
+            stderr_stream: OutputBuffer, reader: SSHReaderThread, timeout: NullableTiming,
+            timeout_read_data_chunk: NullableTiming):
         """Separate different approach for the case when watchers are present, since watchers are slow,
           we can loose data due to the socket buffer limit, if endpoint sending it faster than watchers can read it.
-        To avoid that we run `SSHReaderThread` thread that picks data up from the socket, splits it into lines
+        To avoid that we run `SSHReaderThread` thread that picks data up from the socket, cuts it on line boundaries
         and puts it to stdout and stderr `Queues`.
-        Meanwhile this function reads data from these `Queues` and store them in StringIO and throw it to the watchers
+        Meanwhile this function reads data from these `Queues`, decodes every chunk once, stores it in
+        OutputBuffer and throw it line by line to the watchers
         """
         reader.start()
         if timeout:
@@ -442,29 +463,25 @@ class Client:  # pylint: disable=too-many-instance-attributes
                 return False
             if stdout_stream is not None:
                 try:
-                    stdout = reader.stdout.get(timeout=timeout_read_data_chunk)
-                    data = stdout.decode(encoding) + '\n'
+                    data = reader.stdout.get(timeout=timeout_read_data_chunk).decode(encoding)
                     stdout_stream.write(data)
-                    for watcher in watchers:
-                        watcher.submit_line(data)
+                    submit_lines(watchers, data)
                 except Exception:  # pylint: disable=broad-except
                     pass
             if stderr_stream is not None:
                 if reader.stderr.qsize():
                     try:
-                        stderr = reader.stderr.get(timeout=timeout_read_data_chunk)
-                        data = stderr.decode(encoding) + '\n'
+                        data = reader.stderr.get(timeout=timeout_read_data_chunk).decode(encoding)
                         stderr_stream.write(data)
-                        for watcher in watchers:
-                            watcher.submit_line(data)
+                        submit_lines(watchers, data)
                     except Exception:  # pylint: disable=broad-except
                         pass
         return True
 
     @staticmethod
     def _process_output_no_watchers(  # pylint: disable=too-many-arguments
-            session: Session, channel: Channel, encoding: str, stdout_stream: StringIO,
-            stderr_stream: StringIO, timeout: NullableTiming, timeout_read_data_chunk: NullableTiming) -> bool:
+            session: Session, channel: Channel, stdout_stream: OutputBuffer,
+            stderr_stream: OutputBuffer, timeout: NullableTiming, timeout_read_data_chunk: NullableTiming) -> bool:
         eof_result = stdout_size = stderr_size = LIBSSH2_ERROR_EAGAIN
         if timeout:
             end_time = perf_counter() + timeout
@@ -474,16 +491,18 @@ class Client:  # pylint: disable=too-many-instance-attributes
                 stderr_size == LIBSSH2_ERROR_EAGAIN or stderr_size > 0:  # pylint: disable=consider-using-in
             if perf_counter() > end_time:
                 return False
+            if stdout_size == LIBSSH2_ERROR_EAGAIN and stderr_size == LIBSSH2_ERROR_EAGAIN:  # pylint: disable=consider-using-in
+                session.wait_for_data(timeout=timeout_read_data_chunk)
             with session.lock:
-                if stdout_size == LIBSSH2_ERROR_EAGAIN and stderr_size == LIBSSH2_ERROR_EAGAIN:  # pylint: disable=consider-using-in
-                    session.simple_select(timeout=timeout_read_data_chunk)
                 eof_result = channel.wait_eof()
                 stdout_size, stdout_chunk = channel.read()
                 stderr_size, stderr_chunk = channel.read_stderr()
+            if stdout_size > 0 or stderr_size > 0:
+                session.notify_data()
             if stdout_chunk and stdout_stream is not None:
-                stdout_stream.write(stdout_chunk.decode(encoding))
+                stdout_stream.write_bytes(stdout_chunk)
             if stderr_chunk and stderr_stream is not None:
-                stderr_stream.write(stderr_chunk.decode(encoding))
+                stderr_stream.write_bytes(stderr_chunk)
         return True
 
     def check_if_alive(self, timeout: NullableTiming = __DEFAULT__):
@@ -498,6 +517,13 @@ class Client:  # pylint: disable=too-many-instance-attributes
         """
         if timeout is __DEFAULT__:
             timeout = self.timings.connect_timeout
+        if self.pool is not None:
+            # Connecting of a pooled client means that previous sessions to the endpoint can't be trusted anymore.
+            if self._pool_reconnect_requested:
+                self._pool_reconnect_requested = False
+                self.pool.retire(self)
+            self.pool.release(self.pool.acquire(self, connect_timeout=timeout))
+            return
         if not timeout:
             try:
                 with self.flood_preventing.get_lock(self):
@@ -534,6 +560,10 @@ class Client:  # pylint: disable=too-many-instance-attributes
 
     def disconnect(self):
         """Disconnect session, close socket if needed."""
+        if self.pool is not None:
+            # Pooled sessions are closed by the pool, only remember to use new ones if connect() will be called.
+            self._pool_reconnect_requested = True
+            return
         if self.keepalive_thread:
             self.keepalive_thread.stop()
             self.keepalive_thread = None
@@ -551,21 +581,43 @@ class Client:  # pylint: disable=too-many-instance-attributes
                 pass
             self.sock = None
 
-    def run(  # pylint: disable=unused-argument,too-many-arguments,too-many-locals
+    def run(  # pylint: disable=unused-argument,too-many-arguments
             self, command: str, warn: bool = False, encoding: str = 'utf-8',  # pylint: disable=redefined-outer-name
-            hide=True, watchers=None, env=None, replace_env=False, in_stream=False, timeout=None) -> Result:
+            hide=True, watchers=None, env=None, replace_env=False, in_stream=False, timeout=None,
+            stdout_sink: OutputSink = None, stderr_sink: OutputSink = None,
+            retention: OutputRetention = None) -> Result:
         """Run command, wait till it ends and return result in Result class.
         If `watchers` are defined it runs `SSHReaderThread` that reads data from the socket and forwards it to Queue.
         If `hide` is True it does not collect stdout and stderr.
         if `env` is set it loads variables from the dict to the session environment.
+        If `stdout_sink` / `stderr_sink` are set, output is written to them as it arrives.
+        If `retention` is set, only head and tail of the output are kept in the result, so memory usage is bounded
+          no matter how much output the command produces.
+        If the client is pooled, the command runs on a channel of a session leased from the pool.
         Returns: instance of `Result`
         """
+        stdout = OutputBuffer(encoding=encoding, sink=stdout_sink, retention=retention)
+        stderr = OutputBuffer(encoding=encoding, sink=stderr_sink, retention=retention)
+        if self.pool is None:
+            return self._run(command, warn, encoding, hide, watchers, env, timeout, stdout, stderr)
+        broken = False
+        try:
+            return self._run(command, warn, encoding, hide, watchers, env, timeout, stdout, stderr)
+        except (FailedToRunCommand, FailedToReadCommandOutput):
+            broken = True
+            raise
+        finally:
+            if self._pooled_session is not None:
+                self.pool.release(self._pooled_session, broken=broken)
+                self._pooled_session = self.session = None
+
+    def _run(  # pylint: disable=too-many-arguments,too-many-locals
+            self, command: str, warn: bool, encoding: str, hide, watchers, env, timeout,
+            stdout: OutputBuffer, stderr: OutputBuffer) -> Result:
         if timeout is None:
             timeout = self.timings.read_command_output_timeout
         exception = None
         timeout_reached = False
-        stdout = StringIO()
-        stderr = StringIO()
         # TODO: Implement replace_env
         if env is None:
             shell = '/bin/bash'
@@ -584,14 +636,18 @@ class Client:  # pylint: disable=too-many-instance-attributes
         )
         channel: Optional[Channel] = None
         try:
-            if self.session is None:
+            if self.pool is not None:
+                self._pooled_session = self.pool.acquire(self)
+                self.session = self._pooled_session.session
+            elif self.session is None:
                 self.connect()
             channel = self.open_channel()
         except Exception as exc:  # pylint: disable=broad-except
             return self._complete_run(
                 channel, FailedToRunCommand(result, exc), timeout_reached, timeout, result, warn, stdout, stderr)
         try:
-            self._apply_env(channel, env)
+            with self.session.lock:
+                self._apply_env(channel, env)
         except Exception as exc:  # pylint: disable=broad-except
             return self._complete_run(
                 channel, FailedToRunCommand(result, exc), timeout_reached, timeout, result, warn, stdout, stderr)
@@ -613,7 +669,7 @@ class Client:  # pylint: disable=too-many-instance-attributes
             try:
                 self.execute(command, channel=channel, use_pty=False)
                 timeout_reached = not self._process_output_no_watchers(
-                    self.session, channel, encoding, stdout, stderr, timeout,
+                    self.session, channel, stdout, stderr, timeout,
                     self.timings.read_data_chunk_timeout)
             except Exception as exc:  # pylint: disable=broad-except
                 exception = FailedToReadCommandOutput(result, exc)
@@ -627,7 +683,7 @@ class Client:  # pylint: disable=too-many-instance-attributes
 
     def _complete_run(self, channel: Channel, exception: Exception,  # pylint: disable=too-many-arguments
                       timeout_reached: NullableTiming, timeout: NullableTiming, result: Result, warn,  # pylint: disable=redefined-outer-name
-                      stdout: StringIO, stderr: StringIO) -> Result:
+                      stdout: OutputBuffer, stderr: OutputBuffer) -> Result:
         """Complete executing command and return result, no matter what had happened.
         """
         exit_status = None
@@ -642,8 +698,9 @@ class Client:  # pylint: disable=too-many-instance-attributes
                 self.session.eagain(channel.wait_closed, timeout=self.timings.channel_close_timeout)
             except Exception as exc:  # pylint: disable=broad-except
                 print(f'Failed to close channel due to the following error: {exc}')
-            exit_status = channel.get_exit_status()
-            self.session.drop_channel(channel)
+            with self.session.lock:
+                exit_status = channel.get_exit_status()
+                self.session.drop_channel(channel)
             result.exited = exit_status
         if exception:
             raise exception
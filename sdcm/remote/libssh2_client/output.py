@@ -0,0 +1,88 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import codecs
+from io import StringIO
+from typing import Optional, Protocol, NamedTuple
+from collections import deque
+
+
+class OutputSink(Protocol):  # pylint: disable=too-few-public-methods
+    def write(self, data: str): ...
+
+
+class OutputRetention(NamedTuple):
+    """How much of a command output to keep in `Result': first `head' and last `tail' characters."""
+    head: int = 64 * 1024
+    tail: int = 64 * 1024
+
+
+class OutputBuffer:
+    """Collects a stream of a command output.
+
+    Every written chunk is forwarded to `sink' (if any) and is kept in memory according to `retention': if it's None
+    the whole output is kept, otherwise only first `retention.head' and last `retention.tail' characters are kept,
+    so memory used doesn't depend on the size of the output.
+
+    `write_bytes()' decodes data incrementally, so multibyte characters split between chunks are decoded correctly.
+    """
+
+    def __init__(self, encoding: str = "utf-8", sink: Optional[OutputSink] = None,
+                 retention: Optional[OutputRetention] = None):
+        self.sink = sink
+        self.retention = retention
+        self.skipped = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._head = StringIO()
+        self._head_size = 0
+        self._tail = deque()
+        self._tail_size = 0
+
+    def write_bytes(self, data: bytes, final: bool = False) -> None:
+        if text := self._decoder.decode(data, final):
+            self.write(text)
+
+    def write(self, data: str) -> None:
+        if self.sink is not None:
+            self.sink.write(data)
+        if self.retention is None:
+            self._head.write(data)
+            return
+        if self._head_size < self.retention.head:
+            head_part = data[:self.retention.head - self._head_size]
+            self._head.write(head_part)
+            self._head_size += len(head_part)
+            data = data[len(head_part):]
+        if not data:
+            return
+        self._tail.append(data)
+        self._tail_size += len(data)
+        while self._tail_size > self.retention.tail:
+            excess = self._tail_size - self.retention.tail
+            if len(self._tail[0]) <= excess:
+                chunk = self._tail.popleft()
+                self._tail_size -= len(chunk)
+                self.skipped += len(chunk)
+            else:
+                self._tail[0] = self._tail[0][excess:]
+                self._tail_size -= excess
+                self.skipped += excess
+
+    def getvalue(self) -> str:
+        self.write_bytes(b"", final=True)
+        if not self.skipped:
+            return self._head.getvalue() + "".join(self._tail)
+        return f"{self._head.getvalue()}\n...[{self.skipped} characters skipped]...\n{''.join(self._tail)}"
+
+
+__all__ = ("OutputSink", "OutputRetention", "OutputBuffer", )
@@ -0,0 +1,217 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+from time import perf_counter
+from typing import Dict, List, Tuple, Optional
+from threading import Condition
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from weakref import WeakSet
+
+from .exceptions import OpenChannelTimeout
+from .session import Session
+from .timings import NullableTiming
+
+
+SessionKey = Tuple[str, int, str, Optional[str]]
+
+_CONNECTION_POOLS = WeakSet()
+
+
+@dataclass
+class ConnectionPoolStats:
+    hits: int = 0  # a channel was opened on an already established session
+    misses: int = 0  # a new session was established
+    waits: int = 0  # all sessions to the host were busy, had to wait for a free channel
+    reconnects: int = 0  # sessions were retired because of a broken connection or a reconnect request
+
+
+class PooledSession:  # pylint: disable=too-few-public-methods
+    """SSH session shared by many clients.  The session is owned by a dedicated not pooled client."""
+
+    def __init__(self, key: SessionKey, client):
+        self.key = key
+        self.client = client
+        self.session: Session = client.session
+        self.channels = 0
+        self.retired = False
+        self.last_used = perf_counter()
+
+
+class ConnectionPool:
+    """Process-wide pool of SSH sessions keyed by (host, port, user, pkey).
+
+    libssh2 can run many channels over one session as long as all calls to the session are serialized (which is
+    done using `Session.lock'; waiting for data is done without the lock, see `Session.wait_for_data()'), so
+    instead of a handshake and authentication per client, clients lease a channel slot on a shared session for
+    every command.  New sessions are established only if all sessions to the host already have
+    `max_channels_per_session' channels open and there are less than `max_sessions_per_host' sessions, otherwise
+    the caller waits for a free slot up to `wait_timeout' seconds.  Establishing of sessions is still limited by
+    client's `FloodPreventingFacility'.
+
+    Sessions are closed when they become idle for `idle_timeout' seconds or when they were retired (a command
+    failed on the session or a client asked to reconnect.)
+    """
+
+    def __init__(self, max_sessions_per_host: int = 4, max_channels_per_session: int = 8,
+                 idle_timeout: float = 300, wait_timeout: NullableTiming = 60):
+        self.max_sessions_per_host = max_sessions_per_host
+        self.max_channels_per_session = max_channels_per_session
+        self.idle_timeout = idle_timeout
+        self.wait_timeout = wait_timeout
+        self._reset()
+        _CONNECTION_POOLS.add(self)
+
+    def _reset(self) -> None:
+        self._condition = Condition()
+        self._sessions: Dict[SessionKey, List[PooledSession]] = defaultdict(list)
+        self._connecting: Dict[SessionKey, int] = defaultdict(int)
+        self.stats = ConnectionPoolStats()
+
+    def __reduce__(self):
+        if self is DEFAULT_CONNECTION_POOL:
+            return _get_default_connection_pool, ()
+        return self.__class__, (
+            self.max_sessions_per_host, self.max_channels_per_session, self.idle_timeout, self.wait_timeout)
+
+    @staticmethod
+    def get_key(client) -> SessionKey:
+        return client.host, client.port, client.user, client.pkey
+
+    def _has_capacity(self, key: SessionKey) -> bool:
+        active_sessions = sum(1 for pooled in self._sessions[key] if not pooled.retired)
+        return active_sessions + self._connecting[key] < self.max_sessions_per_host
+
+    def acquire(self, client, connect_timeout=None) -> PooledSession:
+        """Reserve a channel on a session to the client's endpoint, establish a new session if needed."""
+        key = self.get_key(client)
+        end_time = None if self.wait_timeout is None else perf_counter() + self.wait_timeout
+        waited = False
+        with self._condition:
+            while True:
+                available = [pooled for pooled in self._sessions[key]
+                             if not pooled.retired and pooled.channels < self.max_channels_per_session]
+                if available:
+                    pooled = min(available, key=lambda pooled: pooled.channels)
+                    pooled.channels += 1
+                    self.stats.hits += 1
+                    return pooled
+                if self._has_capacity(key):
+                    self._connecting[key] += 1
+                    break
+                if not waited:
+                    self.stats.waits += 1
+                    waited = True
+                if end_time is None:
+                    self._condition.wait()
+                elif (remaining := end_time - perf_counter()) > 0:
+                    self._condition.wait(remaining)
+                else:
+                    raise OpenChannelTimeout(
+                        f"No free SSH channel to {client.host} in {self.wait_timeout} seconds")
+
+        owner = client.unpooled_copy()
+        try:
+            if connect_timeout is None:
+                owner.connect()
+            else:
+                owner.connect(timeout=connect_timeout)
+        except Exception:
+            with self._condition:
+                self._connecting[key] -= 1
+                self._condition.notify_all()
+            raise
+        pooled = PooledSession(key=key, client=owner)
+        pooled.channels = 1
+        with self._condition:
+            self._connecting[key] -= 1
+            self._sessions[key].append(pooled)
+            self.stats.misses += 1
+            self._condition.notify_all()
+        return pooled
+
+    def release(self, pooled: PooledSession, broken: bool = False) -> None:
+        with self._condition:
+            pooled.channels -= 1
+            pooled.last_used = perf_counter()
+            if broken and not pooled.retired:
+                pooled.retired = True
+                self.stats.reconnects += 1
+            closable = self._pop_closable()
+            self._condition.notify_all()
+        self._close(closable)
+
+    def retire(self, client) -> None:
+        """Stop using currently established sessions to the client's endpoint, next commands will use new ones."""
+        with self._condition:
+            for pooled in self._sessions[self.get_key(client)]:
+                if not pooled.retired:
+                    pooled.retired = True
+                    self.stats.reconnects += 1
+            closable = self._pop_closable()
+            self._condition.notify_all()
+        self._close(closable)
+
+    def _pop_closable(self) -> List[PooledSession]:
+        now = perf_counter()
+        closable = []
+        for key, sessions in list(self._sessions.items()):
+            for pooled in list(sessions):
+                if not pooled.channels and (pooled.retired or now - pooled.last_used > self.idle_timeout):
+                    sessions.remove(pooled)
+                    closable.append(pooled)
+            if not sessions and not self._connecting[key]:
+                del self._sessions[key]
+                del self._connecting[key]
+        return closable
+
+    @staticmethod
+    def _close(closable: List[PooledSession]) -> None:
+        for pooled in closable:
+            try:
+                pooled.client.disconnect()
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+    def close(self) -> None:
+        """Retire all sessions and close idle ones."""
+        with self._condition:
+            for sessions in self._sessions.values():
+                for pooled in sessions:
+                    pooled.retired = True
+            closable = self._pop_closable()
+        self._close(closable)
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                **asdict(self.stats),
+                "sessions": sum(len(sessions) for sessions in self._sessions.values()),
+                "channels": sum(pooled.channels for sessions in self._sessions.values() for pooled in sessions),
+            }
+
+
+def _reset_connection_pools_after_fork() -> None:
+    # Sessions (and their sockets) belong to the parent process, forget them without sending anything.
+    for pool in list(_CONNECTION_POOLS):
+        pool._reset()  # pylint: disable=protected-access
+
+
+os.register_at_fork(after_in_child=_reset_connection_pools_after_fork)
+
+DEFAULT_CONNECTION_POOL = ConnectionPool()
+
+
+def _get_default_connection_pool() -> ConnectionPool:
+    return DEFAULT_CONNECTION_POOL
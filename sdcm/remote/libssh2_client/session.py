@@ -11,9 +11,10 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
 from gc import collect as gc_collect
 from select import select
-from threading import Lock
+from threading import Lock, Condition
 
 from ssh2.session import Session as LibSSH2Session, LIBSSH2_SESSION_BLOCK_INBOUND, LIBSSH2_SESSION_BLOCK_OUTBOUND  # pylint: disable=no-name-in-module
 from ssh2.exceptions import SocketRecvError  # pylint: disable=no-name-in-module
@@ -23,19 +24,89 @@ from ssh2.channel import Channel  # pylint: disable=no-name-in-module
 from .timings import NullableTiming
 
 
+class InboundWaiter:
+    """Wait for incoming data on a socket shared by channels of a session without holding the session lock.
+
+    Only one thread (the poller) selects on the socket, other threads wait till the poller is woken up.  A read of
+    any channel can pull packets of other channels out of the socket into libssh2 buffers, so readers which got
+    data call `notify()': it wakes up waiting threads (and the poller, using a pipe) to try to read again.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._polling = False
+        self._generation = 0
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+
+    def wait(self, sock, outbound: bool = False, timeout: NullableTiming = None) -> None:
+        with self._condition:
+            if self._polling:
+                generation = self._generation
+                self._condition.wait_for(lambda: self._generation != generation, timeout)
+                return
+            self._polling = True
+        try:
+            readable, *_ = select((sock, self._wakeup_read), (sock, ) if outbound else (), (), timeout)
+            if self._wakeup_read in readable:
+                while True:
+                    try:
+                        if not os.read(self._wakeup_read, 4096):
+                            break
+                    except BlockingIOError:
+                        break
+        except (TypeError, ValueError, OSError):  # the socket was closed, let the caller to find it out
+            pass
+        finally:
+            with self._condition:
+                self._polling = False
+                self._generation += 1
+                self._condition.notify_all()
+
+    def notify(self) -> None:
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+            if self._polling:
+                try:
+                    os.write(self._wakeup_write, b"\0")
+                except BlockingIOError:  # the pipe is full, so the poller will be woken up anyway
+                    pass
+
+    def close(self) -> None:
+        for fd in (self._wakeup_read, self._wakeup_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
 class Session(LibSSH2Session):  # pylint: disable=too-few-public-methods
     """Custom SSH2 Session class with Lock in it, to make it thread safe where it is needed """
 
-    # Libssh2 is currently not thread safe, we have work it around by having separete session for each thread
-    #   but garbage collection part of the issue still not fixed
-    # channels, drop_channel, __del__ and open_session are part of the workaround gc part of the issue.
+    # Libssh2 is not thread safe, so all calls to a session and its channels are serialized using `lock'.  Channels
+    #   of one session can be used by many threads this way (see ConnectionPool), but waiting for data on the socket
+    #   is done without the lock using `wait_for_data()', so a quiet channel doesn't stall others.
+    # Garbage collection part of the issue still not fixed:
+    #   channels, drop_channel, __del__ and open_session are part of the workaround gc part of the issue.
 
     def __init__(self):
         # A lock that is used to make it thread safe
         self.lock = Lock()
         self.channels = []
+        self.inbound = InboundWaiter()
         super().__init__()
 
+    def wait_for_data(self, timeout: NullableTiming = None):
+        """Wait till there is something to read from the session.  Should be called without holding `lock'."""
+        self.inbound.wait(self.sock, outbound=bool(self.block_directions() & LIBSSH2_SESSION_BLOCK_OUTBOUND),
+                          timeout=timeout)
+
+    def notify_data(self):
+        """Tell other threads waiting for data that some data was read from the session."""
+        self.inbound.notify()
+
     def simple_select(self, timeout: NullableTiming = None):
         """Perform single select on ssh2 session socket.
         It is standalone-function because it is an candidate to be compiled via Cython
@@ -55,13 +126,17 @@ class Session(LibSSH2Session):  # pylint: disable=too-few-public-methods
 
     def eagain(self, func, args=(), kwargs={},  # pylint: disable=dangerous-default-value
                timeout: NullableTiming = None) -> int:
-        """Running function followed by simple_select up until it return anything but `LIBSSH2_ERROR_EAGAIN`"""
-        with self.lock:
-            ret = func(*args, **kwargs)
-            while ret == LIBSSH2_ERROR_EAGAIN:
-                self.simple_select(timeout=timeout)
+        """Running function followed by wait_for_data up until it return anything but `LIBSSH2_ERROR_EAGAIN`"""
+        waited = False
+        while True:
+            with self.lock:
                 ret = func(*args, **kwargs)
-            return ret
+            if ret != LIBSSH2_ERROR_EAGAIN:
+                if waited:
+                    self.notify_data()
+                return ret
+            self.wait_for_data(timeout=timeout)
+            waited = True
 
     def open_session(self):
         channel = super().open_session()
@@ -87,3 +162,4 @@ class Session(LibSSH2Session):  # pylint: disable=too-few-public-methods
             while self.channels:
                 self.drop_channel(self.channels.pop())
             gc_collect()
+        self.inbound.close()
@@ -22,6 +22,7 @@ from invoke.runners import Result
 from invoke.watchers import StreamWatcher
 from sdcm.utils.decorators import retrying
 from .base import CommandRunner, RetryableNetworkException
+from .libssh2_client.output import OutputSink, OutputRetention
 
 
 class LocalCmdRunner(CommandRunner):  # pylint: disable=too-few-public-methods
@@ -46,12 +47,16 @@ class LocalCmdRunner(CommandRunner):  # pylint: disable=too-few-public-methods
 
     def run(self, cmd: str, timeout: Optional[float] = None, ignore_status: bool = False,  # pylint: disable=too-many-arguments
             verbose: bool = True, new_session: bool = False, log_file: Optional[str] = None, retry: int = 1,
-            watchers: Optional[List[StreamWatcher]] = None, change_context: bool = False) -> Result:
+            watchers: Optional[List[StreamWatcher]] = None, change_context: bool = False,
+            stdout_sink: Optional[OutputSink] = None, stderr_sink: Optional[OutputSink] = None,
+            retention: Optional[OutputRetention] = None) -> Result:
 
         watchers = self._setup_watchers(verbose=verbose, log_file=log_file, additional_watchers=watchers)
+        rewind_sinks = self._sinks_rewinder(stdout_sink, stderr_sink)
 
         @retrying(n=retry)
         def _run():
+            rewind_sinks()
 
             start_time = time.perf_counter()
             if verbose:
@@ -64,7 +69,8 @@ class LocalCmdRunner(CommandRunner):  # pylint: disable=too-few-public-methods
                     watchers=watchers,
                     timeout=timeout,
                     env=os.environ, replace_env=True,
-                    in_stream=False
+                    in_stream=False,
+                    **self._output_kwargs(stdout_sink, stderr_sink, retention),
                 )
                 if new_session:
                     with self._create_connection() as connection:
@@ -27,6 +27,7 @@ from invoke.runners import Result
 from sdcm.utils.decorators import retrying
 
 from .base import RetryableNetworkException, CommandRunner
+from .libssh2_client.output import OutputSink, OutputRetention
 from .local_cmd_runner import LocalCmdRunner
 
 
@@ -515,7 +516,8 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
 
     def _run_execute(self, cmd: str, timeout: Optional[float] = None,  # pylint: disable=too-many-arguments
                      ignore_status: bool = False, verbose: bool = True, new_session: bool = False,
-                     watchers: Optional[List[StreamWatcher]] = None):
+                     watchers: Optional[List[StreamWatcher]] = None, stdout_sink: Optional[OutputSink] = None,
+                     stderr_sink: Optional[OutputSink] = None, retention: Optional[OutputRetention] = None):
         if verbose:
             self.log.debug('Running command "%s"...', cmd)
         start_time = time.perf_counter()
@@ -523,7 +525,8 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
             command=cmd, warn=ignore_status,
             encoding='utf-8', hide=True,
             watchers=watchers, timeout=timeout,
-            in_stream=False
+            in_stream=False,
+            **self._output_kwargs(stdout_sink, stderr_sink, retention),
         )
         if new_session:
             with self._create_connection() as connection:
@@ -577,7 +580,10 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
             log_file: str | None = None,
             retry: int = 1,
             watchers: List[StreamWatcher] | None = None,
-            change_context: bool = False
+            change_context: bool = False,
+            stdout_sink: OutputSink | None = None,
+            stderr_sink: OutputSink | None = None,
+            retention: OutputRetention | None = None,
             ) -> Result:
         """
         Run command at the remote endpoint and return result
@@ -592,16 +598,24 @@ class RemoteCmdRunnerBase(CommandRunner):  # pylint: disable=too-many-instance-a
         :param change_context: If True, next run will trigger reconnect on all threads.
           Needed for cases when environment context is changed by the command,
           for example group has been added to the user.
+        :param stdout_sink: Object with `write()' method to stream stdout of the command to.
+          If it's seekable, output of failed attempts is dropped from it before a retry.
+        :param stderr_sink: Same as `stdout_sink', but for stderr
+        :param retention: How much of the output to keep in the result, everything by default.
+          Use it together with sinks for commands with huge output to keep memory usage bounded.
         :return:
         """
 
         watchers = self._setup_watchers(verbose=verbose, log_file=log_file, additional_watchers=watchers)
+        rewind_sinks = self._sinks_rewinder(stdout_sink, stderr_sink)
 
         @retrying(**self._get_retry_params(retry))
         def _run():
+            rewind_sinks()
             self._run_pre_run(cmd, timeout, ignore_status, verbose, new_session, log_file, retry, watchers)
             try:
-                return self._run_execute(cmd, timeout, ignore_status, verbose, new_session, watchers)
+                return self._run_execute(cmd, timeout, ignore_status, verbose, new_session, watchers,
+                                         stdout_sink=stdout_sink, stderr_sink=stderr_sink, retention=retention)
             except self.exception_retryable as exc:
                 if self._run_on_retryable_exception(exc, new_session):
                     raise
@@ -14,8 +14,10 @@
 import os
 import time
 import socket
+from typing import Optional
 
-from .libssh2_client import Client as LibSSH2Client, Timings
+from .libssh2_client import Client as LibSSH2Client, Timings, ConnectionPool, DEFAULT_CONNECTION_POOL, \
+    OutputSink, OutputRetention
 from .libssh2_client.exceptions import AuthenticationException, UnknownHostException, ConnectError, \
     FailedToReadCommandOutput, CommandTimedOut, FailedToRunCommand, OpenChannelTimeout, SocketRecvError, \
     UnexpectedExit, Failure
@@ -29,8 +31,11 @@ class RemoteLibSSH2CmdRunner(RemoteCmdRunnerBase, ssh_transport='libssh2'):  # p
       _connection_thread_map - a dictionary in which we bind thread to the libssh2 session.
     Whenever remoter read self.connection, we return value from _connection_thread_map associated with current thread,
       And if it is not there, we create it.
+    Clients don't own SSH sessions: commands run on channels of sessions shared using `connection_pool',
+      so many remoters and threads working with the same node don't do a handshake each.
     """
     connection: LibSSH2Client
+    connection_pool: Optional[ConnectionPool] = DEFAULT_CONNECTION_POOL
     exception_unexpected = UnexpectedExit
     exception_failure = Failure
     exception_retryable = (
@@ -45,9 +50,15 @@ class RemoteLibSSH2CmdRunner(RemoteCmdRunnerBase, ssh_transport='libssh2'):  # p
             user=self.user,
             port=self.port,
             pkey=os.path.expanduser(self.key_file),
-            timings=Timings(keepalive_timeout=0, connect_timeout=self.connect_timeout)
+            timings=Timings(keepalive_timeout=0, connect_timeout=self.connect_timeout),
+            pool=self.connection_pool,
         )
 
+    @staticmethod
+    def _output_kwargs(stdout_sink: Optional[OutputSink], stderr_sink: Optional[OutputSink],
+                       retention: Optional[OutputRetention]) -> dict:
+        return dict(stdout_sink=stdout_sink, stderr_sink=stderr_sink, retention=retention)
+
     def is_up(self, timeout: float = 30) -> bool:
         end_time = time.perf_counter() + timeout
         while time.perf_counter() <= end_time:
@@ -31,6 +31,7 @@ from sdcm import sct_abs_path
 from sdcm.provision.azure.utils import get_scylla_images
 from sdcm.utils import alternator
 from sdcm.utils.aws_utils import get_arch_from_instance_type
+from sdcm.utils.config_cache import load_yaml_layer, cached_image
 from sdcm.utils.common import (
     MAX_SPOT_DURATION_TIME,
     ami_built_by_scylla,
@@ -1415,11 +1416,11 @@ class SCTConfiguration(dict):
             backend_config_files += self.defaults_config_files[str(backend)]
 
         # 1) load the default backend config files
-        files = anyconfig.load(list(backend_config_files))
+        files = load_yaml_layer(backend_config_files)
         anyconfig.merge(self, files)
 
         # 2) load the config files
-        files = anyconfig.load(list(config_files))
+        files = load_yaml_layer(config_files)
         anyconfig.merge(self, files)
 
         regions_data = self.get('regions_data') or {}
@@ -1479,32 +1480,40 @@ class SCTConfiguration(dict):
                 aws_arch = get_arch_from_instance_type(self.get('instance_type_db'))
                 # ami.name format examples: ScyllaDB 4.4.0 or ScyllaDB Enterprise 2019.1.1
                 scylla_version_substr = f" {scylla_version}"
-                ami_list = []
-                for region in region_names:
+
+                def find_ami_id(region):
                     if ':' in scylla_version:
-                        ami = get_branched_ami(scylla_version=scylla_version, region_name=region, arch=aws_arch)[0]
-                    else:
-                        for ami in get_scylla_ami_versions(region_name=region, arch=aws_arch):
-                            if scylla_version_substr in ami.name:
-                                break
-                        else:
-                            raise ValueError(f"AMIs for {scylla_version=} not found in {region}")
-                    self.log.debug("Found AMI %s for scylla_version='%s' in %s", ami.image_id, scylla_version, region)
-                    ami_list.append(ami)
-                self['ami_id_db_scylla'] = " ".join(ami.image_id for ami in ami_list)
+                        return get_branched_ami(scylla_version=scylla_version, region_name=region, arch=aws_arch)[0]\
+                            .image_id
+                    for ami in get_scylla_ami_versions(region_name=region, arch=aws_arch):
+                        if scylla_version_substr in ami.name:
+                            return ami.image_id
+                    raise ValueError(f"AMIs for {scylla_version=} not found in {region}")
+
+                ami_ids = []
+                for region in region_names:
+                    ami_id = cached_image(key=("aws", scylla_version, region, aws_arch),
+                                          resolve=lambda region=region: find_ami_id(region),
+                                          scylla_version=scylla_version)
+                    self.log.debug("Found AMI %s for scylla_version='%s' in %s", ami_id, scylla_version, region)
+                    ami_ids.append(ami_id)
+                self['ami_id_db_scylla'] = " ".join(ami_ids)
             elif not self.get("gce_image_db") and self.get("cluster_backend") == "gce":
-                if ":" in scylla_version:
-                    gce_image = get_branched_gce_images(scylla_version=scylla_version)[0]
-                else:
+
+                def find_gce_image():
+                    if ":" in scylla_version:
+                        return get_branched_gce_images(scylla_version=scylla_version)[0].extra["selfLink"]
                     # gce_image.name format examples: scylla-4-3-6 or scylla-enterprise-2021-1-2
                     scylla_version_substr = f"scylla-{scylla_version.replace('.', '-')}"
                     for gce_image in get_scylla_gce_images_versions():
                         if gce_image.name.replace("-enterprise", "").startswith(scylla_version_substr):
-                            break
-                    else:
-                        raise ValueError(f"GCE images for {scylla_version=} not found")
-                self.log.debug("Found GCE image %s for scylla_version='%s'", gce_image.name, scylla_version)
-                self["gce_image_db"] = gce_image.extra["selfLink"]
+                            return gce_image.extra["selfLink"]
+                    raise ValueError(f"GCE images for {scylla_version=} not found")
+
+                gce_image = cached_image(key=("gce", scylla_version), resolve=find_gce_image,
+                                         scylla_version=scylla_version)
+                self.log.debug("Found GCE image %s for scylla_version='%s'", gce_image, scylla_version)
+                self["gce_image_db"] = gce_image
             elif not self.get("azure_image_db") and self.get("cluster_backend") == "azure":
                 scylla_azure_images = []
                 for region in self.get('azure_region_name'):
@@ -1636,7 +1645,7 @@ class SCTConfiguration(dict):
         if backend and include_backend:
             default_config_files += self.defaults_config_files[str(backend)]
 
-        return anyconfig.load(list(default_config_files)).get(key, None)
+        return load_yaml_layer(default_config_files).get(key, None)
 
     def _load_environment_variables(self):
         environment_vars = {}
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import re
 import json
 import time
 import uuid
@@ -29,7 +30,7 @@ from typing import \
 from keyword import iskeyword
 from weakref import proxy as weakproxy
 from datetime import datetime, timezone
-from functools import partialmethod
+from functools import partialmethod, lru_cache
 
 import yaml
 import dateutil.parser
@@ -42,6 +43,9 @@ DEFAULT_SEVERITIES = sct_abs_path("defaults/severities.yaml")
 FILTER_EVENT_DECAY_TIME = 600.0
 LOGGER = logging.getLogger(__name__)
 
+# Log timestamps which have a full date, so parsing result doesn't depend on the current date and can be cached.
+DATED_LOG_TIMESTAMP_RE = re.compile(r"\d{4}[-/]\d{2}[-/]\d{2}")
+
 
 class SctEventTypesRegistry(Dict[str, Type["SctEvent"]]):  # pylint: disable=too-few-public-methods
     def __init__(self, severities_conf: str = DEFAULT_SEVERITIES):
@@ -241,7 +245,7 @@ class SctEvent:
 
     def __getstate__(self):
         # Remove everything from the __dict__ that starts with "_".
-        return {attr: value for attr, value in self.__dict__.items() if not attr.startswith("_")}
+        return {attr: value for attr, value in self.__dict__.items() if attr[0] != "_"}
 
     def __str__(self):
         return self.formatter(self.msgfmt, self)
@@ -343,6 +347,25 @@ class BaseFilter(SystemEvent, abstract=True):
         raise NotImplementedError()
 
 
+@lru_cache(maxsize=1024)
+def _parse_dated_log_timestamp(event_time: str) -> float:
+    try:
+        return datetime.fromisoformat(event_time).timestamp()
+    except ValueError:
+        return dateutil.parser.parse(event_time).timestamp()
+
+
+def parse_log_timestamp(event_time: str) -> float:
+    """Parse a timestamp of a log line the same way as `dateutil.parser.parse()' does, but faster.
+
+    ISO format is parsed by `datetime.fromisoformat()' and results are cached: during storms many lines of a log
+    have the same timestamp.
+    """
+    if DATED_LOG_TIMESTAMP_RE.match(event_time):
+        return _parse_dated_log_timestamp(event_time)
+    return dateutil.parser.parse(event_time).timestamp()
+
+
 T_log_event = TypeVar("T_log_event", bound="LogEvent")  # pylint: disable=invalid-name
 
 
@@ -399,7 +422,7 @@ class LogEvent(Generic[T_log_event], InformationalEvent, abstract=True):
                 # 2021-04-06 13:03:28  ...
                 event_time = " ".join(splitted_line[:2])
 
-            self.source_timestamp = dateutil.parser.parse(event_time).timestamp()
+            self.source_timestamp = parse_log_timestamp(event_time)
         except ValueError:
             pass
         self.event_timestamp = time.time()
@@ -0,0 +1,138 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Wire format of events on the events bus.
+
+Every event is encoded once by the publisher into a frame: a fixed size header followed by the name of the event
+class (a key of SctEventTypesRegistry) and the payload.  The header contains everything subscribers usually need to
+decide if they are interested in the event at all (severity, timestamp and class level flags), so an event is
+unpickled only if a subscriber really needs it.
+
+The payload is the pickled state of the event without fields which are already in the header: the class is
+restored using the registry, the severity and the timestamp are taken from the header.  Events which define their
+own pickling (e.g., ones with an exception in their MRO) are pickled as is.
+"""
+
+import enum
+import pickle
+import struct
+from typing import Any, Optional, Union
+
+from sdcm.sct_events import Severity
+
+
+# severity, flags, payload format, event timestamp, length of the event class name
+FRAME_HEADER = struct.Struct("!bBBdH")
+
+
+class EventFlags(enum.IntFlag):
+    SYSTEM = 1
+    FILTER = 2
+    PUBLISH_TO_GRAFANA = 4
+    SAVE_TO_FILES = 8
+
+
+class PayloadFormat(enum.IntEnum):
+    PICKLE = 0  # the whole event is pickled
+    STATE = 1  # the state of the event is pickled without the severity and the timestamp
+    STATE_WITH_TIMESTAMP = 2  # the state of the event is pickled without the severity
+
+
+def event_flags(event: Any) -> EventFlags:
+    # pylint: disable=import-outside-toplevel; to avoid cyclic imports
+    from sdcm.sct_events.base import SystemEvent, BaseFilter
+
+    flags = EventFlags(0)
+    if isinstance(event, SystemEvent):
+        flags |= EventFlags.SYSTEM
+    if isinstance(event, BaseFilter):
+        flags |= EventFlags.FILTER
+    if getattr(event, "publish_to_grafana", False):
+        flags |= EventFlags.PUBLISH_TO_GRAFANA
+    if getattr(event, "save_to_files", False):
+        flags |= EventFlags.SAVE_TO_FILES
+    return flags
+
+
+def _event_class(name: str) -> Optional[type]:
+    # pylint: disable=import-outside-toplevel; to avoid cyclic imports
+    from sdcm.sct_events.base import SctEvent
+
+    if event_class := SctEvent._sct_event_types_registry.get(name):  # pylint: disable=protected-access
+        return event_class.__mro__[0]  # the registry keeps weak proxies of classes
+    return None
+
+
+def _can_encode_state(event: Any) -> bool:
+    event_class = type(event)
+    return event_class.__reduce_ex__ is object.__reduce_ex__ and event_class.__reduce__ is object.__reduce__ \
+        and not hasattr(event_class, "__setstate__") and _event_class(event_class.__name__) is event_class \
+        and isinstance(event.__dict__.get("severity"), Severity)
+
+
+def encode_event(event: Any) -> bytes:
+    name = type(event).__name__.encode("utf-8")
+    payload_format = PayloadFormat.PICKLE
+    payload = event
+    if _can_encode_state(event):
+        payload = event.__getstate__()
+        payload.pop("severity", None)
+        if isinstance(payload.get("event_timestamp"), float):
+            del payload["event_timestamp"]
+            payload_format = PayloadFormat.STATE
+        else:
+            payload_format = PayloadFormat.STATE_WITH_TIMESTAMP
+    header = FRAME_HEADER.pack(
+        event.severity.value, event_flags(event), payload_format, event.event_timestamp or 0.0, len(name))
+    return b"".join((header, name, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)))
+
+
+class EventFrame:
+    """
+    Encoded event received from the events bus.
+
+    Header fields are available as attributes without unpickling of the event itself, use `decode()' to get it.
+    """
+
+    __slots__ = ("severity", "flags", "event_timestamp", "name", "_payload_format", "_payload", )
+
+    def __init__(self, buffer: Union[bytes, memoryview]):
+        buffer = memoryview(buffer)
+        severity, flags, payload_format, self.event_timestamp, name_length = FRAME_HEADER.unpack_from(buffer)
+        self.severity = Severity(severity)
+        self.flags = EventFlags(flags)
+        self._payload_format = PayloadFormat(payload_format)
+        payload_offset = FRAME_HEADER.size + name_length
+        self.name = str(buffer[FRAME_HEADER.size:payload_offset], "utf-8")
+        self._payload = buffer[payload_offset:]
+
+    @property
+    def base(self) -> str:
+        return self.name.split(".", 1)[0]
+
+    def decode(self) -> Any:
+        if self._payload_format is PayloadFormat.PICKLE:
+            return pickle.loads(self._payload)
+        event_class = _event_class(self.name)
+        event = event_class.__new__(event_class)
+        event.__dict__.update(pickle.loads(self._payload), severity=self.severity)
+        if self._payload_format is PayloadFormat.STATE:
+            event.event_timestamp = self.event_timestamp
+        return event
+
+    def __repr__(self) -> str:
+        return f"<EventFrame {self.name} {self.severity.name} flags={self.flags!r}>"
+
+
+__all__ = ("EventFlags", "EventFrame", "PayloadFormat", "encode_event", )
@@ -16,19 +16,21 @@
 import time
 import queue
 import ctypes
-import pickle
+import struct
 import logging
 import multiprocessing
-from typing import Optional, Generator, Any, Tuple, Callable, cast, Dict
+from typing import Optional, Generator, Any, Tuple, Callable, cast, List
 from pathlib import Path
 from functools import cached_property, partial
-from uuid import UUID
 
 import zmq
 
+from sdcm.sct_events import Severity
+from sdcm.sct_events.event_frame import EventFlags, EventFrame, encode_event
 from sdcm.sct_events.events_processes import \
     EVENTS_MAIN_DEVICE_ID, StopEvent, EventsProcessesRegistry, \
     start_events_process, get_events_process, verbose_suppress, suppress_interrupt
+from sdcm.utils.file import AppendOnlyFile
 
 
 EVENTS_DEVICE_START_DELAY: float = 0  # seconds
@@ -36,12 +38,18 @@ EVENTS_DEVICE_START_TIMEOUT: float = 30  # seconds
 SUB_POLLING_TIMEOUT: int = 1000  # milliseconds
 PUB_QUEUE_WAIT_TIMEOUT: float = 1  # seconds
 PUB_QUEUE_EVENTS_RATE: float = 0  # seconds
+PUB_BATCH_MAX_SIZE: int = 256  # events
 PUBLISH_EVENT_TIMEOUT: float = 5  # seconds
-FILTERS_GC_PERIOD: float = 60  # Cleanup old filters once in a while
 
 EVENTS_LOG_DIR: str = "events_log"
 RAW_EVENTS_LOG: str = "raw_events.log"
 
+# Every message sent by EventsDevice is a multipart message: a header frame followed by a frame per encoded event
+# (see `sdcm.sct_events.event_frame'.)
+# The header contains the sequence number of the first event in the batch and the number of events.  Sequence
+# numbers are contiguous, so subscribers can detect lost events.
+BATCH_HEADER = struct.Struct("!QI")
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -51,6 +59,7 @@ class EventsDevice(multiprocessing.Process):
     sub_polling_timeout = SUB_POLLING_TIMEOUT
     pub_queue_wait_timeout = PUB_QUEUE_WAIT_TIMEOUT
     pub_queue_events_rate = PUB_QUEUE_EVENTS_RATE
+    pub_batch_max_size = PUB_BATCH_MAX_SIZE
 
     def __init__(self, _registry: EventsProcessesRegistry):
         self._registry = _registry
@@ -76,6 +85,11 @@ class EventsDevice(multiprocessing.Process):
     def raw_events_log(self) -> Path:
         return self.events_log_base_dir / RAW_EVENTS_LOG
 
+    @cached_property
+    def _raw_events_log_file(self) -> AppendOnlyFile:
+        # Events are written to the raw log immediately, but the file is kept open to avoid open/close per event.
+        return AppendOnlyFile(self.raw_events_log, max_buffer_size=0)
+
     def stop(self, timeout: Optional[float] = None) -> None:
         self._running.clear()
         self.join(timeout)
@@ -86,45 +100,49 @@ class EventsDevice(multiprocessing.Process):
             return f"tcp://localhost:{self._sub_port.value}"
         raise RuntimeError("EventsDevice is not ready to send events.")
 
+    def _get_events_batch(self) -> List[bytes]:
+        try:
+            batch = [self._queue.get(timeout=self.pub_queue_wait_timeout)]
+        except queue.Empty:
+            return []
+        try:
+            while len(batch) < self.pub_batch_max_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
     def run(self):
         with suppress_interrupt(), verbose_suppress("EventsDevice failed"):
-            with zmq.Context() as ctx, ctx.socket(zmq.PUB) as pub, ctx.socket(zmq.SUB) as sub:
+            with zmq.Context() as ctx, ctx.socket(zmq.PUB) as pub:
                 self._sub_port.value = pub.bind_to_random_port("tcp://*")
                 self._running.set()
 
                 LOGGER.debug("EventsDevice listen on %s", self.subscribe_address)
 
-                # Delivery verification subscriber.
-                sub.connect(self.subscribe_address)
-                sub.subscribe(b"")
-
                 time.sleep(self.start_delay)
 
+                sequence_number = 0
                 while self._running.is_set() or not self._queue.empty():
+                    if not (batch := self._get_events_batch()):
+                        continue
                     try:
-                        event = self._queue.get(timeout=self.pub_queue_wait_timeout)
-                        try:
-                            pub.send(event)
-                        except zmq.ZMQError:
-                            LOGGER.exception("EventsDevice failed to send %s", pickle.loads(event))
-                        else:
-                            try:
-                                if sub.poll(timeout=self.sub_polling_timeout) and sub.recv(zmq.NOBLOCK) == event:
-                                    continue  # everything is OK, we can go to send next event in the queue.
-                            except zmq.ZMQError:
-                                pass
-                            LOGGER.error("EventsDevice failed to verify delivery of %s", pickle.loads(event))
+                        pub.send_multipart([BATCH_HEADER.pack(sequence_number, len(batch)), *batch], copy=False)
+                    except zmq.ZMQError:
+                        LOGGER.exception("EventsDevice failed to send %s event(s) starting from #%s",
+                                         len(batch), sequence_number)
+                    sequence_number += len(batch)
+                    if self.pub_queue_events_rate:
                         time.sleep(self.pub_queue_events_rate)
-                    except queue.Empty:
-                        pass
 
     def publish_event(self, event, timeout=PUBLISH_EVENT_TIMEOUT) -> None:
         with verbose_suppress("%s: failed to write %s to %s", self, event, self.raw_events_log):
-            with self._raw_events_lock, open(self.raw_events_log, "ab+", buffering=0) as log_file:
-                log_file.write(event.to_json().encode("utf-8") + b"\n")
+            with self._raw_events_lock:
+                self._raw_events_log_file.write(event.to_json().encode("utf-8") + b"\n",
+                                                fsync=event.severity == Severity.CRITICAL)
 
         with verbose_suppress("%s: failed to publish %s", self, event):
-            self._queue.put(pickle.dumps(event), timeout=timeout)
+            self._queue.put(encode_event(event), timeout=timeout)
             self._events_counter.value += 1
 
     def _sub_socket(self, ctx: zmq.Context) -> zmq.Socket:
@@ -134,50 +152,58 @@ class EventsDevice(multiprocessing.Process):
         sub.subscribe(b"")
         return sub
 
-    def inbound_events(self, stop_event: StopEvent) -> Generator[Any, None, None]:
+    def inbound_events(self, stop_event: StopEvent) -> Generator[EventFrame, None, None]:
+        expected_sequence_number = None
         with zmq.Context() as ctx, self._sub_socket(ctx) as sub:
             while not stop_event.is_set():
                 while sub.poll(timeout=self.sub_polling_timeout):
-                    yield sub.recv_pyobj(flags=zmq.NOBLOCK)
+                    header, *events = sub.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+                    sequence_number, events_count = BATCH_HEADER.unpack(header.buffer)
+                    if expected_sequence_number is not None and sequence_number != expected_sequence_number:
+                        LOGGER.error("%s: lost %s event(s) with sequence numbers from #%s to #%s",
+                                     self, sequence_number - expected_sequence_number,
+                                     expected_sequence_number, sequence_number - 1)
+                    expected_sequence_number = sequence_number + events_count
+                    for event in events:
+                        yield EventFrame(event.buffer)
 
     # pylint: disable=import-outside-toplevel
     def outbound_events(self,
                         stop_event: StopEvent,
-                        events_counter: multiprocessing.Value) -> Generator[Tuple[str, Any], None, None]:
+                        events_counter: multiprocessing.Value,
+                        accept: Optional[Callable[[EventFrame], bool]] = None,
+                        ) -> Generator[Tuple[str, Any], None, None]:
+        # Events for which `accept(frame)' returns False are skipped without unpickling.  Filters are always processed.
         from sdcm.sct_events.base import max_severity
         from sdcm.sct_events.system import SystemEvent
-        from sdcm.sct_events.filters import BaseFilter
+        from sdcm.sct_events.filters import BaseFilter, EventsFiltersIndex
 
-        filters: Dict[UUID, BaseFilter] = {}
-        filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
+        filters = EventsFiltersIndex()
 
         with suppress_interrupt():
-            for events_counter.value, obj in enumerate(self.inbound_events(stop_event=stop_event), start=1):
-                if filters_gc_next_hit < time.perf_counter():
-                    # Run filter GC once in FILTERS_GC_PERIOD seconds
-                    for filter_key, filter_obj in list(filters.items()):
-                        if filter_obj.is_deceased():
-                            del filters[filter_key]
-                    filters_gc_next_hit = time.perf_counter() + FILTERS_GC_PERIOD
+            for events_counter.value, frame in enumerate(self.inbound_events(stop_event=stop_event), start=1):
+                if not frame.flags & EventFlags.FILTER and \
+                        (frame.flags & EventFlags.SYSTEM or accept is not None and not accept(frame)):
+                    continue
+
+                obj = frame.decode()
 
                 if isinstance(obj, BaseFilter):
                     if obj.clear_filter and not obj.expire_time:
                         LOGGER.debug("%s: delete filter with uuid=%s", self, obj.uuid)
-                        filters.pop(obj.uuid, None)
+                        filters.remove(obj.uuid)
                     elif obj.clear_filter and obj.expire_time and obj.uuid in filters:
                         LOGGER.debug("%s: set expire_time to %s for filter with uuid=%s",
                                      self, obj.expire_time, obj.uuid)
-                        filters[obj.uuid].expire_time = obj.expire_time
+                        filters.set_expire_time(obj.uuid, obj.expire_time)
                     else:
                         LOGGER.debug("%s: add filter %s with uuid=%s", self, obj, obj.uuid)
-                        filters[obj.uuid] = obj
+                        filters.add(obj)
 
                 if isinstance(obj, SystemEvent):
                     continue
 
-                obj_filtered = any(f.eval_filter(obj) for f in filters.values())
-
-                if obj_filtered:
+                if filters.is_filtered(obj):
                     continue
 
                 if (obj_max_severity := max_severity(obj)).value < obj.severity.value:
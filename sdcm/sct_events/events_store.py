@@ -0,0 +1,142 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import sqlite3
+import logging
+import threading
+from typing import Optional, List, Tuple, NamedTuple, Union
+from pathlib import Path
+
+from sdcm.sct_events import Severity
+
+
+EVENTS_STORE: str = "events.db"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StoredEvent(NamedTuple):
+    timestamp: float
+    severity: str
+    event_type: str
+    node: Optional[str]
+    message: str
+
+
+class EventsStore:
+    """
+    Append-only index of events backed by SQLite.
+
+    Events are added by EventsFileLogger (the only writer) and can be queried by other processes at the same time
+    (the database uses WAL journal mode.)  All queries use indexes, so getting first/last N events by severity, events
+    of a node or events in a time range doesn't depend on the total number of events.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS events ("
+        "    id INTEGER PRIMARY KEY,"
+        "    timestamp REAL NOT NULL,"
+        "    severity TEXT NOT NULL,"
+        "    event_type TEXT NOT NULL,"
+        "    node TEXT,"
+        "    message TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS events_by_severity ON events (severity, id)",
+        "CREATE INDEX IF NOT EXISTS events_by_node ON events (node, id)",
+        "CREATE INDEX IF NOT EXISTS events_by_event_type ON events (event_type, id)",
+        "CREATE INDEX IF NOT EXISTS events_by_timestamp ON events (timestamp)",
+    )
+    COLUMNS = "timestamp, severity, event_type, node, message"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._pending: List[Tuple[float, str, str, Optional[str], str]] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                self._connection.execute(statement)
+        return self._connection
+
+    def add(self,  # pylint: disable=too-many-arguments
+            timestamp: float, severity: Severity, event_type: str, node: Optional[str], message: str) -> None:
+        """Add an event to the store.  It becomes available for queries after `flush()'."""
+        with self._lock:
+            self._pending.append((timestamp, severity.name, event_type, node, message))
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany(f"INSERT INTO events ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?)", self._pending)
+            self._pending.clear()
+
+    def _query(self, where: str, params: tuple, limit: Optional[int], newest_first: bool) -> List[StoredEvent]:
+        query = f"SELECT {self.COLUMNS} FROM events {where} ORDER BY id {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = [StoredEvent(*row) for row in self._connect().execute(query, params)]
+        if newest_first:
+            rows.reverse()
+        return rows
+
+    def first(self, severity: Severity, limit: Optional[int] = None) -> List[StoredEvent]:
+        return self._query("WHERE severity = ?", (severity.name, ), limit=limit, newest_first=False)
+
+    def last(self, severity: Severity, limit: Optional[int] = None) -> List[StoredEvent]:
+        """Return last `limit' events with the severity in chronological order."""
+        return self._query("WHERE severity = ?", (severity.name, ), limit=limit, newest_first=True)
+
+    def by_node(self, node: str, limit: Optional[int] = None) -> List[StoredEvent]:
+        """Return last `limit' events of the node in chronological order."""
+        return self._query("WHERE node = ?", (node, ), limit=limit, newest_first=True)
+
+    def by_event_type(self, event_type: str, limit: Optional[int] = None) -> List[StoredEvent]:
+        """Return last `limit' events of the type in chronological order."""
+        return self._query("WHERE event_type = ?", (event_type, ), limit=limit, newest_first=True)
+
+    def by_time_range(self, start: float, end: float, severity: Optional[Severity] = None) -> List[StoredEvent]:
+        where, params = "WHERE timestamp BETWEEN ? AND ?", (start, end)
+        if severity is not None:
+            where, params = where + " AND severity = ?", params + (severity.name, )
+        with self._lock:
+            return [StoredEvent(*row) for row in self._connect().execute(
+                f"SELECT {self.COLUMNS} FROM events {where} ORDER BY timestamp", params)]
+
+    def count(self, severity: Optional[Severity] = None) -> int:
+        with self._lock:
+            if severity is None:
+                return self._connect().execute("SELECT count(*) FROM events").fetchone()[0]
+            return self._connect().execute(
+                "SELECT count(*) FROM events WHERE severity = ?", (severity.name, )).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self.flush()
+                self._connection.close()
+            self._connection = None
+
+
+__all__ = ("EventsStore", "StoredEvent", "EVENTS_STORE", )
@@ -13,7 +13,9 @@
 
 import re
 import json
+import time
 import logging
+import threading
 import collections
 import multiprocessing
 from typing import Tuple, Optional, Callable, Any, Dict, List, cast
@@ -26,9 +28,11 @@ from sdcm.sct_events import Severity
 from sdcm.sct_events.base import SctEvent
 from sdcm.sct_events.system import TestResultEvent
 from sdcm.sct_events.events_device import get_events_main_device
+from sdcm.sct_events.events_store import EVENTS_STORE, EventsStore
 from sdcm.sct_events.events_processes import \
     EVENTS_FILE_LOGGER_ID, EventsProcessesRegistry, BaseEventsProcess, \
     start_events_process, get_events_process, verbose_suppress
+from sdcm.utils.file import AppendOnlyFile
 
 
 EVENTS_LOG: str = "events.log"
@@ -39,6 +43,9 @@ WARNING_LOG: str = "warning.log"
 NORMAL_LOG: str = "normal.log"
 DEBUG_LOG: str = "debug.log"
 
+EVENTS_LOG_FLUSH_INTERVAL: float = 0.5  # seconds
+SUMMARY_LOG_UPDATE_INTERVAL: float = 0.5  # seconds
+
 LINE_START_RE = re.compile(r"^\d{4}-\d{2}-\d{2} ")  # date in YYYY-MM-DD format
 
 LOGGER = logging.getLogger(__name__)
@@ -57,6 +64,9 @@ class head(list):  # pylint: disable=invalid-name
 
 
 class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing.Process):
+    flush_interval = EVENTS_LOG_FLUSH_INTERVAL
+    summary_update_interval = SUMMARY_LOG_UPDATE_INTERVAL
+
     def __init__(self, _registry: EventsProcessesRegistry):
         base_dir: Path = get_events_main_device(_registry=_registry).events_log_base_dir
 
@@ -72,6 +82,17 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         self.events_summary = collections.defaultdict(int)
         self.events_summary_log = base_dir / SUMMARY_LOG
 
+        self.events_store = EventsStore(base_dir / EVENTS_STORE)
+
+        self._log_files = {
+            log_file: AppendOnlyFile(log_file, flush_interval=self.flush_interval)
+            for log_file in chain((self.events_log, ), self.events_logs_by_severity.values())
+        }
+        self._summary_lock = threading.Lock()
+        self._summary_is_dirty = False
+        self._summary_next_update = 0.0
+        self._flusher: Optional[threading.Thread] = None
+
         super().__init__(_registry=_registry)
 
     def run(self) -> None:
@@ -80,10 +101,43 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
         for log_file in chain((self.events_log, self.events_summary_log, ), self.events_logs_by_severity.values(), ):
             log_file.touch()
 
-        for event_tuple in self.inbound_events():
-            with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
-                _, event = event_tuple  # try to unpack event from EventsDevice
-                self.write_event(event=event)
+        self._flusher = threading.Thread(target=self._flush_periodically, name=f"{type(self).__name__}Flusher",
+                                         daemon=True)
+        self._flusher.start()
+        try:
+            for event_tuple in self.inbound_events():
+                with verbose_suppress("EventsFileLogger failed to process %s", event_tuple):
+                    _, event = event_tuple  # try to unpack event from EventsDevice
+                    self.write_event(event=event)
+        finally:
+            self.stop_event.set()
+            self._flusher.join()
+            self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        for log_file in self._log_files.values():
+            with verbose_suppress("%s: failed to flush %s", self, log_file.path):
+                log_file.flush()
+        with verbose_suppress("%s: failed to flush %s", self, self.events_store.path):
+            self.events_store.flush()
+        self._update_summary_log()
+
+    def _update_summary_log(self, force: bool = True) -> None:
+        with self._summary_lock:
+            if not self._summary_is_dirty or (not force and time.perf_counter() < self._summary_next_update):
+                return
+            self._summary_is_dirty = False
+            self._summary_next_update = time.perf_counter() + self.summary_update_interval
+            summary = json.dumps(dict(self.events_summary), indent=4).encode("utf-8")
+        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
+            # Write to a temporary file and rename it to avoid reading of partially written summary.
+            summary_log_tmp = self.events_summary_log.with_suffix(".tmp")
+            summary_log_tmp.write_bytes(summary)
+            summary_log_tmp.replace(self.events_summary_log)
 
     def write_event(self, event: SctEvent) -> None:
         if event.source_timestamp:
@@ -100,24 +154,57 @@ class EventsFileLogger(BaseEventsProcess[Tuple[str, Any], None], multiprocessing
                 with verbose_suppress("%s: failed to tee %s to %s", self, event, tee):
                     tee(message)
 
-        # Write event to events.log file
+        # Write event to events.log file.  Critical and error events are flushed (and committed to the events store)
+        # immediately to make them visible to the test status checks, critical ones are fsync'ed also.
         if getattr(event, 'save_to_files', False):
+            fsync = event.severity == Severity.CRITICAL
             with verbose_suppress("%s: failed to write %s to %s", self, event, self.events_log):
-                with self.events_log.open("ab+", buffering=0) as fobj:
-                    fobj.write(message_bin)
+                self._log_files[self.events_log].write(message_bin, fsync=fsync)
 
             if log_file := self.events_logs_by_severity.get(event.severity):
                 with verbose_suppress("%s: failed to write %s to %s", self, event, log_file):
-                    with log_file.open("ab+", buffering=0) as fobj:
-                        fobj.write(message_bin)
+                    self._log_files[log_file].write(message_bin, fsync=fsync)
+                with verbose_suppress("%s: failed to add %s to %s", self, event, self.events_store.path):
+                    node = getattr(event, "node", None)
+                    self.events_store.add(timestamp=event.timestamp,
+                                          severity=event.severity,
+                                          event_type=type(event).__name__,
+                                          node=None if node is None else str(node),
+                                          message=self.normalize_message(message))
+
+        # Update summary.log file (statistics), but not more often than once in `summary_update_interval' seconds.
+        with self._summary_lock:
+            self.events_summary[Severity(event.severity).name] += 1
+            self._summary_is_dirty = True
+
+        # Flush immediately if called outside of the logger process (e.g., by `SctEvent.publish_or_dump()'.)
+        if self._flusher is None or event.severity in (Severity.CRITICAL, Severity.ERROR, ):
+            self.flush()
+        else:
+            self._update_summary_log(force=False)
 
-        # Update summary.log file (statistics.)
-        self.events_summary[Severity(event.severity).name] += 1
-        with verbose_suppress("%s: failed to update %s", self, self.events_summary_log):
-            with self.events_summary_log.open("wb", buffering=0) as fobj:
-                fobj.write(json.dumps(dict(self.events_summary), indent=4).encode("utf-8"))
+    @staticmethod
+    def normalize_message(message: str) -> str:
+        """Return the message the same way as it's read back from the log files by `get_events_by_category()'."""
+        return "\n".join(line for line in map(str.strip, message.splitlines()) if line)
 
     def get_events_by_category(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
+        if self.events_store.path.exists():
+            try:
+                return self._get_events_by_category_from_store(limit=limit)
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.error("%s: failed to query %s, fall back to the log files: %s", self, self.events_store.path, exc)
+        return self._get_events_by_category_from_files(limit=limit)
+
+    def _get_events_by_category_from_store(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
+        # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
+        return {
+            severity.name: [event.message for event in (
+                self.events_store.first if severity is Severity.CRITICAL else self.events_store.last
+            )(severity=severity, limit=limit)] for severity in self.events_logs_by_severity
+        }
+
+    def _get_events_by_category_from_files(self, limit: Optional[int] = None) -> Dict[str, List[str]]:
         output = {}
         for severity, log_file in self.events_logs_by_severity.items():
             # Get first `limit' events with CRITICAL severity and last `limit' for other severities.
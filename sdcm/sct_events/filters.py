@@ -13,11 +13,14 @@
 
 import re
 import time
-from typing import Optional, Type, Union
-from functools import cached_property
+import heapq
+from typing import Optional, Type, Union, Dict, Tuple, List, Callable, Hashable
+from functools import cached_property, lru_cache
+from itertools import chain
 
 from sdcm.sct_events import Severity
-from sdcm.sct_events.base import SctEvent, SctEventProtocol, BaseFilter, LogEventProtocol
+from sdcm.sct_events.base import SctEvent, SctEventProtocol, BaseFilter, LogEventProtocol, FILTER_EVENT_DECAY_TIME
+from sdcm.utils.multi_pattern import combine_patterns
 
 
 class DbEventsFilter(BaseFilter):
@@ -129,3 +132,154 @@ class EventsSeverityChangerFilter(EventsFilter):
         if super().eval_filter(event) and self.new_severity:
             event.severity = self.new_severity
         return False
+
+
+class _FiltersBucket:
+    """Filters which can match events of the same type (or class prefix) and their compiled form."""
+
+    def __init__(self):
+        self.filters: Dict[str, Tuple[int, BaseFilter]] = {}
+        self._compiled = False
+        self._match_all = False
+        self._combined_regex: Optional[re.Pattern] = None
+        self._individual: List[Tuple[int, BaseFilter]] = []
+        self.severity_changers: List[Tuple[int, EventsSeverityChangerFilter]] = []
+
+    def add(self, seq: int, filter_obj: BaseFilter) -> None:
+        self.filters[filter_obj.uuid] = (seq, filter_obj)
+        self._compiled = False
+
+    def remove(self, uuid: str) -> None:
+        if self.filters.pop(uuid, None):
+            self._compiled = False
+
+    def invalidate(self) -> None:
+        self._compiled = False
+
+    def get_severity_changers(self) -> List[Tuple[int, EventsSeverityChangerFilter]]:
+        if not self._compiled:
+            self._compile()
+        return self.severity_changers
+
+    def _compile(self) -> None:
+        self._match_all = False
+        self._combined_regex = None
+        self._individual = []
+        self.severity_changers = []
+        combinable = []
+        for seq, filter_obj in self.filters.values():
+            if isinstance(filter_obj, EventsSeverityChangerFilter):
+                self.severity_changers.append((seq, filter_obj))
+            elif type(filter_obj) is EventsFilter and not filter_obj.expire_time:  # pylint: disable=unidiomatic-typecheck
+                if filter_obj.regex:
+                    combinable.append((seq, filter_obj))
+                else:
+                    self._match_all = True
+            else:
+                self._individual.append((seq, filter_obj))
+        if combinable:
+            self._combined_regex = combine_patterns((f.regex, f.regex_flags) for _, f in combinable)
+            if self._combined_regex is None:
+                self._individual.extend(combinable)
+        self._compiled = True
+
+    def is_filtered(self, event: SctEventProtocol, event_str: Callable[[], str]) -> bool:
+        if not self._compiled:
+            self._compile()
+        if self._match_all:
+            return True
+        if self._combined_regex and self._combined_regex.match(event_str()):
+            return True
+        return any(filter_obj.eval_filter(event) for _, filter_obj in self._individual)
+
+
+class EventsFiltersIndex:
+    """
+    Active events filters indexed by event type and class.
+
+    DbEventsFilter's are bucketed by the type of DB log event, EventsFilter's by the event class prefix (or put to
+    a common bucket if filter by regex only.)  For every event only filters from matching buckets are evaluated.
+    Regexes of not expiring EventsFilter's in a bucket are combined into one regex and `str(event)' is computed
+    once per event.  Buckets are recompiled lazily when their filters are changed.
+
+    Expired filters are removed using a heap ordered by the time when the filter can be cleaned up.
+
+    Severity changers are applied (in the order they were added) before the check if the event is filtered.
+    """
+
+    def __init__(self):
+        self._seq = 0
+        self._filters: Dict[str, Tuple[Hashable, BaseFilter]] = {}
+        self._buckets: Dict[Hashable, _FiltersBucket] = {}
+        self._expiration_heap: List[Tuple[float, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._filters
+
+    @staticmethod
+    def _bucket_key(filter_obj: BaseFilter) -> Hashable:
+        if isinstance(filter_obj, DbEventsFilter):
+            return "type", filter_obj.filter_type
+        if isinstance(filter_obj, EventsFilter):
+            return ("class", filter_obj.event_class) if filter_obj.event_class else ("any", None)
+        return "other", None
+
+    @staticmethod
+    def _event_bucket_keys(event: SctEventProtocol) -> List[Hashable]:
+        keys = [("any", None), ("other", None)]
+        if event_type := getattr(event, "type", None):
+            keys.append(("type", event_type))
+        name = type(event).__name__ + "."
+        keys.extend(("class", name[:idx + 1]) for idx, char in enumerate(name) if char == ".")
+        return keys
+
+    def _push_expiration(self, filter_obj: BaseFilter) -> None:
+        if filter_obj.expire_time:
+            heapq.heappush(self._expiration_heap,
+                           (filter_obj.expire_time + FILTER_EVENT_DECAY_TIME, self._seq, filter_obj.uuid))
+
+    def add(self, filter_obj: BaseFilter) -> None:
+        self.remove(filter_obj.uuid)
+        self._seq += 1
+        key = self._bucket_key(filter_obj)
+        self._filters[filter_obj.uuid] = (key, filter_obj)
+        self._buckets.setdefault(key, _FiltersBucket()).add(self._seq, filter_obj)
+        self._push_expiration(filter_obj)
+
+    def remove(self, uuid: str) -> None:
+        if entry := self._filters.pop(uuid, None):
+            key, _ = entry
+            bucket = self._buckets[key]
+            bucket.remove(uuid)
+            if not bucket.filters:
+                del self._buckets[key]
+
+    def set_expire_time(self, uuid: str, expire_time: float) -> None:
+        if entry := self._filters.get(uuid):
+            key, filter_obj = entry
+            filter_obj.expire_time = expire_time
+            self._buckets[key].invalidate()
+            self._push_expiration(filter_obj)
+
+    def remove_deceased(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.time()
+        while self._expiration_heap and self._expiration_heap[0][0] <= now:
+            _, _, uuid = heapq.heappop(self._expiration_heap)
+            if (entry := self._filters.get(uuid)) and entry[1].is_deceased():
+                self.remove(uuid)
+
+    def is_filtered(self, event: SctEventProtocol) -> bool:
+        """Apply severity changers to the event and return True if the event should be filtered out."""
+        self.remove_deceased()
+        buckets = [bucket for key in self._event_bucket_keys(event) if (bucket := self._buckets.get(key))]
+        if not buckets:
+            return False
+        if severity_changers := sorted(chain.from_iterable(bucket.get_severity_changers() for bucket in buckets)):
+            for _, filter_obj in severity_changers:
+                filter_obj.eval_filter(event)
+        event_str = lru_cache(maxsize=None)(event.__str__)
+        return any(bucket.is_filtered(event, event_str) for bucket in buckets)
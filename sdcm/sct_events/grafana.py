@@ -22,8 +22,9 @@ import requests
 
 from sdcm.sct_events.events_processes import \
     EVENTS_GRAFANA_ANNOTATOR_ID, EVENTS_GRAFANA_AGGREGATOR_ID, EVENTS_GRAFANA_POSTMAN_ID, \
-    EventsProcessesRegistry, BaseEventsProcess, EventsProcessPipe, \
+    EventsProcessesRegistry, BaseEventsProcess, EventsProcessPipe, InboundEventsGenerator, \
     start_events_process, get_events_process, verbose_suppress
+from sdcm.sct_events.event_frame import EventFlags
 
 
 GRAFANA_EVENT_AGGREGATOR_TIME_WINDOW: float = 90  # seconds
@@ -40,6 +41,14 @@ AnnotationKey = NewType("AnnotationKey", Tuple[str, ...])
 
 
 class GrafanaAnnotator(EventsProcessPipe[Tuple[str, Any], Annotation]):
+    def inbound_events(self) -> InboundEventsGenerator:
+        # Skip events which are not published to Grafana without unpickling them.
+        yield from get_events_process(name=self.inbound_events_process, _registry=self._registry).outbound_events(
+            stop_event=self.stop_event,
+            events_counter=self._events_counter,
+            accept=lambda frame: bool(frame.flags & EventFlags.PUBLISH_TO_GRAFANA),
+        )
+
     def run(self) -> None:
         for event_tuple in self.inbound_events():  # pylint: disable=no-member; pylint doesn't understand generics
             with verbose_suppress("GrafanaAnnotator failed to process %s", event_tuple):
@@ -17,12 +17,12 @@ import time
 import logging
 from typing import Type, Optional, List, Tuple, Any
 
-import dateutil.parser
 from invoke.runners import Result
 
 from sdcm.sct_events import Severity, SctEventProtocol
-from sdcm.sct_events.base import SctEvent, LogEvent, LogEventProtocol, T_log_event
+from sdcm.sct_events.base import SctEvent, LogEvent, LogEventProtocol, T_log_event, parse_log_timestamp
 from sdcm.sct_events.stress_events import BaseStressEvent, StressEvent, StressEventProtocol
+from sdcm.utils.stress_log_classifier import StressLogClassifier
 
 LOGGER = logging.getLogger(__name__)
 
@@ -144,6 +144,7 @@ NDBENCH_ERROR_EVENTS = (
 )
 
 NDBENCH_ERROR_EVENTS_PATTERNS = [(re.compile(event.regex), event) for event in NDBENCH_ERROR_EVENTS]
+NDBENCH_LOG_CLASSIFIER = StressLogClassifier(NDBENCH_ERROR_EVENTS_PATTERNS)
 
 
 class KclStressEvent(StressEvent, abstract=True):
@@ -196,6 +197,8 @@ CS_ERROR_EVENTS_PATTERNS: List[Tuple[re.Pattern, LogEventProtocol]] = \
 CS_NORMAL_EVENTS_PATTERNS: List[Tuple[re.Pattern, LogEventProtocol]] = \
     [(re.compile(event.regex), event) for event in CS_NORMAL_EVENTS]
 
+CS_LOG_CLASSIFIER = StressLogClassifier(CS_NORMAL_EVENTS_PATTERNS + CS_ERROR_EVENTS_PATTERNS)
+
 
 class ScyllaBenchLogEvent(LogEvent, abstract=True):
     ConsistencyError: Type[LogEventProtocol]
@@ -209,11 +212,13 @@ SCYLLA_BENCH_ERROR_EVENTS = (
 )
 SCYLLA_BENCH_ERROR_EVENTS_PATTERNS: List[Tuple[re.Pattern, LogEventProtocol]] = \
     [(re.compile(event.regex), event) for event in SCYLLA_BENCH_ERROR_EVENTS]
+SCYLLA_BENCH_LOG_CLASSIFIER = StressLogClassifier(SCYLLA_BENCH_ERROR_EVENTS_PATTERNS, first_match_only=False)
 
 CASSANDRA_HARRY_ERROR_EVENTS = (
 )
 CASSANDRA_HARRY_ERROR_EVENTS_PATTERNS: List[Tuple[re.Pattern, LogEventProtocol]] = \
     [(re.compile(event.regex), event) for event in CASSANDRA_HARRY_ERROR_EVENTS]
+CASSANDRA_HARRY_LOG_CLASSIFIER = StressLogClassifier(CASSANDRA_HARRY_ERROR_EVENTS_PATTERNS, first_match_only=False)
 
 
 class GeminiStressLogEvent(LogEvent[T_log_event], abstract=True):  # pylint: disable=too-many-instance-attributes
@@ -241,7 +246,7 @@ class GeminiStressLogEvent(LogEvent[T_log_event], abstract=True):  # pylint: dis
             return self
 
         try:
-            self.source_timestamp = dateutil.parser.parse(data.pop("T")).timestamp()
+            self.source_timestamp = parse_log_timestamp(data.pop("T"))
         except ValueError:
             pass
 
@@ -273,6 +278,15 @@ class GeminiStressLogEvent(LogEvent[T_log_event], abstract=True):  # pylint: dis
 
 GeminiStressLogEvent.add_subevent_type("GeminiEvent")
 
+# Gemini logs JSON objects, one per line, and every one of them is an event.  Other lines (e.g., Go panics) can't be
+# parsed, so they are skipped without creating an event unless a verbose classifier is used.
+GEMINI_LOG_LINE_RE = re.compile(r"^\s*\{")
+
+
+def get_gemini_log_classifier(verbose: bool = False) -> StressLogClassifier:
+    return StressLogClassifier([(re.compile("") if verbose else GEMINI_LOG_LINE_RE,
+                                 GeminiStressLogEvent.GeminiEvent(verbose=verbose))])
+
 
 class NoSQLBenchStressLogEvents(LogEvent, abstract=True):
     ProgressIndicatorStoppedEvent: Type[LogEventProtocol]
@@ -306,3 +320,4 @@ NOSQLBENCH_LOG_EVENTS = (
 )
 
 NOSQLBENCH_EVENT_PATTERNS = [(re.compile(event.regex), event) for event in NOSQLBENCH_LOG_EVENTS]
+NOSQLBENCH_LOG_CLASSIFIER = StressLogClassifier(NOSQLBENCH_EVENT_PATTERNS, first_match_only=False)
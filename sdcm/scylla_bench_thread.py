@@ -22,7 +22,7 @@ from enum import Enum
 from sdcm.loader import ScyllaBenchStressExporter
 from sdcm.prometheus import nemesis_metrics_obj
 from sdcm.sct_events import Severity
-from sdcm.sct_events.loaders import ScyllaBenchEvent, SCYLLA_BENCH_ERROR_EVENTS_PATTERNS
+from sdcm.sct_events.loaders import ScyllaBenchEvent, SCYLLA_BENCH_LOG_CLASSIFIER
 from sdcm.utils.common import FileFollowerThread, generate_random_string, convert_metric_to_ms
 from sdcm.stress_thread import format_stress_cmd_error
 from sdcm.wait import wait_for
@@ -59,17 +59,15 @@ class ScyllaBenchStressEventsPublisher(FileFollowerThread):
                 time.sleep(0.5)
                 continue
 
-            for line_number, line in enumerate(self.follow_file(self.sb_log_filename)):
+            line_number = 0
+            for lines in self.follow_file(self.sb_log_filename).batches():
                 if self.stopped():
                     break
 
-                for pattern, event in SCYLLA_BENCH_ERROR_EVENTS_PATTERNS:
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
+                for event in SCYLLA_BENCH_LOG_CLASSIFIER.events(lines, node=self.node, event_id=self.event_id,
+                                                                start_line_number=line_number):
+                    event.publish()
+                line_number += len(lines)
 
 
 class ScyllaBenchThread:  # pylint: disable=too-many-instance-attributes
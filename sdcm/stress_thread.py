@@ -19,14 +19,15 @@ import random
 import logging
 import concurrent.futures
 from typing import Any
-from itertools import chain
 
 from sdcm.loader import CassandraStressExporter
 from sdcm.cluster import BaseLoaderSet
 from sdcm.prometheus import nemesis_metrics_obj
+from sdcm.remote import OutputRetention
 from sdcm.sct_events import Severity
 from sdcm.utils.common import FileFollowerThread, generate_random_string, get_profile_content
-from sdcm.sct_events.loaders import CassandraStressEvent, CS_ERROR_EVENTS_PATTERNS, CS_NORMAL_EVENTS_PATTERNS
+from sdcm.utils.cs_results import CassandraStressResults
+from sdcm.sct_events.loaders import CassandraStressEvent, CS_LOG_CLASSIFIER
 
 
 LOGGER = logging.getLogger(__name__)
@@ -54,18 +55,15 @@ class CassandraStressEventsPublisher(FileFollowerThread):
                 time.sleep(0.5)
                 continue
 
-            for line_number, line in enumerate(self.follow_file(self.cs_log_filename)):
+            line_number = 0
+            for lines in self.follow_file(self.cs_log_filename).batches():
                 if self.stopped():
                     break
 
-                for pattern, event in chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS):
-                    if self.event_id:
-                        # Connect the event to the stress load
-                        event.event_id = self.event_id
-
-                    if pattern.search(line):
-                        event.add_info(node=self.node, line=line, line_number=line_number).publish()
-                        break  # Stop iterating patterns to avoid creating two events for one line of the log
+                for event in CS_LOG_CLASSIFIER.events(lines, node=self.node, event_id=self.event_id,
+                                                      start_line_number=line_number):
+                    event.publish()
+                line_number += len(lines)
 
 
 class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
@@ -90,6 +88,8 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         self.shell_marker = generate_random_string(20)
         #  This marker is used to mark shell commands, in order to be able to kill them later
         self.max_workers = 0
+        # Results of all c-s commands parsed while the output streams, keyed by the TAG of the command.
+        self.live_results: dict[str, CassandraStressResults] = {}
 
     def create_stress_cmd(self, node, loader_idx, keyspace_idx):
         stress_cmd = self.stress_cmd
@@ -174,7 +174,7 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         LOGGER.debug('cassandra-stress local log: %s', log_file_name)
 
         # This tag will be output in the header of c-stress result,
-        # we parse it to know the loader & cpu info in _parse_cs_summary().
+        # we parse it to know the loader & cpu info in the summary.
         tag = f'TAG: loader_idx:{loader_idx}-cpu_idx:{cpu_idx}-keyspace_idx:{keyspace_idx}'
 
         if self.stress_num > 1:
@@ -184,6 +184,7 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         node_cmd = f'echo {tag}; {node_cmd}'
 
         result = None
+        cs_results = self.live_results[tag] = CassandraStressResults()
 
         # disable logging for cassandra stress
         node.remoter.run("cp /etc/scylla/cassandra/logback-tools.xml .", ignore_status=True)
@@ -198,12 +199,17 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
                                      log_file_name=log_file_name) as cs_stress_event:
             publisher.event_id = cs_stress_event.event_id
             try:
-                result = node.remoter.run(cmd=node_cmd, timeout=self.timeout, log_file=log_file_name)
+                # c-s output is parsed while it streams, so the result keeps only its head and tail.
+                result = node.remoter.run(cmd=node_cmd, timeout=self.timeout, log_file=log_file_name,
+                                          stdout_sink=cs_results.stdout, stderr_sink=cs_results.stderr,
+                                          retention=OutputRetention())
             except Exception as exc:  # pylint: disable=broad-except
                 cs_stress_event.severity = Severity.CRITICAL if self.stop_test_on_failure else Severity.ERROR
                 cs_stress_event.add_error(errors=[format_stress_cmd_error(exc)])
+            finally:
+                cs_results.finish()
 
-        return node, result, cs_stress_event
+        return node, result, cs_stress_event, cs_results
 
     def run(self):
         if self.round_robin:
@@ -249,14 +255,12 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         for future in concurrent.futures.as_completed(self.results_futures, timeout=self.timeout):
             results.append(future.result())
 
-        for _, result, event in results:
+        for _, result, event, cs_results in results:
             if not result:
                 # Silently skip if stress command threw error, since it was already reported in _run_stress
                 continue
-            output = result.stdout + result.stderr
             try:
-                lines = output.splitlines()
-                node_cs_res = BaseLoaderSet._parse_cs_summary(lines)  # pylint: disable=protected-access
+                node_cs_res = cs_results.summary
                 if node_cs_res:
                     ret.append(node_cs_res)
             except Exception as exc:  # pylint: disable=broad-except
@@ -275,21 +279,26 @@ class CassandraStressThread:  # pylint: disable=too-many-instance-attributes
         for future in concurrent.futures.as_completed(self.results_futures, timeout=self.timeout):
             results.append(future.result())
 
-        for node, result, _ in results:
+        for node, result, _, cs_results in results:
             if not result:
                 # Silently skip if stress command threw error, since it was already reported in _run_stress
                 continue
-            output = result.stdout + result.stderr
-            lines = output.splitlines()
-            node_cs_res = BaseLoaderSet._parse_cs_summary(lines)  # pylint: disable=protected-access
+            node_cs_res = cs_results.summary
             if node_cs_res:
                 cs_summary.append(node_cs_res)
-            for line in lines:
-                if 'java.io.IOException' in line:
-                    errors += ['%s: %s' % (node, line.strip())]
+            errors += ['%s: %s' % (node, line) for line in cs_results.errors]
 
         return cs_summary, errors
 
+    def get_live_intervals(self) -> list[dict]:
+        """Return the latest interval (throughput and latencies) of every running or finished c-s command."""
+        return [interval for cs_results in list(self.live_results.values())
+                if (interval := cs_results.last_interval()) is not None]
+
+    def get_live_throughput(self) -> float:
+        """Return the total op/s of all c-s commands according to their latest intervals."""
+        return sum(interval["ops"] for interval in self.get_live_intervals())
+
 
 class DockerBasedStressThread:
     # pylint: disable=too-many-instance-attributes
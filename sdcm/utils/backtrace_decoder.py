@@ -0,0 +1,148 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Decode batches of Scylla backtraces with one addr2line command.
+
+Reactor stall storms produce thousands of backtraces, but they are built of a small set of addresses.  The decoder
+remembers recently decoded backtraces and every decoded address: all addresses of a batch of backtraces which weren't
+seen before are decoded by one addr2line command and a backtrace is composed of decoded frames of its addresses,
+which is exactly what addr2line prints for the whole backtrace.
+"""
+
+import os
+import logging
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from sdcm.remote.base import CommandRunner
+
+LOGGER = logging.getLogger(__name__)
+
+ADDR2LINE_CMD = "addr2line -Cpife {debug_file} {addresses}"
+ADDR2LINE_MAX_ADDRESSES: int = 1000  # addresses per one addr2line command, to keep the command line short enough
+ADDR2LINE_INLINED_FRAME_PREFIX = " (inlined by) "
+
+BACKTRACES_CACHE_SIZE: int = 10_000
+ADDRESSES_CACHE_SIZE: int = 1_000_000
+BACKTRACES_DECODING_BATCH_SIZE: int = 500
+
+# Debug info files are big (GBs), keep them by build-id for all nodes, monitors and tests run on this host.
+DEBUGINFO_CACHE_DIR = os.path.join(tempfile.gettempdir(), "scylla-debuginfo")
+DEBUGINFO_CACHE_MAX_SIZE: int = 20 * 1024 ** 3  # least recently used files are removed above this size (in bytes)
+
+
+def debuginfo_file_name(debug_file: str, build_id: Optional[str]) -> str:
+    """Name of the cached copy of `debug_file': by build-id if it's known, otherwise by the original file name."""
+    return f"scylla-{build_id}.debug" if build_id else os.path.basename(debug_file)
+
+
+def prune_debuginfo_cache(keep: str, max_size: int = DEBUGINFO_CACHE_MAX_SIZE) -> None:
+    """Remove least recently used debug info files from `DEBUGINFO_CACHE_DIR' till it fits `max_size'.
+
+    Files are ordered by mtime, which is updated on every use of the cached file.  `keep' is never removed.
+    """
+    entries = []
+    with os.scandir(DEBUGINFO_CACHE_DIR) as files:
+        for entry in files:
+            if entry.is_file() and entry.name.endswith(".debug"):  # skip files which are being received
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # removed by another process
+            pass
+        LOGGER.debug("Removed %s from the debug info cache", path)
+        total_size -= size
+
+
+def split_addr2line_frames(output: str) -> List[str]:
+    """Split output of `addr2line -pi' into frames: one per address, each with its inlined frames."""
+    frames = []
+    for line in output.splitlines(keepends=True):
+        if frames and line.startswith(ADDR2LINE_INLINED_FRAME_PREFIX):
+            frames[-1] += line
+        else:
+            frames.append(line)
+    return frames
+
+
+class BacktraceDecoder:
+    """Decode backtraces using `debug_file' which is located on the node of `remoter'."""
+
+    def __init__(self, remoter: CommandRunner, debug_file: str):
+        self.remoter = remoter
+        self.debug_file = debug_file
+        self.stats = {"backtraces": 0, "cached_backtraces": 0, "addresses": 0, "addr2line_runs": 0}
+        self._backtraces: OrderedDict[str, str] = OrderedDict()
+        self._frames: Dict[str, str] = {}
+
+    def decode(self, raw_backtrace: str) -> str:
+        return self.decode_many([raw_backtrace])[0]
+
+    def decode_many(self, raw_backtraces: Sequence[str]) -> List[str]:
+        """Return decoded backtraces in the same order.
+
+        Last `BACKTRACES_CACHE_SIZE' used backtraces are cached.
+        """
+        self.stats["backtraces"] += len(raw_backtraces)
+        decoded_backtraces, new = {}, []
+        for raw in dict.fromkeys(raw_backtraces):
+            if (decoded := self._backtraces.get(raw)) is None:
+                new.append(raw)
+            else:
+                self._backtraces.move_to_end(raw)
+                decoded_backtraces[raw] = decoded
+        self.stats["cached_backtraces"] += len(raw_backtraces) - len(new)
+        if len(self._frames) > ADDRESSES_CACHE_SIZE:
+            self._frames.clear()
+        addresses = list(dict.fromkeys(address for raw in new for address in raw.split()
+                                       if address not in self._frames))
+        for start in range(0, len(addresses), ADDR2LINE_MAX_ADDRESSES):
+            self._decode_addresses(addresses[start:start + ADDR2LINE_MAX_ADDRESSES])
+        for raw in new:
+            frames = [self._frames.get(address) for address in raw.split()]
+            if None in frames:
+                # addr2line output for some addresses of the batch couldn't be mapped, decode the backtrace as is.
+                decoded = self._addr2line(" ".join(raw.split("\n")))
+            else:
+                decoded = "".join(frames)
+            self._backtraces[raw] = decoded_backtraces[raw] = decoded
+            while len(self._backtraces) > BACKTRACES_CACHE_SIZE:
+                self._backtraces.popitem(last=False)
+        return [decoded_backtraces[raw] for raw in raw_backtraces]
+
+    def _decode_addresses(self, addresses: List[str]) -> None:
+        frames = split_addr2line_frames(self._addr2line(" ".join(addresses)))
+        if len(frames) != len(addresses):
+            LOGGER.debug("addr2line returned %d frames for %d addresses", len(frames), len(addresses))
+            return
+        self.stats["addresses"] += len(addresses)
+        self._frames.update(zip(addresses, frames))
+
+    def _addr2line(self, addresses: str) -> str:
+        self.stats["addr2line_runs"] += 1
+        return self.remoter.run(ADDR2LINE_CMD.format(debug_file=self.debug_file, addresses=addresses),
+                                verbose=False).stdout
+
+
+__all__ = ("BacktraceDecoder", "split_addr2line_frames", "debuginfo_file_name", "prune_debuginfo_cache",
+           "ADDR2LINE_MAX_ADDRESSES", "BACKTRACES_DECODING_BATCH_SIZE", "DEBUGINFO_CACHE_DIR",
+           "DEBUGINFO_CACHE_MAX_SIZE", )
@@ -15,7 +15,6 @@
 
 from __future__ import absolute_import, annotations
 
-import atexit
 import itertools
 import os
 import logging
@@ -25,7 +24,6 @@ import time
 import datetime
 import errno
 import threading
-import select
 import shutil
 import copy
 import string
@@ -37,7 +35,7 @@ import uuid
 import zipfile
 import io
 import tempfile
-from typing import Iterable, List, Callable, Optional, Dict, Union, Literal, Any
+from typing import Iterable, Iterator, List, Callable, Optional, Dict, Union, Literal, Any
 from urllib.parse import urlparse
 from unittest.mock import Mock
 from textwrap import dedent
@@ -45,8 +43,7 @@ from contextlib import closing
 from functools import wraps, cached_property, lru_cache
 from collections import defaultdict, namedtuple
 import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from concurrent.futures.thread import _python_exit
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 import hashlib
 from pathlib import Path
 import requests
@@ -68,6 +65,8 @@ from sdcm.provision.azure.provisioner import AzureProvisioner
 from sdcm.utils.aws_utils import EksClusterCleanupMixin, AwsArchType
 from sdcm.utils.ssh_agent import SSHAgent
 from sdcm.utils.decorators import retrying
+from sdcm.utils.file_follower import get_file_follower_service
+from sdcm.utils.task_executor import Task, TaskBatch, get_task_executor
 from sdcm import wait
 from sdcm.utils.ldap import DEFAULT_PWD_SUFFIX, SASLAUTHD_AUTHENTICATOR, LdapServerType
 from sdcm.keystore import KeyStore
@@ -174,6 +173,7 @@ class S3Storage():
     enable_multipart_threshold_size = 1024 * 1024 * 1024  # 1GB
     multipart_chunksize = 50 * 1024 * 1024  # 50 MB
     num_download_attempts = 5
+    stream_upload_concurrency = 4
 
     def __init__(self, bucket=None):
         if bucket:
@@ -183,6 +183,12 @@ class S3Storage():
             multipart_threshold=self.enable_multipart_threshold_size,
             multipart_chunksize=self.multipart_chunksize,
             num_download_attempts=self.num_download_attempts)
+        # Parts of a stream are buffered in memory, so don't wait for `enable_multipart_threshold_size' of data.
+        self.stream_transfer_config = boto3.s3.transfer.TransferConfig(
+            multipart_threshold=self.multipart_chunksize,
+            multipart_chunksize=self.multipart_chunksize,
+            max_concurrency=self.stream_upload_concurrency,
+            num_download_attempts=self.num_download_attempts)
 
     def get_s3_fileojb(self, key):
         objects = []
@@ -219,6 +225,34 @@ class S3Storage():
             LOGGER.debug("Unable to upload to S3: %s", details)
             return ""
 
+    def upload_fileobj(self, fileobj, file_name, dest_dir=''):
+        """Upload data read from a file-like object (e.g., a pipe) without knowing its size in advance.
+
+        Big streams are uploaded using multipart upload, parts are uploaded while the stream is being read.
+        """
+        s3_url = self.generate_url(file_name, dest_dir)
+        s3_obj = "{}/{}".format(dest_dir, file_name)
+        try:
+            LOGGER.info("Uploading stream to %s", s3_url)
+            self._bucket.upload_fileobj(Fileobj=fileobj,
+                                        Key=s3_obj,
+                                        Config=self.stream_transfer_config)
+            LOGGER.info("Uploaded to %s", s3_url)
+            LOGGER.info("Set public read access")
+            self.set_public_access(key=s3_obj)
+            return s3_url
+        except Exception as details:  # pylint: disable=broad-except
+            LOGGER.debug("Unable to upload to S3: %s", details)
+            return ""
+
+    def delete_file(self, file_name, dest_dir=''):
+        s3_obj = "{}/{}".format(dest_dir, file_name)
+        try:
+            LOGGER.info("Deleting %s", self.generate_url(file_name, dest_dir))
+            self._bucket.Object(s3_obj).delete()
+        except Exception as details:  # pylint: disable=broad-except
+            LOGGER.debug("Unable to delete from S3: %s", details)
+
     def set_public_access(self, key):
         acl_obj: S3ServiceResource = boto3.resource('s3').ObjectAcl(self.bucket_name, key)
 
@@ -341,7 +375,7 @@ class ParallelObject:
     """
 
     def __init__(self, objects: Iterable, timeout: int = 6,  # pylint: disable=redefined-outer-name
-                 num_workers: int = None, disable_logging: bool = False):
+                 num_workers: int = None, disable_logging: bool = False, priority: int = 0):
         """Constructor for ParallelObject
 
         Build instances of Parallel object. Item of objects is used as parameter for
@@ -352,15 +386,30 @@ class ParallelObject:
                 if item in object is any other type, will be passed to disrupt_func as is.
                 if function accept list as parameter, the item shuld be list of list item = [[]]
 
-        :param timeout: global timeout for running all
-        :param num_workers: num of parallel threads, defaults to None
+        :param timeout: timeout for every call, counted from the start of the call
+        :param num_workers: max number of calls running at the same time, defaults to None (min(32, cpu count + 4))
         :param disable_logging: disable logging for running disrupt_func, defaults to False
+        :param priority: priority of calls in the shared task executor, a lower one runs first
         """
         self.objects = objects
         self.timeout = timeout
-        self.num_workers = num_workers
+        self.num_workers = num_workers or min(32, (os.cpu_count() or 1) + 4)
         self.disable_logging = disable_logging
-        self._thread_pool = ThreadPoolExecutor(max_workers=self.num_workers)  # pylint: disable=consider-using-with
+        self.priority = priority
+
+    def iter_results(self, func: Callable, unpack_objects: bool = False) -> Iterator["ParallelObjectResult"]:
+        """Run callable object "disrupt_func" in parallel and yield results as soon as they are ready
+
+        Calls run in the task executor shared by the process.  Every call has its own deadline, `timeout' seconds
+        from the start of the call: a call which didn't finish by its deadline is reported with
+        FuturesTimeoutError.  If the consumer stops the iteration, calls which didn't start are cancelled.
+
+        :param func: Callable object to run in parallel
+        :param unpack_objects: set to True when unpacking of objects to the disrupt_func as args or kwargs needed
+        :returns: iterator of FutureResult objects in order of completion
+        """
+        for task in self._iter_tasks(self._submit(func, unpack_objects=unpack_objects), func_name=func.__name__):
+            yield ParallelObjectResult(obj=task.obj, exc=task.exc, result=task.result)
 
     def run(self, func: Callable, ignore_exceptions=False, unpack_objects: bool = False):
         """Run callable object "disrupt_func" in parallel
@@ -378,66 +427,65 @@ class ParallelObject:
         :param func: Callable object to run in parallel
         :param ignore_exceptions: ignore exception and return result, defaults to False
         :param unpack_objects: set to True when unpacking of objects to the disrupt_func as args or kwargs needed
-        :returns: list of FutureResult object
+        :returns: list of FutureResult object in order of objects
         :rtype: {List[FutureResult]}
         """
+        batch = self._submit(func, unpack_objects=unpack_objects)
+        for _ in self._iter_tasks(batch, func_name=func.__name__):
+            pass
+        results = [ParallelObjectResult(obj=task.obj, exc=task.exc, result=task.result) for task in batch.tasks]
+
+        if ignore_exceptions:
+            return results
+
+        timed_out = [result for result in results if isinstance(result.exc, FuturesTimeoutError)]
+        if timed_out:
+            raise FuturesTimeoutError("when running on: %s" % [r.obj for r in timed_out])
+        runs_that_finished_with_exception = [res for res in results if res.exc]
+        if runs_that_finished_with_exception:
+            raise ParallelObjectException(results=results)
+        return results
+
+    def _submit(self, func: Callable, unpack_objects: bool) -> TaskBatch:
 
         def func_wrap(fun):
             @wraps(fun)
             def inner(*args, **kwargs):
                 thread_name = threading.current_thread().name
-                fun_args = args
-                fun_kwargs = kwargs
-                fun_name = fun.__name__
-                LOGGER.debug("[{thread_name}] {fun_name}({fun_args}, {fun_kwargs})".format(thread_name=thread_name,
-                                                                                           fun_name=fun_name,
-                                                                                           fun_args=fun_args,
-                                                                                           fun_kwargs=fun_kwargs))
+                LOGGER.debug("[%s] %s(%s, %s)", thread_name, fun.__name__, args, kwargs)
                 return_val = fun(*args, **kwargs)
-                LOGGER.debug("[{thread_name}] Done.".format(thread_name=thread_name))
+                LOGGER.debug("[%s] Done.", thread_name)
                 return return_val
 
             return inner
 
-        results = []
-
+        objects = list(self.objects)
         if not self.disable_logging:
-            LOGGER.debug("Executing in parallel: '{}' on {}".format(func.__name__, self.objects))
+            LOGGER.debug("Executing in parallel: '%s' on %d object(s)", func.__name__, len(objects))
             func = func_wrap(func)
 
-        futures = []
-
-        for obj in self.objects:
+        batch = get_task_executor().batch(concurrency=self.num_workers)
+        for obj in objects:
             if unpack_objects and isinstance(obj, (list, tuple)):
-                futures.append((self._thread_pool.submit(func, *obj), obj))
+                args, kwargs = obj, None
             elif unpack_objects and isinstance(obj, dict):
-                futures.append((self._thread_pool.submit(func, **obj), obj))
-            else:
-                futures.append((self._thread_pool.submit(func, obj), obj))
-        time_out = self.timeout
-        for future, target_obj in futures:
-            try:
-                result = future.result(time_out)
-            except FuturesTimeoutError as exception:
-                results.append(ParallelObjectResult(obj=target_obj, exc=exception, result=None))
-                time_out = 0.001  # if there was a timeout on one of the futures there is no need to wait for all
-            except Exception as exception:  # pylint: disable=broad-except
-                results.append(ParallelObjectResult(obj=target_obj, exc=exception, result=None))
+                args, kwargs = (), obj
             else:
-                results.append(ParallelObjectResult(obj=target_obj, exc=None, result=result))
-
-        self.clean_up(futures)
-
-        if ignore_exceptions:
-            return results
+                args, kwargs = (obj, ), None
+            batch.submit(func, args=args, kwargs=kwargs, priority=self.priority, timeout=self.timeout, obj=obj)
+        return batch
 
-        timed_out = [result for result in results if isinstance(result.exc, FuturesTimeoutError)]
-        if timed_out:
-            raise FuturesTimeoutError("when running on: %s" % [r.obj for r in results])
-        runs_that_finished_with_exception = [res for res in results if res.exc]
-        if runs_that_finished_with_exception:
-            raise ParallelObjectException(results=results)
-        return results
+    def _iter_tasks(self, batch: TaskBatch, func_name: str) -> Iterator[Task]:
+        try:
+            yield from batch.as_completed()
+        finally:
+            # if there are calls that didn't start we cancel them
+            batch.cancel()
+            if not self.disable_logging and batch.tasks:
+                LOGGER.debug("Executed in parallel: '%s' on %d object(s), max queue wait %.1fs, max duration %.1fs",
+                             func_name, len(batch.tasks),
+                             max(task.queue_wait or 0 for task in batch.tasks),
+                             max(task.duration or 0 for task in batch.tasks))
 
     def call_objects(self, ignore_exceptions: bool = False) -> list["ParallelObjectResult"]:
         """
@@ -459,14 +507,6 @@ class ParallelObject:
         """
         return self.run(lambda x: x(), ignore_exceptions=ignore_exceptions)
 
-    def clean_up(self, futures):
-        # if there are futures that didn't run  we cancel them
-        for future, _ in futures:
-            future.cancel()
-        self._thread_pool.shutdown(wait=False)
-        # we need to unregister internal function that waits for all threads to finish when interpreter exits
-        atexit.unregister(_python_exit)
-
     @staticmethod
     def run_named_tasks_in_parallel(tasks: dict[str, Callable],
                                     timeout: int,
@@ -1335,25 +1375,26 @@ def safe_kill(pid, signal):
 
 
 class FileFollowerIterator():  # pylint: disable=too-few-public-methods
+    """Iterate over lines of a growing file till `thread_obj' is stopped.
+
+    The file is read by the shared `FileFollowerService' which wakes up on changes of the file and passes new lines
+    here in batches.
+    """
+
     def __init__(self, filename, thread_obj):
         self.filename = filename
         self.thread_obj = thread_obj
 
     def __iter__(self):
-        with open(self.filename, encoding="utf-8") as input_file:
-            line = ''
-            while not self.thread_obj.stopped():
-                poller = select.poll()  # pylint: disable=no-member
-                poller.register(input_file, select.POLLIN)  # pylint: disable=no-member
-                if poller.poll(100):
-                    line += input_file.readline()
-                if not line or not line.endswith('\n'):
-                    time.sleep(0.1)
-                    continue
-                poller.unregister(input_file)
-                yield line
-                line = ''
-            yield line
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self):
+        followed = get_file_follower_service().follow(self.filename)
+        try:
+            yield from followed.iter_batches(stopped=self.thread_obj.stopped)
+        finally:
+            followed.close()
 
 
 class FileFollowerThread():
@@ -0,0 +1,106 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Caches used to build SCT configuration.
+
+- Layers of YAML files (e.g., defaults of a backend) are parsed and merged once per process while the files aren't
+  modified: a layer is keyed by paths, mtimes and sizes of its files.
+- Resolution of `scylla_version' to an image (AMI, GCE image) is memoized on disk for `IMAGES_CACHE_TTL' seconds,
+  so processes which build the same configuration (`sct.py lint_yamls' workers, stages of a CI job) query the cloud
+  only once.  Versions which point to the latest build are not cached on disk.
+"""
+
+import os
+import copy
+import json
+import time
+import logging
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, Tuple
+
+import anyconfig
+
+LOGGER = logging.getLogger(__name__)
+
+CONFIG_CACHE_DIR = os.path.join(tempfile.gettempdir(), "sct-config-cache")
+IMAGES_CACHE_FILE = os.path.join(CONFIG_CACHE_DIR, "images.json")
+IMAGES_CACHE_TTL: int = 3600
+
+_YAML_LAYERS: Dict[Tuple, dict] = {}
+_YAML_LAYERS_LOCK = threading.Lock()
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def load_yaml_layer(paths: Iterable[str]) -> dict:
+    """The same as `anyconfig.load(paths)', but files are parsed and merged only once while they aren't modified.
+
+    Return a copy, so the caller can change it.
+    """
+    paths = list(paths)
+    try:
+        key = tuple(_file_key(path) for path in paths)
+    except OSError:
+        return anyconfig.load(paths)  # let anyconfig report missing files as it always did
+    with _YAML_LAYERS_LOCK:
+        if key not in _YAML_LAYERS:
+            _YAML_LAYERS[key] = anyconfig.load(paths)
+        return copy.deepcopy(_YAML_LAYERS[key])
+
+
+def clear_yaml_layers() -> None:
+    with _YAML_LAYERS_LOCK:
+        _YAML_LAYERS.clear()
+
+
+def _load_images_cache() -> dict:
+    try:
+        with open(IMAGES_CACHE_FILE, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_images_cache(cache: dict) -> None:
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=CONFIG_CACHE_DIR, delete=False, encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(cache_file.name, IMAGES_CACHE_FILE)
+    except OSError as exc:
+        LOGGER.debug("Unable to save images cache: %s", exc)
+
+
+def cached_image(key: Tuple[str, ...], resolve: Callable[[], str], scylla_version: str) -> str:
+    """Return the image found by `resolve()' for `key' earlier than `IMAGES_CACHE_TTL' seconds ago or resolve it."""
+    if "latest" in scylla_version:
+        return resolve()
+    cache_key = "|".join(key)
+    now = time.time()
+    cache = _load_images_cache()
+    if (entry := cache.get(cache_key)) and now - entry[0] < IMAGES_CACHE_TTL:
+        LOGGER.debug("Use cached image %s for %s", entry[1], key)
+        return entry[1]
+    image = resolve()
+    cache = {name: entry for name, entry in _load_images_cache().items() if now - entry[0] < IMAGES_CACHE_TTL}
+    cache[cache_key] = [now, image]
+    _save_images_cache(cache)
+    return image
+
+
+__all__ = ("load_yaml_layer", "clear_yaml_layers", "cached_image", "CONFIG_CACHE_DIR", "IMAGES_CACHE_TTL", )
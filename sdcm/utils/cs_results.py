@@ -0,0 +1,250 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Parse cassandra-stress output incrementally while it streams from a loader.
+
+`CassandraStressResults' has output sinks for a remoter: pass them to `remoter.run()' and it consumes the output line
+by line.  Interval lines (`total, ...') are stored in typed arrays, one per column, so a multi-hour run takes a few
+bytes per interval, and the summary is parsed as soon as it's printed.  Nothing else of the output is kept, so results
+are available without splitting the whole stdout/stderr after the run, and the remoter can keep only a bit of it.
+
+    >>> cs_results = CassandraStressResults()
+    >>> node.remoter.run(cmd=stress_cmd, stdout_sink=cs_results.stdout, stderr_sink=cs_results.stderr,
+    ...                  retention=OutputRetention())
+    >>> cs_results.finish()
+    >>> cs_results.last_interval()["ops"], cs_results.summary
+"""
+
+import re
+import logging
+import threading
+from array import array
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+# Positions of columns in c-s interval lines:
+#   type, total ops, op/s, pk/s, row/s, mean, med, .95, .99, .999, max, time, stderr, errors, gc: #, ...
+#   total,    203589,  40718,  40718,  40718,  1.2,  0.9,  2.7,  6.2,  16.5,  38.2,  5.0, 0.00000, 0, 0, ...
+CS_INTERVAL_COLUMNS: Dict[str, int] = {
+    "totalops": 1,
+    "ops": 2,
+    "lat95": 7,
+    "lat99": 8,
+    "lat999": 9,
+    "latmax": 10,
+    "time": 11,
+}
+CS_TAG_RE = re.compile(r"TAG: loader_idx:(\d+)-cpu_idx:(\d+)-keyspace_idx:(\d+)")
+CS_MIXED_RESULT_RE = re.compile(r".*READ:(\d+), WRITE:(\d+)]")
+CS_MAX_ERROR_LINES: int = 100
+
+
+class CassandraStressIntervals:
+    """Columns of c-s intervals stored in arrays of doubles.
+
+    Columns are accessible by name (e.g., intervals["ops"]) the same way as lists of the former results dict.
+    Rows are appended by one writer thread and can be read by other threads at the same time: `len()' is updated
+    only after all columns of a row are appended.
+    """
+
+    def __init__(self):
+        self._columns = {name: array("d") for name in CS_INTERVAL_COLUMNS}
+        self._size = 0
+
+    def add_line(self, line: str) -> bool:
+        """Add an interval line (`total, ...') and return True if it was added."""
+        items = line.split(",")
+        try:
+            values = [float(items[position]) for position in CS_INTERVAL_COLUMNS.values()]
+        except (IndexError, ValueError):
+            return False
+        for column, value in zip(self._columns.values(), values):
+            column.append(value)
+        self._size += 1
+        return True
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, column: str) -> array:
+        return self._columns[column][:self._size]
+
+    def row(self, index: int) -> Dict[str, float]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("interval index out of range")
+        return {name: column[index] for name, column in self._columns.items()}
+
+
+class CassandraStressSummary:
+    """Parse the summary of c-s output (`Results:' section) line by line.
+
+    Produce the same dict as parsing of the whole output at once: TAG, username and all `key : value' lines of
+    the summary till `END'.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.found = False
+        self.finished = False
+        self._last_lines = deque(maxlen=10)
+
+    def add_line(self, line: str) -> None:
+        if self.finished:
+            return
+        line = line.strip()
+        if not line:
+            return
+        self._last_lines.append(line)
+        if line.startswith("TAG:"):
+            # TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
+            ret = CS_TAG_RE.findall(line)
+            self.results["loader_idx"], self.results["cpu_idx"], self.results["keyspace_idx"] = ret[0]
+            return
+        if line.startswith("Username:"):
+            # Mode:
+            # ...
+            #   Username: null
+            #   Password: null
+            self.results["username"] = line.split("Username:")[1].strip()
+        if line.startswith("Results:"):
+            # Results:
+            # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
+            # Partition rate            :    9,999 pk/s  [WRITE: 9,999 pk/s]
+            # ....
+            self.found = True
+            return
+        if line == "END":
+            self.finished = True
+            return
+        if not self.found:
+            return
+        split_idx = line.find(":")
+        if split_idx < 0:
+            return
+        # Op rate                   :    9,999 op/s  [WRITE: 9,999 op/s]
+        # Latency 99.9th percentile :   23.7 ms [WRITE: 23.7 ms]
+        # Latency max               : 15787.4 ms [WRITE: 15,787.4 ms]
+        # Total partitions          : 108,000,096 [WRITE: 108,000,096]
+        # Total GC time             :    0.0 seconds
+        key = line[:split_idx].strip().lower()
+        self.results[key] = line[split_idx + 1:].split()[0].replace(",", "")
+        if match := CS_MIXED_RESULT_RE.findall(line):  # parse results for mixed workload
+            self.results[f"{key} read"] = match[0][0]
+            self.results[f"{key} write"] = match[0][1]
+
+    def get(self) -> dict:
+        if not self.found:
+            LOGGER.warning("Cannot find summary in c-stress results: %s", list(self._last_lines))
+            return {}
+        return self.results
+
+
+class CassandraStressOutputStream:
+    """Output sink which splits written data into lines and passes them to `add_line'.
+
+    A remoter writes to it from one thread, `add_line' is called under `lock' which can be shared by a few streams.
+    """
+
+    def __init__(self, add_line: Callable[[str], None], lock: threading.Lock):
+        self._add_line = add_line
+        self._lock = lock
+        self._partial_line = ""
+
+    def write(self, data: str) -> None:
+        lines = (self._partial_line + data).split("\n")
+        self._partial_line = lines.pop()
+        with self._lock:
+            for line in lines:
+                self._add_line(line)
+
+    def flush(self) -> None:
+        """Called by invoke after every write: nothing to do, lines are passed on as soon as they're complete."""
+
+    def finish(self) -> None:
+        """Pass on the last line if it doesn't end with a newline."""
+        if self._partial_line:
+            with self._lock:
+                self._add_line(self._partial_line)
+            self._partial_line = ""
+
+
+class CassandraStressResults:
+    """Incremental parser of c-s output: intervals, summary and `java.io.IOException' lines.
+
+    `stdout' and `stderr' are output sinks for `remoter.run()'.  Intervals and the summary are parsed from stdout
+    only, error lines are collected from both streams.  The results can be read by other threads while c-s runs.
+    Only the last `CS_MAX_ERROR_LINES' error lines are kept, `errors_count' counts all of them.
+    """
+
+    def __init__(self):
+        self.intervals = CassandraStressIntervals()
+        self._summary = CassandraStressSummary()
+        self.errors = deque(maxlen=CS_MAX_ERROR_LINES)
+        self.errors_count = 0
+        lock = threading.Lock()
+        self.stdout = CassandraStressOutputStream(add_line=self.add_line, lock=lock)
+        self.stderr = CassandraStressOutputStream(add_line=self.add_error_line, lock=lock)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "CassandraStressResults":
+        results = cls()
+        for line in lines:
+            results.add_line(line)
+        return results
+
+    def add_line(self, line: str) -> None:
+        """Consume a line of stdout."""
+        if line.startswith("total,"):
+            self.intervals.add_line(line)
+            return
+        if self.add_error_line(line):
+            return
+        self._summary.add_line(line)
+
+    def add_error_line(self, line: str) -> bool:
+        """Consume a line of stderr: return True if it's an error line."""
+        if "java.io.IOException" not in line:
+            return False
+        self.errors.append(line.strip())
+        self.errors_count += 1
+        return True
+
+    @property
+    def summary(self) -> dict:
+        """The summary of the run or an empty dict if c-s didn't print it."""
+        return self._summary.get()
+
+    def last_interval(self) -> Optional[Dict[str, float]]:
+        """The latest interval: throughput (`ops'), latencies in ms and time, or None if there are no intervals yet."""
+        return self.intervals.row(-1) if self.intervals else None
+
+    def finish(self) -> None:
+        """Consume last lines of the output streams which don't end with a newline."""
+        self.stdout.finish()
+        self.stderr.finish()
+
+
+def parse_cs_summary(lines: Iterable[str]) -> dict:
+    summary = CassandraStressSummary()
+    for line in lines:
+        summary.add_line(line)
+    return summary.get()
+
+
+__all__ = ("CS_INTERVAL_COLUMNS", "CassandraStressIntervals", "CassandraStressSummary", "CassandraStressOutputStream",
+           "CassandraStressResults", "parse_cs_summary", )
@@ -13,10 +13,8 @@
 
 # Data validation module may be used with cassandra-stress user profile only
 #
-# **************** Caution **************************************************************
-# BE AWARE: During data validation all materialized views/expected table rows will be read into the memory
-#           Be sure your dataset will be less then 2Gb.
-# ****************************************************************************************
+# Views and expected data tables are compared by token ranges using per-range digests (see sdcm.utils.table_digest),
+# so they are not read into the memory.  Rows are fetched only for ranges with mismatched digests.
 #
 # Here is described Data validation module and requirements for user profile.
 # Please, read the explanation and requirements
@@ -137,6 +135,7 @@ import logging
 from sdcm.sct_events import Severity
 
 from sdcm.utils.common import get_profile_content
+from sdcm.utils.table_digest import TableDigestComparator
 from sdcm.sct_events.health import DataValidatorEvent
 
 
@@ -388,6 +387,10 @@ class LongevityDataValidator:
                 self.rows_before_deletion = len(rows_before_deletion)
                 LOGGER.debug("%s rows for deletion", self.rows_before_deletion)
 
+    def get_table_digest_comparator(self, session, columns="*", verbose=True) -> TableDigestComparator:
+        return TableDigestComparator(session=session, keyspace=self.keyspace_name, columns=columns,
+                                     fetch_size=self.DEFAULT_FETCH_SIZE, verbose=verbose)
+
     def validate_range_not_expected_to_change(self, session, during_nemesis=False):
         """
         Part of data in the user profile table shouldn't be updated using LWT.
@@ -407,48 +410,53 @@ class LongevityDataValidator:
         if not during_nemesis:
             LOGGER.debug('Verify immutable rows')
 
-        actual_result = self.longevity_self_object.fetch_all_rows(
-            session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT * FROM {self.view_name_for_not_updated_data}",
-            verbose=not during_nemesis)
-        if not actual_result:
+        try:
+            comparison = self.get_table_digest_comparator(session, verbose=not during_nemesis).compare_ordered(
+                actual_table=self.view_name_for_not_updated_data, expected_table=self.expected_data_table_name)
+        except Exception as error:  # pylint: disable=broad-except
+            DataValidatorEvent.ImmutableRowsValidator(
+                severity=Severity.WARNING,
+                message=f"Can't validate immutable rows. Scan of {self.view_name_for_not_updated_data} and "
+                        f"{self.expected_data_table_name} failed: {error}"
+            ).publish()
+            return
+        LOGGER.debug("Immutable rows compared in %.0f seconds (%.0f rows/s)",
+                     comparison.duration, comparison.rows_per_second)
+
+        if not comparison.actual_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
                 message=f"Can't validate immutable rows. "
-                        f"Fetch all rows from {self.view_name_for_not_updated_data} failed. "
+                        f"No rows found in {self.view_name_for_not_updated_data}. "
                         f"See error above in the sct.log"
             ).publish()
             return
 
-        expected_result = self.longevity_self_object.fetch_all_rows(
-            session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-            statement=f"SELECT * FROM {self.expected_data_table_name}",
-            verbose=not during_nemesis)
-        if not expected_result:
+        if not comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Can't validate immutable rows. Fetch all rows from {self.expected_data_table_name} failed. "
+                message=f"Can't validate immutable rows. No rows found in {self.expected_data_table_name}. "
                         f"See error above in the sct.log"
             ).publish()
             return
 
         # Issue https://github.com/scylladb/scylla/issues/6181
         # Not fail the test if unexpected additional rows where found in actual result table
-        if len(actual_result) > len(expected_result):
+        if comparison.actual_rows > comparison.expected_rows:
             DataValidatorEvent.ImmutableRowsValidator(
                 severity=Severity.WARNING,
-                message=f"Actual dataset length more then expected ({len(actual_result)} > {len(expected_result)}). "
-                        f"Issue #6181"
+                message=f"Actual dataset length more then expected "
+                        f"({comparison.actual_rows} > {comparison.expected_rows}). Issue #6181"
             ).publish()
         else:
             if not during_nemesis:
-                assert len(actual_result) == len(expected_result), \
+                assert comparison.actual_rows == comparison.expected_rows, \
                     'One or more rows are not as expected, suspected LWT wrong update. ' \
-                    'Actual dataset length: {}, Expected dataset length: {}'.format(len(actual_result),
-                                                                                    len(expected_result))
+                    'Actual dataset length: {}, Expected dataset length: {}'.format(comparison.actual_rows,
+                                                                                    comparison.expected_rows)
 
-                assert actual_result == expected_result, \
-                    'One or more rows are not as expected, suspected LWT wrong update'
+                assert comparison.equal, \
+                    f'One or more rows are not as expected, suspected LWT wrong update: {comparison}'
 
                 # Raise info event at the end of the test only.
                 DataValidatorEvent.ImmutableRowsValidator(
@@ -456,17 +464,17 @@ class LongevityDataValidator:
                     message="Validation immutable rows finished successfully"
                 ).publish()
             else:
-                if len(actual_result) < len(expected_result):
+                if comparison.actual_rows < comparison.expected_rows:
                     DataValidatorEvent.ImmutableRowsValidator(
                         severity=Severity.ERROR,
                         error=f"Verify immutable rows. "
                               f"One or more rows not found as expected, suspected LWT wrong update. "
-                              f"Actual dataset length: {len(actual_result)}, "
-                              f"Expected dataset length: {len(expected_result)}"
+                              f"Actual dataset length: {comparison.actual_rows}, "
+                              f"Expected dataset length: {comparison.expected_rows}"
                     ).publish()
                 else:
                     LOGGER.debug('Verify immutable rows. Actual dataset length: %s, Expected dataset length: %s',
-                                 len(actual_result), len(expected_result))
+                                 comparison.actual_rows, comparison.expected_rows)
 
     def validate_range_expected_to_change(self, session, during_nemesis=False):
         """
@@ -515,63 +523,47 @@ class LongevityDataValidator:
                 ).publish()
                 return
 
-            before_update_rows = self.longevity_self_object.fetch_all_rows(
-                session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                statement=f"SELECT {partition_keys} FROM {views_set[0]}",
-                verbose=not during_nemesis)
-            if not before_update_rows:
+            try:
+                comparison = self.get_table_digest_comparator(
+                    session, columns=partition_keys, verbose=not during_nemesis).compare_unordered(
+                        actual_tables=views_set[:2], expected_tables=views_set[2:3])
+            except Exception as error:  # pylint: disable=broad-except
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.WARNING,
-                    message=f"Can't validate updated rows. Fetch all rows from {views_set[0]} failed. "
-                            f"See error above in the sct.log"
+                    message=f"Can't validate updated rows. Scan of {', '.join(views_set[:3])} failed: {error}"
                 ).publish()
                 return
+            LOGGER.debug("Updated rows of %s compared in %.0f seconds (%.0f rows/s)",
+                         views_set[0], comparison.duration, comparison.rows_per_second)
 
-            after_update_rows = self.longevity_self_object.fetch_all_rows(
-                session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                statement=f"SELECT {partition_keys} FROM {views_set[1]}",
-                verbose=not during_nemesis)
-            if not after_update_rows:
-                DataValidatorEvent.UpdatedRowsValidator(
-                    severity=Severity.WARNING,
-                    message=f"Can't validate updated rows. Fetch all rows from {views_set[1]} failed. "
-                            f"See error above in the sct.log"
-                ).publish()
-                return
-
-            expected_rows = self.longevity_self_object.fetch_all_rows(
-                session=session, default_fetch_size=self.DEFAULT_FETCH_SIZE,
-                statement=f"SELECT {partition_keys} FROM {views_set[2]}",
-                verbose=not during_nemesis)
-            if not expected_rows:
-                DataValidatorEvent.UpdatedRowsValidator(
-                    severity=Severity.WARNING,
-                    message=f"Can't validate updated row. Fetch all rows from {views_set[2]} failed. "
-                            f"See error above in the sct.log"
-                ).publish()
-                return
+            for view_name in views_set[:3]:
+                if not comparison.rows_per_table[view_name]:
+                    DataValidatorEvent.UpdatedRowsValidator(
+                        severity=Severity.WARNING,
+                        message=f"Can't validate updated rows. No rows found in {view_name}. "
+                                f"See error above in the sct.log"
+                    ).publish()
+                    return
 
             # Issue https://github.com/scylladb/scylla/issues/6181
             # Not fail the test if unexpected additional rows where found in actual result table
-            if len(before_update_rows) + len(after_update_rows) > len(expected_rows):
+            if comparison.actual_rows > comparison.expected_rows:
                 DataValidatorEvent.UpdatedRowsValidator(
                     severity=Severity.WARNING,
                     message=f"View {views_set[0]}. "
-                            f"Actual dataset length {len(before_update_rows) + len(after_update_rows)} "
-                            f"more then expected dataset length: {len(expected_rows)}. "
+                            f"Actual dataset length {comparison.actual_rows} "
+                            f"more then expected dataset length: {comparison.expected_rows}. "
                             f"Issue #6181"
                 ).publish()
             else:
-                actual_data = sorted(before_update_rows+after_update_rows)
-                expected_data = sorted(expected_rows)
                 if not during_nemesis:
-                    assert actual_data == expected_data,\
-                        'One or more rows are not as expected, suspected LWT wrong update'
+                    assert comparison.equal, \
+                        f'One or more rows are not as expected, suspected LWT wrong update: {comparison}'
 
-                    assert len(before_update_rows) + len(after_update_rows) == len(expected_rows), \
+                    assert comparison.actual_rows == comparison.expected_rows, \
                         'One or more rows are not as expected, suspected LWT wrong update. '\
-                        f'Actual dataset length: {len(before_update_rows) + len(after_update_rows)}, ' \
-                        f'Expected dataset length: {len(expected_rows)}'
+                        f'Actual dataset length: {comparison.actual_rows}, ' \
+                        f'Expected dataset length: {comparison.expected_rows}'
 
                     # raise info event in the end of test only
                     DataValidatorEvent.UpdatedRowsValidator(
@@ -581,7 +573,7 @@ class LongevityDataValidator:
                 else:
                     LOGGER.debug('Validation updated rows.  View %s. Actual dataset length %s, '
                                  'Expected dataset length: %s.',
-                                 views_set[0], len(before_update_rows) + len(after_update_rows), len(expected_rows))
+                                 views_set[0], comparison.actual_rows, comparison.expected_rows)
 
     def validate_deleted_rows(self, session, during_nemesis=False):
         """
@@ -11,6 +11,9 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import os
+import time
+import threading
 from typing import Optional, TextIO, List, Union, AnyStr, Iterable
 from re import Pattern
 
@@ -129,3 +132,69 @@ class File:
 
     def __getattr__(self, item):
         return getattr(self._io, item)
+
+
+class AppendOnlyFile:
+    """
+    Binary file opened in append mode which is kept open between writes.
+
+    Writes are coalesced in memory and written to the file by `flush()', which is called automatically if the buffer
+    grows above `max_buffer_size' bytes or the previous flush was more than `flush_interval' seconds ago.  Use
+    `max_buffer_size=0' to write every chunk immediately.  The owner should call `flush()' periodically to bound the
+    time data stays in the buffer when there are no new writes.
+
+    If `write()' or `flush()' called with `fsync=True' the data is flushed and fsync'ed immediately (e.g., for
+    critical events.)
+
+    The file is reopened if the object is used after fork.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], flush_interval: float = 0.5, max_buffer_size: int = 64 * 1024):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._lock = threading.RLock()
+        self._buffer: List[bytes] = []
+        self._buffer_size = 0
+        self._last_flush = time.perf_counter()
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def _get_fd(self) -> int:
+        if self._pid != os.getpid():
+            self._fd = None
+            self._buffer.clear()  # data which was buffered by the parent process belongs to it
+            self._buffer_size = 0
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def write(self, data: bytes, fsync: bool = False) -> None:
+        with self._lock:
+            self._get_fd()
+            self._buffer.append(data)
+            self._buffer_size += len(data)
+            if fsync or self._buffer_size > self.max_buffer_size \
+                    or time.perf_counter() - self._last_flush >= self.flush_interval:
+                self.flush(fsync=fsync)
+
+    def flush(self, fsync: bool = False) -> None:
+        with self._lock:
+            fd = self._get_fd()
+            if self._buffer:
+                data = b"".join(self._buffer)
+                self._buffer.clear()
+                self._buffer_size = 0
+                while data:
+                    data = data[os.write(fd, data):]
+            if fsync:
+                os.fsync(fd)
+            self._last_flush = time.perf_counter()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                self.flush()
+                os.close(self._fd)
+            self._fd = None
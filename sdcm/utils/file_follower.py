@@ -0,0 +1,345 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Follow many growing files using one thread and one inotify instance.
+
+Files are read in big chunks by `FileTailReader' and complete lines are passed to consumers in batches.  Every
+followed file has a bounded queue of batches: if a consumer doesn't keep up, the file isn't read anymore till the
+consumer takes a batch, i.e., unread data stays in the file and not in the memory.
+
+A consumer can either register a callback which is called with every batch (callbacks of one file are called
+one by one in the order of lines, callbacks of different files run concurrently):
+
+    >>> followed = get_file_follower_service().follow("cassandra-stress.log", callback=process_lines)
+    >>> ...
+    >>> followed.close()
+
+or iterate lines in its own thread:
+
+    >>> for line in followed.iter_lines(stopped=thread.stopped):
+    ...     process_line(line)
+"""
+
+import os
+import time
+import queue
+import select
+import logging
+import threading
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from sdcm.utils.file_tail import DEFAULT_CHUNK_SIZE, FileTailReader
+from sdcm.utils.inotify import Inotify, InotifyUnavailable, IN_FILE_CHANGES, IN_Q_OVERFLOW
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_LINES: int = 1000
+DEFAULT_MAX_PENDING_BATCHES: int = 16
+CALLBACK_WORKERS: int = 4
+
+# Without inotify all files are read every `POLL_INTERVAL' seconds.  With inotify all files are read every
+# `RESCAN_INTERVAL' seconds anyway to catch changes which can't be watched (e.g., a directory created later.)
+POLL_INTERVAL: float = 1.0
+RESCAN_INTERVAL: float = 5.0
+
+# Files which have a partial line or are paused by a slow consumer are read more often.
+SHORT_INTERVAL: float = 0.1
+
+LinesCallback = Callable[[List[str]], None]
+
+
+class FollowedFile:  # pylint: disable=too-many-instance-attributes
+    """A file followed by `FileFollowerService'."""
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 service: "FileFollowerService",
+                 path: str,
+                 callback: Optional[LinesCallback],
+                 batch_lines: int,
+                 max_pending_batches: int,
+                 chunk_size: int):
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self.batch_lines = batch_lines
+        self.batches = queue.Queue(maxsize=max_pending_batches)
+        self.closed = False
+        self.reader = FileTailReader(self.path, chunk_size=chunk_size)
+        self._service = service
+        self._lines: Optional[Iterator[str]] = None  # not exhausted iter_lines() of the reader
+        self._overflow: Optional[List[str]] = None  # a batch which didn't fit into the queue
+        self._dispatching = False
+        self._lock = threading.Lock()
+
+    @property
+    def paused(self) -> bool:
+        return self._overflow is not None
+
+    def read(self) -> None:
+        """Read available lines into the queue till it's full (called by the service thread only.)"""
+        if self._overflow is not None:
+            try:
+                self.batches.put_nowait(self._overflow)
+            except queue.Full:
+                return
+            self._overflow = None
+        while True:
+            if self._lines is None:
+                self._lines = self.reader.iter_lines()
+            batch = list(islice(self._lines, self.batch_lines))
+            if len(batch) < self.batch_lines:
+                self._lines = None
+            if batch:
+                try:
+                    self.batches.put_nowait(batch)
+                except queue.Full:
+                    self._overflow = batch
+                    return
+            if self._lines is None:
+                return
+
+    def get_batch(self, timeout: Optional[float] = None) -> Optional[List[str]]:
+        """Take the next batch of lines or return None if there is no one during `timeout' seconds."""
+        try:
+            batch = self.batches.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if self.paused:
+            self._service.wakeup()
+        return batch
+
+    def iter_batches(self, stopped: Callable[[], bool], timeout: float = 0.5) -> Iterator[List[str]]:
+        """Yield batches of lines of the file till `stopped()' returns True or the file is closed."""
+        while not stopped() and not self.closed:
+            if batch := self.get_batch(timeout=timeout):
+                yield batch
+
+    def iter_lines(self, stopped: Callable[[], bool], timeout: float = 0.5) -> Iterator[str]:
+        """Yield lines of the file till `stopped()' returns True or the file is closed."""
+        for batch in self.iter_batches(stopped=stopped, timeout=timeout):
+            yield from batch
+
+    def dispatch(self, executor: ThreadPoolExecutor) -> None:
+        """Schedule a call of the callback for queued batches unless it's scheduled already."""
+        with self._lock:
+            if self._dispatching or self.batches.empty():
+                return
+            self._dispatching = True
+        executor.submit(self._call_callback)
+
+    def _call_callback(self) -> None:
+        while True:
+            with self._lock:
+                try:
+                    batch = self.batches.get_nowait()
+                except queue.Empty:
+                    self._dispatching = False
+                    return
+            if self.paused:
+                self._service.wakeup()
+            if self.closed:
+                continue
+            try:
+                self.callback(batch)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Callback for lines of %s failed", self.path)
+
+    def close(self) -> None:
+        self._service.unfollow(self)
+
+    def __repr__(self):
+        return f"<FollowedFile {self.path}>"
+
+
+class FileFollowerService:  # pylint: disable=too-many-instance-attributes
+    """Read new lines of all followed files in one thread which sleeps till any of the files is changed."""
+
+    def __init__(self, callback_workers: int = CALLBACK_WORKERS):
+        self.callback_workers = callback_workers
+        self._followed: List[FollowedFile] = []
+        self._closed: List[FollowedFile] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        os.set_blocking(self._wakeup_write_fd, False)
+        self._inotify: Optional[Inotify] = None
+        self._watches: Dict[str, int] = {}  # directory -> watch descriptor
+
+    def follow(self,  # pylint: disable=too-many-arguments
+               path: str,
+               callback: Optional[LinesCallback] = None,
+               batch_lines: int = DEFAULT_BATCH_LINES,
+               max_pending_batches: int = DEFAULT_MAX_PENDING_BATCHES,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> FollowedFile:
+        """Start to follow the file from its beginning.
+
+        If `callback' is None, batches of lines should be taken using `FollowedFile.get_batch()' or
+        `FollowedFile.iter_lines()'.
+        """
+        followed = FollowedFile(service=self, path=path, callback=callback, batch_lines=batch_lines,
+                                max_pending_batches=max_pending_batches, chunk_size=chunk_size)
+        with self._lock:
+            if self._stop_event.is_set():
+                raise RuntimeError("FileFollowerService is stopped")
+            self._followed.append(followed)
+            if callback is not None and self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.callback_workers,
+                                                    thread_name_prefix="FileFollowerCallback")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="FileFollowerService", daemon=True)
+                self._thread.start()
+        self.wakeup()
+        return followed
+
+    def unfollow(self, followed: FollowedFile) -> None:
+        with self._lock:
+            if followed in self._followed:
+                self._followed.remove(followed)
+                self._closed.append(followed)
+            followed.closed = True
+        self.wakeup()
+
+    def wakeup(self) -> None:
+        """Make the service thread read all files."""
+        try:
+            os.write(self._wakeup_write_fd, b"\0")
+        except BlockingIOError:  # the pipe is full, so the service thread will wake up anyway
+            pass
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._stop_event.set()
+            followed_files, self._followed = self._followed, []
+            self._closed.extend(followed_files)
+        for followed in followed_files:
+            followed.closed = True
+        self.wakeup()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _run(self) -> None:
+        poller = select.poll()
+        poller.register(self._wakeup_read_fd, select.POLLIN)
+        try:
+            self._inotify = Inotify()
+            poller.register(self._inotify.fd, select.POLLIN)
+        except (InotifyUnavailable, OSError) as exc:
+            LOGGER.debug("inotify can't be used to follow files, fall back to polling: %s", exc)
+        try:
+            self._loop(poller)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("FileFollowerService failed")
+        finally:
+            self._cleanup()
+
+    def _loop(self, poller: select.poll) -> None:
+        to_read: Set[FollowedFile] = set()
+        next_rescan = 0
+        while not self._stop_event.is_set():
+            with self._lock:
+                followed_files = list(self._followed)
+                closed, self._closed = self._closed, []
+            for followed in closed:
+                followed.reader.close()
+            self._update_watches(followed_files)
+
+            if time.perf_counter() >= next_rescan:
+                to_read = set(followed_files)
+                next_rescan = time.perf_counter() + (RESCAN_INTERVAL if self._inotify else POLL_INTERVAL)
+            for followed in followed_files:
+                if followed in to_read:
+                    followed.read()
+                if followed.callback is not None:
+                    followed.dispatch(self._executor)
+
+            if any(followed.paused or followed.reader.has_partial_line for followed in followed_files):
+                timeout = SHORT_INTERVAL
+            else:
+                timeout = max(0.0, next_rescan - time.perf_counter())
+            to_read = self._wait(poller, timeout, followed_files)
+
+    def _wait(self, poller: select.poll, timeout: float, followed_files: List[FollowedFile]) -> Set[FollowedFile]:
+        """Wait for changes of files and return files which should be read."""
+        ready = poller.poll(int(timeout * 1000))
+        if not ready:
+            return set(followed_files)
+        to_read = set()
+        for fd, _ in ready:
+            if fd == self._wakeup_read_fd:
+                while True:
+                    try:
+                        if not os.read(self._wakeup_read_fd, 4096):
+                            break
+                    except BlockingIOError:
+                        break
+                return set(followed_files)
+            by_path = {}
+            for followed in followed_files:
+                by_path.setdefault(followed.path, []).append(followed)
+            directories = {wd: directory for directory, wd in self._watches.items()}
+            for event in self._inotify.read_events(timeout=0):
+                if event.mask & IN_Q_OVERFLOW:
+                    return set(followed_files)
+                if directory := directories.get(event.wd):
+                    to_read.update(by_path.get(os.path.join(directory, event.name), ()))
+        return to_read
+
+    def _update_watches(self, followed_files: List[FollowedFile]) -> None:
+        if self._inotify is None:
+            return
+        directories = {os.path.dirname(followed.path) for followed in followed_files}
+        for directory in set(self._watches) - directories:
+            if (wd := self._watches.pop(directory)) >= 0:
+                self._inotify.rm_watch(wd)
+        for directory in directories - set(self._watches):
+            try:
+                self._watches[directory] = self._inotify.add_watch(directory, IN_FILE_CHANGES)
+            except FileNotFoundError:
+                pass  # will try again on the next iteration
+            except OSError as exc:
+                LOGGER.debug("Can't watch %s, files in it will be read every %ss: %s",
+                             directory, RESCAN_INTERVAL, exc)
+                self._watches[directory] = -1
+
+    def _cleanup(self) -> None:
+        with self._lock:
+            followed_files = self._followed + self._closed
+        for followed in followed_files:
+            followed.reader.close()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._watches.clear()
+
+
+_FILE_FOLLOWER_SERVICE_LOCK = threading.Lock()
+_FILE_FOLLOWER_SERVICE: Optional[FileFollowerService] = None
+
+
+def get_file_follower_service() -> FileFollowerService:
+    """Return the file follower service shared by all consumers in the process."""
+    global _FILE_FOLLOWER_SERVICE  # pylint: disable=global-statement
+    with _FILE_FOLLOWER_SERVICE_LOCK:
+        if _FILE_FOLLOWER_SERVICE is None:
+            _FILE_FOLLOWER_SERVICE = FileFollowerService()
+        return _FILE_FOLLOWER_SERVICE
+
+
+__all__ = ("FileFollowerService", "FollowedFile", "get_file_follower_service", )
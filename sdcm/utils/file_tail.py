@@ -0,0 +1,179 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import io
+import os
+import time
+import logging
+from typing import Iterator, Optional
+
+from sdcm.utils.inotify import Inotify, InotifyUnavailable, IN_FILE_CHANGES, IN_Q_OVERFLOW
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class FileTailReader:  # pylint: disable=too-many-instance-attributes
+    """
+    Follow a growing text file.
+
+    The file descriptor is kept open between reads and data is read in big binary chunks.  Only complete lines
+    are decoded (one decode call per chunk) and returned; a trailing partial line is buffered till the rest of it
+    is written.  If a partial line isn't completed during `max_partial_line_reads' reads it's returned as is.
+
+    Log rotation (the path points to another inode) is handled by draining the old file and reopening the path,
+    truncation (the file became shorter than the current position) by reading the file from its beginning.
+
+    `wait()' sleeps till the file is changed (using inotify on the parent directory) or, if inotify isn't
+    available, using a bounded exponential backoff.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_partial_line_reads: int = 20,
+                 min_backoff: float = 0.1,
+                 max_backoff: float = 1.0,
+                 encoding: str = "utf-8"):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.max_partial_line_reads = max_partial_line_reads
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.encoding = encoding
+
+        self._fd: Optional[int] = None
+        self._inode: Optional[tuple] = None
+        self._position = 0
+        self._partial = b""
+        self._partial_line_reads = 0
+        self._backoff = min_backoff
+        self._inotify: Optional[Inotify] = None
+        self._inotify_failed = False
+
+    @property
+    def position(self) -> int:
+        """Offset in the current file of the first byte which wasn't returned as a part of a line yet."""
+        return self._position - len(self._partial)
+
+    @property
+    def has_partial_line(self) -> bool:
+        return bool(self._partial)
+
+    def _open(self) -> bool:
+        try:
+            self._fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(self._fd)
+        self._inode = (stat.st_dev, stat.st_ino)
+        self._position = 0
+        self._partial = b""
+        self._partial_line_reads = 0
+        return True
+
+    def _close_file(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _rotated(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        return (stat.st_dev, stat.st_ino) != self._inode
+
+    def _truncated(self) -> bool:
+        return os.fstat(self._fd).st_size < self._position
+
+    def _decode(self, data: bytes) -> Iterator[str]:
+        return io.StringIO(data.decode(self.encoding, errors="replace"), newline="\n")
+
+    def _read_chunks(self) -> Iterator[str]:
+        got_data = False
+        while chunk := os.read(self._fd, self.chunk_size):
+            got_data = True
+            self._position += len(chunk)
+            data = self._partial + chunk
+            end_of_last_line = data.rfind(b"\n") + 1
+            self._partial = data[end_of_last_line:]
+            if end_of_last_line:
+                self._partial_line_reads = 0
+                yield from self._decode(data[:end_of_last_line])
+        if self._partial and not got_data:
+            self._partial_line_reads += 1
+            if self._partial_line_reads > self.max_partial_line_reads:
+                partial, self._partial, self._partial_line_reads = self._partial, b"", 0
+                yield from self._decode(partial)
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield all lines added to the file since the previous call."""
+        if self._fd is None and not self._open():
+            return
+        if self._truncated():
+            LOGGER.debug("%s was truncated, read it from the beginning", self.path)
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            self._position = 0
+            self._partial = b""
+        got_lines = False
+        for line in self._read_chunks():
+            got_lines = True
+            yield line
+        if self._rotated():
+            LOGGER.debug("%s was rotated, reopen it", self.path)
+            if self._partial:
+                got_lines = True
+                yield from self._decode(self._partial)
+            self._close_file()
+            if self._open():
+                for line in self._read_chunks():
+                    got_lines = True
+                    yield line
+        if got_lines:
+            self._backoff = self.min_backoff
+
+    def _get_inotify(self) -> Optional[Inotify]:
+        if self._inotify is None and not self._inotify_failed:
+            try:
+                self._inotify = Inotify()
+                self._inotify.add_watch(os.path.dirname(os.path.abspath(self.path)), IN_FILE_CHANGES)
+            except (InotifyUnavailable, OSError) as exc:
+                LOGGER.debug("inotify can't be used to follow %s, fall back to polling: %s", self.path, exc)
+                self._inotify_failed = True
+                if self._inotify is not None:
+                    self._inotify.close()
+                    self._inotify = None
+        return self._inotify
+
+    def wait(self, timeout: float) -> None:
+        """Wait till the file is changed, but no longer than `timeout' seconds."""
+        if self._partial:  # give a writer a chance to finish the line
+            time.sleep(min(self.min_backoff, timeout))
+            return
+        if inotify := self._get_inotify():
+            name = os.path.basename(self.path)
+            deadline = time.perf_counter() + timeout
+            while (remaining := deadline - time.perf_counter()) > 0:
+                if any(event.name == name or event.mask & IN_Q_OVERFLOW for event in inotify.read_events(remaining)):
+                    return
+            return
+        time.sleep(min(self._backoff, timeout))
+        self._backoff = min(self._backoff * 2, self.max_backoff)
+
+    def close(self) -> None:
+        self._close_file()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
@@ -13,14 +13,18 @@
 
 import time
 import logging
-from typing import Generator
+import itertools
+from dataclasses import dataclass, field
+from typing import Dict, Generator, Iterable, Iterator
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.health import ClusterHealthValidatorEvent
+from sdcm.utils.common import ParallelObject
 
 
 CHECK_NODE_HEALTH_RETRIES = 3
 CHECK_NODE_HEALTH_RETRY_DELAY = 45
+CLUSTER_HEALTH_SNAPSHOT_TIMEOUT = 600
 
 LOGGER = logging.getLogger(__name__)
 
@@ -253,3 +257,111 @@ def check_schema_agreement_in_gossip_and_peers(node, retries: int = CHECK_NODE_H
 
     LOGGER.debug('Schema agreement has been completed on all nodes')
     return True
+
+
+def check_health_info_collected(error: BaseException, current_node) -> HealthEventsGenerator:
+    """The node which health info can't be collected from is unhealthy."""
+    yield ClusterHealthValidatorEvent.NodeStatus(
+        severity=Severity.ERROR,
+        node=current_node.name,
+        error=f"Current node {current_node}. Unable to collect the health info: {error}",
+    )
+
+
+@dataclass
+class NodeHealthView:
+    """The cluster as a node sees it: `nodetool status', `nodetool gossipinfo' and `system.peers' mapped to nodes."""
+
+    nodes_status: dict = field(default_factory=dict)
+    gossip_info: dict = field(default_factory=dict)
+    peers_details: dict = field(default_factory=dict)
+
+    @classmethod
+    def collect(cls, node) -> "NodeHealthView":
+        return cls(nodes_status=node.get_nodes_status(),
+                   peers_details=node.get_peers_info() or {},
+                   gossip_info=node.get_gossip_info() or {})
+
+
+class ClusterHealthSnapshot:
+    """Health views of nodes collected from all of them concurrently, so the time doesn't grow with the cluster size.
+
+        >>> snapshot = ClusterHealthSnapshot(nodes=db_cluster.nodes).collect()
+        >>> for event in snapshot.health_events():
+        ...     event.publish()
+    """
+
+    def __init__(self, nodes: Iterable):
+        self.nodes = list(nodes)
+        self.views: Dict = {}
+        self.errors: Dict = {}  # nodes which health info wasn't collected from, mapped to the exceptions
+
+    def collect(self) -> "ClusterHealthSnapshot":
+        results = ParallelObject(objects=self.nodes, timeout=CLUSTER_HEALTH_SNAPSHOT_TIMEOUT, disable_logging=True) \
+            .run(NodeHealthView.collect, ignore_exceptions=True)
+        for result in results:
+            if result.exc:
+                LOGGER.warning("Unable to collect health info from `%s': %s", result.obj.name, result.exc)
+                self.errors[result.obj] = result.exc
+            else:
+                self.views[result.obj] = result.result
+        return self
+
+    def node_health_events(self, node) -> HealthEventsGenerator:
+        if node in self.errors:
+            return check_health_info_collected(error=self.errors[node], current_node=node)
+        view = self.views[node]
+        return itertools.chain(
+            check_nodes_status(
+                nodes_status=view.nodes_status,
+                current_node=node,
+                removed_nodes_list=node.parent_cluster.dead_nodes_ip_address_list),
+            check_node_status_in_gossip_and_nodetool_status(
+                gossip_info=view.gossip_info,
+                nodes_status=view.nodes_status,
+                current_node=node),
+            check_schema_version(
+                gossip_info=view.gossip_info,
+                peers_details=view.peers_details,
+                nodes_status=view.nodes_status,
+                current_node=node),
+            check_nulls_in_peers(
+                gossip_info=view.gossip_info,
+                peers_details=view.peers_details,
+                current_node=node),
+        )
+
+    def health_events(self) -> Iterator[ClusterHealthValidatorEvent]:
+        return itertools.chain.from_iterable(self.node_health_events(node) for node in self.nodes)
+
+
+def check_nodes_health(nodes: Iterable, retries: int = CHECK_NODE_HEALTH_RETRIES) -> None:
+    """Validate the health of nodes and publish health events of nodes which are still unhealthy on the last retry.
+
+    Every retry collects the health snapshot of nodes which weren't healthy on the previous one.
+    """
+    nodes = list(nodes)
+    for retry_n in range(1, retries+1):
+        LOGGER.debug("Check the health of %d node(s) [attempt #%d]", len(nodes), retry_n)
+        snapshot = ClusterHealthSnapshot(nodes=nodes).collect()
+        unhealthy = []
+        for node in nodes:
+            events = snapshot.node_health_events(node)
+            event = next(events, None)
+            if event is None:
+                LOGGER.debug("Node `%s' is healthy", node.name)
+                continue
+            if retry_n == retries:  # publish health validation events on the last retry.
+                LOGGER.debug("One or more node `%s' health validation has failed", node.name)
+                event.publish()
+                for event in events:
+                    event.publish()
+                continue
+            event.dont_publish()
+            unhealthy.append(node)
+        if not unhealthy:
+            break
+        nodes = unhealthy
+        LOGGER.debug("Wait for %d secs before next try to validate the health of %s",
+                     CHECK_NODE_HEALTH_RETRY_DELAY, ", ".join(node.name for node in nodes))
+        time.sleep(CHECK_NODE_HEALTH_RETRY_DELAY)
@@ -0,0 +1,136 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Minimal ctypes binding to Linux inotify(7).
+
+Only the bits we need to wake up log followers are exposed.  On systems without inotify `Inotify()' raises
+`InotifyUnavailable' and callers are expected to fall back to polling.
+"""
+
+import os
+import ctypes
+import ctypes.util
+import errno
+import select
+import struct
+import logging
+from functools import lru_cache
+from typing import NamedTuple, List, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o0004000
+
+# Everything which can mean that a file in a watched directory got new data, was rotated or truncated.
+IN_FILE_CHANGES = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class InotifyUnavailable(Exception):
+    pass
+
+
+class InotifyEvent(NamedTuple):
+    wd: int
+    mask: int
+    cookie: int
+    name: str
+
+
+@lru_cache(maxsize=None)
+def _libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _ = libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+    except (OSError, AttributeError) as exc:
+        raise InotifyUnavailable(str(exc)) from None
+    return libc
+
+
+def _check(result: int) -> int:
+    if result < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return result
+
+
+class Inotify:
+    """One inotify instance which can watch many paths.
+
+    Example:
+        >>> with Inotify() as inotify:
+        ...     wd = inotify.add_watch("/var/log", IN_FILE_CHANGES)
+        ...     events = inotify.read_events(timeout=1)
+    """
+
+    def __init__(self):
+        self._libc = _libc()
+        self.fd = _check(self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC))
+        self._poll = select.poll()
+        self._poll.register(self.fd, select.POLLIN)
+
+    def add_watch(self, path: str, mask: int = IN_FILE_CHANGES) -> int:
+        return _check(self._libc.inotify_add_watch(self.fd, os.fsencode(path), ctypes.c_uint32(mask)))
+
+    def rm_watch(self, wd: int) -> None:
+        try:
+            _check(self._libc.inotify_rm_watch(self.fd, wd))
+        except OSError as exc:
+            if exc.errno != errno.EINVAL:  # watch was removed already (e.g., the directory was deleted)
+                raise
+
+    def read_events(self, timeout: Optional[float] = None) -> List[InotifyEvent]:
+        """Wait up to `timeout' seconds (forever if None) for events and return all pending ones."""
+        if not self._poll.poll(None if timeout is None else int(timeout * 1000)):
+            return []
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+            offset += name_len
+            events.append(InotifyEvent(wd=wd, mask=mask, cookie=cookie, name=name))
+        return events
+
+    def close(self) -> None:
+        if self.fd is not None:
+            self._poll.unregister(self.fd)
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
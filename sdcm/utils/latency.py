@@ -12,6 +12,7 @@
 # Copyright (c) 2020 ScyllaDB
 
 from sdcm.db_stats import PrometheusDBStats
+from sdcm.utils.time_series import TimeSeries
 
 
 def avg(values):
@@ -26,56 +27,52 @@ def collect_latency(monitor_node, start, end, load_type, cluster, nodes_list):
     cassandra_stress_precision = ['99', '95']  # in the future should include also 'max'
     scylla_precision = ['99']  # in the future should include also '95', '5'
 
+    cs_queries = {}
     for precision in cassandra_stress_precision:
         metric = f'c-s {precision}' if precision == 'max' else f'c-s P{precision}'
         if not precision == 'max':
             precision = f'perc_{precision}'
-        query = f'collectd_cassandra_stress_{load_type}_gauge{{type="lat_{precision}"}}'
-        query_res = prometheus.query(query, start, end)
-        latency_values_lst = []
-        max_latency_values_lst = []
-        for entry in query_res:
-            if not entry['values']:
-                continue
-            sequence = [float(val[-1]) for val in entry['values'] if not val[-1].lower() == 'nan']
-            if not sequence or all(val == sequence[0] for val in sequence):
-                continue
-            latency_values_lst.extend(sequence)
-            max_latency_values_lst.extend(sequence)
-
-        if latency_values_lst:
-            res[metric] = float(format(avg(latency_values_lst), '.2f'))
-        if max_latency_values_lst:
-            res[f'{metric} max'] = float(format(max(max_latency_values_lst), '.2f'))
+        cs_queries[metric] = f'collectd_cassandra_stress_{load_type}_gauge{{type="lat_{precision}"}}'
 
     if load_type == 'mixed':
         load_type = ['read', 'write']
     else:
         load_type = [load_type]
 
+    scylla_queries = {}
     for load in load_type:
         for precision in scylla_precision:
-            query = f'histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_coordinator_{load}_' \
-                    f'latency_bucket{{}}[{duration}s])) by (instance, le))'
-            query_res = prometheus.query(query, start, end)
-            for entry in query_res:
-                node_ip = entry['metric']['instance'].replace('[', '').replace(']', '')
-                node = cluster.get_node_by_ip(node_ip)
-                if not node:
-                    for db_node in nodes_list:
-                        if db_node.ip_address == node_ip:
-                            node = db_node
-                if node:
-                    node_idx = node.name.split('-')[-1]
-                else:
-                    continue
-                node_name = f'node-{node_idx}'
-                metric = f"Scylla P{precision}_{load} - {node_name}"
-                if not entry['values']:
-                    continue
-                sequence = [float(val[-1]) for val in entry['values'] if not val[-1].lower() == 'nan']
-                if sequence:
-                    res[metric] = float(format(avg(sequence) / 1000, '.2f'))
+            scylla_queries[(load, precision)] = \
+                f'histogram_quantile(0.{precision},sum(rate(scylla_storage_proxy_coordinator_{load}_' \
+                f'latency_bucket{{}}[{duration}s])) by (instance, le))'
+
+    # All queries are independent, so run them concurrently.
+    query_results = prometheus.query_many({**cs_queries, **scylla_queries}, start, end)
+
+    for metric in cs_queries:
+        latency_values = TimeSeries.concat(
+            sequence for entry in query_results[metric]
+            if (sequence := TimeSeries.from_values(entry['values'])) and not sequence.is_constant())
+        if latency_values:
+            res[metric] = float(format(latency_values.mean(), '.2f'))
+            res[f'{metric} max'] = float(format(latency_values.max(), '.2f'))
+
+    for load, precision in scylla_queries:
+        for entry in query_results[(load, precision)]:
+            node_ip = entry['metric']['instance'].replace('[', '').replace(']', '')
+            node = cluster.get_node_by_ip(node_ip)
+            if not node:
+                for db_node in nodes_list:
+                    if db_node.ip_address == node_ip:
+                        node = db_node
+            if node:
+                node_idx = node.name.split('-')[-1]
+            else:
+                continue
+            node_name = f'node-{node_idx}'
+            metric = f"Scylla P{precision}_{load} - {node_name}"
+            if sequence := TimeSeries.from_values(entry['values']):
+                res[metric] = float(format(sequence.mean() / 1000, '.2f'))
 
     return res
 
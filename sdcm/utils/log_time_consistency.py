@@ -11,10 +11,84 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+"""
+Analyzers of time shifts in DB nodes and SCT logs.
+
+Log files are read in big binary chunks and only complete lines are decoded.  `ignore_lines' are searched in a
+whole chunk, so only lines which contain them pay for extra work, and timestamps are parsed once per second (log
+records share the same second a lot.)  Files found by `analyze_dir()' are analyzed in parallel by a pool of processes.
+"""
+
+import io
+import os
 import abc
-import datetime
 import re
+import datetime
+import multiprocessing
+from typing import Iterable, Iterator, Optional
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+LOG_READ_CHUNK_SIZE: int = 4 * 1024 * 1024
+TIMESTAMPS_CACHE_SIZE: int = 4096
+MAX_ANALYZER_WORKERS: int = 16
+ISO_SECONDS_LENGTH: int = len("YYYY-MM-DDTHH:MM:SS")
+
+
+def iter_log_chunks(log_file: Path, chunk_size: int = LOG_READ_CHUNK_SIZE) -> Iterator[str]:
+    """Yield decoded pieces of the file which end by a complete line (the last piece may have no newline.)"""
+    partial = b""
+    with log_file.open(mode="rb") as file:
+        while chunk := file.read(chunk_size):
+            data = partial + chunk
+            end_of_last_line = data.rfind(b"\n") + 1
+            partial = data[end_of_last_line:]
+            if end_of_last_line:
+                yield data[:end_of_last_line].decode(errors="replace")
+    if partial:
+        yield partial.decode(errors="replace")
+
+
+def split_lines(text: str) -> list[str]:
+    return io.StringIO(text, newline="\n").readlines()
+
+
+def drop_lines_containing(text: str, literals: Iterable[str]) -> list[str]:
+    """Split the text to lines and drop lines which contain any of the literals."""
+    ignored = set()
+    for literal in literals:
+        position = text.find(literal)
+        while position >= 0:
+            line_end = text.find("\n", position) + 1 or len(text)
+            ignored.add((text.rfind("\n", 0, position) + 1, line_end))
+            position = text.find(literal, line_end)
+    if not ignored:
+        return split_lines(text)
+    lines = []
+    next_line_start = 0
+    for line_start, line_end in sorted(ignored):
+        lines.extend(split_lines(text[next_line_start:line_start]))
+        next_line_start = line_end
+    lines.extend(split_lines(text[next_line_start:]))
+    return lines
+
+
+@lru_cache(maxsize=TIMESTAMPS_CACHE_SIZE)
+def _whole_seconds_timestamp(value: str) -> float:
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def iso_timestamp(value: str) -> float:
+    """The same as `datetime.datetime.fromisoformat(value).timestamp()', but parse each second only once."""
+    fraction = 0.0
+    if len(value) > ISO_SECONDS_LENGTH and value[ISO_SECONDS_LENGTH] in ".,":
+        end = ISO_SECONDS_LENGTH + 1
+        while end < len(value) and value[end].isdigit():
+            end += 1
+        fraction = float("." + value[ISO_SECONDS_LENGTH + 1:end])
+        value = value[:ISO_SECONDS_LENGTH] + value[end:]
+    return _whole_seconds_timestamp(value) + fraction
 
 
 class LogTimeConsistencyAnalyzerBase:  # pylint: disable=too-few-public-methods
@@ -43,6 +117,13 @@ class LogTimeConsistencyAnalyzerBase:  # pylint: disable=too-few-public-methods
     def _analyze_file(cls, log_file: Path) -> tuple[dict[str, list[str]], dict[str, int]]:
         pass
 
+    @classmethod
+    def _iter_lines(cls, log_file: Path) -> Iterator[str]:
+        """Yield lines of the file which don't contain any of `ignore_lines'."""
+        ignore_lines = cls.ignore_lines or ()
+        for text in iter_log_chunks(log_file):
+            yield from drop_lines_containing(text, ignore_lines)
+
     @classmethod
     def _get_timeshift_bucket_name(cls, time_shift: float) -> None | str:
         low_mark = 0
@@ -59,13 +140,22 @@ class LogTimeConsistencyAnalyzerBase:  # pylint: disable=too-few-public-methods
         return {name: init_value_type() for name in cls.times} | {'>3hours': init_value_type()}
 
     @classmethod
-    def analyze_dir(cls, log_dir: str):
-        pathlist = Path(log_dir).glob(cls.files_pattern)
-        all_files_data = {}
-        total_data = {}
+    def analyze_dir(cls, log_dir: str, max_workers: Optional[int] = None):
+        pathlist = list(Path(log_dir).glob(cls.files_pattern))
         for log_file in pathlist:
             print('Start processing ' + log_file.parent.name + '/' + log_file.name)
-            detailed, counters = cls._analyze_file(log_file)
+        if max_workers is None:
+            max_workers = min(len(pathlist), os.cpu_count() or 1, MAX_ANALYZER_WORKERS)
+        if max_workers > 1:
+            # The analyzer runs in the test process which has threads, so don't fork it.
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("forkserver")) as executor:
+                results = list(executor.map(cls._analyze_file, pathlist))
+        else:
+            results = [cls._analyze_file(log_file) for log_file in pathlist]
+        all_files_data = {}
+        total_data = {}
+        for log_file, (detailed, counters) in zip(pathlist, results):
             all_files_data[str(log_file)] = detailed
             for key, value in counters.items():
                 total_data[key] = total_data.get(key, 0) + value
@@ -90,16 +180,14 @@ class DbLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint: d
         output = cls._init_timeshift_buckets(list)
         counters = cls._init_timeshift_buckets(int) | {'total': 0}
         prior_line = ""
-        for line in log_file.open(mode='r').readlines():
-            if cls.ignore_lines:
-                if any(line_pattern in line for line_pattern in cls.ignore_lines):
-                    continue
+        for line in cls._iter_lines(log_file):
             try:
-                current_time = datetime.datetime.fromisoformat(line.split()[0]).timestamp()
+                current_time = iso_timestamp(line.split(maxsplit=1)[0])
             except Exception:  # pylint: disable=broad-except
                 continue
             current_time_shift = prior_time - current_time
-            if bucket_name := cls._get_timeshift_bucket_name(current_time_shift):
+            if current_time_shift > cls.lower_shift_limit and \
+                    (bucket_name := cls._get_timeshift_bucket_name(current_time_shift)):
                 counters['total'] += 1
                 counters[bucket_name] += 1
                 if counters[bucket_name] < cls.records_limit:
@@ -112,6 +200,7 @@ class DbLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint: d
 
 class SctLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint: disable=too-few-public-methods
     files_pattern = '**/sct.log'
+    sct_scylla_log_marker = 'c:sdcm.cluster'
     sct_scylla_log_re = re.compile(
         r'< t:([0-9-]+ [0-9:]+),[0-9]+[ \t]+f:cluster.py[ \t]+l:[0-9]+[ \t]+c:sdcm.cluster[ \t]+p:[A-Z]+ > ([0-9T:-]+)')
 
@@ -119,10 +208,9 @@ class SctLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint:
     def _analyze_file(cls, log_file: Path) -> tuple[dict[str, list[str]], dict[str, int]]:
         output = cls._init_timeshift_buckets(list)
         counters = cls._init_timeshift_buckets(int) | {'total': 0}
-        for line in log_file.open(mode='r').readlines():
-            if cls.ignore_lines:
-                if any(line_pattern in line for line_pattern in cls.ignore_lines):
-                    continue
+        for line in cls._iter_lines(log_file):
+            if cls.sct_scylla_log_marker not in line:
+                continue
             match = cls.sct_scylla_log_re.search(line)
             if not match:
                 continue
@@ -130,8 +218,8 @@ class SctLogTimeConsistencyAnalyzer(LogTimeConsistencyAnalyzerBase):  # pylint:
             # < t:2021-11-09 14:22:18,447 f:cluster.py      l:1405 c:sdcm.cluster   p:DEBUG > 2021-10-06T18:38:00+00:00
             try:
                 sct_time, event_time = match.groups()
-                sct_time = datetime.datetime.fromisoformat(sct_time).timestamp()
-                event_time = datetime.datetime.fromisoformat(event_time).timestamp()
+                sct_time = iso_timestamp(sct_time)
+                event_time = iso_timestamp(event_time)
             except Exception:  # pylint: disable=broad-except
                 continue
             current_time_shift = sct_time - event_time
@@ -0,0 +1,175 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Helpers for matching a single line against many regular expressions.
+
+Most log lines don't match any of the patterns we are looking for.  Instead of running every regex against every
+line we extract literal substrings which must be present in any match of a pattern and check them with plain
+substring search on the case-folded line.  Only patterns which pass this literal gate pay for full regex evaluation.
+"""
+
+import re
+import logging
+from itertools import groupby
+from typing import Iterable, Generic, TypeVar, Optional, Tuple, Union, FrozenSet, List
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse  # pylint: disable=deprecated-module
+    import sre_constants  # pylint: disable=deprecated-module
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+BACKREFERENCE_RE = re.compile(r"\\\d|\(\?P=")
+SCOPED_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+}
+
+# A pattern's requirements: a line can match the pattern only if for every set at least one of its literals is
+# a substring of the case-folded line.  An empty tuple means that nothing is required.
+Requirements = Tuple[FrozenSet[str], ...]
+
+MAX_REQUIREMENTS_PER_PATTERN = 3
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, getattr(sre_constants, "POSSESSIVE_REPEAT", None))
+
+
+def _min_length(literals: FrozenSet[str]) -> int:
+    return min(len(literal) for literal in literals)
+
+
+def _best_requirement(requirements: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    return max(requirements, key=_min_length, default=None)
+
+
+def _requirements(parsed) -> List[FrozenSet[str]]:  # pylint: disable=too-many-branches
+    requirements = []
+    for is_literal, items in groupby(parsed, key=lambda item: item[0] is sre_constants.LITERAL):
+        if is_literal:
+            literal = "".join(chr(code) for _, code in items).casefold()
+            if literal.isascii():
+                requirements.append(frozenset((literal, )))
+            continue
+        for opcode, args in items:
+            if opcode is sre_constants.SUBPATTERN:
+                requirements.extend(_requirements(args[-1]))
+            elif opcode in _REPEATS and args[0] >= 1:
+                requirements.extend(_requirements(args[2]))
+            elif opcode is sre_constants.BRANCH:
+                branch_literals = set()
+                for branch in args[1]:
+                    if (best := _best_requirement(_requirements(branch))) is None:
+                        break
+                    branch_literals.update(best)
+                else:
+                    requirements.append(frozenset(branch_literals))
+    return requirements
+
+
+def pattern_requirements(pattern: Union[str, re.Pattern]) -> Requirements:
+    """
+    Return literal requirements of the regex.
+
+    Requirements are conservative: a line which doesn't satisfy them can't match the pattern, but a line which
+    satisfies them still needs to be checked using the regex itself.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.debug("Unable to parse pattern %r, no literal requirements are used", pattern)
+        return ()
+    requirements = set(_requirements(parsed))
+    return tuple(sorted(requirements, key=_min_length, reverse=True)[:MAX_REQUIREMENTS_PER_PATTERN])
+
+
+def combine_patterns(patterns: Iterable[Tuple[str, int]]) -> Optional[re.Pattern]:
+    """
+    Build one alternation regex from (pattern, flags) pairs, which matches iff any of the patterns matches.
+
+    Flags are preserved using scoped inline flags and named groups are replaced with non-capturing ones.  If some
+    pattern can't be combined safely (backreferences, unsupported flags or compilation failure) return None.
+
+    Note that Python's regex engine tries all alternatives at every position, so such regex is effective for
+    anchored matching (`re.match()') but not necessarily for `re.search()' -- consider MultiPatternMatcher for that.
+    """
+    scoped_patterns = []
+    for pattern, flags in patterns:
+        flags &= ~re.UNICODE
+        if BACKREFERENCE_RE.search(pattern) or flags & ~sum(SCOPED_FLAGS):
+            return None
+        scoped_flags = "".join(flag_char for flag, flag_char in SCOPED_FLAGS.items() if flags & flag)
+        scoped_patterns.append(f"(?{scoped_flags}:{NAMED_GROUP_RE.sub('(?:', pattern)})" if scoped_flags else
+                               f"(?:{NAMED_GROUP_RE.sub('(?:', pattern)})")
+    if not scoped_patterns:
+        return None
+    try:
+        return re.compile("|".join(scoped_patterns))
+    except re.error as exc:
+        LOGGER.debug("Failed to compile combined pattern: %s", exc)
+        return None
+
+
+def requirements_satisfied(requirements: Requirements, folded_line: str) -> bool:
+    for literals in requirements:
+        for literal in literals:
+            if literal in folded_line:
+                break
+        else:
+            return False
+    return True
+
+
+class MultiPatternMatcher(Generic[T]):
+    """
+    Ordered list of (pattern, value) pairs with literal prefilters.
+
+    `first_match()' has the same semantics as iterating over the pairs and returning the first one which matches,
+    but regexes are evaluated only for patterns which literal requirements are satisfied by the line.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[Union[str, re.Pattern], T]], flags: int = 0):
+        self.patterns: Tuple[Tuple[re.Pattern, T], ...] = tuple(
+            (re.compile(pattern, flags) if isinstance(pattern, str) else pattern, value) for pattern, value in patterns
+        )
+        self._entries = tuple((pattern, value, pattern_requirements(pattern)) for pattern, value in self.patterns)
+        self._has_unconditional = any(not requirements for *_, requirements in self._entries)
+
+    def is_candidate(self, line: str, folded_line: Optional[str] = None) -> bool:
+        """Return False if the line can't match any of the patterns."""
+        if self._has_unconditional:
+            return True
+        if folded_line is None:
+            folded_line = line.casefold()
+        return any(requirements_satisfied(requirements, folded_line) for *_, requirements in self._entries)
+
+    def first_match(self, line: str, folded_line: Optional[str] = None) -> Optional[Tuple[re.Match, T]]:
+        if folded_line is None:
+            folded_line = line.casefold()
+        for pattern, value, requirements in self._entries:
+            if requirements_satisfied(requirements, folded_line) and (match := pattern.search(line)):
+                return match, value
+        return None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
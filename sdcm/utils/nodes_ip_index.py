@@ -0,0 +1,113 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Index of nodes of a cluster by all their IP addresses (public, private, IPv6 and K8S pod/service IPs.)
+
+`node.get_all_ip_addresses()' may query a cloud API or K8S, so IPs of a node are fetched once, when the node
+appears in the cluster or after its IPs were invalidated by `refresh_ip_address()'.  IPs can be changed without
+it too (e.g., K8S pods restarted by the operator), so if there is no node with an IP, `lookup()' fetches IPs of
+all nodes again and retries.  Lookups are dict lookups: the index is copy-on-write, readers don't take the lock
+and always see a consistent mapping.
+
+    >>> index = NodesIpIndex()
+    >>> index.lookup(cluster.nodes, "10.0.0.1")  # sync is cheap when the list of nodes isn't changed
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+class NodesIpIndex:
+    """Map IP addresses to nodes; IPs of every node are fetched only when it's added or invalidated."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._synced_nodes: Optional[List] = None  # the list of nodes the index was synced with and its length
+        self._synced_len = 0
+        self._node_ips: Dict[Any, Tuple[str, ...]] = {}
+        self._by_ip: Dict[str, Tuple[Any, ...]] = {}
+
+    def sync(self, nodes: List, refetch: bool = False) -> None:
+        """Index nodes which were added to `nodes' or invalidated and drop nodes which were removed from it.
+
+        Nodes are expected to be added to or removed from the same list, so it's checked by identity and length.
+        Use `refetch=True' to fetch IPs of all nodes again.
+        """
+        if not refetch and nodes is self._synced_nodes and len(nodes) == self._synced_len == len(self._node_ips):
+            return
+        with self._lock:
+            synced_len = len(nodes)
+            node_ips = {node: (not refetch and self._node_ips.get(node)) or self._fetch_ips(node) for node in nodes}
+            by_ip = {}
+            for node in nodes:  # keep nodes in order of the cluster for IPs shared by few nodes (e.g., in multi-DC)
+                for ip_address in node_ips[node]:
+                    by_ip[ip_address] = by_ip.get(ip_address, ()) + (node, )
+            self._node_ips, self._by_ip = node_ips, by_ip
+            self._synced_nodes, self._synced_len = nodes, synced_len
+
+    def lookup(self, nodes: List, ip_address: str) -> Optional[Any]:
+        """Sync the index with `nodes' and return the first node which has the IP address or None."""
+        if found := self.lookup_all(nodes, ip_address):
+            return found[0]
+        return None
+
+    def lookup_all(self, nodes: List, ip_address: str) -> Tuple[Any, ...]:
+        """Sync the index with `nodes' and return nodes which have the IP address.
+
+        If there are no such nodes, IPs of all nodes are fetched again once and the lookup is retried.
+        """
+        self.sync(nodes)
+        if found := self.get_all(ip_address):
+            return found
+        self.sync(nodes, refetch=True)
+        return self.get_all(ip_address)
+
+    def invalidate(self, node) -> None:
+        """Fetch IPs of the node on the next sync."""
+        with self._lock:
+            if node in self._node_ips:
+                self._node_ips = {key: ips for key, ips in self._node_ips.items() if key is not node}
+
+    def remove(self, node) -> None:
+        with self._lock:
+            self._synced_nodes = None
+            self._node_ips = {key: ips for key, ips in self._node_ips.items() if key is not node}
+            self._by_ip = {ip_address: nodes for ip_address, nodes in
+                           ((ip_address, tuple(key for key in nodes if key is not node))
+                            for ip_address, nodes in self._by_ip.items()) if nodes}
+
+    def get(self, ip_address: str) -> Optional[Any]:
+        """The first node which has the IP address or None."""
+        if nodes := self._by_ip.get(ip_address):
+            return nodes[0]
+        return None
+
+    def get_all(self, ip_address: str) -> Tuple[Any, ...]:
+        return self._by_ip.get(ip_address, ())
+
+    @staticmethod
+    def _fetch_ips(node) -> Tuple[str, ...]:
+        try:
+            ips = node.get_all_ip_addresses()
+        except NotImplementedError:  # nodes with static IPs (e.g., bare metal) don't refresh their instance state
+            ips = [node.public_ip_address, node.private_ip_address]
+        ips = tuple(dict.fromkeys(ip_address for ip_address in ips if ip_address))
+        LOGGER.debug("IP addresses of %s: %s", node, ips)
+        return ips
+
+
+__all__ = ("NodesIpIndex", )
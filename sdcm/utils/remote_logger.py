@@ -22,7 +22,7 @@ from multiprocessing import Process, Event
 from textwrap import dedent
 
 from sdcm import wait
-from sdcm.remote import RemoteCmdRunnerBase
+from sdcm.remote import RemoteCmdRunnerBase, OutputRetention
 from sdcm.sct_events.decorators import raise_event_on_failure
 from sdcm.utils.k8s import KubernetesOps
 
@@ -80,9 +80,11 @@ class SSHLoggerBase(NodeLoggerBase):
 
     def _retrieve(self, since):
         since = '--since "{}" '.format(since) if since else ""
-        self._remoter.run(self._logger_cmd.format(since=since),
-                          verbose=True, ignore_status=True,
-                          log_file=self._target_log_file)
+        # The command follows the log, so stream its output to the file and keep only a bit of it in memory.
+        with open(self._target_log_file, "a+", encoding="utf-8", buffering=1) as log_file:
+            self._remoter.run(self._logger_cmd.format(since=since),
+                              verbose=True, ignore_status=True,
+                              stdout_sink=log_file, stderr_sink=log_file, retention=OutputRetention())
 
     def _retrieve_journal(self, since):
         try:
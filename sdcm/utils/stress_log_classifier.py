@@ -0,0 +1,101 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Classify lines of stress tools logs into log events.
+
+Every tool has one classifier built once from its (pattern, event) pairs.  Lines are classified in batches: every
+pattern is searched in the whole batch joined into one string, which is done by the regex engine at C speed and
+usually finds nothing.  Only lines touched by these matches are matched against the patterns one by one, so the
+result is the same as of the per-line loop.  Events are cloned from the templates, so templates are never mutated
+and can be shared by all publishers.
+"""
+
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sdcm.sct_events.base import LogEventProtocol
+from sdcm.utils.multi_pattern import MultiPatternMatcher
+
+
+class StressLogClassifier:
+    """Match lines against patterns of one stress tool.
+
+    If `first_match_only' is set, a line produces an event for the first matching pattern only, otherwise for every
+    matching pattern in the order of the patterns.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[re.Pattern, LogEventProtocol]], first_match_only: bool = True):
+        self.matcher = MultiPatternMatcher(patterns)
+        self.first_match_only = first_match_only
+
+        # Patterns which are searched in a batch: `^' and `$' should match at boundaries of lines.
+        self._batch_patterns = tuple(re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+                                     for pattern, _ in self.matcher.patterns)
+        self._matches_empty_line = any(pattern.search("") for pattern, _ in self.matcher.patterns)
+        self._all_patterns = list(range(len(self.matcher.patterns)))
+
+    def candidate_lines(self, lines: Sequence[str]) -> Dict[int, List[int]]:
+        """Return {line index: indexes of patterns which can match the line} for the batch."""
+        if self._matches_empty_line:
+            return {index: self._all_patterns for index in range(len(lines))}
+        text = "\n".join(lines)
+        ends = list(accumulate(len(line) + 1 for line in lines))
+        last_index = len(lines) - 1
+        candidates = {}
+        for pattern_index, pattern in enumerate(self._batch_patterns):
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                first = bisect_right(ends, start)
+                # A match can span a few lines (e.g., `\s' matches a newline), all of them are candidates.
+                last = first if end < ends[first] else min(bisect_right(ends, max(start, end - 1)), last_index)
+                for index in range(first, last + 1):
+                    if (line_patterns := candidates.get(index)) is None:
+                        candidates[index] = [pattern_index]
+                    elif line_patterns[-1] != pattern_index:
+                        line_patterns.append(pattern_index)
+        return dict(sorted(candidates.items()))
+
+    def classify(self,
+                 lines: Sequence[str],
+                 start_line_number: int = 0) -> Iterator[Tuple[int, str, LogEventProtocol]]:
+        """Yield (line_number, line, event template) for every matching line of the batch."""
+        patterns = self.matcher.patterns
+        for index, pattern_indexes in self.candidate_lines(lines).items():
+            line = lines[index]
+            for pattern_index in pattern_indexes:
+                pattern, template = patterns[pattern_index]
+                if pattern.search(line):
+                    yield start_line_number + index, line, template
+                    if self.first_match_only:
+                        break
+
+    def events(self,  # pylint: disable=too-many-arguments
+               lines: Sequence[str],
+               node: str,
+               event_id: Optional[str] = None,
+               start_line_number: int = 0) -> Iterator[LogEventProtocol]:
+        """Yield new events ready to be published for matching lines of the batch."""
+        for line_number, line, template in self.classify(lines, start_line_number=start_line_number):
+            # The same as `template.clone()', but much cheaper.
+            event = template.__class__.__new__(template.__class__)
+            event.__dict__.update(template.__getstate__())
+            if event_id:
+                # Connect the event to the stress load
+                event.event_id = event_id
+            yield event.add_info(node=node, line=line, line_number=line_number)
+
+
+__all__ = ("StressLogClassifier", )
@@ -0,0 +1,291 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Compare content of big tables without reading them into the memory.
+
+Tables are scanned by token ranges in parallel and only a digest of every range is kept.  Rows are fetched and
+diffed only for ranges with different digests.
+"""
+
+import logging
+import threading
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from hashlib import blake2b
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+
+from cassandra import ConsistencyLevel
+from cassandra.query import SimpleStatement
+
+from sdcm.utils.decorators import retrying
+
+
+TOKEN_RING_START: int = -2 ** 63  # Murmur3Partitioner never assigns this token, so the ring is (START, END]
+TOKEN_RING_END: int = 2 ** 63 - 1
+TOKEN_RANGES: int = 256
+ROW_BUCKETS: int = 1024
+CONCURRENCY: int = 8
+FETCH_SIZE: int = 5000
+MAX_REPORTED_ROWS: int = 100
+MAX_RESCANNED_BUCKETS: int = 16
+PROGRESS_LOG_INTERVAL: float = 30  # seconds
+
+LOGGER = logging.getLogger(__name__)
+
+TokenRange = Tuple[int, int]
+
+
+def split_token_ring(ranges: int) -> List[TokenRange]:
+    step = (TOKEN_RING_END - TOKEN_RING_START) // ranges
+    bounds = [TOKEN_RING_START + step * i for i in range(ranges)] + [TOKEN_RING_END]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def row_fingerprint(row) -> bytes:
+    return repr(tuple(row)).encode()
+
+
+def row_hash(row) -> int:
+    return int.from_bytes(blake2b(row_fingerprint(row), digest_size=8).digest(), "big")
+
+
+@dataclass
+class DigestComparison:  # pylint: disable=too-many-instance-attributes
+    actual_rows: int = 0
+    expected_rows: int = 0
+    rows_per_table: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    mismatched_ranges: int = 0
+    missing_rows: List[str] = field(default_factory=list)  # a sample of expected rows which were not found
+    unexpected_rows: List[str] = field(default_factory=list)  # a sample of found rows which were not expected
+    duration: float = 0
+
+    @property
+    def equal(self) -> bool:
+        return not self.mismatched_ranges
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.actual_rows + self.expected_rows) / self.duration if self.duration else 0
+
+    def add_diff(self, actual: Counter, expected: Counter) -> None:
+        for sample, rows in ((self.missing_rows, expected - actual), (self.unexpected_rows, actual - expected)):
+            for row in rows.elements():
+                if len(sample) >= MAX_REPORTED_ROWS:
+                    break
+                sample.append(row.decode())
+
+    def __str__(self):
+        return (f"{self.mismatched_ranges} mismatched range(s); "
+                f"actual rows: {self.actual_rows}, expected rows: {self.expected_rows}; "
+                f"missing rows (first {MAX_REPORTED_ROWS}): {self.missing_rows}; "
+                f"unexpected rows (first {MAX_REPORTED_ROWS}): {self.unexpected_rows}")
+
+
+class ScanProgress:
+    def __init__(self, name: str, total: int, verbose: bool = True):
+        self.name = name
+        self.total = total
+        self.verbose = verbose
+        self.done = 0
+        self.rows = 0
+        self.start_time = self.last_report_time = perf_counter()
+        self._lock = threading.Lock()
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / (perf_counter() - self.start_time or 1)
+
+    def update(self, rows: int) -> None:
+        with self._lock:
+            self.done += 1
+            self.rows += rows
+            now = perf_counter()
+            if not self.verbose or (now - self.last_report_time < PROGRESS_LOG_INTERVAL and self.done < self.total):
+                return
+            self.last_report_time = now
+            LOGGER.debug("%s: scanned %s of %s ranges, %s rows, %.0f rows/s",
+                         self.name, self.done, self.total, self.rows, self.rows_per_second)
+
+
+class TableDigestComparator:  # pylint: disable=too-many-instance-attributes
+    """Compare rows of tables in `keyspace' using per-range digests.
+
+    `compare_ordered()' is for tables with the same primary key: rows of a token range come in the same order
+    from both tables, so a hash of all rows of the range is compared.  `compare_unordered()' is for tables with
+    different partitioning (or for comparing a union of tables): rows are spread into `row_buckets' buckets by
+    their hash and an order independent digest of every bucket is compared.
+
+    Memory used is bounded by `concurrency' pages of `fetch_size' rows and rows of mismatched ranges.
+    """
+
+    def __init__(self, session, keyspace: str, columns: str = "*",  # pylint: disable=too-many-arguments
+                 token_ranges: int = TOKEN_RANGES, row_buckets: int = ROW_BUCKETS, concurrency: int = CONCURRENCY,
+                 fetch_size: int = FETCH_SIZE, verbose: bool = True):
+        self.session = session
+        self.keyspace = keyspace
+        self.columns = columns
+        self.token_ranges = split_token_ring(token_ranges)
+        self.row_buckets = row_buckets
+        self.concurrency = concurrency
+        self.fetch_size = fetch_size
+        self.verbose = verbose
+        self._partition_keys: Dict[str, str] = {}
+
+    def get_partition_keys(self, table: str) -> str:
+        if table not in self._partition_keys:
+            rows = self.session.execute(
+                "SELECT column_name, kind, position FROM system_schema.columns "
+                "WHERE keyspace_name = %s AND table_name = %s", (self.keyspace, table))
+            keys = sorted((row.position, row.column_name) for row in rows if row.kind == "partition_key")
+            if not keys:
+                raise ValueError(f"Table {self.keyspace}.{table} not found")
+            self._partition_keys[table] = ", ".join(name for _, name in keys)
+        return self._partition_keys[table]
+
+    def scan(self, table: str, token_range: TokenRange) -> Iterator:
+        """Iterate over rows of the token range; rows are fetched page by page."""
+        partition_keys = self.get_partition_keys(table)
+        statement = SimpleStatement(
+            f"SELECT {self.columns} FROM {self.keyspace}.{table} "
+            f"WHERE token({partition_keys}) > %s AND token({partition_keys}) <= %s",
+            fetch_size=self.fetch_size, consistency_level=ConsistencyLevel.QUORUM)
+        return iter(self.session.execute(statement, token_range))
+
+    @retrying(n=4, sleep_time=5, message="Digest token range")
+    def _range_digest(self, table: str, token_range: TokenRange) -> Tuple[int, bytes]:
+        digest = blake2b(digest_size=16)
+        rows = 0
+        for row in self.scan(table, token_range):
+            digest.update(row_fingerprint(row))
+            digest.update(b"\n")  # repr() escapes new lines, so it can't be a part of a row
+            rows += 1
+        return rows, digest.digest()
+
+    @retrying(n=4, sleep_time=5, message="Digest row buckets")
+    def _range_buckets(self, table: str, token_range: TokenRange) -> Tuple[int, Dict[int, Tuple[int, int]]]:
+        buckets = defaultdict(lambda: (0, 0))
+        rows = 0
+        for row in self.scan(table, token_range):
+            hashed = row_hash(row)
+            count, total = buckets[hashed % self.row_buckets]
+            buckets[hashed % self.row_buckets] = (count + 1, (total + hashed) % 2 ** 64)
+            rows += 1
+        return rows, buckets
+
+    @retrying(n=4, sleep_time=5, message="Fetch rows of mismatched range")
+    def _range_rows(self, tables: Sequence[str], token_range: TokenRange,
+                    predicate: Optional[Callable] = None) -> Counter:
+        rows = Counter()
+        for table in tables:
+            rows.update(row_fingerprint(row) for row in self.scan(table, token_range)
+                        if predicate is None or predicate(row))
+        return rows
+
+    def _run(self, func: Callable, tasks: Iterable) -> None:
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="TableDigest")
+        try:
+            for _ in executor.map(func, tasks):
+                pass
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def compare_ordered(self, actual_table: str, expected_table: str) -> DigestComparison:
+        for table in (actual_table, expected_table):
+            self.get_partition_keys(table)
+        result = DigestComparison()
+        progress = ScanProgress(f"{actual_table} vs {expected_table}", len(self.token_ranges), self.verbose)
+        lock = threading.Lock()
+
+        def compare_range(token_range: TokenRange) -> None:
+            actual_rows, actual_digest = self._range_digest(actual_table, token_range)
+            expected_rows, expected_digest = self._range_digest(expected_table, token_range)
+            actual = expected = None
+            if actual_digest != expected_digest:
+                actual = self._range_rows((actual_table, ), token_range)
+                expected = self._range_rows((expected_table, ), token_range)
+            with lock:
+                result.actual_rows += actual_rows
+                result.expected_rows += expected_rows
+                result.rows_per_table[actual_table] += actual_rows
+                result.rows_per_table[expected_table] += expected_rows
+                if actual != expected:
+                    result.mismatched_ranges += 1
+                    result.add_diff(actual, expected)
+            progress.update(actual_rows + expected_rows)
+
+        self._run(compare_range, self.token_ranges)
+        result.duration = perf_counter() - progress.start_time
+        return result
+
+    def compare_unordered(self, actual_tables: Sequence[str], expected_tables: Sequence[str]) -> DigestComparison:
+        tables = list(actual_tables) + list(expected_tables)
+        for table in tables:
+            self.get_partition_keys(table)
+        result = DigestComparison()
+        progress = ScanProgress(f"{', '.join(actual_tables)} vs {', '.join(expected_tables)}",
+                                len(tables) * len(self.token_ranges), self.verbose)
+        buckets = {table: [(0, 0)] * self.row_buckets for table in tables}
+        lock = threading.Lock()
+
+        def digest_range(task: Tuple[str, TokenRange]) -> None:
+            table, token_range = task
+            rows, range_buckets = self._range_buckets(table, token_range)
+            with lock:
+                result.rows_per_table[table] += rows
+                table_buckets = buckets[table]
+                for bucket, (count, total) in range_buckets.items():
+                    table_count, table_total = table_buckets[bucket]
+                    table_buckets[bucket] = (table_count + count, (table_total + total) % 2 ** 64)
+            progress.update(rows)
+
+        self._run(digest_range, [(table, token_range) for table in tables for token_range in self.token_ranges])
+
+        def merge(side_tables: Sequence[str]) -> List[Tuple[int, int]]:
+            return [(sum(buckets[table][bucket][0] for table in side_tables),
+                     sum(buckets[table][bucket][1] for table in side_tables) % 2 ** 64)
+                    for bucket in range(self.row_buckets)]
+
+        actual_buckets, expected_buckets = merge(actual_tables), merge(expected_tables)
+        result.actual_rows = sum(count for count, _ in actual_buckets)
+        result.expected_rows = sum(count for count, _ in expected_buckets)
+        mismatched = [bucket for bucket in range(self.row_buckets)
+                      if actual_buckets[bucket] != expected_buckets[bucket]]
+        result.mismatched_ranges = len(mismatched)
+        if mismatched:
+            self._diff_buckets(result, actual_tables, expected_tables, set(mismatched[:MAX_RESCANNED_BUCKETS]))
+        result.duration = perf_counter() - progress.start_time
+        return result
+
+    def _diff_buckets(self, result: DigestComparison, actual_tables: Sequence[str],
+                      expected_tables: Sequence[str], rescanned_buckets: Set[int]) -> None:
+        LOGGER.debug("Fetch rows of %s mismatched bucket(s) to find a difference", len(rescanned_buckets))
+        actual, expected = Counter(), Counter()
+        lock = threading.Lock()
+
+        def predicate(row) -> bool:
+            return row_hash(row) % self.row_buckets in rescanned_buckets
+
+        def fetch_range(token_range: TokenRange) -> None:
+            actual_rows = self._range_rows(actual_tables, token_range, predicate)
+            expected_rows = self._range_rows(expected_tables, token_range, predicate)
+            with lock:
+                actual.update(actual_rows)
+                expected.update(expected_rows)
+
+        self._run(fetch_range, self.token_ranges)
+        result.add_diff(actual, expected)
+
+
+__all__ = ("TableDigestComparator", "DigestComparison", "ScanProgress", "split_token_ring", "row_hash", )
@@ -0,0 +1,331 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+One bounded pool of threads shared by all parallel calls in the process.
+
+Tasks are submitted in batches.  A batch limits the number of its tasks in flight, gives every task its own deadline
+(counted from the start of the task) and streams tasks back as soon as they are done, cancelled or their deadline
+passed:
+
+    >>> batch = get_task_executor().batch(concurrency=len(nodes))
+    >>> for node in nodes:
+    ...     batch.submit(node.restart, timeout=600, obj=node)
+    >>> for task in batch.as_completed():
+    ...     print(task.obj, task.result if task.exc is None else task.exc)
+
+Tasks of all batches are taken from one priority queue (a lower `priority' runs first) by idle workers.  Workers are
+started on demand up to `TASK_EXECUTOR_MAX_WORKERS' and exit after being idle for `TASK_EXECUTOR_IDLE_TIMEOUT'
+seconds.  If a task waits for a nested batch, the waiting worker runs pending tasks of that batch itself, so nested
+parallel calls can't starve each other when all workers are busy.
+"""
+
+import os
+import heapq
+import logging
+import threading
+import time
+from itertools import count
+from concurrent.futures import CancelledError, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+TASK_EXECUTOR_MAX_WORKERS: int = 256
+TASK_EXECUTOR_IDLE_TIMEOUT: float = 60.0
+
+TASK_PENDING = "pending"
+TASK_RUNNING = "running"
+TASK_DONE = "done"
+TASK_CANCELLED = "cancelled"
+TASK_TIMED_OUT = "timed out"
+TASK_FINAL_STATES = frozenset((TASK_DONE, TASK_CANCELLED, TASK_TIMED_OUT, ))
+
+_WORKER = threading.local()
+
+
+class Task:  # pylint: disable=too-many-instance-attributes
+    """A call of `func' submitted to `TaskExecutor'.
+
+    `result' and `exc' are set when the task is finished.  The deadline of the task is set when it's started, `timeout'
+    seconds later.  If the deadline passed, `exc' is FuturesTimeoutError and the result of the call (if it ever ends)
+    is dropped.
+    """
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 batch: "TaskBatch",
+                 func: Callable,
+                 args: tuple,
+                 kwargs: dict,
+                 priority: int,
+                 timeout: Optional[float],
+                 obj: Any):
+        self.batch = batch
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.timeout = timeout
+        self.deadline: Optional[float] = None
+        self.obj = obj
+        self.state = TASK_PENDING
+        self.result = None
+        self.exc: Optional[BaseException] = None
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def done(self) -> bool:
+        return self.state in TASK_FINAL_STATES
+
+    def cancel(self) -> bool:
+        """Cancel the task if it isn't started yet."""
+        return self.batch.executor.cancel(self)
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """Seconds the task waited in the queue."""
+        return None if self.started_at is None else self.started_at - self.submitted_at
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the task ran."""
+        return None if self.finished_at is None else self.finished_at - self.started_at
+
+    def __repr__(self):
+        return f"<Task {getattr(self.func, '__name__', self.func)} {self.state}>"
+
+
+class TaskBatch:
+    """Tasks submitted together: not more than `concurrency' of them are queued or running at the same time."""
+
+    def __init__(self, executor: "TaskExecutor", concurrency: Optional[int] = None):
+        self.executor = executor
+        self.concurrency = concurrency
+        self.tasks: List[Task] = []
+        self._in_flight = 0
+        self._waiting: List[Task] = []
+
+    def submit(self,  # pylint: disable=too-many-arguments
+               func: Callable,
+               args: tuple = (),
+               kwargs: Optional[dict] = None,
+               priority: int = 0,
+               timeout: Optional[float] = None,
+               obj: Any = None) -> Task:
+        """Submit `func(*args, **kwargs)'; `timeout' is counted from the start of the task and `obj' is its tag."""
+        task = Task(batch=self, func=func, args=args, kwargs=kwargs or {}, priority=priority, timeout=timeout, obj=obj)
+        with self.executor.cond:
+            self.tasks.append(task)
+            if self.concurrency is None or self._in_flight < self.concurrency:
+                self._in_flight += 1
+                self.executor.enqueue(task)
+            else:
+                self._waiting.append(task)
+        return task
+
+    def as_completed(self) -> Iterator[Task]:
+        """Yield tasks in order of completion; a task whose deadline passed is yielded at its deadline."""
+        cond = self.executor.cond
+        not_reported = list(self.tasks)
+        while not_reported:
+            stolen = None
+            with cond:
+                while True:
+                    now = time.monotonic()
+                    for task in not_reported:
+                        if not task.done() and task.deadline is not None and now >= task.deadline:
+                            self.executor.expire(task)
+                    ready = [task for task in not_reported if task.done()]
+                    if ready:
+                        break
+                    if getattr(_WORKER, "executor", None) is self.executor and (stolen := self.take_pending()):
+                        break
+                    deadlines = [task.deadline for task in not_reported if task.deadline is not None]
+                    cond.wait(timeout=min(deadlines) - now if deadlines else None)
+                if ready:
+                    not_reported = [task for task in not_reported if not task.done()]
+            if stolen is not None:
+                self.executor.run_task(stolen)
+                continue
+            yield from ready
+
+    def wait(self) -> List[Task]:
+        """Wait till all tasks are reported and return them in order of submission."""
+        for _ in self.as_completed():
+            pass
+        return list(self.tasks)
+
+    def cancel(self) -> None:
+        """Cancel all tasks which aren't started yet."""
+        for task in self.tasks:
+            task.cancel()
+
+    def take_pending(self) -> Optional[Task]:
+        """Take a pending task of the batch to run it in the current thread (with the executor lock held.)"""
+        for task in self._waiting + self.tasks:
+            if task.state == TASK_PENDING:
+                if task in self._waiting:
+                    self._waiting.remove(task)
+                    self._in_flight += 1
+                self.executor.start(task)
+                return task
+        return None
+
+    def task_finished(self, task: Task) -> None:
+        """Free the slot of the finished task and queue the next waiting task (with the executor lock held.)"""
+        if task in self._waiting:
+            self._waiting.remove(task)
+            return
+        self._in_flight -= 1
+        while self._waiting and (self.concurrency is None or self._in_flight < self.concurrency):
+            task = self._waiting.pop(0)
+            self._in_flight += 1
+            self.executor.enqueue(task)
+
+
+class TaskExecutor:
+    """A bounded pool of worker threads which run tasks from one priority queue."""
+
+    def __init__(self, max_workers: int = TASK_EXECUTOR_MAX_WORKERS, idle_timeout: float = TASK_EXECUTOR_IDLE_TIMEOUT,
+                 name: str = "TaskExecutor"):
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self.name = name
+        self.cond = threading.Condition()
+        self._queue = []
+        self._counter = count()
+        self._workers = 0
+        self._idle = 0
+        self._stats = {"tasks": 0, "queue_wait_total": 0.0, "queue_wait_max": 0.0,
+                       "duration_total": 0.0, "duration_max": 0.0}
+
+    def batch(self, concurrency: Optional[int] = None) -> TaskBatch:
+        return TaskBatch(executor=self, concurrency=concurrency)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Task:
+        """Submit one task without a limit of concurrency or a deadline."""
+        return self.batch().submit(func, args=args, kwargs=kwargs)
+
+    def enqueue(self, task: Task) -> None:
+        with self.cond:
+            heapq.heappush(self._queue, (task.priority, next(self._counter), task))
+            if self._idle == 0 and self._workers < self.max_workers:
+                self._workers += 1
+                threading.Thread(target=self._worker, name=f"{self.name}-{next(self._counter)}", daemon=True).start()
+            else:
+                self.cond.notify_all()
+
+    def start(self, task: Task) -> None:
+        task.state = TASK_RUNNING
+        task.started_at = time.monotonic()
+        if task.timeout is not None:
+            task.deadline = task.started_at + task.timeout
+            self.cond.notify_all()  # wake up `as_completed()' to wait for the new deadline
+
+    def cancel(self, task: Task) -> bool:
+        with self.cond:
+            if task.state != TASK_PENDING:
+                return False
+            self._finish(task, state=TASK_CANCELLED, exc=CancelledError())
+            return True
+
+    def expire(self, task: Task) -> None:
+        """Mark the task as timed out; a running task continues, but its result is dropped."""
+        with self.cond:
+            if task.state == TASK_PENDING:
+                self._finish(task, state=TASK_TIMED_OUT, exc=FuturesTimeoutError())
+            elif task.state == TASK_RUNNING:
+                task.state = TASK_TIMED_OUT
+                task.exc = FuturesTimeoutError()
+                self.cond.notify_all()
+
+    def run_task(self, task: Task) -> None:
+        """Run the task taken from the queue (task's state is running already.)"""
+        result, exc = None, None
+        try:
+            result = task.func(*task.args, **task.kwargs)
+        except BaseException as exception:  # pylint: disable=broad-except
+            exc = exception
+        with self.cond:
+            task.finished_at = time.monotonic()
+            self._stats["tasks"] += 1
+            self._stats["queue_wait_total"] += task.queue_wait
+            self._stats["queue_wait_max"] = max(self._stats["queue_wait_max"], task.queue_wait)
+            self._stats["duration_total"] += task.duration
+            self._stats["duration_max"] = max(self._stats["duration_max"], task.duration)
+            if task.state == TASK_RUNNING:
+                task.result, task.exc = result, exc
+                task.state = TASK_DONE
+            task.batch.task_finished(task)
+            self.cond.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """Number of finished tasks, total and max of their queue wait and run time, current workers and queue."""
+        with self.cond:
+            return dict(self._stats, workers=self._workers, idle_workers=self._idle,
+                        queued=sum(1 for _, _, task in self._queue if task.state == TASK_PENDING))
+
+    def _finish(self, task: Task, state: str, exc: BaseException) -> None:
+        task.state = state
+        task.exc = exc
+        task.batch.task_finished(task)
+        self.cond.notify_all()
+
+    def _take(self) -> Optional[Task]:
+        while self._queue:
+            _, _, task = heapq.heappop(self._queue)
+            if task.state == TASK_PENDING:
+                self.start(task)
+                return task
+        return None
+
+    def _worker(self) -> None:
+        _WORKER.executor = self
+        while True:
+            with self.cond:
+                while (task := self._take()) is None:
+                    self._idle += 1
+                    notified = self.cond.wait(timeout=self.idle_timeout)
+                    self._idle -= 1
+                    if not notified and not self._queue:
+                        self._workers -= 1
+                        return
+            self.run_task(task)
+
+
+_TASK_EXECUTOR_LOCK = threading.Lock()
+_TASK_EXECUTOR: Optional[TaskExecutor] = None
+
+
+def get_task_executor() -> TaskExecutor:
+    """Return the task executor shared by all parallel calls in the process."""
+    global _TASK_EXECUTOR  # pylint: disable=global-statement
+    with _TASK_EXECUTOR_LOCK:
+        if _TASK_EXECUTOR is None:
+            _TASK_EXECUTOR = TaskExecutor()
+        return _TASK_EXECUTOR
+
+
+def _reset_task_executor_after_fork() -> None:
+    # Worker threads don't exist in the child process, start a new executor on demand.
+    global _TASK_EXECUTOR, _TASK_EXECUTOR_LOCK  # pylint: disable=global-statement
+    _TASK_EXECUTOR_LOCK = threading.Lock()
+    _TASK_EXECUTOR = None
+
+
+os.register_at_fork(after_in_child=_reset_task_executor_after_fork)
+
+
+__all__ = ("Task", "TaskBatch", "TaskExecutor", "get_task_executor",
+           "TASK_EXECUTOR_MAX_WORKERS", "TASK_EXECUTOR_IDLE_TIMEOUT", )
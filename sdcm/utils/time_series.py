@@ -0,0 +1,127 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""Statistics of Prometheus time series.
+
+Values of a series are parsed once into NumPy arrays and all statistics are computed on these arrays.
+
+    >>> series = TimeSeries.from_prometheus(prometheus.query(query, start, end))
+    >>> series.max(), series.filtered(min_value=series.max() * 0.01).mean()
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+import numpy
+
+
+class TimeSeries:
+    """Timestamps and float values of one or many Prometheus series, NaN values are dropped."""
+
+    __slots__ = ("metric", "timestamps", "values", )
+
+    def __init__(self, timestamps: Sequence[float], values: Sequence[float], metric: Optional[dict] = None):
+        self.metric = metric or {}
+        self.timestamps = numpy.asarray(timestamps, dtype=float)
+        self.values = numpy.asarray(values, dtype=float)
+
+    @classmethod
+    def from_values(cls, values: Sequence[Sequence], metric: Optional[dict] = None) -> "TimeSeries":
+        """Create from Prometheus `values': [[timestamp, "value"], ...]."""
+        timestamps = numpy.fromiter((value[0] for value in values), dtype=float, count=len(values))
+        floats = numpy.fromiter((float(value[1]) for value in values), dtype=float, count=len(values))
+        mask = ~numpy.isnan(floats)
+        return cls(timestamps=timestamps[mask], values=floats[mask], metric=metric)
+
+    @classmethod
+    def from_prometheus(cls, results: Iterable[dict]) -> "TimeSeries":
+        """Create one series from all series of a Prometheus matrix response."""
+        return cls.concat(cls.from_values(item["values"], metric=item["metric"]) for item in results)
+
+    @classmethod
+    def by_metric(cls, results: Iterable[dict], label: str) -> Dict[str, "TimeSeries"]:
+        """Create a series for every series of a Prometheus matrix response keyed by the value of the `label'."""
+        return {item["metric"].get(label): cls.from_values(item["values"], metric=item["metric"]) for item in results}
+
+    @classmethod
+    def concat(cls, series: Iterable["TimeSeries"]) -> "TimeSeries":
+        series = list(series)
+        if not series:
+            return cls(timestamps=numpy.empty(0), values=numpy.empty(0))
+        return cls(timestamps=numpy.concatenate([item.timestamps for item in series]),
+                   values=numpy.concatenate([item.values for item in series]),
+                   metric=series[0].metric if len(series) == 1 else None)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __bool__(self):
+        return len(self.values) > 0
+
+    def max(self) -> float:
+        return float(numpy.max(self.values))
+
+    def min(self) -> float:
+        return float(numpy.min(self.values))
+
+    def mean(self) -> float:
+        if not self:
+            raise ValueError("mean of an empty series")
+        return float(numpy.mean(self.values))
+
+    def stdev(self) -> float:
+        """Population standard deviation."""
+        return float(numpy.std(self.values))
+
+    def percentile(self, percent: float) -> float:
+        """Percentile with linear interpolation between the closest ranks."""
+        if not self:
+            raise ValueError("percentile of an empty series")
+        return float(numpy.percentile(self.values, percent))
+
+    def is_constant(self) -> bool:
+        return bool(numpy.all(self.values == self.values[0])) if self else True
+
+    def filtered(self, min_value: Optional[float] = None, max_value: Optional[float] = None) -> "TimeSeries":
+        """Return a series with values in [min_value, max_value] only."""
+        mask = numpy.ones(len(self.values), dtype=bool)
+        if min_value is not None:
+            mask &= self.values >= min_value
+        if max_value is not None:
+            mask &= self.values <= max_value
+        return TimeSeries(timestamps=self.timestamps[mask], values=self.values[mask], metric=self.metric)
+
+    def windows(self, window: float, aggregate: Callable[["TimeSeries"], float] = None) -> "TimeSeries":
+        """Aggregate values in consecutive windows of `window' seconds (mean by default.)
+
+        The result has one value per non-empty window with the timestamp of the window beginning.
+        """
+        aggregate = aggregate or TimeSeries.mean
+        if not self:
+            return TimeSeries(timestamps=self.timestamps, values=self.values, metric=self.metric)
+        order = numpy.argsort(self.timestamps, kind="stable")
+        timestamps, values = self.timestamps[order], self.values[order]
+        buckets = numpy.floor(timestamps / window)
+        bounds = numpy.flatnonzero(numpy.diff(buckets)) + 1
+        starts = numpy.concatenate(([0], bounds))
+        if aggregate is TimeSeries.mean:  # the most common case, fully vectorized
+            sums = numpy.add.reduceat(values, starts)
+            counts = numpy.diff(numpy.concatenate((starts, [len(values)])))
+            return TimeSeries(timestamps=buckets[starts] * window, values=sums / counts, metric=self.metric)
+        return TimeSeries(
+            timestamps=buckets[starts] * window,
+            values=[aggregate(TimeSeries(timestamps=chunk_ts, values=chunk))
+                    for chunk_ts, chunk in zip(numpy.split(timestamps, bounds), numpy.split(values, bounds))],
+            metric=self.metric)
+
+
+__all__ = ("TimeSeries", )
@@ -0,0 +1,102 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import time
+import unittest
+import urllib.parse
+
+from sdcm import db_stats
+from sdcm.db_stats import PrometheusDBStats, PROMETHEUS_QUERY_CHUNK_POINTS
+
+
+CONFIG = """
+scrape_configs:
+- job_name: scylla
+  scrape_interval: 20s
+"""
+
+
+class FakePrometheusDBStats(PrometheusDBStats):
+    requests = []
+
+    @staticmethod
+    def request(url, post=False):
+        FakePrometheusDBStats.requests.append(url)
+        if url.endswith("/status/config"):
+            return {"status": "success", "data": {"yaml": CONFIG}}
+        params = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(url).query))
+        start, end, step = float(params["start"]), float(params["end"]), int(params["step"])
+        values = []
+        while start <= end:
+            values.append([start, str(start * 2)])
+            start += step
+        return {"status": "success", "data": {"result": [{"metric": {"instance": "10.0.0.1"}, "values": values}]}}
+
+
+class TestPrometheusDBStats(unittest.TestCase):
+    def setUp(self):
+        db_stats._PROMETHEUS_CONFIGS.clear()  # pylint: disable=protected-access
+        db_stats._PROMETHEUS_QUERY_CACHE.clear()  # pylint: disable=protected-access
+        FakePrometheusDBStats.requests = []
+
+    def test_config_is_fetched_once(self):
+        FakePrometheusDBStats("10.0.0.10")
+        prometheus = FakePrometheusDBStats("10.0.0.10")
+        self.assertEqual(prometheus.scylla_scrape_interval, 20)
+        self.assertEqual(len(FakePrometheusDBStats.requests), 1)
+
+    def test_long_range_is_chunked_and_cached(self):
+        prometheus = FakePrometheusDBStats("10.0.0.10")
+        step = 20
+        start = (int(time.time()) // 86400 - 2) * 86400 + 7
+        end = start + step * PROMETHEUS_QUERY_CHUNK_POINTS * 3
+        result = prometheus.query("up", start, end, step)
+        self.assertEqual(len(result), 1)
+        timestamps = [value[0] for value in result[0]["values"]]
+        self.assertEqual(timestamps, list(range(start - 7 + step, end - 7 + 1, step)))
+        self.assertEqual(len(FakePrometheusDBStats.requests), 1 + 4)
+
+        # An overlapping window is served from the cache.
+        result = prometheus.query("up", start + 3600, end - 600, step)
+        self.assertEqual(result[0]["values"][0][0], start - 7 + 3600 + step)
+        self.assertEqual(len(FakePrometheusDBStats.requests), 1 + 4)
+
+    def test_cached_result_is_not_shared(self):
+        prometheus = FakePrometheusDBStats("10.0.0.10")
+        step = 20
+        span = step * PROMETHEUS_QUERY_CHUNK_POINTS
+        start = (int(time.time()) // span - 10) * span
+        end = start + span - step
+        prometheus.query("up", start, end, step)[0]["values"].clear()
+        self.assertEqual(len(prometheus.query("up", start, end, step)[0]["values"]), PROMETHEUS_QUERY_CHUNK_POINTS)
+        self.assertEqual(len(FakePrometheusDBStats.requests), 1 + 1)
+
+    @staticmethod
+    def recent_end_time():
+        # Ends in the current chunk and not too close to its beginning, so a 5 minutes query hits one chunk.
+        span = 20 * PROMETHEUS_QUERY_CHUNK_POINTS
+        return int(time.time()) // span * span + 310
+
+    def test_recent_data_is_not_cached(self):
+        prometheus = FakePrometheusDBStats("10.0.0.10")
+        end = self.recent_end_time()
+        prometheus.query("up", end - 300, end, 20)
+        prometheus.query("up", end - 300, end, 20)
+        self.assertEqual(len(FakePrometheusDBStats.requests), 1 + 2)
+
+    def test_query_many(self):
+        prometheus = FakePrometheusDBStats("10.0.0.10")
+        end = self.recent_end_time()
+        results = prometheus.query_many({"a": "up", "b": "down"}, end - 300, end, 20)
+        self.assertEqual(set(results), {"a", "b"})
+        self.assertTrue(all(len(result[0]["values"]) == 15 for result in results.values()))
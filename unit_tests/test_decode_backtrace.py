@@ -16,6 +16,7 @@ import json
 from multiprocessing import Queue
 import unittest
 from functools import cached_property
+from types import SimpleNamespace
 
 from sdcm.cluster import TestConfig
 from sdcm.db_log_reader import DbLogReader
@@ -27,8 +28,14 @@ from unit_tests.lib.events_utils import EventsUtilsMixin
 
 
 class DecodeDummyNode(DummyNode):  # pylint: disable=abstract-method
+    copied_debug_files = 0
+    db_nodes_version = "5.1.0 with build-id 1234"
+
+    def _get_db_node(self, node_name):
+        return SimpleNamespace(name=node_name, scylla_version_detailed=self.db_nodes_version)
 
     def copy_scylla_debug_info(self, node_name, debug_file):
+        self.copied_debug_files += 1
         return "scylla_debug_info_file"
 
 
@@ -193,3 +200,25 @@ class TestDecodeBactraces(unittest.TestCase, EventsUtilsMixin):
             if event.get('backtrace') and event.get('raw_backtrace'):
                 self.assertEqual(event['backtrace'].strip(),
                                  "addr2line -Cpife scylla_debug_info_file {}".format(' '.join(event['raw_backtrace'].split("\n"))))
+
+    def test_05_decoders_are_memoized(self):
+        node = DecodeDummyNode(
+            name='test_decoders_node',
+            parent_cluster=None,
+            base_logdir=self.temp_dir,
+            ssh_login_info=dict(key_file='~/.ssh/scylla-test'),
+        )
+        node.remoter = DummyRemote()
+        decoders = {}
+        decoder = node.get_backtrace_decoder("db_node_1", "scylla.debug", decoders)
+        self.assertIs(node.get_backtrace_decoder("db_node_1", "scylla.debug", decoders), decoder)
+        self.assertEqual(node.copied_debug_files, 1)
+
+        # Nodes with the same build share the decoder, but the debug info is looked up for every node.
+        self.assertIs(node.get_backtrace_decoder("db_node_2", "scylla.debug", decoders), decoder)
+        self.assertEqual(node.copied_debug_files, 2)
+
+        # Upgraded node needs the debug info of the new build.
+        node.db_nodes_version = "5.2.0 with build-id 5678"
+        node.get_backtrace_decoder("db_node_1", "scylla.debug", decoders)
+        self.assertEqual(node.copied_debug_files, 3)
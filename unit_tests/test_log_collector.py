@@ -11,12 +11,17 @@
 #
 # Copyright (c) 2022 ScyllaDB
 # pylint: disable=redefined-outer-name
+import io
 import uuid
+import tarfile
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from sdcm.logcollector import Collector
+from sdcm.logcollector import Collector, CommandLog, LogCollector, stream_archive_to_s3
 from sdcm.provision import provisioner_factory
+from sdcm.remote import LocalCmdRunner
 from unit_tests.lib.fake_resources import prepare_fake_region
 
 
@@ -47,3 +52,50 @@ def test_create_collecting_nodes(test_id, tmp_path_factory):
     assert len(collector.monitor_set) == len(monitor_nodes)
     for collecting_node, v_m in zip(collector.monitor_set, monitor_nodes):
         assert collecting_node.name == v_m.name
+
+
+def test_collect_on_node_and_archive_remotely(tmp_path):
+    node = SimpleNamespace(name="node1", remoter=LocalCmdRunner())
+    remote_dir = tmp_path / "remote" / node.name
+    remote_dir.mkdir(parents=True)
+    remote_logfiles = CommandLog(name="hello.log", command="echo hello").collect_on_node(
+        node, str(tmp_path / "local"), str(remote_dir))
+    assert remote_logfiles == [str(remote_dir / "hello.log")]
+    assert not (tmp_path / "local" / "hello.log").exists()
+
+    (remote_dir / "leftover.log").write_text("from a previous run\n")
+    archive = LogCollector.archive_dir_remotely(node, str(remote_dir), remote_logfiles)
+    assert archive in (f"{remote_dir}.tar.zst", f"{remote_dir}.tar.gz")
+    LogCollector.receive_archive(node, archive, str(tmp_path / "local"))
+    assert sorted(path.name for path in (tmp_path / "local").iterdir()) == ["hello.log"]
+    assert (tmp_path / "local" / "hello.log").read_text() == "hello\n"
+    assert not (tmp_path / "remote" / archive.rsplit("/", 1)[-1]).exists()
+
+
+def test_stream_archive_to_s3(tmp_path):
+    (tmp_path / "logs" / "node1").mkdir(parents=True)
+    (tmp_path / "logs" / "node1" / "system.log").write_text("log line\n" * 1000)
+    uploaded = io.BytesIO()
+
+    def upload_fileobj(self, fileobj, file_name, dest_dir=""):  # pylint: disable=unused-argument
+        uploaded.write(fileobj.read())
+        return f"https://bucket/{dest_dir}/{file_name}"
+
+    with patch("sdcm.logcollector.S3Storage.__init__", return_value=None), \
+            patch("sdcm.logcollector.S3Storage.upload_fileobj", upload_fileobj):
+        assert stream_archive_to_s3(str(tmp_path / "logs"), "test-id/run") == "https://bucket/test-id/run/logs.tar.gz"
+    uploaded.seek(0)
+    with tarfile.open(fileobj=uploaded, mode="r:gz") as tar:
+        assert tar.extractfile("logs/node1/system.log").read() == b"log line\n" * 1000
+
+
+def test_stream_archive_to_s3_failed(tmp_path):
+    def upload_fileobj(self, fileobj, file_name, dest_dir=""):  # pylint: disable=unused-argument
+        fileobj.read()
+        return f"https://bucket/{dest_dir}/{file_name}"
+
+    with patch("sdcm.logcollector.S3Storage.__init__", return_value=None), \
+            patch("sdcm.logcollector.S3Storage.upload_fileobj", upload_fileobj), \
+            patch("sdcm.logcollector.S3Storage.delete_file") as delete_file:
+        assert stream_archive_to_s3(str(tmp_path / "no-such-dir"), "test-id/run") is None
+    delete_file.assert_called_once_with(file_name="no-such-dir.tar.gz", dest_dir="test-id/run")
@@ -0,0 +1,143 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from sdcm.parallel_timeline_report.generate_pt_report import (
+    Event,
+    ParallelTimelinesReportGenerator,
+    TimelineChartBuilder,
+    TimelineLabel,
+)
+
+NODE = "Node longevity-100gb-4h-master-db-node-6fb3995d-{} [13.49.80.25 | 10.0.1.221] (seed: True)"
+
+
+def db_event(node, timestamp, event_type="REACTOR_STALLED"):
+    return {"base": "DatabaseLogEvent", "event_id": f"db-{node}-{timestamp}", "type": event_type,
+            "node": NODE.format(node), "period_type": "one-time", "event_timestamp": timestamp}
+
+
+def continuous_event(base, event_id, period_type, begin, end=None, **kwargs):
+    return {"base": base, "event_id": event_id, "type": "NA", "period_type": period_type,
+            "begin_timestamp": begin, "end_timestamp": end, "table": "keyspace1.standard1", **kwargs}
+
+
+def labels_of(chart_data):
+    return {group["group"]: [label["label"] for label in group["data"]] for group in chart_data}
+
+
+def time_ranges(chart_data, group_name, label_name):
+    group = next(group for group in chart_data if group["group"] == group_name)
+    label = next(label for label in group["data"] if label["label"] == label_name)
+    return [item["timeRange"] for item in label["data"]]
+
+
+class TestTimelineChartBuilder(unittest.TestCase):
+    def build(self, events, **kwargs):
+        builder = TimelineChartBuilder(**kwargs)
+        for event in events:
+            builder.add(Event(event_dict=event))
+        return builder.finish()
+
+    def test_groups_and_labels_order(self):
+        chart_data = self.build([
+            db_event(10, 100),
+            continuous_event("CompactionEvent", "c1", "begin", 101, node=NODE.format(2), shard=1),
+            db_event(2, 102),
+            continuous_event("CompactionEvent", "c1", "end", 101, 110, node=NODE.format(2), shard=1),
+            {"base": "InfoEvent", "event_id": "i1", "type": "NA", "message": "hello", "event_timestamp": 103},
+            {"base": "PrometheusAlertManagerEvent", "event_id": "p1", "type": "start", "node": "10.0.0.2",
+             "alert_name": "B", "event_timestamp": 104},
+            {"base": "PrometheusAlertManagerEvent", "event_id": "p2", "type": "start", "node": "10.0.0.1",
+             "alert_name": "A", "event_timestamp": 105},
+        ])
+        self.assertEqual(list(labels_of(chart_data).items()), [
+            ("node-2", ["CompactionEvent, shard: 1", "DatabaseLogEvent"]),
+            ("node-10", ["DatabaseLogEvent"]),
+            ("Prometheus events", ["node: 10.0.0.1, alert: A", "node: 10.0.0.2, alert: B"]),
+            ("SCT events", ["InfoEvent"]),
+        ])
+
+    def test_begin_end_pairing(self):
+        chart_data = self.build([
+            continuous_event("CompactionEvent", "paired", "begin", 100, node=NODE.format(1), shard=0),
+            continuous_event("CompactionEvent", "paired", "end", 100, 200, node=NODE.format(1), shard=0),
+            continuous_event("CompactionEvent", "endless", "begin", 300, node=NODE.format(1), shard=1),
+            continuous_event("ScyllaServerStatusEvent", "down", "begin", 400, node=NODE.format(1)),
+            continuous_event("DisruptionEvent", "seq", "begin", 100, node=NODE.format(1),
+                             nemesis_name="RunUniqueSequence"),
+            db_event(1, 1000),
+        ], merge_gap=0)
+        self.assertEqual(time_ranges(chart_data, "node-1", "CompactionEvent, shard: 0"), [[100_000, 200_000]])
+        self.assertEqual(time_ranges(chart_data, "node-1", "CompactionEvent, shard: 1"), [[300_000, 300_000]])
+        self.assertEqual(time_ranges(chart_data, "node-1", "ScyllaServerStatusEvent"), [[400_000, 1_000_000]])
+        self.assertNotIn("DisruptionEvent, nemesis: RunUniqueSequence", labels_of(chart_data)["node-1"])
+
+    def test_close_events_are_merged(self):
+        chart_data = self.build([db_event(1, timestamp) for timestamp in (100, 100.5, 101, 110)] +
+                                [db_event(1, 100.7, event_type="RUNTIME_ERROR")])
+        group = chart_data[0]["data"][0]["data"]
+        self.assertEqual([(item["timeRange"], item["val"]) for item in group], [
+            ([100_000, 101_000], "type: REACTOR_STALLED"),
+            ([110_000, 110_000], "type: REACTOR_STALLED"),
+            ([100_700, 100_700], "type: RUNTIME_ERROR"),
+        ])
+
+
+class TestTimelineLabel(unittest.TestCase):
+    def test_compact_same_values(self):
+        label = TimelineLabel(label="label", sort_key=(), merge_gap=0, max_segments=1000)
+        for i in range(1000):
+            label.add(begin=i * 10, end=i * 10 + 1, val="a" if i < 500 else "b")
+        label.compact(max_segments=10)
+        self.assertEqual([segment[:3] for segment in label.segments], [[0, 4991, "a"], [5000, 9991, "b"]])
+
+    def test_compact_different_values(self):
+        label = TimelineLabel(label="label", sort_key=(), merge_gap=0, max_segments=10)
+        for i in range(1000):
+            label.add(begin=i * 10, end=i * 10 + 1, val=str(i))
+        self.assertLessEqual(len(label.segments), 20)
+        label.compact(max_segments=10)
+        self.assertLessEqual(len(label.segments), 11)
+        self.assertEqual(label.segments[0][0], 0)
+        self.assertEqual(max(segment[1] for segment in label.segments), 9991)
+        self.assertEqual(sum(segment[3] + 1 for segment in label.segments), 1000)
+        self.assertTrue(label.chart_data()["data"][0]["val"].endswith(" more"))
+
+
+class TestParallelTimelinesReportGenerator(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_generate_full_report(self):
+        events = [
+            {"base": "InfoEvent", "event_id": "i1", "type": "NA", "event_timestamp": 100,
+             "message": "TEST_START test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30"},
+            db_event(1, 101),
+        ]
+        events_file = self.temp_dir / "raw_events.log"
+        events_file.write_text("".join(json.dumps(event) + "\n" for event in events), encoding="utf-8")
+        generator = ParallelTimelinesReportGenerator(events_file=events_file)
+        report_file = generator.generate_full_report()
+        self.assertEqual(report_file.name, "longevity-100gb-4h-master-6fb3995d-parallel-timelines-report.html")
+        self.assertEqual(generator.test_id, "fe9c9218-367f-47ba-b59f-0d06c0e81c30")
+        self.assertIn("fe9c9218-367f-47ba-b59f-0d06c0e81c30", report_file.read_text(encoding="utf-8"))
+        self.assertEqual(generator.max_end_timestamp, 101_000)
@@ -139,3 +139,8 @@ class ParallelObjectTester(unittest.TestCase):
         returned_results = [r.result for r in results]
         expected_results = [r[0][1] for r in self.list_as_arg]
         self.assertListEqual(returned_results, expected_results)
+
+    def test_timeout_is_counted_from_the_start_of_every_call(self):
+        parallel_object = ParallelObject([0.5] * 4, timeout=0.8, num_workers=2)
+        results = parallel_object.run(dummy_func_return_single)
+        self.assertListEqual([r.result for r in results], [0.5] * 4)
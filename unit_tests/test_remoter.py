@@ -11,6 +11,7 @@
 #
 # Copyright (c) 2020 ScyllaDB
 
+import io
 import os
 import getpass
 import unittest
@@ -18,10 +19,12 @@ import threading
 from typing import Union, Optional
 from logging import getLogger
 
+from invoke.exceptions import UnexpectedExit
+
 # from parameterized import parameterized
 
 from sdcm.remote import RemoteLibSSH2CmdRunner, RemoteCmdRunner, LocalCmdRunner, RetryableNetworkException, \
-    SSHConnectTimeoutError, shell_script_cmd
+    SSHConnectTimeoutError, shell_script_cmd, OutputRetention
 from sdcm.remote.kubernetes_cmd_runner import KubernetesCmdRunner
 from sdcm.remote.base import CommandRunner, Result
 from sdcm.remote.remote_file import remote_file
@@ -488,3 +491,25 @@ class TestRemoteFile(unittest.TestCase):
         self.assertTrue(remoter.rf_dst.startswith("/tmp/sct"))
         self.assertTrue(remoter.rf_dst.endswith(os.path.basename(some_file)))
         self.assertEqual(remoter.sf_data, None)
+
+
+class TestOutputSinks(unittest.TestCase):
+    def test_local_runner_streams_to_sinks(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        result = LocalCmdRunner().run("seq 1 3; echo oops >&2", stdout_sink=stdout, stderr_sink=stderr)
+        self.assertEqual(stdout.getvalue(), "1\n2\n3\n")
+        self.assertEqual(stderr.getvalue(), "oops\n")
+        self.assertEqual(result.stdout, "1\n2\n3\n")
+
+    def test_output_of_failed_attempts_is_dropped(self):
+        stdout = io.StringIO()
+        stdout.write("before\n")
+        with self.assertRaises(UnexpectedExit):
+            LocalCmdRunner().run("echo attempt; false", stdout_sink=stdout, retry=2, verbose=False)
+        self.assertEqual(stdout.getvalue(), "before\nattempt\n")
+
+    def test_libssh2_runner_passes_output_options_to_client(self):
+        sink, retention = io.StringIO(), OutputRetention(head=1, tail=1)
+        output_kwargs = RemoteLibSSH2CmdRunner._output_kwargs  # pylint: disable=protected-access
+        self.assertEqual(output_kwargs(sink, None, retention),
+                         {"stdout_sink": sink, "stderr_sink": None, "retention": retention})
@@ -0,0 +1,103 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import pickle
+import threading
+import unittest
+
+from sdcm.remote.libssh2_client import ConnectionPool, DEFAULT_CONNECTION_POOL
+from sdcm.remote.libssh2_client.exceptions import OpenChannelTimeout, ConnectError
+
+
+class FakeClient:  # pylint: disable=too-few-public-methods
+    connects = 0
+
+    def __init__(self, host="127.0.0.1", fail=False):
+        self.host = host
+        self.port = 22
+        self.user = "scylla"
+        self.pkey = "~/.ssh/key"
+        self.session = None
+        self.fail = fail
+        self.disconnected = False
+
+    def unpooled_copy(self):
+        return FakeClient(host=self.host, fail=self.fail)
+
+    def connect(self, timeout=None):  # pylint: disable=unused-argument
+        if self.fail:
+            raise ConnectError("Connection refused")
+        FakeClient.connects += 1
+        self.session = object()
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        FakeClient.connects = 0
+        self.pool = ConnectionPool(max_sessions_per_host=2, max_channels_per_session=2, wait_timeout=0.5)
+
+    def test_sessions_are_shared(self):
+        leases = [self.pool.acquire(FakeClient()) for _ in range(4)]
+        self.assertEqual(FakeClient.connects, 2)
+        self.assertEqual(len({id(lease.session) for lease in leases}), 2)
+        for lease in leases:
+            self.pool.release(lease)
+        self.pool.release(self.pool.acquire(FakeClient()))
+        self.assertEqual(FakeClient.connects, 2)
+        self.assertEqual(self.pool.get_stats(),
+                         {"hits": 3, "misses": 2, "waits": 0, "reconnects": 0, "sessions": 2, "channels": 0})
+
+    def test_different_hosts(self):
+        self.pool.acquire(FakeClient(host="10.0.0.1"))
+        self.pool.acquire(FakeClient(host="10.0.0.2"))
+        self.assertEqual(FakeClient.connects, 2)
+
+    def test_wait_for_free_channel(self):
+        leases = [self.pool.acquire(FakeClient()) for _ in range(4)]
+        self.assertRaises(OpenChannelTimeout, self.pool.acquire, FakeClient())
+        threading.Timer(0.1, self.pool.release, args=(leases[0], )).start()
+        self.assertIs(self.pool.acquire(FakeClient()), leases[0])
+        self.assertEqual(self.pool.stats.waits, 2)
+        self.assertEqual(FakeClient.connects, 2)
+
+    def test_broken_session_is_replaced(self):
+        lease = self.pool.acquire(FakeClient())
+        self.pool.release(lease, broken=True)
+        self.assertTrue(lease.client.disconnected)
+        new_lease = self.pool.acquire(FakeClient())
+        self.assertIsNot(new_lease, lease)
+        self.assertEqual(self.pool.stats.reconnects, 1)
+        self.assertEqual(FakeClient.connects, 2)
+
+    def test_retire(self):
+        lease = self.pool.acquire(FakeClient())
+        self.pool.retire(FakeClient())
+        self.assertFalse(lease.client.disconnected)  # still in use
+        self.assertIsNot(self.pool.acquire(FakeClient()), lease)
+        self.pool.release(lease)
+        self.assertTrue(lease.client.disconnected)
+
+    def test_connect_failure(self):
+        self.assertRaises(ConnectError, self.pool.acquire, FakeClient(fail=True))
+        self.pool.acquire(FakeClient())
+        self.pool.acquire(FakeClient())
+        self.assertEqual(self.pool.get_stats()["sessions"], 1)
+
+    def test_pickle(self):
+        self.assertIs(pickle.loads(pickle.dumps(DEFAULT_CONNECTION_POOL)), DEFAULT_CONNECTION_POOL)
+        pool = pickle.loads(pickle.dumps(self.pool))
+        self.assertIsNot(pool, self.pool)
+        self.assertEqual(pool.max_channels_per_session, 2)
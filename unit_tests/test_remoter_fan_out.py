@@ -0,0 +1,92 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import time
+import unittest
+import threading
+
+from invoke import Result
+
+from sdcm.remote import run_on_nodes, raise_for_failures, RunOnNodesError
+from unit_tests.lib.fake_remoter import FakeRemoter
+
+
+class SlowFakeRemoter(FakeRemoter):
+    result_map = {
+        r"echo": Result(stdout="ok", exited=0),
+        r"false": Result(exited=1),
+    }
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def run(self, cmd, *args, **kwargs):  # pylint: disable=arguments-differ
+        with self.lock:
+            SlowFakeRemoter.running += 1
+            SlowFakeRemoter.max_running = max(SlowFakeRemoter.running, SlowFakeRemoter.max_running)
+        try:
+            time.sleep(0.2 if self.hostname == "slow" else 0.05)
+            return super().run(cmd, *args, **kwargs)
+        finally:
+            with self.lock:
+                SlowFakeRemoter.running -= 1
+
+
+class FakeNode:  # pylint: disable=too-few-public-methods
+    def __init__(self, name):
+        self.name = name
+        self.remoter = SlowFakeRemoter(hostname=name)
+
+    def __str__(self):
+        return self.name
+
+
+class TestRunOnNodes(unittest.TestCase):
+    def setUp(self):
+        SlowFakeRemoter.max_running = 0
+
+    def test_results_are_streamed_as_completed(self):
+        nodes = [FakeNode("slow")] + [FakeNode(f"node{i}") for i in range(5)]
+        results = list(run_on_nodes(nodes, "echo"))
+        self.assertEqual(len(results), 6)
+        self.assertEqual(results[-1].node.name, "slow")
+        self.assertTrue(all(res.ok and res.result.stdout == "ok" for res in results))
+
+    def test_concurrency(self):
+        nodes = [FakeNode(f"node{i}") for i in range(10)]
+        raise_for_failures(run_on_nodes(nodes, "echo", concurrency=3))
+        self.assertEqual(SlowFakeRemoter.max_running, 3)
+
+    def test_per_node_command(self):
+        nodes = [FakeNode("node1"), FakeNode("node2")]
+        results = raise_for_failures(run_on_nodes(nodes, lambda node: "echo" if node.name == "node1" else "false",
+                                                  ignore_status=True))
+        self.assertEqual({res.node.name: res.result.exited for res in results}, {"node1": 0, "node2": 1})
+
+    def test_errors_are_aggregated(self):
+        nodes = [FakeNode("node1"), FakeNode("node2"), FakeNode("node3")]
+        with self.assertRaises(RunOnNodesError) as exc:
+            raise_for_failures(run_on_nodes(nodes, lambda node: "echo" if node.name == "node1" else "false"))
+        self.assertEqual(sorted(res.node.name for res in exc.exception.failed), ["node2", "node3"])
+        self.assertEqual(len(exc.exception.results), 3)
+        self.assertIn("Command failed on 2 of 3 node(s)", str(exc.exception))
+        self.assertIn("when running command: false", str(exc.exception.__cause__))
+
+    def test_error_on_one_node_is_reraised(self):
+        nodes = [FakeNode("node1"), FakeNode("node2")]
+        with self.assertRaisesRegex(Exception, "when running command: false") as exc:
+            raise_for_failures(run_on_nodes(nodes, lambda node: "echo" if node.name == "node1" else "false"))
+        self.assertNotIsInstance(exc.exception, RunOnNodesError)
+
+    def test_no_nodes(self):
+        self.assertEqual(list(run_on_nodes([], "echo")), [])
@@ -0,0 +1,57 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import io
+import unittest
+
+from sdcm.remote.libssh2_client.output import OutputBuffer, OutputRetention
+
+
+class TestOutputBuffer(unittest.TestCase):
+    def test_unbounded(self):
+        buffer = OutputBuffer()
+        for i in range(1000):
+            buffer.write(f"line {i}\n")
+        self.assertEqual(buffer.getvalue(), "".join(f"line {i}\n" for i in range(1000)))
+        self.assertEqual(buffer.skipped, 0)
+
+    def test_retention(self):
+        buffer = OutputBuffer(retention=OutputRetention(head=5, tail=5))
+        for chunk in ("012", "3456", "789ab", "cdefg"):
+            buffer.write(chunk)
+        self.assertEqual(buffer.getvalue(), "01234\n...[7 characters skipped]...\ncdefg")
+
+    def test_retention_not_exceeded(self):
+        buffer = OutputBuffer(retention=OutputRetention(head=5, tail=5))
+        buffer.write("0123456789")
+        self.assertEqual(buffer.getvalue(), "0123456789")
+
+    def test_sink_gets_everything(self):
+        sink = io.StringIO()
+        buffer = OutputBuffer(sink=sink, retention=OutputRetention(head=1, tail=1))
+        buffer.write("a" * 100)
+        buffer.write("b" * 100)
+        self.assertEqual(sink.getvalue(), "a" * 100 + "b" * 100)
+        self.assertEqual(buffer.getvalue(), "a\n...[198 characters skipped]...\nb")
+
+    def test_multibyte_char_split_between_chunks(self):
+        data = "привет\n".encode("utf-8")
+        buffer = OutputBuffer()
+        buffer.write_bytes(data[:3])
+        buffer.write_bytes(data[3:])
+        self.assertEqual(buffer.getvalue(), "привет\n")
+
+    def test_truncated_char_at_the_end(self):
+        buffer = OutputBuffer()
+        buffer.write_bytes("ok ж".encode("utf-8")[:-1])
+        self.assertRaises(UnicodeDecodeError, buffer.getvalue)
@@ -0,0 +1,133 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import socket
+import threading
+import time
+import unittest
+from collections import defaultdict
+
+from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN  # pylint: disable=no-name-in-module
+
+from sdcm.remote.libssh2_client import Client
+from sdcm.remote.libssh2_client.output import OutputBuffer
+from sdcm.remote.libssh2_client.session import Session, InboundWaiter
+
+READ_DATA_CHUNK_TIMEOUT = 2
+
+
+class FakeSession:
+    """A session with channels multiplexed over a socket: every packet is a `<channel>:<data>' line."""
+
+    wait_for_data = Session.wait_for_data
+    notify_data = Session.notify_data
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.inbound = InboundWaiter()
+        self.sock, self.remote = socket.socketpair()
+        self.sock.setblocking(False)
+        self.buffers = defaultdict(bytes)
+        self.closed = set()
+
+    @staticmethod
+    def block_directions():
+        return 1  # LIBSSH2_SESSION_BLOCK_INBOUND
+
+    def send(self, channel, data):
+        self.remote.sendall(f"{channel}:{data}\n".encode())
+
+    def pump(self):
+        """Read all packets from the socket into buffers of channels (called with the lock held.)"""
+        try:
+            data = self.sock.recv(65536)
+        except BlockingIOError:
+            return
+        for packet in data.decode().splitlines():
+            channel, payload = packet.split(":", 1)
+            if payload == "EOF":
+                self.closed.add(channel)
+            else:
+                self.buffers[channel] += payload.encode() + b"\n"
+
+    def close(self):
+        self.sock.close()
+        self.remote.close()
+        self.inbound.close()
+
+
+class FakeChannel:
+    def __init__(self, session, name):
+        self.session = session
+        self.name = name
+
+    def read(self):
+        self.session.pump()
+        if data := self.session.buffers.pop(self.name, b""):
+            return len(data), data
+        return (0, b"") if self.name in self.session.closed else (LIBSSH2_ERROR_EAGAIN, b"")
+
+    def read_stderr(self):
+        return (0, b"") if self.name in self.session.closed else (LIBSSH2_ERROR_EAGAIN, b"")
+
+    def wait_eof(self):
+        return 1 if self.name in self.session.closed and not self.session.buffers.get(self.name) \
+            else LIBSSH2_ERROR_EAGAIN
+
+
+class TestSharedSession(unittest.TestCase):
+    def setUp(self):
+        self.session = FakeSession()
+        self.addCleanup(self.session.close)
+        self.output = {}
+
+    def read_channel(self, name):
+        stdout = OutputBuffer()
+        Client._process_output_no_watchers(  # pylint: disable=protected-access
+            self.session, FakeChannel(self.session, name), stdout, OutputBuffer(),
+            timeout=10, timeout_read_data_chunk=READ_DATA_CHUNK_TIMEOUT)
+        self.output[name] = stdout.getvalue()
+
+    def start_reader(self, name):
+        thread = threading.Thread(target=self.read_channel, args=(name, ), daemon=True)
+        thread.start()
+        time.sleep(0.2)  # let the reader to start waiting for data
+        return thread
+
+    def test_idle_channel_doesnt_delay_busy_one(self):
+        idle = self.start_reader("idle")
+        busy = self.start_reader("busy")
+        start_time = time.perf_counter()
+        self.session.send("busy", "data")
+        self.session.send("busy", "EOF")
+        busy.join(READ_DATA_CHUNK_TIMEOUT)
+        self.assertFalse(busy.is_alive())
+        self.assertLess(time.perf_counter() - start_time, READ_DATA_CHUNK_TIMEOUT / 4)
+        self.assertEqual(self.output["busy"], "data\n")
+
+        self.session.send("idle", "EOF")
+        idle.join(READ_DATA_CHUNK_TIMEOUT * 2)
+        self.assertFalse(idle.is_alive())
+        self.assertEqual(self.output["idle"], "")
+
+    def test_data_read_by_another_channel_wakes_up_waiting_one(self):
+        busy = self.start_reader("busy")
+        start_time = time.perf_counter()
+        with self.session.lock:  # packets of `busy' were pulled out of the socket by a read of another channel
+            self.session.buffers["busy"] += b"data\n"
+            self.session.closed.add("busy")
+        self.session.notify_data()
+        busy.join(READ_DATA_CHUNK_TIMEOUT)
+        self.assertFalse(busy.is_alive())
+        self.assertLess(time.perf_counter() - start_time, READ_DATA_CHUNK_TIMEOUT / 4)
+        self.assertEqual(self.output["busy"], "data\n")
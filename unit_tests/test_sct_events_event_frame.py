@@ -0,0 +1,68 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import pickle
+import unittest
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.database import DatabaseLogEvent
+from sdcm.sct_events.event_frame import EventFlags, EventFrame, PayloadFormat, encode_event
+from sdcm.sct_events.filters import DbEventsFilter
+from sdcm.sct_events.health import ClusterHealthValidatorEvent
+from sdcm.sct_events.system import TestResultEvent
+
+
+class TestEventFrame(unittest.TestCase):
+    def test_encode_decode(self):
+        event = ClusterHealthValidatorEvent.NodeStatus(message="abc")
+        frame = EventFrame(encode_event(event))
+        self.assertEqual(frame.name, "ClusterHealthValidatorEvent.NodeStatus")
+        self.assertEqual(frame.base, "ClusterHealthValidatorEvent")
+        self.assertEqual(frame.severity, event.severity)
+        self.assertEqual(frame.event_timestamp, event.event_timestamp)
+        self.assertEqual(frame.flags, EventFlags.PUBLISH_TO_GRAFANA | EventFlags.SAVE_TO_FILES)
+        self.assertEqual(frame.decode(), event)
+
+    def test_class_flags(self):
+        event = DatabaseLogEvent.BAD_ALLOC()
+        event.severity = Severity.CRITICAL
+        frame = EventFrame(memoryview(encode_event(event)))
+        self.assertEqual(frame.severity, Severity.CRITICAL)
+        self.assertNotIn(EventFlags.SYSTEM, frame.flags)
+
+        db_filter = DbEventsFilter(db_event=DatabaseLogEvent.BAD_ALLOC)
+        frame = EventFrame(encode_event(db_filter))
+        self.assertIn(EventFlags.SYSTEM, frame.flags)
+        self.assertIn(EventFlags.FILTER, frame.flags)
+        self.assertEqual(frame.decode(), db_filter)
+
+    def test_frame_is_smaller_than_pickle(self):
+        event = DatabaseLogEvent.BACKTRACE()
+        event.add_info(node="node1", line="Backtrace: 0x1234", line_number=1)
+        encoded = encode_event(event)
+        self.assertLess(len(encoded), len(pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)))
+        frame = EventFrame(encoded)
+        self.assertIs(frame._payload_format, PayloadFormat.STATE)  # pylint: disable=protected-access
+        decoded = frame.decode()
+        self.assertIs(type(decoded), type(event))
+        self.assertEqual(decoded, event)
+        self.assertEqual(decoded.event_timestamp, event.event_timestamp)
+        self.assertIs(decoded.severity, event.severity)
+        event.dont_publish()
+
+    def test_event_with_own_pickling(self):
+        event = TestResultEvent(test_status="SUCCESS", events={})
+        frame = EventFrame(encode_event(event))
+        self.assertIs(frame._payload_format, PayloadFormat.PICKLE)  # pylint: disable=protected-access
+        decoded = frame.decode()
+        self.assertEqual((decoded.test_status, decoded.event_timestamp), (event.test_status, event.event_timestamp))
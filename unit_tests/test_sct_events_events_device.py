@@ -77,6 +77,27 @@ class TestEventsDevice(unittest.TestCase):
         self.assertEqual(self.events_device.events_counter, counter.value)
         self.assertEqual(counter.value, 2)
 
+    def test_publish_subscribe_batches(self):
+        events = [ClusterHealthValidatorEvent.NodeStatus(message=f"event #{i}") for i in range(10)]
+        for event in events:
+            self.events_device.publish_event(event)
+
+        stop_event = threading.Event()
+        counter = multiprocessing.Value(ctypes.c_uint32, 0)
+
+        threading.Timer(interval=1, function=stop_event.set).start()  # stop subscriber in 1 second.
+        self.events_device.start_delay = 0.5
+        self.events_device.pub_batch_max_size = 3
+        self.events_device.start()
+
+        try:
+            events_generator = self.events_device.outbound_events(stop_event=stop_event, events_counter=counter)
+            self.assertEqual([event for _, event in events_generator], events)
+        finally:
+            self.events_device.stop(timeout=1)
+
+        self.assertEqual(counter.value, 10)
+
     def test_start_get_events_main_device(self):
         self.assertIsNone(get_events_main_device(_registry=self.events_processes_registry))
         start_events_main_device(_registry=self.events_processes_registry)
@@ -0,0 +1,63 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from sdcm.sct_events import Severity
+from sdcm.sct_events.events_store import EventsStore
+
+
+class TestEventsStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = EventsStore(Path(self.temp_dir) / "events.db")
+        for num in range(10):
+            for severity in (Severity.CRITICAL, Severity.ERROR, ):
+                self.store.add(timestamp=1000 + num, severity=severity, event_type="DatabaseLogEvent.BAD_ALLOC",
+                               node=f"node-{num % 2}", message=f"m-{num}-{severity.name}")
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_events_available_after_flush(self):
+        self.assertEqual(self.store.count(), 0)
+        self.store.flush()
+        self.assertEqual(self.store.count(), 20)
+        self.assertEqual(self.store.count(severity=Severity.CRITICAL), 10)
+
+    def test_first_and_last(self):
+        self.store.flush()
+        self.assertEqual([event.message for event in self.store.first(Severity.CRITICAL, limit=3)],
+                         ["m-0-CRITICAL", "m-1-CRITICAL", "m-2-CRITICAL"])
+        self.assertEqual([event.message for event in self.store.last(Severity.ERROR, limit=3)],
+                         ["m-7-ERROR", "m-8-ERROR", "m-9-ERROR"])
+        self.assertEqual(len(self.store.last(Severity.WARNING)), 0)
+
+    def test_by_node_and_time_range(self):
+        self.store.flush()
+        self.assertEqual([event.message for event in self.store.by_node("node-1", limit=2)],
+                         ["m-9-CRITICAL", "m-9-ERROR"])
+        events = self.store.by_time_range(1002, 1003, severity=Severity.ERROR)
+        self.assertEqual([event.message for event in events], ["m-2-ERROR", "m-3-ERROR"])
+
+    def test_reader_in_another_connection(self):
+        self.store.flush()
+        reader = EventsStore(self.store.path)
+        try:
+            self.assertEqual(reader.count(), 20)
+        finally:
+            reader.close()
@@ -13,6 +13,7 @@
 
 import time
 import unittest
+from unittest.mock import patch
 
 from sdcm.sct_events import Severity
 from sdcm.sct_events.system import SpotTerminationEvent
@@ -104,3 +105,37 @@ class TestFileLogger(unittest.TestCase, EventsUtilsMixin):
             self.assertEqual(len(group), 5)
             for num, event in enumerate(group, start=0 if severity == Severity.CRITICAL.name else 5):
                 self.assertIn(f"m-{num}-{severity}", event)
+
+
+class TestFileLoggerCriticalEvents(unittest.TestCase, EventsUtilsMixin):
+    def setUp(self) -> None:
+        self.setup_events_processes(events_device=False, events_main_device=True, registry_patcher=False)
+        with patch.object(EventsFileLogger, "flush_interval", 600):  # no periodic flushes during the test
+            start_events_logger(_registry=self.events_processes_registry)
+        self.file_logger = get_events_logger(_registry=self.events_processes_registry)
+        time.sleep(EVENTS_SUBSCRIBERS_START_DELAY)
+
+    def tearDown(self) -> None:
+        self.file_logger.stop(timeout=1)
+        self.teardown_events_processes()
+
+    def test_critical_event_is_committed_to_store_immediately(self) -> None:
+        event = SpotTerminationEvent(node="n1", message="critical-m1")
+        event.severity = Severity.CRITICAL
+        with self.wait_for_n_events(self.file_logger, count=1, timeout=3):
+            self.events_main_device.publish_event(event)
+
+        grouped = get_events_grouped_by_category(_registry=self.events_processes_registry)
+        self.assertEqual(len(grouped[Severity.CRITICAL.name]), 1)
+        self.assertIn("critical-m1", grouped[Severity.CRITICAL.name][0])
+
+    def test_error_event_is_committed_to_store_and_summary_immediately(self) -> None:
+        event = SpotTerminationEvent(node="n1", message="error-m1")
+        event.severity = Severity.ERROR
+        with self.wait_for_n_events(self.file_logger, count=1, timeout=3):
+            self.events_main_device.publish_event(event)
+
+        grouped = get_events_grouped_by_category(_registry=self.events_processes_registry)
+        self.assertEqual(len(grouped[Severity.ERROR.name]), 1)
+        self.assertIn("error-m1", grouped[Severity.ERROR.name][0])
+        self.assertEqual(get_logger_event_summary(_registry=self.events_processes_registry)[Severity.ERROR.name], 1)
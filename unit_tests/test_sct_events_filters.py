@@ -12,11 +12,13 @@
 # Copyright (c) 2020 ScyllaDB
 
 import re
+import time
 import pickle
 import unittest
 
 from sdcm.sct_events import Severity
-from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsSeverityChangerFilter
+from sdcm.sct_events.base import FILTER_EVENT_DECAY_TIME
+from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsSeverityChangerFilter, EventsFiltersIndex
 from sdcm.sct_events.database import DatabaseLogEvent
 
 
@@ -125,3 +127,72 @@ class TestEventsSeverityChangerFilter(unittest.TestCase):
         self.assertEqual(event.severity, Severity.ERROR)
         db_events_filter.eval_filter(event)
         self.assertEqual(event.severity, Severity.NORMAL)
+
+
+class TestEventsFiltersIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = EventsFiltersIndex()
+
+    def test_empty(self):
+        self.assertFalse(self.index.is_filtered(DatabaseLogEvent.BAD_ALLOC()))
+
+    def test_db_events_filter(self):
+        self.index.add(DbEventsFilter(db_event=DatabaseLogEvent.BAD_ALLOC, node="node1", line="y"))
+        event1 = DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1)
+        event2 = event1.clone().add_info(node="node2", line="xyz", line_number=1)
+        event3 = DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node1", line="xyz", line_number=1)
+        self.assertTrue(self.index.is_filtered(event1))
+        self.assertFalse(self.index.is_filtered(event2))
+        self.assertFalse(self.index.is_filtered(event3))
+
+    def test_events_filter_class_prefix_and_combined_regexes(self):
+        self.index.add(EventsFilter(event_class=DatabaseLogEvent, regex=".*abc.*"))
+        self.index.add(EventsFilter(event_class=DatabaseLogEvent.BAD_ALLOC, regex=".*xyz.*"))
+        self.index.add(EventsFilter(regex=".*qwe.*"))
+        event1 = DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1)
+        event2 = DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node1", line="xyz", line_number=1)
+        event3 = DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node1", line="abc", line_number=1)
+        event4 = DatabaseLogEvent.NO_SPACE_ERROR().add_info(node="node1", line="qwe", line_number=1)
+        self.assertTrue(self.index.is_filtered(event1))
+        self.assertFalse(self.index.is_filtered(event2))
+        self.assertTrue(self.index.is_filtered(event3))
+        self.assertTrue(self.index.is_filtered(event4))
+
+    def test_class_prefix_sentinel(self):
+        self.index.add(EventsFilter(event_class=DatabaseLogEvent.BAD_ALLOC))
+        self.assertTrue(self.index.is_filtered(DatabaseLogEvent.BAD_ALLOC()))
+        self.assertFalse(self.index.is_filtered(DatabaseLogEvent.BACKTRACE()))
+
+    def test_remove(self):
+        events_filter = EventsFilter(event_class=DatabaseLogEvent)
+        self.index.add(events_filter)
+        self.assertTrue(self.index.is_filtered(DatabaseLogEvent.BAD_ALLOC()))
+        self.index.remove(events_filter.uuid)
+        self.assertFalse(self.index.is_filtered(DatabaseLogEvent.BAD_ALLOC()))
+        self.assertEqual(len(self.index), 0)
+
+    def test_expire_time(self):
+        events_filter = EventsFilter(event_class=DatabaseLogEvent, regex=".*xyz.*")
+        self.index.add(events_filter)
+        old_event = DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1)
+        self.index.set_expire_time(events_filter.uuid, time.time())
+        new_event = DatabaseLogEvent.BAD_ALLOC().add_info(node="node1", line="xyz", line_number=1)
+        new_event.event_timestamp = time.time() + 1
+        self.assertTrue(self.index.is_filtered(old_event))
+        self.assertFalse(self.index.is_filtered(new_event))
+        self.index.remove_deceased(now=time.time() + FILTER_EVENT_DECAY_TIME - 10)
+        self.assertIn(events_filter.uuid, self.index)
+        events_filter.expire_time -= FILTER_EVENT_DECAY_TIME
+        self.index.set_expire_time(events_filter.uuid, events_filter.expire_time)
+        self.index.remove_deceased()
+        self.assertNotIn(events_filter.uuid, self.index)
+
+    def test_severity_changer(self):
+        self.index.add(EventsSeverityChangerFilter(new_severity=Severity.WARNING, event_class=DatabaseLogEvent))
+        self.index.add(EventsSeverityChangerFilter(new_severity=Severity.NORMAL, event_class=DatabaseLogEvent.BAD_ALLOC))
+        event1 = DatabaseLogEvent.BAD_ALLOC()
+        event2 = DatabaseLogEvent.NO_SPACE_ERROR()
+        self.assertFalse(self.index.is_filtered(event1))
+        self.assertFalse(self.index.is_filtered(event2))
+        self.assertEqual(event1.severity, Severity.NORMAL)
+        self.assertEqual(event2.severity, Severity.WARNING)
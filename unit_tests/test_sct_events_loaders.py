@@ -23,7 +23,8 @@ from sdcm.sct_events.base import LogEvent
 from sdcm.sct_events.loaders import \
     GeminiStressEvent, CassandraStressEvent, ScyllaBenchEvent, YcsbStressEvent, NdBenchStressEvent, CDCReaderStressEvent, \
     KclStressEvent, CassandraStressLogEvent, ScyllaBenchLogEvent, GeminiStressLogEvent, \
-    CS_ERROR_EVENTS, CS_NORMAL_EVENTS, SCYLLA_BENCH_ERROR_EVENTS, CS_ERROR_EVENTS_PATTERNS, CS_NORMAL_EVENTS_PATTERNS
+    CS_ERROR_EVENTS, CS_NORMAL_EVENTS, SCYLLA_BENCH_ERROR_EVENTS, CS_ERROR_EVENTS_PATTERNS, CS_NORMAL_EVENTS_PATTERNS, \
+    CS_LOG_CLASSIFIER, SCYLLA_BENCH_LOG_CLASSIFIER, get_gemini_log_classifier
 
 
 class TestGeminiEvent(unittest.TestCase):
@@ -495,3 +496,50 @@ class TestGeminiLogEvent(unittest.TestCase):
             "event_id=3ce0cdeb-0866-40ce-9a20-25ea3ae08be2: type=GeminiEvent line_number=0 node=None",
         )
         self.assertEqual(event, pickle.loads(pickle.dumps(event)))
+
+
+class TestStressLogClassifier(unittest.TestCase):
+    CS_LINES = [
+        "total,      12345,   12345,   12345,   12345,     1.0,     0.9,     1.3,     1.6,     2.9,     5.1,    1.0\n",
+        "com.datastax.driver.core.Cluster - ===== Using optimized driver!!! =====\n",
+        "java.io.IOException: Operation x10 on key(s) [334f37384f4d32303430]: Error executing: (OverloadedException): "
+        "Queried host (10.0.3.167/10.0.3.167:9042) was overloaded: Too many in flight hints: 10490670\n",
+        "WARN  03:56:37,572 Cannot achieve consistency level for cl QUORUM. Requires 2, alive 1\n",
+        "java.io.IOException: Connection reset by peer\n",
+    ]
+
+    def test_same_result_as_plain_loop(self):
+        expected = []
+        for line_number, line in enumerate(self.CS_LINES, start=10):
+            for pattern, event in chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS):
+                if pattern.search(line):
+                    expected.append((line_number, event.type))
+                    break
+        self.assertEqual([(line_number, template.type) for line_number, _, template in
+                          CS_LOG_CLASSIFIER.classify(self.CS_LINES, start_line_number=10)], expected)
+        self.assertEqual(len(expected), 4)
+
+    def test_events_are_cloned(self):
+        templates = [(template.event_id, template.node) for template in chain(CS_NORMAL_EVENTS, CS_ERROR_EVENTS)]
+        events = list(CS_LOG_CLASSIFIER.events(self.CS_LINES, node="loader-1", event_id="stress-id"))
+        for event in events:
+            event.dont_publish()
+        self.assertEqual([event.type for event in events],
+                         ["ShardAwareDriver", "TooManyHintsInFlight", "ConsistencyError", "IOException"])
+        self.assertTrue(all(event.event_id == "stress-id" and event.node == "loader-1" for event in events))
+        self.assertEqual(events[1].line_number, 2)
+        self.assertEqual([(template.event_id, template.node) for template in chain(CS_NORMAL_EVENTS, CS_ERROR_EVENTS)],
+                         templates)
+
+    def test_batch_without_candidates(self):
+        self.assertEqual(list(CS_LOG_CLASSIFIER.classify(self.CS_LINES[:1] * 1000)), [])
+        self.assertEqual(list(SCYLLA_BENCH_LOG_CLASSIFIER.classify(["2021/04/06 13:03:28 ok\n"])), [])
+
+    def test_gemini(self):
+        lines = ['{"L":"INFO","T":"2020-06-09T03:40:39.349Z","N":"pump","M":"Test run stopped. Exiting."}\n',
+                 "panic: runtime error\n"]
+        events = list(get_gemini_log_classifier().events(lines, node="loader-1", start_line_number=1))
+        self.assertEqual(len(events), 1)
+        events[0].dont_publish()
+        self.assertEqual(events[0].line, 'Test run stopped. Exiting. (N="pump")')
+        self.assertEqual(len(list(get_gemini_log_classifier(verbose=True).classify(lines))), 2)
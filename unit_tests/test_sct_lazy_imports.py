@@ -0,0 +1,41 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import unittest
+
+from utils.benchmarks.sct_import_time import import_times
+
+# Modules used only by few commands of `sct.py': they are imported by the commands, not by the CLI startup.
+LAZY_MODULES = (
+    "pytest",
+    "sdcm.tester",
+    "sdcm.sct_provision",
+    "sdcm.results_analyze",
+    "sdcm.send_email",
+    "sdcm.monitorstack",
+    "sdcm.utils.jepsen",
+    "sdcm.parallel_timeline_report",
+    "sdcm.utils.cloud_monitor",
+    "utils.build_system.create_test_release_jobs",
+    "utils.mocks.aws_mock",
+)
+
+
+class TestSctLazyImports(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.import_times = import_times("sct")
+
+    def test_heavy_modules_are_not_imported_on_startup(self):
+        self.assertIn("sct", self.import_times)
+        self.assertEqual([module for module in LAZY_MODULES if module in self.import_times], [])
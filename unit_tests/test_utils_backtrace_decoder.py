@@ -0,0 +1,100 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sdcm.utils.backtrace_decoder import BacktraceDecoder, split_addr2line_frames, prune_debuginfo_cache
+
+
+class DummyOutput:
+    def __init__(self, stdout):
+        self.stdout = stdout
+
+
+class Addr2lineRemote:
+    """Print a frame per address as `addr2line -Cpife' does, with an inlined frame for odd addresses."""
+
+    def __init__(self):
+        self.commands = []
+
+    def run(self, cmd, **_):
+        self.commands.append(cmd)
+        output = ""
+        for address in cmd.split()[3:]:
+            output += f"func_{address} at file.cc:{int(address, 16)}\n"
+            if int(address, 16) % 2:
+                output += f" (inlined by) caller_{address} at file.cc:1\n"
+        return DummyOutput(output)
+
+
+class TestBacktraceDecoder(unittest.TestCase):
+    def setUp(self):
+        self.remote = Addr2lineRemote()
+        self.decoder = BacktraceDecoder(self.remote, "scylla.debug")
+
+    def test_split_frames(self):
+        self.assertEqual(split_addr2line_frames("a at x:1\n (inlined by) b at y:2\nc at z:3\n"),
+                         ["a at x:1\n (inlined by) b at y:2\n", "c at z:3\n"])
+
+    def test_batch_is_decoded_by_one_command(self):
+        raw_backtraces = ["0x1\n0x2\n0x3", "0x2\n0x4", "0x1\n0x2\n0x3"]
+        decoded = self.decoder.decode_many(raw_backtraces)
+        self.assertEqual(self.remote.commands, ["addr2line -Cpife scylla.debug 0x1 0x2 0x3 0x4"])
+        for raw, backtrace in zip(raw_backtraces, decoded):
+            self.assertEqual(backtrace, Addr2lineRemote().run(f"addr2line -Cpife scylla.debug {raw}").stdout)
+        self.assertEqual(self.decoder.stats, {"backtraces": 3, "cached_backtraces": 1, "addresses": 4,
+                                              "addr2line_runs": 1})
+
+    def test_known_addresses_are_not_decoded_again(self):
+        self.decoder.decode("0x1 0x2")
+        self.assertEqual(self.decoder.decode("0x2\n0x1"), "func_0x2 at file.cc:2\nfunc_0x1 at file.cc:1\n"
+                                                          " (inlined by) caller_0x1 at file.cc:1\n")
+        self.decoder.decode("0x1\n0x5")
+        self.assertEqual(self.remote.commands, ["addr2line -Cpife scylla.debug 0x1 0x2",
+                                                "addr2line -Cpife scylla.debug 0x5"])
+
+    def test_commands_are_chunked(self):
+        with patch("sdcm.utils.backtrace_decoder.ADDR2LINE_MAX_ADDRESSES", 2):
+            self.decoder.decode("0x1 0x2 0x3 0x4 0x5")
+        self.assertEqual(len(self.remote.commands), 3)
+
+    def test_unmapped_output_fallbacks_to_decoding_of_each_backtrace(self):
+        self.remote.run = lambda cmd, **_: self.remote.commands.append(cmd) or DummyOutput(f"{cmd}\n")
+        self.assertEqual(self.decoder.decode_many(["0x1\n0x2", "0x3"]),
+                         ["addr2line -Cpife scylla.debug 0x1 0x2\n", "addr2line -Cpife scylla.debug 0x3\n"])
+        self.assertEqual(self.remote.commands, ["addr2line -Cpife scylla.debug 0x1 0x2 0x3",
+                                                "addr2line -Cpife scylla.debug 0x1 0x2",
+                                                "addr2line -Cpife scylla.debug 0x3"])
+
+    def test_backtraces_cache_is_lru(self):
+        with patch("sdcm.utils.backtrace_decoder.BACKTRACES_CACHE_SIZE", 2):
+            self.decoder.decode_many(["0x1", "0x2"])
+            self.decoder.decode("0x1")  # 0x2 is the least recently used now
+            self.decoder.decode("0x3")
+            self.assertEqual(list(self.decoder._backtraces), ["0x1", "0x3"])  # pylint: disable=protected-access
+
+
+class TestPruneDebuginfoCache(unittest.TestCase):
+    def test_least_recently_used_files_are_removed(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch("sdcm.utils.backtrace_decoder.DEBUGINFO_CACHE_DIR", cache_dir):
+            for mtime, name in enumerate(("old.debug", "new.debug", "newest.debug", "receiving.debug.1234")):
+                path = os.path.join(cache_dir, name)
+                with open(path, "wb") as debug_file:
+                    debug_file.write(b"x" * 10)
+                os.utime(path, (mtime, mtime))
+            prune_debuginfo_cache(keep=os.path.join(cache_dir, "old.debug"), max_size=20)
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["newest.debug", "old.debug", "receiving.debug.1234"])
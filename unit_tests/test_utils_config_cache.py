@@ -0,0 +1,70 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import anyconfig
+
+from sdcm.utils import config_cache
+from sdcm.utils.config_cache import load_yaml_layer, clear_yaml_layers, cached_image
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(clear_yaml_layers)
+        self.defaults = os.path.join(self.tmp_dir.name, "defaults.yaml")
+        self.backend = os.path.join(self.tmp_dir.name, "backend.yaml")
+        self.write(self.defaults, "a: 1\nnested:\n  x: 1\n  y: 2\n")
+        self.write(self.backend, "b: 2\nnested:\n  y: 3\n")
+
+    @staticmethod
+    def write(path, content):
+        with open(path, "w", encoding="utf-8") as yaml_file:
+            yaml_file.write(content)
+
+    def test_layer_is_parsed_once(self):
+        paths = [self.defaults, self.backend]
+        with patch.object(config_cache.anyconfig, "load", wraps=anyconfig.load) as load:
+            layer = load_yaml_layer(paths)
+            layer["nested"]["x"] = 100
+            self.assertEqual(load_yaml_layer(paths), anyconfig.load(paths))
+            self.assertEqual(load.call_count, 2)  # the second one is the call in the assertion above
+        self.assertEqual(load_yaml_layer(paths), {"a": 1, "b": 2, "nested": {"x": 1, "y": 3}})
+
+    def test_modified_file_is_parsed_again(self):
+        self.assertEqual(load_yaml_layer([self.defaults])["a"], 1)
+        self.write(self.defaults, "a: 10\n")
+        os.utime(self.defaults, ns=(0, 10 ** 9))
+        self.assertEqual(load_yaml_layer([self.defaults]), {"a": 10})
+
+    def test_cached_image(self):
+        resolved = []
+
+        def resolve():
+            resolved.append(1)
+            return f"ami-{len(resolved)}"
+
+        with patch.object(config_cache, "CONFIG_CACHE_DIR", self.tmp_dir.name), \
+                patch.object(config_cache, "IMAGES_CACHE_FILE", os.path.join(self.tmp_dir.name, "images.json")):
+            self.assertEqual(cached_image(("aws", "5.0.1", "eu-west-1"), resolve, scylla_version="5.0.1"), "ami-1")
+            self.assertEqual(cached_image(("aws", "5.0.1", "eu-west-1"), resolve, scylla_version="5.0.1"), "ami-1")
+            self.assertEqual(cached_image(("aws", "5.0.1", "us-east-1"), resolve, scylla_version="5.0.1"), "ami-2")
+            self.assertEqual(cached_image(("aws", "master:latest"), resolve, scylla_version="master:latest"), "ami-3")
+            self.assertEqual(cached_image(("aws", "master:latest"), resolve, scylla_version="master:latest"), "ami-4")
+            with patch.object(config_cache, "IMAGES_CACHE_TTL", 0):
+                self.assertEqual(cached_image(("aws", "5.0.1", "eu-west-1"), resolve, scylla_version="5.0.1"), "ami-5")
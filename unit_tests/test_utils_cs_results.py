@@ -0,0 +1,106 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import threading
+import unittest
+
+from sdcm.utils.cs_results import CS_MAX_ERROR_LINES, CassandraStressResults, parse_cs_summary
+
+
+CS_OUTPUT = """\
+TAG: loader_idx:1-cpu_idx:0-keyspace_idx:1
+Mode:
+  API: JAVA_DRIVER_NATIVE
+  Username: cassandra
+  Password: *suppressed*
+type       total ops,    op/s,    pk/s,   row/s,    mean,     med,     .95,     .99,    .999,     max,   time,   stderr, errors,  gc: #,  max ms,  sum ms,  sdv ms,      mb
+total,         40718,   40718,   40718,   40718,     1.2,     0.9,     2.7,     6.2,    16.5,    38.2,    1.0,  0.00000,      0,      0,       0,       0,       0,       0
+java.io.IOException: Operation x10 on key(s) [334f37384f4d32303430]: Error executing: (OverloadedException)
+total,         90718,   50000,   50000,   50000,     1.1,     0.8,     2.5,     5.9,    15.1,    30.0,    2.0,  0.00000,      0,      0,       0,       0,       0,       0
+
+
+Results:
+Op rate                   :   45,359 op/s  [READ:20000, WRITE:25359]
+Partition rate            :   45,359 pk/s  [WRITE: 45,359 pk/s]
+Latency mean              :    1.1 ms [WRITE: 1.1 ms]
+Latency 99th percentile   :    6.0 ms [WRITE: 6.0 ms]
+Latency max               :   38.2 ms [WRITE: 38.2 ms]
+Total operation time      : 00:00:02
+
+END
+"""
+
+EXPECTED_SUMMARY = {
+    "loader_idx": "1",
+    "cpu_idx": "0",
+    "keyspace_idx": "1",
+    "username": "cassandra",
+    "op rate": "45359",
+    "op rate read": "20000",
+    "op rate write": "25359",
+    "partition rate": "45359",
+    "latency mean": "1.1",
+    "latency 99th percentile": "6.0",
+    "latency max": "38.2",
+    "total operation time": "00:00:02",
+}
+
+
+class TestCassandraStressResults(unittest.TestCase):
+    def test_parse_cs_summary(self):
+        self.assertEqual(parse_cs_summary(CS_OUTPUT.splitlines()), EXPECTED_SUMMARY)
+        self.assertEqual(parse_cs_summary(["total, 1, 2"]), {})
+
+    def test_intervals(self):
+        results = CassandraStressResults.from_lines(CS_OUTPUT.splitlines())
+        self.assertEqual(len(results.intervals), 2)
+        self.assertEqual(list(results.intervals["ops"]), [40718, 50000])
+        self.assertEqual(list(results.intervals["lat99"]), [6.2, 5.9])
+        self.assertEqual(list(results.intervals["time"]), [1.0, 2.0])
+        self.assertEqual(results.last_interval(),
+                         {"totalops": 90718, "ops": 50000, "lat95": 2.5, "lat99": 5.9, "lat999": 15.1, "latmax": 30.0,
+                          "time": 2.0})
+        self.assertEqual(results.summary, EXPECTED_SUMMARY)
+        self.assertEqual(len(results.errors), 1)
+        self.assertIsNone(CassandraStressResults().last_interval())
+
+    def test_output_streams(self):
+        results = CassandraStressResults()
+        stdout = CS_OUTPUT[:-1]
+        stderr = "java.io.IOException: first\nResults:\nOp rate : 1 op/s\ntotal, 1, 2\njava.io.IOException: second"
+        both_written = threading.Barrier(2)
+
+        def write(stream, sink, chunk_size):
+            for start in range(0, len(stream), chunk_size):
+                sink.write(stream[start:start + chunk_size])
+                sink.flush()
+            both_written.wait(timeout=10)
+
+        threads = [threading.Thread(target=write, args=(stdout, results.stdout, 7)),
+                   threading.Thread(target=write, args=(stderr, results.stderr, 5))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results.finish()
+        self.assertEqual(list(results.intervals["totalops"]), [40718, 90718])
+        self.assertEqual(results.summary, EXPECTED_SUMMARY)
+        self.assertEqual(results.errors_count, 3)
+
+    def test_errors_are_bounded(self):
+        results = CassandraStressResults()
+        for index in range(CS_MAX_ERROR_LINES * 2):
+            results.stderr.write(f"java.io.IOException: error {index}\n")
+        self.assertEqual(results.errors_count, CS_MAX_ERROR_LINES * 2)
+        self.assertEqual(len(results.errors), CS_MAX_ERROR_LINES)
+        self.assertEqual(results.errors[-1], f"java.io.IOException: error {CS_MAX_ERROR_LINES * 2 - 1}")
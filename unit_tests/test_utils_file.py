@@ -0,0 +1,63 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import tempfile
+import unittest
+
+from sdcm.utils.file import AppendOnlyFile
+
+
+class TestAppendOnlyFile(unittest.TestCase):
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False)  # pylint: disable=consider-using-with
+        self.temp_file.write(b"header\n")
+        self.temp_file.close()
+        self.log_file = AppendOnlyFile(self.temp_file.name, flush_interval=3600)
+
+    def tearDown(self):
+        self.log_file.close()
+        os.unlink(self.temp_file.name)
+
+    def read(self):
+        with open(self.temp_file.name, "rb") as fobj:
+            return fobj.read()
+
+    def test_coalesced_writes(self):
+        self.log_file.write(b"line 1\n")
+        self.log_file.write(b"line 2\n")
+        self.assertEqual(self.read(), b"header\n")
+        self.log_file.flush()
+        self.assertEqual(self.read(), b"header\nline 1\nline 2\n")
+
+    def test_fsync_flushes_immediately(self):
+        self.log_file.write(b"line 1\n")
+        self.log_file.write(b"critical\n", fsync=True)
+        self.assertEqual(self.read(), b"header\nline 1\ncritical\n")
+
+    def test_buffer_size_limit(self):
+        self.log_file.max_buffer_size = 10
+        self.log_file.write(b"line 1\n")
+        self.assertEqual(self.read(), b"header\n")
+        self.log_file.write(b"line 2\n")
+        self.assertEqual(self.read(), b"header\nline 1\nline 2\n")
+
+    def test_write_through(self):
+        self.log_file.max_buffer_size = 0
+        self.log_file.write(b"line 1\n")
+        self.assertEqual(self.read(), b"header\nline 1\n")
+
+    def test_close_flushes(self):
+        self.log_file.write(b"line 1\n")
+        self.log_file.close()
+        self.assertEqual(self.read(), b"header\nline 1\n")
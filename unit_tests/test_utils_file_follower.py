@@ -0,0 +1,80 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+
+from sdcm.utils.file_follower import FileFollowerService
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError
+        time.sleep(0.01)
+
+
+class TestFileFollowerService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = FileFollowerService()
+
+    def tearDown(self):
+        self.service.stop(timeout=5)
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, name, data):
+        with open(os.path.join(self.temp_dir, name), "a", encoding="utf-8") as log_file:
+            log_file.write(data)
+
+    def test_callbacks_of_many_files(self):
+        lines = {"a.log": [], "b.log": []}
+        for name, collected in lines.items():
+            self.service.follow(os.path.join(self.temp_dir, name), callback=collected.extend)
+        self.write("a.log", "a1\na2\n")
+        self.write("b.log", "b1\nb2")
+        wait_for(lambda: len(lines["a.log"]) == 2 and len(lines["b.log"]) == 1)
+        self.assertEqual(lines, {"a.log": ["a1\n", "a2\n"], "b.log": ["b1\n"]})
+        self.write("b.log", "\nb3\n")
+        wait_for(lambda: len(lines["b.log"]) == 3)
+        self.assertEqual(lines["b.log"], ["b1\n", "b2\n", "b3\n"])
+
+    def test_backpressure(self):
+        self.write("c.log", "".join(f"line {i}\n" for i in range(100)))
+        followed = self.service.follow(os.path.join(self.temp_dir, "c.log"), batch_lines=10, max_pending_batches=2)
+        wait_for(lambda: followed.paused)
+        self.assertEqual(followed.batches.qsize(), 2)
+        stop = threading.Event()
+        lines = []
+        for line in followed.iter_lines(stopped=stop.is_set, timeout=0.1):
+            lines.append(line)
+            if len(lines) == 100:
+                stop.set()
+        self.assertEqual(lines, [f"line {i}\n" for i in range(100)])
+        self.assertFalse(followed.paused)
+
+    def test_close(self):
+        lines = []
+        followed = self.service.follow(os.path.join(self.temp_dir, "d.log"), callback=lines.extend)
+        self.write("d.log", "d1\n")
+        wait_for(lambda: lines)
+        followed.close()
+        self.write("d.log", "d2\n")
+        time.sleep(0.3)
+        self.assertEqual(lines, ["d1\n"])
+        self.assertTrue(followed.closed)
@@ -0,0 +1,82 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+
+from sdcm.utils.file_tail import FileTailReader
+
+
+class TestFileTailReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.temp_dir, "system.log")
+        self.reader = FileTailReader(self.log_path, chunk_size=16, max_partial_line_reads=2)
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, data: str, mode: str = "a"):
+        with open(self.log_path, mode, encoding="utf-8") as log_file:
+            log_file.write(data)
+
+    def test_missing_file(self):
+        self.assertEqual(list(self.reader.iter_lines()), [])
+        self.write("line 1\n")
+        self.assertEqual(list(self.reader.iter_lines()), ["line 1\n"])
+
+    def test_lines_longer_than_chunk(self):
+        lines = [f"{'x' * length} {length}\n" for length in range(40)]
+        self.write("".join(lines))
+        self.assertEqual(list(self.reader.iter_lines()), lines)
+        self.assertEqual(list(self.reader.iter_lines()), [])
+
+    def test_partial_line(self):
+        self.write("line 1\nline")
+        self.assertEqual(list(self.reader.iter_lines()), ["line 1\n"])
+        self.write(" 2\nline 3")
+        self.assertEqual(list(self.reader.iter_lines()), ["line 2\n"])
+        self.assertEqual(list(self.reader.iter_lines()), [])
+        self.assertEqual(list(self.reader.iter_lines()), [])
+        self.assertEqual(list(self.reader.iter_lines()), ["line 3"])
+
+    def test_truncation(self):
+        self.write("line 1\nline 2\n")
+        self.assertEqual(len(list(self.reader.iter_lines())), 2)
+        self.write("line 3\n", mode="w")
+        self.assertEqual(list(self.reader.iter_lines()), ["line 3\n"])
+
+    def test_rotation(self):
+        self.write("line 1\n")
+        self.assertEqual(list(self.reader.iter_lines()), ["line 1\n"])
+        self.write("line 2\n")
+        os.rename(self.log_path, self.log_path + ".1")
+        self.write("line 3\n")
+        self.assertEqual(list(self.reader.iter_lines()), ["line 2\n", "line 3\n"])
+
+    def test_wait_wakes_up_on_write(self):
+        self.write("line 1\n")
+        list(self.reader.iter_lines())
+        self.reader.wait(timeout=0.01)  # set up the watcher
+        writer = threading.Timer(0.2, self.write, args=("line 2\n", ))
+        writer.start()
+        start = time.perf_counter()
+        self.reader.wait(timeout=5)
+        writer.join()
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual(list(self.reader.iter_lines()), ["line 2\n"])
@@ -12,11 +12,14 @@
 # Copyright (c) 2020 ScyllaDB
 
 
+import time
 import unittest
+from unittest.mock import patch
 
 from sdcm.sct_events import Severity
+from sdcm.sct_events.health import ClusterHealthValidatorEvent
 from sdcm.utils.health_checker import check_nodes_status, check_nulls_in_peers, \
-    check_node_status_in_gossip_and_nodetool_status, check_schema_version
+    check_node_status_in_gossip_and_nodetool_status, check_schema_version, check_nodes_health, ClusterHealthSnapshot
 
 
 class Node:
@@ -153,3 +156,64 @@ class TestHealthChecker(unittest.TestCase):
     def test_check_schema_version_all_ok(self):
         event = next(check_schema_version(GOSSIP_INFO, PEERS_INFO, NODES_STATUS, node1), None)
         self.assertIsNone(event)
+
+
+class ClusterNode(Node):
+    """A node of a cluster in which `down_node' is seen as DN by nodetool status `down_checks' times."""
+
+    def __init__(self, ip_address, name, cluster):
+        super().__init__(ip_address, name)
+        self.parent_cluster = cluster
+        self.collected = 0
+
+    def get_nodes_status(self):
+        time.sleep(0.2)
+        self.collected += 1
+        cluster = self.parent_cluster
+        if self is cluster.unreachable_node:
+            raise ConnectionError(f"{self.name} is unreachable")
+        down = self is cluster.down_node and self.collected <= cluster.down_checks
+        return {node: {"status": "DN" if down and node is self else "UN", "dc": "dc1"} for node in cluster.nodes}
+
+    def get_gossip_info(self):
+        return {node: {"schema": "s1", "status": "NORMAL", "dc": "dc1"} for node in self.parent_cluster.nodes}
+
+    def get_peers_info(self):
+        return {node: {"schema_version": "s1"} for node in self.parent_cluster.nodes if node is not self}
+
+
+class Cluster:
+    dead_nodes_ip_address_list = []
+
+    def __init__(self, nodes_count, down_checks=0):
+        self.nodes = [ClusterNode(f"127.0.1.{index}", f"node-{index}", self) for index in range(nodes_count)]
+        self.down_node = self.nodes[0]
+        self.down_checks = down_checks
+        self.unreachable_node = None
+
+
+class TestClusterHealthSnapshot(unittest.TestCase):
+    def test_nodes_are_collected_concurrently(self):
+        cluster = Cluster(nodes_count=10, down_checks=1)
+        start = time.monotonic()
+        snapshot = ClusterHealthSnapshot(nodes=cluster.nodes).collect()
+        self.assertLess(time.monotonic() - start, 1)
+        events = list(snapshot.health_events())
+        for event in events:
+            event.dont_publish()
+        self.assertEqual([(event.type, event.node) for event in events], [("NodeStatus", "node-0")] * 2)
+
+    @patch("sdcm.utils.health_checker.CHECK_NODE_HEALTH_RETRY_DELAY", 0)
+    def test_only_unhealthy_nodes_are_checked_again(self):
+        cluster = Cluster(nodes_count=3, down_checks=1)
+        check_nodes_health(nodes=cluster.nodes)
+        self.assertEqual([node.collected for node in cluster.nodes], [2, 1, 1])
+
+    @patch("sdcm.utils.health_checker.CHECK_NODE_HEALTH_RETRY_DELAY", 0)
+    def test_unreachable_node_is_unhealthy(self):
+        cluster = Cluster(nodes_count=3)
+        cluster.unreachable_node = cluster.nodes[1]
+        with patch.object(ClusterHealthValidatorEvent.NodeStatus, "publish") as publish:
+            check_nodes_health(nodes=cluster.nodes)
+        self.assertEqual([node.collected for node in cluster.nodes], [1, 3, 1])
+        publish.assert_called_once_with()
@@ -0,0 +1,91 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+
+from sdcm.utils.log_time_consistency import (
+    DbLogTimeConsistencyAnalyzer,
+    SctLogTimeConsistencyAnalyzer,
+    drop_lines_containing,
+    iso_timestamp,
+    iter_log_chunks,
+)
+
+TODAY = datetime.date.today().isoformat()  # the first record of a DB log is compared with a year ago
+DB_LOG = f"""\
+{TODAY}T10:00:00+00:00 db-node-1 !INFO    | scylla: started
+{TODAY}T10:00:05.250+00:00 db-node-1 !INFO    | scylla: a record
+{TODAY}T09:59:00+00:00 db-node-1 !INFO    | rsyslogd: shifted, but ignored
+{TODAY}T09:58:00+00:00 db-node-1 !INFO    | scylla: shifted by 2 minutes
+{TODAY}T09:58:01+00:00 db-node-1 !INFO    | scylla: a record
+not a timestamp
+{TODAY}T06:00:00+00:00 db-node-1 !INFO    | scylla: shifted by 4 hours"""
+
+SCT_LOG = """\
+< t:2021-11-09 14:22:18,447 f:cluster.py      l:1405 c:sdcm.cluster   p:DEBUG > 2021-11-09T14:22:18+00:00 a
+< t:2021-11-09 14:22:18,447 f:cluster.py      l:1405 c:sdcm.cluster   p:DEBUG > 2021-11-09T14:12:18+00:00 b
+< t:2021-11-09 14:22:18,447 f:tester.py       l:1405 c:sdcm.tester    p:DEBUG > 2021-11-09T14:12:18+00:00 c
+"""
+
+
+class TestLogTimeConsistency(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.log_dir = Path(self.tmp_dir.name)
+
+    def write(self, name, content):
+        path = self.log_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_iter_log_chunks(self):
+        path = self.write("messages.log", DB_LOG)
+        chunks = list(iter_log_chunks(path, chunk_size=100))
+        self.assertEqual("".join(chunks), DB_LOG)
+        self.assertTrue(all(chunk.endswith("\n") for chunk in chunks[:-1]))
+
+    def test_drop_lines_containing(self):
+        literals = DbLogTimeConsistencyAnalyzer.ignore_lines
+        lines = (DB_LOG + "\nsystemd[1]: a\nrsyslogd: rsyslogd[1] b\nc").splitlines(keepends=True)
+        self.assertEqual(drop_lines_containing("".join(lines), literals),
+                         [line for line in lines if not any(literal in line for literal in literals)])
+
+    def test_iso_timestamp(self):
+        for value in ("2022-03-10T10:00:05.250+00:00", "2022-03-10T10:00:05+02:00", "2021-11-09 14:22:18",
+                      "2022-03-10T10:00:05.000001"):
+            self.assertEqual(iso_timestamp(value), datetime.datetime.fromisoformat(value).timestamp())
+        with self.assertRaises(ValueError):
+            iso_timestamp("not-a-timestamp")
+
+    def test_db_logs_analyzed_in_parallel(self):
+        for node in ("db-node-1", "db-node-2"):
+            self.write(f"{node}/messages.log", DB_LOG)
+        for max_workers in (None, 1):
+            result = DbLogTimeConsistencyAnalyzer.analyze_dir(self.tmp_dir.name, max_workers=max_workers)
+            self.assertEqual(result["TOTAL"], {"<1min": 0, "<5min": 2, "<30min": 0, "<3hours": 0, ">3hours": 2,
+                                               "total": 4})
+            details = result[str(self.log_dir / "db-node-2" / "messages.log")]
+            self.assertEqual(len(details["<5min"]), 1)
+            self.assertIn("shifted by 2 minutes", details["<5min"][0])
+            self.assertNotIn("ignored", details["<5min"][0])
+
+    def test_sct_log(self):
+        self.write("sct.log", SCT_LOG)
+        result = SctLogTimeConsistencyAnalyzer.analyze_dir(self.tmp_dir.name)
+        self.assertEqual(result["TOTAL"]["<30min"], 1)
+        self.assertEqual(result["TOTAL"]["total"], 1)
@@ -0,0 +1,60 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import os
+import re
+import unittest
+
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS
+from sdcm.utils.multi_pattern import MultiPatternMatcher, pattern_requirements
+
+
+class TestPatternRequirements(unittest.TestCase):
+    def test_literal(self):
+        self.assertEqual(pattern_requirements("Reactor stalled"), (frozenset({"reactor stalled"}), ))
+
+    def test_branch(self):
+        self.assertEqual(pattern_requirements("(Operation timed out|mutation_write_)"),
+                         (frozenset({"operation timed out", "mutation_write_"}), ))
+
+    def test_optional_parts_are_not_required(self):
+        self.assertEqual(pattern_requirements(r"a?(foo)*\d+"), ())
+
+    def test_branch_with_unconditional_alternative(self):
+        self.assertEqual(pattern_requirements(r"foo|\d+"), ())
+
+
+class TestMultiPatternMatcher(unittest.TestCase):
+    def test_first_match_order(self):
+        matcher = MultiPatternMatcher([("Reactor stalled", "stall"), ("backtrace", "backtrace")], flags=re.IGNORECASE)
+        match, value = matcher.first_match("Reactor stalled for 32 ms on shard 1. Backtrace: 0x1")
+        self.assertEqual(value, "stall")
+        self.assertEqual(match.group(), "Reactor stalled")
+        self.assertEqual(matcher.first_match("BACKTRACE: 0x1")[1], "backtrace")
+        self.assertIsNone(matcher.first_match("compaction - [Compact ks.cf 1234]"))
+
+    def test_is_candidate(self):
+        matcher = MultiPatternMatcher([(r"Starting \w+ Server", None)])
+        self.assertTrue(matcher.is_candidate("starting Scylla server"))
+        self.assertFalse(matcher.is_candidate("Stopping Scylla Server"))
+
+    def test_same_result_as_plain_loop(self):
+        matcher = MultiPatternMatcher(SYSTEM_ERROR_EVENTS_PATTERNS)
+        test_data = os.path.join(os.path.dirname(__file__), "test_data")
+        for file_name in ("system.log", "system_one_line_backtrace.log", "kernel_callstack.log", ):
+            with open(os.path.join(test_data, file_name), encoding="utf-8") as log_file:
+                for line in log_file:
+                    expected = next((event for pattern, event in SYSTEM_ERROR_EVENTS_PATTERNS if pattern.search(line)),
+                                    None)
+                    result = matcher.first_match(line)
+                    self.assertIs(result and result[1], expected, line)
@@ -0,0 +1,83 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import unittest
+
+from sdcm.utils.nodes_ip_index import NodesIpIndex
+
+
+class Node:
+    def __init__(self, name, *ips):
+        self.name = name
+        self.ips = list(ips)
+        self.fetched = 0
+
+    def get_all_ip_addresses(self):
+        self.fetched += 1
+        return self.ips + [None]
+
+
+class StaticIpNode:
+    public_ip_address = "1.1.1.1"
+    private_ip_address = "10.0.0.1"
+
+    def get_all_ip_addresses(self):
+        raise NotImplementedError()
+
+
+class TestNodesIpIndex(unittest.TestCase):
+    def setUp(self):
+        self.nodes = [Node("node1", "1.1.1.1", "10.0.0.1", "fe80::1"), Node("node2", "1.1.1.2", "10.0.0.2")]
+        self.index = NodesIpIndex()
+
+    def test_ips_are_fetched_once(self):
+        for _ in range(3):
+            self.index.sync(self.nodes)
+            self.assertIs(self.index.get("fe80::1"), self.nodes[0])
+            self.assertIs(self.index.get("10.0.0.2"), self.nodes[1])
+            self.assertIsNone(self.index.get("10.0.0.3"))
+        self.assertEqual([node.fetched for node in self.nodes], [1, 1])
+
+    def test_nodes_added_and_removed(self):
+        self.index.sync(self.nodes)
+        self.nodes.append(Node("node3", "10.0.0.3"))
+        self.index.sync(self.nodes)
+        self.assertIs(self.index.get("10.0.0.3"), self.nodes[2])
+        removed = self.nodes.pop(0)
+        self.index.remove(removed)
+        self.assertIsNone(self.index.get("1.1.1.1"))
+        self.index.sync(self.nodes)
+        self.assertIsNone(self.index.get("10.0.0.1"))
+        self.assertEqual([node.fetched for node in self.nodes], [1, 1])
+
+    def test_invalidate(self):
+        self.index.sync(self.nodes)
+        self.nodes[1].ips = ["10.0.0.22"]
+        self.index.invalidate(self.nodes[1])
+        self.index.sync(self.nodes)
+        self.assertIsNone(self.index.get("10.0.0.2"))
+        self.assertIs(self.index.get("10.0.0.22"), self.nodes[1])
+        self.assertEqual([node.fetched for node in self.nodes], [1, 2])
+
+    def test_lookup_refetches_ips_on_miss(self):
+        self.assertIs(self.index.lookup(self.nodes, "10.0.0.2"), self.nodes[1])
+        self.nodes[1].ips = ["10.0.0.22"]  # e.g., a K8S pod restarted without `refresh_ip_address()'
+        self.assertIs(self.index.lookup(self.nodes, "10.0.0.22"), self.nodes[1])
+        self.assertIsNone(self.index.lookup(self.nodes, "10.0.0.2"))
+        self.assertEqual([node.fetched for node in self.nodes], [3, 3])
+
+    def test_shared_ip_and_static_ips(self):
+        nodes = [Node("dc1-node", "10.0.0.1"), Node("dc2-node", "10.0.0.1"), StaticIpNode()]
+        self.index.sync(nodes)
+        self.assertEqual(self.index.get_all("10.0.0.1"), tuple(nodes))
+        self.assertIs(self.index.get("1.1.1.1"), nodes[2])
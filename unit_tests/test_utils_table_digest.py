@@ -0,0 +1,92 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import re
+import unittest
+from collections import namedtuple
+
+from sdcm.utils.table_digest import TableDigestComparator, split_token_ring, TOKEN_RING_START, TOKEN_RING_END
+
+
+ColumnRow = namedtuple("ColumnRow", ["column_name", "kind", "position"])
+Row = namedtuple("Row", ["pk", "ck", "value"])
+
+
+def fake_token(partition_key):
+    return hash(partition_key) % 2 ** 64 + TOKEN_RING_START + 1
+
+
+class FakeSession:
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = 0
+
+    def execute(self, statement, params=None):
+        query = getattr(statement, "query_string", statement)
+        if "system_schema" in query:
+            return [ColumnRow("pk", "partition_key", 0), ColumnRow("ck", "clustering", 0)] \
+                if params[1] in self.tables else []
+        self.queries += 1
+        table = re.search(r"FROM \w+\.(\w+)", query).group(1)
+        start, end = params
+        return sorted((row for row in self.tables[table] if start < fake_token(row.pk) <= end),
+                      key=lambda row: (fake_token(row.pk), row.ck))
+
+
+def make_rows(count, value="v"):
+    return [Row(f"pk{i // 3}", i % 3, value) for i in range(count)]
+
+
+class TestTableDigest(unittest.TestCase):
+    def test_split_token_ring(self):
+        ranges = split_token_ring(7)
+        self.assertEqual(len(ranges), 7)
+        self.assertEqual(ranges[0][0], TOKEN_RING_START)
+        self.assertEqual(ranges[-1][1], TOKEN_RING_END)
+        self.assertTrue(all(prev[1] == cur[0] for prev, cur in zip(ranges, ranges[1:])))
+
+    def test_ordered_equal(self):
+        session = FakeSession({"view": make_rows(300), "expected": make_rows(300)})
+        result = TableDigestComparator(session, "ks", token_ranges=16).compare_ordered("view", "expected")
+        self.assertTrue(result.equal)
+        self.assertEqual((result.actual_rows, result.expected_rows), (300, 300))
+        self.assertEqual(session.queries, 32)  # no range was fetched twice
+
+    def test_ordered_mismatch(self):
+        actual = make_rows(300)
+        actual[10] = actual[10]._replace(value="changed")
+        del actual[20]
+        session = FakeSession({"view": actual, "expected": make_rows(300)})
+        result = TableDigestComparator(session, "ks", token_ranges=16).compare_ordered("view", "expected")
+        self.assertFalse(result.equal)
+        self.assertEqual((result.actual_rows, result.expected_rows), (299, 300))
+        self.assertCountEqual(result.missing_rows, [repr(tuple(make_rows(300)[10])), repr(tuple(make_rows(300)[20]))])
+        self.assertEqual(result.unexpected_rows, [repr(tuple(actual[10]))])
+
+    def test_unordered(self):
+        rows = make_rows(300)
+        session = FakeSession({"before": rows[:100], "after": rows[100:], "expected": list(reversed(rows))})
+        comparator = TableDigestComparator(session, "ks", token_ranges=8, row_buckets=32)
+        result = comparator.compare_unordered(["before", "after"], ["expected"])
+        self.assertTrue(result.equal)
+        self.assertEqual(result.rows_per_table, {"before": 100, "after": 200, "expected": 300})
+
+        session.tables["after"] = rows[101:]
+        result = comparator.compare_unordered(["before", "after"], ["expected"])
+        self.assertFalse(result.equal)
+        self.assertEqual(result.missing_rows, [repr(tuple(rows[100]))])
+        self.assertEqual(result.unexpected_rows, [])
+
+    def test_unknown_table(self):
+        comparator = TableDigestComparator(FakeSession({}), "ks")
+        self.assertRaises(ValueError, comparator.compare_ordered, "view", "expected")
@@ -0,0 +1,114 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import time
+import threading
+import unittest
+from concurrent.futures import CancelledError, TimeoutError as FuturesTimeoutError
+
+from sdcm.utils.task_executor import TaskExecutor
+
+
+class TestTaskExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = TaskExecutor(max_workers=4, idle_timeout=1, name="TestTaskExecutor")
+
+    def test_results_are_streamed_in_completion_order(self):
+        batch = self.executor.batch()
+        for delay in (0.3, 0.1, 0.2):
+            batch.submit(time.sleep, args=(delay, ), obj=delay)
+        self.assertEqual([task.obj for task in batch.as_completed()], [0.1, 0.2, 0.3])
+        self.assertEqual(self.executor.stats()["tasks"], 3)
+
+    def test_exception(self):
+        batch = self.executor.batch()
+        task = batch.submit(int, args=("not a number", ))
+        batch.wait()
+        self.assertIsInstance(task.exc, ValueError)
+        self.assertIsNone(task.result)
+
+    def test_per_task_deadline(self):
+        batch = self.executor.batch()
+        fast = batch.submit(time.sleep, args=(0.1, ), timeout=1)
+        slow = batch.submit(time.sleep, args=(1, ), timeout=0.3)
+        start = time.monotonic()
+        self.assertEqual(list(batch.as_completed()), [fast, slow])
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertIsNone(fast.exc)
+        self.assertIsInstance(slow.exc, FuturesTimeoutError)
+
+    def test_deadline_is_counted_from_the_start_of_the_task(self):
+        batch = self.executor.batch(concurrency=1)
+        tasks = [batch.submit(time.sleep, args=(0.3, ), timeout=0.5) for _ in range(3)]
+        batch.wait()
+        self.assertEqual([task.exc for task in tasks], [None, None, None])
+        self.assertGreaterEqual(tasks[2].queue_wait, 0.5)
+
+    def test_concurrency_and_cancel(self):
+        started = []
+        release = threading.Event()
+
+        def work(index):
+            started.append(index)
+            release.wait(timeout=10)
+            return index
+
+        batch = self.executor.batch(concurrency=2)
+        tasks = [batch.submit(work, args=(index, )) for index in range(5)]
+        time.sleep(0.2)
+        self.assertEqual(sorted(started), [0, 1])
+        self.assertTrue(tasks[4].cancel())
+        release.set()
+        batch.wait()
+        self.assertEqual([task.result for task in tasks[:4]], [0, 1, 2, 3])
+        self.assertIsInstance(tasks[4].exc, CancelledError)
+        self.assertNotIn(4, started)
+
+    def test_priority(self):
+        executor = TaskExecutor(max_workers=1, name="TestTaskExecutorPriority")
+        release = threading.Event()
+        order = []
+        blocker = executor.batch()
+        blocker.submit(release.wait, args=(10, ))
+        batch = executor.batch()
+        for priority in (5, 1, 3):
+            batch.submit(order.append, args=(priority, ), priority=priority)
+        release.set()
+        batch.wait()
+        self.assertEqual(order, [1, 3, 5])
+
+    def test_nested_batches_dont_starve(self):
+        executor = TaskExecutor(max_workers=2, name="TestTaskExecutorNested")
+
+        def outer(index):
+            inner = executor.batch()
+            for value in range(3):
+                inner.submit(lambda value=value: index * 10 + value)
+            return [task.result for task in inner.wait()]
+
+        batch = executor.batch()
+        tasks = [batch.submit(outer, args=(index, ), timeout=10) for index in range(4)]
+        batch.wait()
+        self.assertEqual([task.result for task in tasks], [[index * 10 + value for value in range(3)]
+                                                           for index in range(4)])
+        self.assertLessEqual(executor.stats()["workers"], 2)
+
+    def test_metrics(self):
+        batch = self.executor.batch()
+        task = batch.submit(time.sleep, args=(0.1, ))
+        batch.wait()
+        self.assertGreaterEqual(task.duration, 0.1)
+        self.assertGreaterEqual(task.queue_wait, 0)
+        stats = self.executor.stats()
+        self.assertGreaterEqual(stats["duration_max"], 0.1)
+        self.assertEqual(stats["queued"], 0)
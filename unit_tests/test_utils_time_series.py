@@ -0,0 +1,62 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+import statistics
+import unittest
+
+from sdcm.utils.time_series import TimeSeries
+
+
+VALUES = [[1000, "10"], [1010, "NaN"], [1020, "30"], [1030, "20"], [1040, "0.1"], [1050, "40"]]
+
+
+class TestTimeSeries(unittest.TestCase):
+    def test_from_values(self):
+        series = TimeSeries.from_values(VALUES)
+        self.assertEqual(len(series), 5)
+        self.assertEqual(list(series.timestamps), [1000, 1020, 1030, 1040, 1050])
+        self.assertEqual(list(series.values), [10, 30, 20, 0.1, 40])
+
+    def test_stats(self):
+        series = TimeSeries.from_values(VALUES)
+        self.assertEqual(series.max(), 40)
+        self.assertEqual(series.min(), 0.1)
+        filtered = series.filtered(min_value=series.max() * 0.01)
+        self.assertEqual(list(filtered.values), [10, 30, 20, 40])
+        self.assertAlmostEqual(filtered.mean(), 25)
+        self.assertAlmostEqual(filtered.stdev(), statistics.pstdev([10, 30, 20, 40]))
+        self.assertAlmostEqual(filtered.percentile(50), 25)
+        self.assertAlmostEqual(filtered.percentile(90), 37)
+        self.assertFalse(series.is_constant())
+        self.assertTrue(TimeSeries.from_values([[1, "5"], [2, "5"]]).is_constant())
+
+    def test_empty(self):
+        series = TimeSeries.from_values([[1000, "NaN"]])
+        self.assertFalse(series)
+        self.assertRaises(ValueError, series.max)
+        self.assertRaises(ValueError, series.mean)
+
+    def test_from_prometheus(self):
+        results = [{"metric": {"instance": "10.0.0.1"}, "values": VALUES},
+                   {"metric": {"instance": "10.0.0.2"}, "values": [[1000, "100"]]}]
+        self.assertEqual(len(TimeSeries.from_prometheus(results)), 6)
+        by_instance = TimeSeries.by_metric(results, label="instance")
+        self.assertEqual(by_instance["10.0.0.2"].max(), 100)
+        self.assertEqual(len(TimeSeries.from_prometheus([])), 0)
+
+    def test_windows(self):
+        series = TimeSeries.from_values(VALUES)
+        windows = series.windows(30)
+        self.assertEqual(list(windows.timestamps), [990, 1020, 1050])
+        self.assertEqual([round(value, 2) for value in windows.values], [10, 16.7, 40])
+        self.assertEqual(list(series.windows(30, aggregate=TimeSeries.max).values), [10, 30, 40])
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Measure lines/sec of system.log lines classification done by DbLogReader.
+
+Compares the per-line loop over all patterns (`before') with the literal-prefiltered matchers (`after') and verifies
+that both produce the same classification.  Usage:
+
+    python -m utils.benchmarks.db_log_reader [--repeat N] [system.log ...]
+
+By default uses system.log samples from unit_tests/test_data.
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# pylint: disable=wrong-import-position
+from sdcm.db_log_reader import ONE_LINE_BACKTRACE_RE
+from sdcm.sct_events.database import SYSTEM_ERROR_EVENTS_PATTERNS, BACKTRACE_RE, SCYLLA_DATABASE_CONTINUOUS_EVENTS
+from sdcm.utils.multi_pattern import MultiPatternMatcher
+
+DEFAULT_CORPORA = os.path.join(os.path.dirname(__file__), "..", "..", "unit_tests", "test_data", "*.log")
+CONTINUOUS_PATTERNS = [(pattern, event.__name__)
+                       for event in SCYLLA_DATABASE_CONTINUOUS_EVENTS
+                       for pattern in (event.begin_pattern, event.end_pattern)]
+
+
+def classify_before(lines):
+    continuous = [(re.compile(pattern), name) for pattern, name in CONTINUOUS_PATTERNS]
+    result = []
+    for line in lines:
+        is_backtrace = bool(BACKTRACE_RE.search(line)) or ("backtrace:" in line.lower() and "0x" in line)
+        continuous_event = next((name for pattern, name in continuous if pattern.search(line)), None)
+        system_event = next((event.type for pattern, event in SYSTEM_ERROR_EVENTS_PATTERNS if pattern.search(line)),
+                            None)
+        result.append((is_backtrace, continuous_event, system_event))
+    return result
+
+
+def classify_after(lines):
+    continuous = MultiPatternMatcher(CONTINUOUS_PATTERNS)
+    system = MultiPatternMatcher(SYSTEM_ERROR_EVENTS_PATTERNS)
+    candidate = MultiPatternMatcher([(BACKTRACE_RE, None), (ONE_LINE_BACKTRACE_RE, None),
+                                     *continuous.patterns, *system.patterns])
+    result = []
+    for line in lines:
+        folded_line = line.casefold()
+        if not candidate.is_candidate(line, folded_line):
+            result.append((False, None, None))
+            continue
+        is_backtrace = ("0x" in folded_line and bool(BACKTRACE_RE.search(line))) or \
+            ("backtrace:" in folded_line and "0x" in line)
+        continuous_event = (continuous.first_match(line, folded_line) or (None, None))[1]
+        system_event = getattr((system.first_match(line, folded_line) or (None, None))[1], "type", None)
+        result.append((is_backtrace, continuous_event, system_event))
+    return result
+
+
+def measure(func, lines):
+    start = time.perf_counter()
+    result = func(lines)
+    return result, len(lines) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="how many times to repeat the corpora")
+    parser.add_argument("files", nargs="*", help="system.log files to use as corpora")
+    args = parser.parse_args()
+
+    lines = []
+    for file_name in args.files or sorted(glob.glob(DEFAULT_CORPORA)):
+        with open(file_name, encoding="utf-8", errors="replace") as log_file:
+            lines.extend(log_file)
+    lines *= args.repeat
+
+    before, before_rate = measure(classify_before, lines)
+    after, after_rate = measure(classify_after, lines)
+    mismatches = sum(1 for old, new in zip(before, after) if old != new)
+
+    print(f"lines:      {len(lines)}")
+    print(f"before:     {before_rate:,.0f} lines/sec")
+    print(f"after:      {after_rate:,.0f} lines/sec")
+    print(f"speedup:    x{after_rate / before_rate:.2f}")
+    print(f"mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
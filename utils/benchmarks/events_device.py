@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Measure throughput (events/sec) and publish latency of EventsDevice with 1, 10 and 100 concurrent publishers.
+
+Latency is the time between `publish_event()' call and receiving of the event by a subscriber.  Usage:
+
+    python -m utils.benchmarks.events_device [--events N] [--publishers 1 10 100]
+"""
+
+import os
+import sys
+import time
+import ctypes
+import argparse
+import tempfile
+import threading
+import statistics
+import multiprocessing
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# pylint: disable=wrong-import-position
+from sdcm.sct_events.events_device import EventsDevice
+from sdcm.sct_events.events_processes import EventsProcessesRegistry
+from sdcm.sct_events.system import InfoEvent
+
+
+def run_benchmark(log_dir: str, publishers: int, events_per_publisher: int) -> dict:
+    registry = EventsProcessesRegistry(log_dir=os.path.join(log_dir, f"publishers_{publishers}"))
+    device = EventsDevice(_registry=registry)
+    device.start_delay = 0.5
+    device.start()
+
+    total = publishers * events_per_publisher
+    published_at = {}
+    latencies = []
+    stop_event = threading.Event()
+    all_received = threading.Event()
+
+    def subscriber():
+        counter = multiprocessing.Value(ctypes.c_uint32, 0)
+        for _, event in device.outbound_events(stop_event=stop_event, events_counter=counter):
+            latencies.append(time.perf_counter() - published_at[event.message])
+            if len(latencies) == total:
+                all_received.set()
+
+    def publisher(publisher_id: int):
+        for i in range(events_per_publisher):
+            message = f"{publisher_id}-{i}"
+            published_at[message] = time.perf_counter()
+            device.publish_event(InfoEvent(message=message))
+
+    subscriber_thread = threading.Thread(target=subscriber, daemon=True)
+    subscriber_thread.start()
+    time.sleep(device.start_delay + 0.5)  # let the subscriber to connect
+
+    start = time.perf_counter()
+    publisher_threads = [threading.Thread(target=publisher, args=(i, )) for i in range(publishers)]
+    for thread in publisher_threads:
+        thread.start()
+    for thread in publisher_threads:
+        thread.join()
+    all_received.wait(timeout=300)
+    duration = time.perf_counter() - start
+
+    stop_event.set()
+    subscriber_thread.join(timeout=5)
+    device.stop(timeout=5)
+
+    latencies.sort()
+    return {
+        "publishers": publishers,
+        "received": len(latencies),
+        "events_per_sec": len(latencies) / duration,
+        "latency_avg_ms": statistics.mean(latencies) * 1000 if latencies else 0,
+        "latency_p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000, help="total number of events per run")
+    parser.add_argument("--publishers", type=int, nargs="*", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        print(f"{'publishers':>10} {'received':>10} {'events/sec':>12} {'avg ms':>10} {'p99 ms':>10}")
+        for publishers in args.publishers:
+            result = run_benchmark(log_dir, publishers, max(args.events // publishers, 1))
+            print("{publishers:>10} {received:>10} {events_per_sec:>12,.0f} "
+                  "{latency_avg_ms:>10.2f} {latency_p99_ms:>10.2f}".format(**result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Measure per-event cost of events filtering as a function of the number of active filters.
+
+Compare evaluation of every filter for every event (the way EventsDevice did it before) with EventsFiltersIndex and
+check that both give the same results.  Usage:
+
+    python -m utils.benchmarks.events_filters [--events N] [--filters 10 100 500 1000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# pylint: disable=wrong-import-position
+from sdcm.sct_events.database import DatabaseLogEvent
+from sdcm.sct_events.filters import DbEventsFilter, EventsFilter, EventsFiltersIndex
+from sdcm.sct_events.system import InfoEvent
+
+DB_EVENT_TYPES = (DatabaseLogEvent.BAD_ALLOC, DatabaseLogEvent.NO_SPACE_ERROR, DatabaseLogEvent.DATABASE_ERROR,
+                  DatabaseLogEvent.RUNTIME_ERROR, DatabaseLogEvent.REACTOR_STALLED, DatabaseLogEvent.BACKTRACE, )
+
+
+def make_filters(count: int, rnd: random.Random) -> list:
+    filters = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            filters.append(DbEventsFilter(db_event=rnd.choice(DB_EVENT_TYPES), line=f"line{i}", node=f"node{i % 10}"))
+        elif kind == 1:
+            filters.append(EventsFilter(event_class=DatabaseLogEvent, regex=f".*message {i}.*"))
+        else:
+            filters.append(EventsFilter(event_class=InfoEvent, regex=f".*info {i}.*"))
+    return filters
+
+
+def make_events(count: int, filters_count: int, rnd: random.Random) -> list:
+    events = []
+    for i in range(count):
+        if i % 2:
+            events.append(InfoEvent(message=f"info {rnd.randrange(filters_count * 2)}"))
+        else:
+            n = rnd.randrange(filters_count * 2)
+            events.append(rnd.choice(DB_EVENT_TYPES)().add_info(
+                node=f"node{n % 10}", line=f"line{n} message {n}", line_number=n))
+    return events
+
+
+def run_benchmark(filters_count: int, events_count: int) -> dict:
+    rnd = random.Random(filters_count)
+    filters = make_filters(filters_count, rnd)
+    events = make_events(events_count, filters_count, rnd)
+
+    start = time.perf_counter()
+    expected = [any(f.eval_filter(event) for f in filters) for event in events]
+    linear_time = time.perf_counter() - start
+
+    index = EventsFiltersIndex()
+    for filter_obj in filters:
+        index.add(filter_obj)
+    start = time.perf_counter()
+    actual = [index.is_filtered(event) for event in events]
+    index_time = time.perf_counter() - start
+
+    return {
+        "filters": filters_count,
+        "filtered": sum(actual),
+        "linear_us": linear_time / events_count * 1_000_000,
+        "index_us": index_time / events_count * 1_000_000,
+        "mismatches": sum(a != e for a, e in zip(actual, expected)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000, help="number of events per run")
+    parser.add_argument("--filters", type=int, nargs="*", default=[10, 100, 500, 1000])
+    args = parser.parse_args()
+
+    print(f"{'filters':>8} {'filtered':>9} {'linear us/event':>16} {'index us/event':>15} {'mismatches':>11}")
+    for filters_count in args.filters:
+        result = run_benchmark(filters_count, args.events)
+        print("{filters:>8} {filtered:>9} {linear_us:>16.1f} {index_us:>15.1f} {mismatches:>11}".format(**result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Measure time and memory of the parallel timelines report generation for a synthetic raw_events.log file.
+
+The file has a mix of one-time and continuous (begin/end) events of many nodes, shards and stress commands which
+spans a week long test.  Usage:
+
+    python -m utils.benchmarks.pt_report [--events 5000000] [--nodes 30] [--keep]
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import resource
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# pylint: disable=wrong-import-position
+from sdcm.parallel_timeline_report.generate_pt_report import ParallelTimelinesReportGenerator
+
+TEST_START = 1_650_000_000.0
+TEST_DURATION = 7 * 24 * 3600
+CLUSTER = "longevity-100gb-4h-master-db-node-6fb3995d"
+
+
+def make_events(count: int, nodes: int, rnd: random.Random):  # pylint: disable=too-many-locals
+    yield {"base": "InfoEvent", "type": "NA", "event_id": str(uuid.uuid4()), "event_timestamp": TEST_START,
+           "message": "TEST_START test_id=fe9c9218-367f-47ba-b59f-0d06c0e81c30", "period_type": "one-time"}
+    step = TEST_DURATION / count
+    open_events = []
+    for i in range(count - 1):
+        timestamp = TEST_START + i * step
+        node = f"Node {CLUSTER}-{rnd.randrange(1, nodes + 1)} [13.49.80.25 | 10.0.1.221] (seed: False)"
+        kind = rnd.random()
+        if open_events and (kind < 0.2 or len(open_events) > 1000):
+            event = open_events.pop(rnd.randrange(len(open_events)))
+            event.update(period_type="end", end_timestamp=timestamp)
+        elif kind < 0.4:
+            base = rnd.choice(("CompactionEvent", "RepairEvent", "NodetoolEvent", "DisruptionEvent"))
+            event = {"base": base, "type": "NA", "event_id": str(uuid.uuid4()), "node": node,
+                     "shard": rnd.randrange(8), "table": f"keyspace1.standard{rnd.randrange(5)}",
+                     "nemesis_name": rnd.choice(("StopStartService", "MajorCompaction", "DecommissionNode")),
+                     "nodetool_command": "repair", "period_type": "begin", "begin_timestamp": timestamp}
+            open_events.append(event)
+        elif kind < 0.75:
+            event = {"base": "DatabaseLogEvent", "type": rnd.choice(("REACTOR_STALLED", "RUNTIME_ERROR")),
+                     "event_id": str(uuid.uuid4()), "node": node, "period_type": "one-time",
+                     "event_timestamp": timestamp}
+        elif kind < 0.85:
+            event = {"base": "CassandraStressLogEvent", "type": "IOException", "event_id": str(uuid.uuid4()),
+                     "node": f"loader-node-{rnd.randrange(1, 4)}", "period_type": "one-time",
+                     "event_timestamp": timestamp}
+        elif kind < 0.95:
+            event = {"base": "PrometheusAlertManagerEvent", "type": "start", "event_id": str(uuid.uuid4()),
+                     "node": f"10.0.1.{rnd.randrange(nodes)}", "alert_name": rnd.choice(("InstanceDown", "DiskFull")),
+                     "period_type": "one-time", "event_timestamp": timestamp}
+        else:
+            event = {"base": "InfoEvent", "type": "NA", "event_id": str(uuid.uuid4()), "message": f"message {i}",
+                     "period_type": "one-time", "event_timestamp": timestamp}
+        yield event
+
+
+def write_events_file(path: Path, count: int, nodes: int) -> None:
+    rnd = random.Random(count)
+    with path.open("w", encoding="utf-8") as file:
+        for event in make_events(count, nodes, rnd):
+            file.write(json.dumps(event) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=5_000_000, help="number of events in the file")
+    parser.add_argument("--nodes", type=int, default=30, help="number of DB nodes")
+    parser.add_argument("--keep", action="store_true", help="don't remove the generated files")
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="pt-report-benchmark-"))
+    events_file = tmp_dir / "raw_events.log"
+    start = time.perf_counter()
+    write_events_file(events_file, args.events, args.nodes)
+    print(f"generated {args.events} events ({events_file.stat().st_size / 2 ** 20:.0f} MiB) "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    generator = ParallelTimelinesReportGenerator(events_file=events_file)
+    report_file = generator.generate_full_report()
+    duration = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    labels = [label for group in generator.chart_data for label in group["data"]]
+    print(f"report generated in {duration:.1f}s ({args.events / duration:,.0f} events/s), "
+          f"max RSS grew by {(rss_after - rss_before) / 1024:.0f} MiB")
+    print(f"{len(generator.chart_data)} groups, {len(labels)} labels, "
+          f"{sum(len(label['data']) for label in labels)} segments, "
+          f"HTML size {report_file.stat().st_size / 2 ** 20:.1f} MiB")
+    if args.keep:
+        print(f"files are kept in {tmp_dir}")
+    else:
+        events_file.unlink()
+        report_file.unlink()
+        tmp_dir.rmdir()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Measure the startup import time of `sct.py' (with all modules it imports) and show the slowest imports.
+
+Every run imports the module in a new interpreter with `-X importtime'.  The first run warms up .pyc files and isn't
+counted.  Exits with 1 if the median import time is over `--budget' seconds.  Usage:
+
+    python -m utils.benchmarks.sct_import_time [--module sct] [--runs 5] [--top 10] [--budget 5.0]
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+SCT_DIR = Path(__file__).parent.parent.parent
+
+SCT_IMPORT_TIME_BUDGET: float = 5.0  # seconds
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import `module' in a new interpreter and return {module name: cumulative import time in us}."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=SCT_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    # import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():  # skip the header
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="sct")
+    parser.add_argument("--runs", type=int, default=5, help="number of measured runs")
+    parser.add_argument("--top", type=int, default=10, help="number of the slowest imports to show")
+    parser.add_argument("--budget", type=float, default=SCT_IMPORT_TIME_BUDGET, help="seconds")
+    args = parser.parse_args()
+
+    import_times(args.module)
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    median = statistics.median(times[args.module] for times in runs) / 1_000_000
+    print(f"`import {args.module}': median {median:.2f}s of {args.runs} run(s), budget {args.budget:.2f}s")
+    print(f"{'cumulative us':>14}  module")
+    for name, cumulative in sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)[1:args.top + 1]:
+        print(f"{cumulative:>14}  {name}")
+    sys.exit(int(median > args.budget))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See LICENSE for more details.
+#
+# Copyright (c) 2022 ScyllaDB
+
+"""
+Measure lines/sec of stress tools logs classification.
+
+Compares the per-line loop over all patterns of a tool (`before') with StressLogClassifier which classifies batches
+of lines (`after') and verifies that both produce the same events.  Both create events ready to be published, with
+`--encode' events are also serialized the same way as `publish()' does.  Usage:
+
+    python -m utils.benchmarks.stress_log [--lines N] [--errors-rate R] [--encode] \
+        [--cs FILE] [--sb FILE] [--gemini FILE]
+
+Captured logs of cassandra-stress, scylla-bench and gemini can be given, otherwise a synthetic stress storm output
+is generated for every tool.
+"""
+
+import os
+import sys
+import json
+import logging
+import time
+import random
+import argparse
+from itertools import chain
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# pylint: disable=wrong-import-position
+from sdcm.sct_events.event_frame import encode_event
+from sdcm.sct_events.loaders import (
+    CS_ERROR_EVENTS_PATTERNS,
+    CS_NORMAL_EVENTS_PATTERNS,
+    CS_LOG_CLASSIFIER,
+    SCYLLA_BENCH_ERROR_EVENTS_PATTERNS,
+    SCYLLA_BENCH_LOG_CLASSIFIER,
+    GEMINI_LOG_LINE_RE,
+    GeminiStressLogEvent,
+    get_gemini_log_classifier,
+)
+
+BATCH_LINES = 1000
+ENCODE = False
+
+CS_LINES = (
+    "total,   {i:>10},   12345,   12345,   12345,     1.0,     0.9,     1.3,     1.6,     2.9,     5.1,  {i:>6}\n",
+    "WARN  03:56:37,572 Cannot achieve consistency level for cl QUORUM. Requires 2, alive 1\n",
+    "java.io.IOException: Operation x10 on key(s) [334f37384f4d32303430]: Error executing: (OverloadedException)\n",
+)
+SB_LINES = (
+    "{i:>10}  20.1s  107421  107421  0  1.2ms  1.1ms  2.4ms  3.5ms  4.2ms  8.5ms  11ms\n",
+    "2021/04/06 13:03:28 Operation timed out for scylla_bench.test - received only 1 responses from 2 CL=QUORUM.\n",
+)
+
+
+def gemini_line(i: int, rnd: random.Random) -> str:
+    if rnd.random() < 0.01:
+        return f"goroutine {i} [running]:\n"
+    return json.dumps({"L": "INFO", "T": "2020-06-09T03:40:39.349Z", "N": "pump", "M": f"message {i}"}) + "\n"
+
+
+def synthetic_lines(tool: str, count: int, errors_rate: float) -> list:
+    rnd = random.Random(count)
+    if tool == "gemini":
+        return [gemini_line(i, rnd) for i in range(count)]
+    templates = CS_LINES if tool == "cs" else SB_LINES
+    return [(rnd.choice(templates[1:]) if rnd.random() < errors_rate else templates[0]).format(i=i)
+            for i in range(count)]
+
+
+def done(event) -> None:
+    if ENCODE:
+        event.to_json()
+        encode_event(event)
+    event.dont_publish()
+
+
+def events_before(tool: str, lines: list) -> list:
+    """The way publishers did it: loop over the patterns for every line and publish the shared template."""
+    result = []
+    if tool == "gemini":
+        for line_number, line in enumerate(lines):
+            event = GeminiStressLogEvent.GeminiEvent()
+            event.add_info(node="loader-1", line=line, line_number=line_number)
+            if event._ready_to_publish:  # pylint: disable=protected-access
+                result.append((line_number, event.type))
+                done(event)
+            else:
+                event.dont_publish()
+        return result
+    patterns = chain(CS_NORMAL_EVENTS_PATTERNS, CS_ERROR_EVENTS_PATTERNS) if tool == "cs" else \
+        SCYLLA_BENCH_ERROR_EVENTS_PATTERNS
+    patterns = list(patterns)
+    for line_number, line in enumerate(lines):
+        for pattern, event in patterns:
+            event.event_id = "stress-id"
+            if pattern.search(line):
+                done(event.add_info(node="loader-1", line=line, line_number=line_number))
+                result.append((line_number, event.type))
+                if tool == "cs":
+                    break
+    return result
+
+
+def events_after(tool: str, lines: list) -> list:
+    classifier = {"cs": CS_LOG_CLASSIFIER, "sb": SCYLLA_BENCH_LOG_CLASSIFIER}.get(tool) or get_gemini_log_classifier()
+    result = []
+    for start in range(0, len(lines), BATCH_LINES):
+        for event in classifier.events(lines[start:start + BATCH_LINES], node="loader-1", event_id="stress-id",
+                                       start_line_number=start):
+            if event._ready_to_publish:  # pylint: disable=protected-access
+                result.append((event.line_number, event.type))
+                done(event)
+            else:
+                event.dont_publish()
+    return result
+
+
+def measure(func, tool, lines):
+    start = time.perf_counter()
+    result = func(tool, lines)
+    return result, len(lines) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=500_000, help="number of lines of synthetic logs")
+    parser.add_argument("--errors-rate", type=float, default=0.001, help="share of lines with errors in synthetic logs")
+    parser.add_argument("--encode", action="store_true", help="serialize events the same way as publish() does")
+    parser.add_argument("--cs", help="captured cassandra-stress log")
+    parser.add_argument("--sb", help="captured scylla-bench log")
+    parser.add_argument("--gemini", help="captured gemini log")
+    args = parser.parse_args()
+    global ENCODE  # pylint: disable=global-statement
+    ENCODE = args.encode
+    logging.disable(logging.DEBUG)  # don't format a message for every not published event
+
+    mismatches = 0
+    print(f"{'tool':>7} {'lines':>9} {'events':>8} {'before lines/s':>15} {'after lines/s':>14} {'speedup':>8}")
+    for tool in ("cs", "sb", "gemini"):
+        if file_name := getattr(args, tool):
+            with open(file_name, encoding="utf-8", errors="replace") as log_file:
+                lines = list(log_file)
+        else:
+            lines = synthetic_lines(tool, args.lines, args.errors_rate)
+        before, before_rate = measure(events_before, tool, lines)
+        after, after_rate = measure(events_after, tool, lines)
+        mismatches += before != after
+        if tool == "gemini":
+            # JSON lines which weren't recognized by the line prefilter would be lost.
+            mismatches += sum(1 for line in lines
+                              if line.lstrip().startswith("{") and not GEMINI_LOG_LINE_RE.match(line))
+        print(f"{tool:>7} {len(lines):>9} {len(after):>8} {before_rate:>15,.0f} {after_rate:>14,.0f} "
+              f"{after_rate / before_rate:>7.1f}x")
+    print(f"mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())